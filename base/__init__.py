@@ -4,44 +4,51 @@ Provides get_logger(...) used across the base package.
 """
 
 import logging
+import os
 from logging import Logger
 from typing import Optional
 
-_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+from .logging_config import _DATE_FORMAT, _LOG_FORMAT, ensure_logging
 
 
 def get_logger(
-    name: str, level: int = logging.INFO, *, log_file: Optional[str] = None
+    name: str, level: Optional[int] = None, *, log_file: Optional[str] = None
 ) -> Logger:
     """Return a configured logger.
 
-    - Ensures handlers are not added multiple times for the same logger name.
-    - By default logs to the console. Optionally writes to a file if log_file is provided.
+    - Records propagate to the queued root handlers from base.logging_config,
+      so every line is written once by the background listener.
+    - Installs the queued console handler if logging has not been set up yet.
+    - Optionally writes to a file if log_file is provided.
 
     Args:
         name: Logger name (typically __name__)
-        level: Logging level (default INFO)
+        level: Optional logging level (default inherits from the root logger)
         log_file: Optional path to a file to also write logs to.
 
     Returns:
         logging.Logger: configured logger instance
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-
-    if not logger.handlers:
-        fmt = logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT)
+    ensure_logging()
 
-        console = logging.StreamHandler()
-        console.setLevel(level)
-        console.setFormatter(fmt)
-        logger.addHandler(console)
-
-        if log_file:
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
-            file_handler.setLevel(level)
-            file_handler.setFormatter(fmt)
+    logger = logging.getLogger(name)
+    if level is not None:
+        logger.setLevel(level)
+
+    if log_file:
+        log_path = os.path.abspath(log_file)
+        has_file_handler = any(
+            isinstance(handler, logging.FileHandler)
+            and handler.baseFilename == log_path
+            for handler in logger.handlers
+        )
+        if not has_file_handler:
+            file_handler = logging.FileHandler(log_path, encoding="utf-8")
+            if level is not None:
+                file_handler.setLevel(level)
+            file_handler.setFormatter(
+                logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT)
+            )
             logger.addHandler(file_handler)
 
     return logger
@@ -1,24 +1,76 @@
+import logging
 import os
 import pickle
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
 
 import requests
 import urllib3
 from bs4 import BeautifulSoup, Tag
 from requests import Response
 from requests.adapters import HTTPAdapter
-from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.wait import WebDriverWait
 from urllib3.exceptions import InsecureRequestWarning
 from urllib3.util.retry import Retry
 
 from . import get_logger
+from .http_telemetry import HttpTelemetry, get_http_telemetry
+from .logging_config import LogSampler, get_request_log_sample
+from .login import LoginProvider, get_default_login_provider
+from .phase_timing import record_network_time
 from .runtime_config import get_current_cms_base_url, get_current_session_file
+from .session_monitor import SessionMonitor, get_session_monitor
 
 logger = get_logger(__name__)
 
+_request_log_sampler = LogSampler(get_request_log_sample())
+
+
+@dataclass
+class RequestTally:
+    requests: int = 0
+    bytes: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, response: Response) -> None:
+        content = getattr(response, "content", None)
+        with self._lock:
+            self.requests += 1
+            if isinstance(content, bytes):
+                self.bytes += len(content)
+
+
+_request_tally: ContextVar[RequestTally | None] = ContextVar(
+    "request_tally", default=None
+)
+
+
+@contextmanager
+def track_requests() -> Iterator[RequestTally]:
+    tally = RequestTally()
+    token = _request_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _request_tally.reset(token)
+
+
+def _record_request(response: Response) -> None:
+    tally = _request_tally.get()
+    if tally is not None:
+        tally.record(response)
+
+
+def _log_request(message: str) -> None:
+    if logger.isEnabledFor(logging.DEBUG) and _request_log_sampler.should_log():
+        logger.debug(message)
+
 
 class _BaseUrlProxy:
     def __str__(self) -> str:
@@ -60,18 +112,106 @@ def check_logged_in(html: str) -> bool:
     return True
 
 
+def _is_login_url(url: str | None) -> bool:
+    if not url:
+        return False
+    return urlparse(url).path.rstrip("/").endswith("login.php")
+
+
+def is_login_response(response: Response) -> bool:
+    if _is_login_url(response.url):
+        return True
+
+    for redirect in response.history:
+        if _is_login_url(redirect.headers.get("Location")):
+            return True
+
+    content_type = response.headers.get("Content-Type", "")
+    if content_type and "html" not in content_type.lower():
+        return False
+
+    html = response.text
+    if "login.php" not in html:
+        return False
+
+    return not check_logged_in(html)
+
+
 class Browser:
     _instance = None
     logged_in = False
     max_retries = 60
     session: requests.Session | None = None
+    login_provider: LoginProvider | None = None
+    login_generation = 0
+    _login_lock = threading.Lock()
+    session_monitor: SessionMonitor | None = None
+    telemetry: HttpTelemetry | None = None
+    keep_alive_path = "f_schoollist.php"
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Browser, cls).__new__(cls)
             cls._instance.load_session()
+            cls._instance.get_session_monitor().start_keep_alive(
+                cls._instance.keep_alive
+            )
         return cls._instance
 
+    def get_session_monitor(self) -> SessionMonitor:
+        monitor = self.session_monitor
+        if monitor is None:
+            monitor = get_session_monitor()
+            type(self).session_monitor = monitor
+        return monitor
+
+    def get_telemetry(self) -> HttpTelemetry:
+        telemetry = self.telemetry
+        if telemetry is None:
+            telemetry = get_http_telemetry()
+            type(self).telemetry = telemetry
+        return telemetry
+
+    def _request(self, method: str, url: str, data: dict | str | None = None):
+        if self.session is None:
+            raise ValueError("Session is not initialized")
+
+        started = time.perf_counter()
+        try:
+            if method == "POST":
+                response = self.session.post(url, data, timeout=120)
+            else:
+                response = self.session.get(url, timeout=120)
+        except (requests.RequestException, TimeoutError):
+            self.get_telemetry().record_failure(url)
+            raise
+
+        elapsed = time.perf_counter() - started
+        record_network_time(elapsed)
+        content = getattr(response, "content", None)
+        self.get_telemetry().record_response(
+            url,
+            response.status_code,
+            elapsed,
+            len(content) if isinstance(content, bytes) else 0,
+        )
+        return response
+
+    def keep_alive(self) -> bool:
+        if self.session is None:
+            return False
+
+        url = f"{BASE_URL}/{self.keep_alive_path}"
+        logger.info(f"Sending session keep-alive to {url}")
+        response = self.session.get(url, timeout=30)
+        if is_login_response(response):
+            logger.warning("Session expired before keep-alive, login will be needed")
+            self.get_session_monitor().record_expiry()
+            return False
+
+        self.get_session_monitor().record_activity()
+        return True
+
     def load_session(self):
         session_file = get_current_session_file()
         if os.path.exists(session_file):
@@ -92,9 +232,7 @@ class Browser:
         adapter = HTTPAdapter(
             pool_connections=20,
             pool_maxsize=80,
-            max_retries=Retry(
-                total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504]
-            ),
+            max_retries=Retry(total=3, backoff_factor=1),
         )
 
         self.session.mount("http://", adapter)
@@ -105,32 +243,44 @@ class Browser:
             pickle.dump(self.session, f)
         logger.info("Saved session")
 
+    @classmethod
+    def set_login_provider(cls, provider: LoginProvider | None):
+        cls.login_provider = provider
+
+    def get_login_provider(self) -> LoginProvider:
+        provider = self.login_provider
+        if provider is None:
+            provider = get_default_login_provider()
+            type(self).login_provider = provider
+        return provider
+
     def login(self):
         logger.info("Logging in...")
-        driver = ChromeWebDriver()
-        url = f"{BASE_URL}/login.php"
-        logger.info(f"Fetching {url}")
-        driver.get(url)
-        WebDriverWait(driver, 60 * 3).until(
-            expected_conditions.presence_of_element_located(
-                (By.LINK_TEXT, "[ Logout ]")
-            )
-        )
+        provider = self.get_login_provider()
+        cookies = provider.login(f"{BASE_URL}/login.php")
         logger.info("Logged in successfully")
 
-        selenium_cookies = driver.get_cookies()
-        driver.quit()
-
         if self.session is None:
             raise ValueError("Session is not initialized")
 
         self.session.cookies.clear()
-        for cookie in selenium_cookies:
+        for cookie in cookies:
             self.session.cookies.set(
-                cookie["name"], cookie["value"], domain=cookie["domain"]
+                cookie["name"], cookie["value"], domain=cookie.get("domain", "")
             )
 
         self.save_session()
+        self.get_session_monitor().record_login()
+
+    def relogin(self, observed_generation: int) -> None:
+        with self._login_lock:
+            if type(self).login_generation != observed_generation:
+                logger.info("Session was refreshed by another thread")
+                return
+
+            self.get_session_monitor().record_expiry()
+            self.login()
+            type(self).login_generation += 1
 
     def fetch(self, url: str) -> Response:
         if self.session is None:
@@ -141,20 +291,24 @@ class Browser:
 
         while retry_count < self.max_retries:
             try:
-                attempt_info = (
-                    f"(Attempt {retry_count + 1}/{self.max_retries})"
-                    if retry_count > 0
-                    else ""
-                )
-                logger.info(f"Fetching {url} {attempt_info}")
-                response = self.session.get(url, timeout=120)
+                if retry_count > 0:
+                    logger.info(
+                        f"Fetching {url} (Attempt {retry_count + 1}/{self.max_retries})"
+                    )
+                else:
+                    _log_request(f"Fetching {url}")
+                generation = self.login_generation
+                response = self._request("GET", url)
 
-                is_logged_in = check_logged_in(response.text)
-                if not is_logged_in:
+                if is_login_response(response):
                     logger.info("Session expired, logging in again")
-                    self.login()
+                    self.get_telemetry().record_relogin(url)
+                    self.relogin(generation)
                     logger.info(f"Logged in, re-fetching {url}")
-                    response = self.session.get(url, timeout=120)
+                    response = self._request("GET", url)
+                else:
+                    self.get_session_monitor().record_activity()
+                _record_request(response)
 
                 if response.status_code != 200:
                     logger.error(
@@ -166,9 +320,11 @@ class Browser:
                     )
                     retry_count += 1
                     if retry_count < self.max_retries:
+                        self.get_telemetry().record_retry(url)
                         logger.info(
                             f"Waiting {wait_time} seconds before retry ({retry_count}/{self.max_retries})"
                         )
+                        record_network_time(wait_time)
                         time.sleep(wait_time)
                         wait_time *= 2
                         continue
@@ -178,12 +334,14 @@ class Browser:
             except (requests.RequestException, TimeoutError) as e:
                 retry_count += 1
                 if retry_count < self.max_retries:
+                    self.get_telemetry().record_retry(url)
                     logger.error(
                         f"Request failed - url={url}, error={str(e)}, "
                         f"error_type={type(e).__name__}, "
                         f"retry_attempt={retry_count}/{self.max_retries}, "
                         f"waiting {wait_time} seconds before retry",
                     )
+                    record_network_time(wait_time)
                     time.sleep(wait_time)
                     wait_time *= 2
                 else:
@@ -201,15 +359,18 @@ class Browser:
     def post(self, url: str, data: dict | str) -> Response:
         if self.session is None:
             raise ValueError("Session is not initialized")
-        logger.info(f"Posting to {url}")
-        logger.info(f"Payload: {str(data)}")
-        response = self.session.post(url, data, timeout=120)
-        is_logged_in = check_logged_in(response.text)
-        if not is_logged_in:
+        _log_request(f"Posting to {url} - payload={str(data)}")
+        generation = self.login_generation
+        response = self._request("POST", url, data)
+        if is_login_response(response):
             logger.info("Not logged in, attempting to re-login...")
-            self.login()
+            self.get_telemetry().record_relogin(url)
+            self.relogin(generation)
             logger.info(f"Logged in, re-posting to {url}")
-            response = self.session.post(url, data, timeout=120)
+            response = self._request("POST", url, data)
+        else:
+            self.get_session_monitor().record_activity()
+        _record_request(response)
         if response.status_code != 200:
             logger.error(
                 f"Unexpected status code on post - url={url}, "
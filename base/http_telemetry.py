@@ -0,0 +1,219 @@
+import bisect
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+from . import get_logger
+
+logger = get_logger(__name__)
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def endpoint_name(url: str) -> str:
+    path = urlparse(url).path.rstrip("/")
+    return path.rsplit("/", 1)[-1] or "/"
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    bytes: int = 0
+    server_errors: int = 0
+    failures: int = 0
+    retries: int = 0
+    relogins: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def record(self, status_code: int, seconds: float, size: int) -> None:
+        self.requests += 1
+        self.bytes += size
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if status_code >= 500:
+            self.server_errors += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        if not self.requests:
+            return None
+        target = fraction * self.requests
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                if index < len(LATENCY_BUCKETS):
+                    return LATENCY_BUCKETS[index]
+                return self.max_seconds
+        return self.max_seconds
+
+    def merge(self, other: "EndpointStats") -> None:
+        self.requests += other.requests
+        self.bytes += other.bytes
+        self.server_errors += other.server_errors
+        self.failures += other.failures
+        self.retries += other.retries
+        self.relogins += other.relogins
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EndpointStats":
+        histogram = data.get("latency_histogram", {})
+        return cls(
+            requests=int(data["requests"]),
+            bytes=int(data["bytes"]),
+            server_errors=int(data["server_errors"]),
+            failures=int(data["failures"]),
+            retries=int(data["retries"]),
+            relogins=int(data["relogins"]),
+            total_seconds=float(data["total_seconds"]),
+            max_seconds=float(data["max_seconds"]),
+            buckets=[
+                int(histogram.get(f"le_{bound:g}s", 0)) for bound in LATENCY_BUCKETS
+            ]
+            + [int(histogram.get("overflow", 0))],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "server_errors": self.server_errors,
+            "server_error_rate": (
+                round(self.server_errors / self.requests, 4) if self.requests else 0.0
+            ),
+            "failures": self.failures,
+            "retries": self.retries,
+            "relogins": self.relogins,
+            "total_seconds": round(self.total_seconds, 3),
+            "mean_seconds": (
+                round(self.total_seconds / self.requests, 3) if self.requests else 0.0
+            ),
+            "p50_seconds": self.percentile(0.5),
+            "p95_seconds": self.percentile(0.95),
+            "max_seconds": round(self.max_seconds, 3),
+            "latency_histogram": {
+                **{
+                    f"le_{bound:g}s": count
+                    for bound, count in zip(LATENCY_BUCKETS, self.buckets)
+                },
+                "overflow": self.buckets[-1],
+            },
+        }
+
+
+class HttpTelemetry:
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, EndpointStats] = {}
+        self.started_at = clock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints = {}
+            self.started_at = self._clock()
+
+    def load_summary(self, path: Path) -> bool:
+        if not path.exists():
+            return False
+        try:
+            with open(path, encoding="utf-8") as f:
+                summary = json.load(f)
+            started_at = datetime.fromisoformat(summary["started_at"]).timestamp()
+            endpoints = {
+                name: EndpointStats.from_dict(data)
+                for name, data in summary["endpoints"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Could not load CMS request telemetry: {str(e)}")
+            return False
+
+        with self._lock:
+            for name, stats in endpoints.items():
+                self._endpoints.setdefault(name, EndpointStats()).merge(stats)
+            self.started_at = min(self.started_at, started_at)
+        return True
+
+    def _stats(self, url: str) -> EndpointStats:
+        name = endpoint_name(url)
+        stats = self._endpoints.get(name)
+        if stats is None:
+            stats = EndpointStats()
+            self._endpoints[name] = stats
+        return stats
+
+    def record_response(
+        self, url: str, status_code: int, seconds: float, size: int
+    ) -> None:
+        with self._lock:
+            self._stats(url).record(status_code, seconds, size)
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            self._stats(url).failures += 1
+
+    def record_retry(self, url: str) -> None:
+        with self._lock:
+            self._stats(url).retries += 1
+
+    def record_relogin(self, url: str) -> None:
+        with self._lock:
+            self._stats(url).relogins += 1
+
+    def totals(self) -> EndpointStats:
+        totals = EndpointStats()
+        with self._lock:
+            for stats in self._endpoints.values():
+                totals.merge(stats)
+        return totals
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            endpoints = {
+                name: stats.to_dict() for name, stats in sorted(self._endpoints.items())
+            }
+            started_at = self.started_at
+        return {
+            "started_at": datetime.fromtimestamp(started_at).isoformat(
+                timespec="seconds"
+            ),
+            "elapsed_seconds": round(self._clock() - started_at, 3),
+            "totals": self.totals().to_dict(),
+            "endpoints": endpoints,
+        }
+
+    def describe(self) -> str | None:
+        totals = self.totals()
+        if not totals.requests:
+            return None
+        p95 = totals.percentile(0.95) or 0.0
+        error_rate = totals.server_errors / totals.requests * 100
+        return (
+            f"CMS {totals.requests:,} req, {totals.bytes / 1_048_576:.1f} MB, "
+            f"p95 {p95:g}s, {totals.retries} retries, {totals.relogins} relogins, "
+            f"5xx {error_rate:.1f}%"
+        )
+
+    def write_summary(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2, sort_keys=True)
+        logger.info(f"Wrote CMS request telemetry to {path}")
+        return path
+
+
+_telemetry = HttpTelemetry()
+
+
+def get_http_telemetry() -> HttpTelemetry:
+    return _telemetry
@@ -1,10 +1,23 @@
+import atexit
+import itertools
 import logging
-from pathlib import Path
+import os
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
 
 _LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 _DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+DEFAULT_REQUEST_LOG_SAMPLE = 20
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+_listener_lock = threading.Lock()
+_atexit_registered = False
+
 
 class LazyFileHandler(logging.Handler):
     def __init__(self, log_dir: Path, level: int = logging.ERROR):
@@ -30,25 +43,100 @@ class LazyFileHandler(logging.Handler):
         super().close()
 
 
-def setup_logging(log_dir: Path | None = None, level: int = logging.INFO) -> None:
-    if log_dir is None:
-        log_dir = Path(__file__).parent.parent / "logs"
+class LogSampler:
+    def __init__(self, every: int):
+        self.every = max(every, 1)
+        self._counter = itertools.count()
+
+    def should_log(self) -> bool:
+        return next(self._counter) % self.every == 0
+
+
+def get_configured_log_level(default: int = logging.INFO) -> int:
+    value = os.getenv("REGISTRY_LOG_LEVEL", "").strip().upper()
+    if not value:
+        return default
+    level = logging.getLevelName(value)
+    return level if isinstance(level, int) else default
+
+
+def get_request_log_sample() -> int:
+    try:
+        return int(
+            os.getenv("REGISTRY_REQUEST_LOG_SAMPLE", str(DEFAULT_REQUEST_LOG_SAMPLE))
+        )
+    except ValueError:
+        return DEFAULT_REQUEST_LOG_SAMPLE
+
+
+def _stop_listener() -> None:
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(level)
 
-    if root_logger.handlers:
-        root_logger.handlers.clear()
+def _install_handlers(handlers: list[logging.Handler], level: int) -> None:
+    global _listener, _queue_handler, _atexit_registered
 
-    formatter = logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT)
+    with _listener_lock:
+        _stop_listener()
 
+        root_logger = logging.getLogger()
+        root_logger.setLevel(level)
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        root_logger.addHandler(_queue_handler)
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+        if not _atexit_registered:
+            atexit.register(shutdown_logging)
+            _atexit_registered = True
+
+
+def _console_handler(level: int) -> logging.Handler:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT))
+    return console_handler
+
+
+def ensure_logging() -> None:
+    if logging.getLogger().handlers:
+        return
+
+    level = get_configured_log_level()
+    _install_handlers([_console_handler(level)], level)
+
+
+def setup_logging(log_dir: Path | None = None, level: int | None = None) -> None:
+    if log_dir is None:
+        log_dir = Path(__file__).parent.parent / "logs"
+    if level is None:
+        level = get_configured_log_level()
 
     lazy_error_handler = LazyFileHandler(log_dir, level=logging.ERROR)
-    lazy_error_handler.setFormatter(formatter)
-    root_logger.addHandler(lazy_error_handler)
+    lazy_error_handler.setFormatter(
+        logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT)
+    )
+
+    _install_handlers([_console_handler(level), lazy_error_handler], level)
 
     logging.info("Logging initialized. Error logs will be created on first error.")
+
+
+def shutdown_logging() -> None:
+    with _listener_lock:
+        _stop_listener()
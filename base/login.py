@@ -0,0 +1,109 @@
+import json
+import os
+from pathlib import Path
+from typing import Protocol
+
+from . import get_logger
+
+logger = get_logger(__name__)
+
+LOGIN_TIMEOUT_SECONDS = 60 * 3
+LOGGED_IN_LINK_TEXT = "[ Logout ]"
+LOGIN_FORM_SELECTOR = "form[action$='login.php']"
+USERNAME_INPUT_SELECTOR = (
+    f"{LOGIN_FORM_SELECTOR} input[type='text'], {LOGIN_FORM_SELECTOR} input:not([type])"
+)
+PASSWORD_INPUT_SELECTOR = f"{LOGIN_FORM_SELECTOR} input[type='password']"
+
+
+class LoginProvider(Protocol):
+    def login(self, login_url: str) -> list[dict]: ...
+
+
+class ChromeLoginProvider:
+    def __init__(
+        self,
+        *,
+        headless: bool = False,
+        timeout: int = LOGIN_TIMEOUT_SECONDS,
+        username: str | None = None,
+        password: str | None = None,
+    ):
+        if headless and not (username and password):
+            raise ValueError(
+                "Headless login needs REGISTRY_LOGIN_USERNAME and "
+                "REGISTRY_LOGIN_PASSWORD, there is no window to type them into"
+            )
+        self.headless = headless
+        self.timeout = timeout
+        self.username = username or ""
+        self.password = password or ""
+
+    def login(self, login_url: str) -> list[dict]:
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions
+        from selenium.webdriver.support.wait import WebDriverWait
+
+        options = ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+
+        driver = ChromeWebDriver(options=options)
+        try:
+            logger.info(f"Fetching {login_url}")
+            driver.get(login_url)
+            if self.headless:
+                wait = WebDriverWait(driver, self.timeout)
+                username_input = wait.until(
+                    expected_conditions.presence_of_element_located(
+                        (By.CSS_SELECTOR, USERNAME_INPUT_SELECTOR)
+                    )
+                )
+                password_input = driver.find_element(
+                    By.CSS_SELECTOR, PASSWORD_INPUT_SELECTOR
+                )
+                username_input.send_keys(self.username)
+                password_input.send_keys(self.password)
+                password_input.submit()
+            WebDriverWait(driver, self.timeout).until(
+                expected_conditions.presence_of_element_located(
+                    (By.LINK_TEXT, LOGGED_IN_LINK_TEXT)
+                )
+            )
+            return driver.get_cookies()
+        finally:
+            driver.quit()
+
+
+class CookieFileLoginProvider:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def login(self, login_url: str) -> list[dict]:
+        logger.info(f"Loading login cookies from {self.path}")
+        cookies = json.loads(self.path.read_text(encoding="utf-8"))
+        if isinstance(cookies, dict):
+            cookies = [
+                {"name": name, "value": value} for name, value in cookies.items()
+            ]
+        if not isinstance(cookies, list):
+            raise ValueError(f"Unsupported cookie file format: {self.path}")
+        return cookies
+
+
+def _is_enabled(value: str | None) -> bool:
+    return (value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def get_default_login_provider() -> LoginProvider:
+    cookie_file = os.getenv("REGISTRY_LOGIN_COOKIES", "").strip()
+    if cookie_file:
+        return CookieFileLoginProvider(cookie_file)
+
+    return ChromeLoginProvider(
+        headless=_is_enabled(os.getenv("REGISTRY_LOGIN_HEADLESS")),
+        username=os.getenv("REGISTRY_LOGIN_USERNAME", "").strip() or None,
+        password=os.getenv("REGISTRY_LOGIN_PASSWORD") or None,
+    )
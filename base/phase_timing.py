@@ -0,0 +1,112 @@
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class PhaseTimings:
+    key: str
+    phases: dict[str, float] = field(default_factory=dict)
+    calls: dict[str, int] = field(default_factory=dict)
+    total_seconds: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, phase: str, seconds: float, calls: int = 1) -> None:
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+            self.calls[phase] = self.calls.get(phase, 0) + calls
+
+
+@dataclass
+class _Span:
+    network_seconds: float = 0.0
+    child_seconds: float = 0.0
+    thread_id: int = field(default_factory=threading.get_ident)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add_network(self, seconds: float) -> None:
+        with self._lock:
+            self.network_seconds += seconds
+
+    def add_child(self, seconds: float) -> None:
+        with self._lock:
+            self.child_seconds += seconds
+
+
+_current_timings: ContextVar[PhaseTimings | None] = ContextVar(
+    "phase_timings", default=None
+)
+_current_span: ContextVar[_Span | None] = ContextVar("phase_span", default=None)
+
+
+@contextmanager
+def record_phases(key: str) -> Iterator[PhaseTimings]:
+    timings = PhaseTimings(key)
+    timings_token = _current_timings.set(timings)
+    span_token = _current_span.set(None)
+    started = time.perf_counter()
+    try:
+        yield timings
+    finally:
+        timings.total_seconds = time.perf_counter() - started
+        _current_span.reset(span_token)
+        _current_timings.reset(timings_token)
+
+
+@contextmanager
+def phase(name: str, *, split_network: bool = False) -> Iterator[None]:
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    parent = _current_span.get()
+    span = _Span()
+    token = _current_span.set(span)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        _current_span.reset(token)
+        if parent is not None and parent.thread_id == span.thread_id:
+            parent.add_child(elapsed)
+
+        own_seconds = max(elapsed - span.child_seconds, 0.0)
+        if split_network:
+            network_seconds = min(span.network_seconds, own_seconds)
+            timings.add(f"fetch.{name}", network_seconds)
+            timings.add(f"parse.{name}", own_seconds - network_seconds)
+        else:
+            timings.add(name, own_seconds)
+
+
+def timed_phase(name: str, *, split_network: bool = False) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_timings.get() is None:
+                return func(*args, **kwargs)
+            with phase(name, split_network=split_network):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def record_network_time(seconds: float) -> None:
+    span = _current_span.get()
+    if span is not None:
+        span.add_network(seconds)
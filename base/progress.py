@@ -0,0 +1,85 @@
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+DEFAULT_PROGRESS_RATE = 10.0
+PROGRESS_EVENTS = frozenset({"progress"})
+
+ProgressCallback = Callable[..., Any]
+
+
+class ProgressChannel:
+    def __init__(
+        self,
+        callback: ProgressCallback,
+        *,
+        rate: float = DEFAULT_PROGRESS_RATE,
+        coalesce: Iterable[str] = PROGRESS_EVENTS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.callback = callback
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.coalesce = frozenset(coalesce)
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._pending: tuple[str, tuple[Any, ...]] | None = None
+        self._timer: threading.Timer | None = None
+        self._last_delivery: float | None = None
+        self.received = 0
+        self.delivered = 0
+
+    @property
+    def dropped(self) -> int:
+        with self._lock:
+            pending = 1 if self._pending is not None else 0
+            return self.received - self.delivered - pending
+
+    def __call__(self, event_type: str, *args: Any) -> None:
+        with self._lock:
+            if event_type not in self.coalesce:
+                self._cancel_timer()
+                self._deliver_pending()
+                self.callback(event_type, *args)
+                return
+
+            self.received += 1
+            self._pending = (event_type, args)
+            now = self._clock()
+            if (
+                self._last_delivery is None
+                or now - self._last_delivery >= self.interval
+            ):
+                self._cancel_timer()
+                self._deliver_pending()
+            elif self._timer is None:
+                delay = self.interval - (now - self._last_delivery)
+                self._timer = threading.Timer(delay, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._cancel_timer()
+            self._deliver_pending()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._timer is threading.current_thread():
+                self._timer = None
+            self._deliver_pending()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _deliver_pending(self) -> None:
+        if self._pending is None:
+            return
+
+        event_type, args = self._pending
+        self._pending = None
+        self._last_delivery = self._clock()
+        self.delivered += 1
+        self.callback(event_type, *args)
@@ -249,7 +249,24 @@ def get_current_country_label() -> str:
     return get_current_country_config().label
 
 
+def get_cms_base_url_override() -> str | None:
+    value = (os.getenv("REGISTRY_CMS_BASE_URL") or "").strip()
+    if value:
+        return _clean_base_url(value)
+    return None
+
+
+def set_cms_base_url_override(base_url: str | None) -> None:
+    if base_url:
+        os.environ["REGISTRY_CMS_BASE_URL"] = _clean_base_url(base_url)
+    else:
+        os.environ.pop("REGISTRY_CMS_BASE_URL", None)
+
+
 def get_current_cms_base_url() -> str:
+    override = get_cms_base_url_override()
+    if override:
+        return override
     return get_current_country_config().cms_base_url
 
 
@@ -258,4 +275,6 @@ def get_current_database_name() -> str:
 
 
 def get_current_session_file() -> str:
+    if get_cms_base_url_override():
+        return f"session_{_current_country_code or 'default'}_override.pkl"
     return f"session_{_current_country_code or 'default'}.pkl"
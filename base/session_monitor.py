@@ -0,0 +1,200 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from . import get_logger
+from .runtime_config import get_current_session_file
+
+logger = get_logger(__name__)
+
+DEFAULT_KEEP_ALIVE_INTERVAL = 5 * 60
+MIN_KEEP_ALIVE_INTERVAL = 60
+EXPIRY_WARNING_SECONDS = 15 * 60
+
+
+@dataclass(frozen=True)
+class SessionHealth:
+    logged_in_at: float | None
+    last_activity_at: float | None
+    expired: bool
+    observed_idle_timeout: float | None
+    observed_lifetime: float | None
+    session_age: float | None
+    seconds_until_expiry: float | None
+
+    @property
+    def needs_login_soon(self) -> bool:
+        if self.expired:
+            return True
+        return (
+            self.seconds_until_expiry is not None
+            and self.seconds_until_expiry <= EXPIRY_WARNING_SECONDS
+        )
+
+    def describe(self) -> str | None:
+        if self.expired:
+            return "CMS session expired - the next request will need an interactive login"
+        if self.needs_login_soon and self.seconds_until_expiry is not None:
+            minutes = max(int(self.seconds_until_expiry // 60), 0)
+            return f"CMS session expected to expire in ~{minutes}m - interactive login will be needed"
+        return None
+
+
+class SessionMonitor:
+    def __init__(
+        self,
+        state_file: str | None = None,
+        *,
+        keep_alive_interval: float = DEFAULT_KEEP_ALIVE_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.state_file = state_file or f"{get_current_session_file()}.health.json"
+        self.configured_keep_alive_interval = keep_alive_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._keep_alive_thread: threading.Thread | None = None
+        self.logged_in_at: float | None = None
+        self.last_activity_at: float | None = None
+        self.expired = False
+        self.observed_idle_timeout: float | None = None
+        self.observed_lifetime: float | None = None
+        self._load_state()
+
+    @property
+    def keep_alive_interval(self) -> float:
+        interval = self.configured_keep_alive_interval
+        if self.observed_idle_timeout:
+            interval = min(interval, self.observed_idle_timeout / 2)
+        return max(interval, MIN_KEEP_ALIVE_INTERVAL)
+
+    def _load_state(self) -> None:
+        if not os.path.exists(self.state_file):
+            return
+
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read session health state: {str(e)}")
+            return
+
+        self.logged_in_at = state.get("logged_in_at")
+        self.observed_idle_timeout = state.get("observed_idle_timeout")
+        self.observed_lifetime = state.get("observed_lifetime")
+
+    def _save_state(self) -> None:
+        state = {
+            "logged_in_at": self.logged_in_at,
+            "observed_idle_timeout": self.observed_idle_timeout,
+            "observed_lifetime": self.observed_lifetime,
+        }
+        try:
+            with open(self.state_file, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except OSError as e:
+            logger.warning(f"Could not save session health state: {str(e)}")
+
+    def record_login(self) -> None:
+        with self._lock:
+            now = self._clock()
+            self.logged_in_at = now
+            self.last_activity_at = now
+            self.expired = False
+            self._save_state()
+
+    def record_activity(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if self.logged_in_at is None:
+                self.logged_in_at = now
+            self.last_activity_at = now
+            self.expired = False
+
+    def record_expiry(self) -> None:
+        with self._lock:
+            if self.expired:
+                return
+
+            now = self._clock()
+            idle = now - self.last_activity_at if self.last_activity_at else None
+            age = now - self.logged_in_at if self.logged_in_at else None
+
+            if idle is not None and idle >= self.keep_alive_interval:
+                self.observed_idle_timeout = _shortest(self.observed_idle_timeout, idle)
+                logger.info(f"Session expired after {int(idle)}s idle")
+            elif age is not None:
+                self.observed_lifetime = _shortest(self.observed_lifetime, age)
+                logger.info(f"Session expired {int(age)}s after login")
+
+            self.expired = True
+            self._save_state()
+
+    def needs_keep_alive(self) -> bool:
+        with self._lock:
+            if self.expired or self.last_activity_at is None:
+                return False
+            return self._clock() - self.last_activity_at >= self.keep_alive_interval
+
+    def get_health(self) -> SessionHealth:
+        with self._lock:
+            now = self._clock()
+            session_age = now - self.logged_in_at if self.logged_in_at else None
+            seconds_until_expiry = None
+            if session_age is not None and self.observed_lifetime:
+                seconds_until_expiry = self.observed_lifetime - session_age
+
+            return SessionHealth(
+                logged_in_at=self.logged_in_at,
+                last_activity_at=self.last_activity_at,
+                expired=self.expired,
+                observed_idle_timeout=self.observed_idle_timeout,
+                observed_lifetime=self.observed_lifetime,
+                session_age=session_age,
+                seconds_until_expiry=seconds_until_expiry,
+            )
+
+    def start_keep_alive(self, ping: Callable[[], bool]) -> threading.Thread:
+        if self._keep_alive_thread and self._keep_alive_thread.is_alive():
+            return self._keep_alive_thread
+
+        self._stop_event.clear()
+
+        def run():
+            while not self._stop_event.wait(
+                min(MIN_KEEP_ALIVE_INTERVAL, self.keep_alive_interval / 2)
+            ):
+                if not self.needs_keep_alive():
+                    continue
+                try:
+                    ping()
+                except Exception as e:
+                    logger.warning(f"Session keep-alive failed: {str(e)}")
+
+        self._keep_alive_thread = threading.Thread(target=run, daemon=True)
+        self._keep_alive_thread.start()
+        return self._keep_alive_thread
+
+    def stop_keep_alive(self) -> None:
+        self._stop_event.set()
+
+
+def _shortest(current: float | None, observed: float) -> float:
+    return observed if current is None else min(current, observed)
+
+
+_monitors: dict[str, SessionMonitor] = {}
+_monitors_lock = threading.Lock()
+
+
+def get_session_monitor() -> SessionMonitor:
+    session_file = get_current_session_file()
+    with _monitors_lock:
+        monitor = _monitors.get(session_file)
+        if monitor is None:
+            monitor = SessionMonitor(f"{session_file}.health.json")
+            _monitors[session_file] = monitor
+        return monitor
@@ -4,11 +4,17 @@ from typing import Deque, Tuple
 
 import wx
 
+from base.http_telemetry import get_http_telemetry
+from base.session_monitor import get_session_monitor
+from database.instrumentation import add_report_listener, is_sql_profiling_enabled
+
 
 class StatusBar(wx.Panel):
     RATE_SAMPLE_WINDOW = 50
     MIN_SAMPLES_FOR_ESTIMATE = 3
     RATE_UPDATE_INTERVAL = 0.5
+    SESSION_CHECK_INTERVAL_MS = 30000
+    HTTP_STATS_INTERVAL_MS = 2000
 
     def __init__(self, parent):
         super().__init__(parent)
@@ -21,6 +27,23 @@ class StatusBar(wx.Panel):
 
         sizer.AddStretchSpacer()
 
+        self.http_stats_text = wx.StaticText(self, label="")
+        self.http_stats_text.SetForegroundColour(wx.Colour(90, 90, 90))
+        self.http_stats_text.Hide()
+        sizer.Add(self.http_stats_text, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 15)
+
+        self.sql_profile_text = wx.StaticText(self, label="")
+        self.sql_profile_text.SetForegroundColour(wx.Colour(90, 90, 90))
+        self.sql_profile_text.Hide()
+        sizer.Add(self.sql_profile_text, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 15)
+
+        self.session_warning_text = wx.StaticText(self, label="")
+        self.session_warning_text.SetForegroundColour(wx.Colour(200, 100, 0))
+        self.session_warning_text.Hide()
+        sizer.Add(
+            self.session_warning_text, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 15
+        )
+
         self.time_remaining_text = wx.StaticText(self, label="")
         self.time_remaining_text.Hide()
         sizer.Add(self.time_remaining_text, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
@@ -38,6 +61,21 @@ class StatusBar(wx.Panel):
 
         self._reset_progress_state()
 
+        self.session_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_session_timer, self.session_timer)
+        self.session_timer.Start(self.SESSION_CHECK_INTERVAL_MS)
+
+        self.http_stats_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_http_stats_timer, self.http_stats_timer)
+        self.http_stats_timer.Start(self.HTTP_STATS_INTERVAL_MS)
+
+        self._remove_sql_listener = None
+        if is_sql_profiling_enabled():
+            self._remove_sql_listener = add_report_listener(
+                lambda profile: self.show_sql_profile(profile.summary())
+            )
+            self.Bind(wx.EVT_WINDOW_DESTROY, self._on_destroy)
+
     def _reset_progress_state(self):
         self.start_time: float | None = None
         self.last_current = 0
@@ -158,5 +196,56 @@ class StatusBar(wx.Panel):
         self.percentage_text.Hide()
         self.time_remaining_text.Hide()
         self._reset_progress_state()
-        self.Hide()
+        if not self.session_warning_text.IsShown():
+            self.Hide()
+        self.GetParent().Layout()
+
+    def show_session_warning(self, message: str | None):
+        wx.CallAfter(self._show_session_warning_impl, message)
+
+    def _show_session_warning_impl(self, message: str | None):
+        if message:
+            self.session_warning_text.SetLabel(message)
+            self.session_warning_text.Show()
+            self.Show()
+        else:
+            self.session_warning_text.SetLabel("")
+            self.session_warning_text.Hide()
+            if not self.message_text.GetLabel():
+                self.Hide()
+        self.GetParent().Layout()
+
+    def _on_session_timer(self, event):
+        message = get_session_monitor().get_health().describe()
+        if message != (self.session_warning_text.GetLabel() or None):
+            self._show_session_warning_impl(message)
+
+    def _on_http_stats_timer(self, event):
+        message = get_http_telemetry().describe()
+        if message == (self.http_stats_text.GetLabel() or None):
+            return
+        if message:
+            self.http_stats_text.SetLabel(message)
+            self.http_stats_text.Show()
+        else:
+            self.http_stats_text.SetLabel("")
+            self.http_stats_text.Hide()
+        if self.IsShown():
+            self.GetParent().Layout()
+
+    def show_sql_profile(self, message: str):
+        wx.CallAfter(self._show_sql_profile_impl, message)
+
+    def _show_sql_profile_impl(self, message: str):
+        if not self:
+            return
+        self.sql_profile_text.SetLabel(f"SQL {message}")
+        self.sql_profile_text.Show()
+        self.Show()
         self.GetParent().Layout()
+
+    def _on_destroy(self, event):
+        if event.GetEventObject() is self and self._remove_sql_listener:
+            self._remove_sql_listener()
+            self._remove_sql_listener = None
+        event.Skip()
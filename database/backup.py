@@ -4,6 +4,7 @@ import argparse
 import os
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -12,17 +13,36 @@ from sqlalchemy.engine.url import make_url
 
 from database.connection import get_database_env_label, get_database_url
 
+BACKUP_FORMATS = ("custom", "directory")
+BACKUP_SUFFIXES = {"custom": ".dump", "directory": ".dir"}
+MAX_COMPRESSION_LEVEL = 9
+
 
 @dataclass(slots=True)
 class BackupResult:
     environment: str
     database_name: str
     output_path: Path
+    backup_format: str = "custom"
+    jobs: int = 1
+    seconds: float = 0.0
+    size_bytes: int = 0
 
 
-def get_default_output_path(database_name: str) -> Path:
+def get_default_output_path(database_name: str, backup_format: str = "custom") -> Path:
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    return Path("backup_db") / f"{database_name}-{timestamp}.dump"
+    suffix = BACKUP_SUFFIXES[backup_format]
+    return Path("backup_db") / f"{database_name}-{timestamp}{suffix}"
+
+
+def get_backup_size(path: Path) -> int:
+    if path.is_dir():
+        return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
+def format_size(size_bytes: int) -> str:
+    return f"{size_bytes / (1024 * 1024):,.1f} MB"
 
 
 def get_pg_dump_path() -> str:
@@ -44,7 +64,40 @@ def get_pg_dump_url() -> tuple[str, str | None]:
     return dump_url.render_as_string(hide_password=False), database_url.password
 
 
-def create_database_dump(output_path: str | None = None) -> BackupResult:
+def build_dump_command(
+    target_path: Path,
+    dump_url: str,
+    backup_format: str = "custom",
+    jobs: int = 1,
+    compress: int | None = None,
+) -> list[str]:
+    if backup_format not in BACKUP_FORMATS:
+        raise ValueError(f"Backup format must be one of: {', '.join(BACKUP_FORMATS)}")
+    if jobs < 1:
+        raise ValueError("Backup jobs must be at least 1")
+    if jobs > 1 and backup_format != "directory":
+        raise ValueError("Parallel backups require the directory format")
+    if compress is not None and not 0 <= compress <= MAX_COMPRESSION_LEVEL:
+        raise ValueError(
+            f"Compression level must be between 0 and {MAX_COMPRESSION_LEVEL}"
+        )
+
+    command = [get_pg_dump_path(), f"--format={backup_format}"]
+    if jobs > 1:
+        command.extend(["--jobs", str(jobs)])
+    if compress is not None:
+        command.extend(["--compress", str(compress)])
+    command.extend(["--file", str(target_path), "--dbname", dump_url])
+    return command
+
+
+def create_database_dump(
+    output_path: str | None = None,
+    *,
+    backup_format: str = "custom",
+    jobs: int = 1,
+    compress: int | None = None,
+) -> BackupResult:
     database_url = make_url(get_database_url())
     database_name = database_url.database
 
@@ -54,39 +107,46 @@ def create_database_dump(output_path: str | None = None) -> BackupResult:
     target_path = (
         Path(output_path).expanduser()
         if output_path
-        else get_default_output_path(database_name)
+        else get_default_output_path(database_name, backup_format)
     )
+    if backup_format == "directory" and target_path.exists():
+        raise FileExistsError(f"Backup directory already exists: {target_path}")
     target_path.parent.mkdir(parents=True, exist_ok=True)
 
     dump_url, password = get_pg_dump_url()
+    command = build_dump_command(
+        target_path,
+        dump_url,
+        backup_format=backup_format,
+        jobs=jobs,
+        compress=compress,
+    )
     env = os.environ.copy()
 
     if password:
         env["PGPASSWORD"] = password
 
-    subprocess.run(
-        [
-            get_pg_dump_path(),
-            "--format=custom",
-            "--file",
-            str(target_path),
-            "--dbname",
-            dump_url,
-        ],
-        check=True,
-        env=env,
-    )
+    started = time.perf_counter()
+    subprocess.run(command, check=True, env=env)
+    elapsed = time.perf_counter() - started
 
     return BackupResult(
         environment=get_database_env_label(),
         database_name=database_name,
         output_path=target_path.resolve(),
+        backup_format=backup_format,
+        jobs=jobs,
+        seconds=elapsed,
+        size_bytes=get_backup_size(target_path),
     )
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("--output")
+    parser.add_argument("--format", choices=BACKUP_FORMATS, default="custom")
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--compress", type=int)
     return parser
 
 
@@ -94,7 +154,12 @@ def main() -> None:
     args = build_parser().parse_args()
 
     try:
-        result = create_database_dump(output_path=args.output)
+        result = create_database_dump(
+            output_path=args.output,
+            backup_format=args.format,
+            jobs=args.jobs,
+            compress=args.compress,
+        )
     except Exception as exc:
         print(f"Database backup failed: {exc}")
         raise SystemExit(1) from exc
@@ -102,6 +167,9 @@ def main() -> None:
     print(f"Environment: {result.environment}")
     print(f"Database: {result.database_name}")
     print(f"Backup: {result.output_path}")
+    print(f"Format: {result.backup_format} ({result.jobs} job(s))")
+    print(f"Duration: {result.seconds:.1f}s")
+    print(f"Size: {format_size(result.size_bytes)}")
 
 
 if __name__ == "__main__":
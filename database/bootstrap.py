@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from sqlalchemy import text
+from sqlalchemy import MetaData, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from base import get_logger
 
 from base.runtime_config import (
     CountryConfig,
@@ -22,12 +28,32 @@ from database.connection import (
 )
 from database.models import Base
 
+logger = get_logger(__name__)
+
+SCHEMA_VERSION_TABLE = "registry_schema_version"
+
 
 @dataclass(slots=True)
 class BootstrapResult:
     environment: str
     database_name: str
     database_created: bool
+    schema_updated: bool = True
+
+
+@dataclass(slots=True)
+class SchemaStatus:
+    database_name: str
+    database_exists: bool
+    stored_fingerprint: str | None
+    expected_fingerprint: str
+
+    @property
+    def is_current(self) -> bool:
+        return (
+            self.database_exists
+            and self.stored_fingerprint == self.expected_fingerprint
+        )
 
 
 def parse_country_selection(
@@ -99,6 +125,55 @@ def ensure_database_exists(target_url: URL, admin_database: str = "postgres") ->
         engine.dispose()
 
 
+def get_schema_fingerprint(metadata: MetaData | None = None) -> str:
+    resolved: MetaData = metadata if metadata is not None else Base.metadata
+    dialect = postgresql.dialect()
+    digest = hashlib.sha256()
+
+    for table in resolved.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda item: item.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+
+    return digest.hexdigest()
+
+
+def read_schema_fingerprint(engine: Engine) -> str | None:
+    with engine.connect() as conn:
+        try:
+            return conn.execute(
+                text(f"SELECT fingerprint FROM {SCHEMA_VERSION_TABLE} WHERE id = 1")
+            ).scalar()
+        except ProgrammingError:
+            return None
+
+
+def stamp_schema_fingerprint(engine: Engine, fingerprint: str) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+                    id INTEGER PRIMARY KEY,
+                    fingerprint VARCHAR(64) NOT NULL,
+                    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                f"""
+                INSERT INTO {SCHEMA_VERSION_TABLE} (id, fingerprint, updated_at)
+                VALUES (1, :fingerprint, NOW())
+                ON CONFLICT (id) DO UPDATE
+                SET fingerprint = EXCLUDED.fingerprint, updated_at = NOW()
+                """
+            ),
+            {"fingerprint": fingerprint},
+        )
+
+
 def ensure_database_schema(engine: Engine) -> None:
     with engine.begin() as conn:
         conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
@@ -140,6 +215,43 @@ def ensure_database_schema(engine: Engine) -> None:
         )
 
     Base.metadata.create_all(engine)
+    stamp_schema_fingerprint(engine, get_schema_fingerprint())
+
+
+def check_database_schema(country_code: str | None = None) -> SchemaStatus:
+    if country_code:
+        configure_database_urls_for_country(country_code)
+
+    target_url = make_url(get_database_url())
+    database_name = target_url.database
+
+    if not database_name:
+        raise ValueError("Database URL must include a database name")
+
+    expected_fingerprint = get_schema_fingerprint()
+    engine = create_database_engine(target_url)
+
+    try:
+        stored_fingerprint = read_schema_fingerprint(engine)
+        database_exists = True
+    except OperationalError as exc:
+        logger.info(f"Could not read schema version for {database_name}: {exc}")
+        stored_fingerprint = None
+        database_exists = False
+    finally:
+        engine.dispose()
+
+    return SchemaStatus(
+        database_name=database_name,
+        database_exists=database_exists,
+        stored_fingerprint=stored_fingerprint,
+        expected_fingerprint=expected_fingerprint,
+    )
+
+
+def check_current_database_schema() -> SchemaStatus:
+    country_code = get_current_country_code() or None
+    return check_database_schema(country_code=country_code)
 
 
 def bootstrap_database(
@@ -0,0 +1,63 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from database.bootstrap import quote_identifier
+
+COPY_CHUNK_ROWS = 2000
+COPY_BUFFER_SIZE = 1 << 20
+
+
+def _copy_value(value: object) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class CopyStream:
+    def __init__(self, rows: Iterable[tuple]):
+        self._rows = iter(rows)
+        self._buffer = ""
+        self.rows = 0
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            chunk = []
+            for row in self._rows:
+                chunk.append("\t".join(_copy_value(value) for value in row))
+                if len(chunk) >= COPY_CHUNK_ROWS:
+                    break
+            if not chunk:
+                break
+            self.rows += len(chunk)
+            self._buffer += "\n".join(chunk) + "\n"
+
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
+
+
+def copy_rows(
+    cursor, table_name: str, columns: Iterable[str], rows: Iterable[tuple]
+) -> int:
+    column_list = ", ".join(quote_identifier(column) for column in columns)
+    stream = CopyStream(rows)
+    cursor.copy_expert(
+        f"COPY {quote_identifier(table_name)} ({column_list}) FROM STDIN",
+        stream,
+        size=COPY_BUFFER_SIZE,
+    )
+    return stream.rows
@@ -10,6 +10,7 @@ from base.runtime_config import (
     get_current_database_name,
     set_current_country,
 )
+from database.instrumentation import instrument_engine, is_sql_profiling_enabled
 
 DATABASE_ENV: str = "local"
 DESKTOP_ENV: str = os.getenv("DESKTOP_ENV", "prod")
@@ -68,6 +69,14 @@ def configure_database_urls_for_country(country_code: str | None = None) -> None
     DATABASE_REMOTE_URL = None
 
 
+def use_database_url(database_url: str) -> None:
+    global DATABASE_ENV, DATABASE_LOCAL_URL, DATABASE_REMOTE_URL
+
+    DATABASE_ENV = "local"
+    DATABASE_LOCAL_URL = database_url
+    DATABASE_REMOTE_URL = None
+
+
 def is_remote_database() -> bool:
     if DATABASE_REMOTE_URL and not DATABASE_LOCAL_URL:
         return True
@@ -100,12 +109,15 @@ def get_database_url() -> str:
 
 
 def create_database_engine(database_url: str | URL) -> Engine:
-    return create_engine(
+    engine = create_engine(
         database_url,
         echo=False,
         pool_pre_ping=True,
         poolclass=NullPool,
     )
+    if is_sql_profiling_enabled():
+        instrument_engine(engine)
+    return engine
 
 
 def get_engine() -> Engine:
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from base import get_logger
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+REPEATED_STATEMENT_THRESHOLD = 5
+STATEMENT_PREVIEW_LENGTH = 160
+
+ReportListener = Callable[["OperationProfile"], None]
+
+_active_profiles: ContextVar[tuple[OperationProfile, ...]] = ContextVar(
+    "sql_profiles", default=()
+)
+_report_listeners: list[ReportListener] = []
+_method_totals: dict[str, MethodTotals] = {}
+_method_totals_lock = threading.Lock()
+_settings_lock = threading.Lock()
+_enabled: bool | None = None
+_report_path: str | None = None
+
+
+@dataclass
+class QueryRecord:
+    statement: str
+    duration: float
+
+
+@dataclass
+class MethodTotals:
+    queries: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class OperationProfile:
+    name: str
+    queries: list[QueryRecord] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def query_count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def query_seconds(self) -> float:
+        return sum(query.duration for query in self.queries)
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def record(self, statement: str, duration: float) -> None:
+        with self._lock:
+            self.queries.append(QueryRecord(statement, duration))
+
+    def repeated_statements(
+        self, threshold: int = REPEATED_STATEMENT_THRESHOLD
+    ) -> list[tuple[str, int, float]]:
+        counts = Counter(query.statement for query in self.queries)
+        seconds: dict[str, float] = {}
+        for query in self.queries:
+            seconds[query.statement] = seconds.get(query.statement, 0.0) + (
+                query.duration
+            )
+        return [
+            (statement, count, seconds[statement])
+            for statement, count in counts.most_common()
+            if count >= threshold
+        ]
+
+    def summary(self) -> str:
+        repeated = self.repeated_statements()
+        text = (
+            f"{self.name}: {self.query_count} queries, "
+            f"{self.query_seconds:.3f}s in SQL of {self.elapsed:.3f}s"
+        )
+        if repeated:
+            text += f", {len(repeated)} repeated statement(s)"
+        return text
+
+    def format_report(self) -> str:
+        lines = [f"SQL profile - {self.summary()}"]
+        for statement, count, seconds in self.repeated_statements():
+            lines.append(f"  repeated {count}x ({seconds:.3f}s): {_preview(statement)}")
+        return "\n".join(lines)
+
+
+def _preview(statement: str) -> str:
+    text = " ".join(statement.split())
+    if len(text) > STATEMENT_PREVIEW_LENGTH:
+        return f"{text[:STATEMENT_PREVIEW_LENGTH]}..."
+    return text
+
+
+def _load_settings() -> None:
+    global _enabled, _report_path
+
+    value = os.getenv("REGISTRY_SQL_PROFILE", "").strip()
+    if value.lower() in {"", "0", "false", "no", "off"}:
+        _enabled = False
+        _report_path = None
+    elif value.lower() in {"1", "true", "yes", "on"}:
+        _enabled = True
+        _report_path = None
+    else:
+        _enabled = True
+        _report_path = value
+
+
+def is_sql_profiling_enabled() -> bool:
+    if _enabled is None:
+        with _settings_lock:
+            if _enabled is None:
+                _load_settings()
+    return bool(_enabled)
+
+
+def configure_sql_profiling(enabled: bool, report_path: str | None = None) -> None:
+    global _enabled, _report_path
+
+    with _settings_lock:
+        _enabled = enabled
+        _report_path = report_path
+
+
+def add_report_listener(listener: ReportListener) -> Callable[[], None]:
+    _report_listeners.append(listener)
+
+    def remove():
+        if listener in _report_listeners:
+            _report_listeners.remove(listener)
+
+    return remove
+
+
+def _caller_method_name() -> str:
+    frame = sys._getframe(2)
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if owner is not None and type(owner).__name__.endswith("Repository"):
+            return f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<unattributed>"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("registry_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("registry_query_started")
+    if not started:
+        return
+    duration = time.perf_counter() - started.pop()
+
+    profiles = _active_profiles.get()
+    if profiles:
+        for profile in profiles:
+            profile.record(statement, duration)
+        return
+
+    if not is_sql_profiling_enabled():
+        return
+
+    name = _caller_method_name()
+    with _method_totals_lock:
+        totals = _method_totals.setdefault(name, MethodTotals())
+        totals.queries += 1
+        totals.seconds += duration
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+def _publish(profile: OperationProfile) -> None:
+    report = profile.format_report()
+    if profile.repeated_statements():
+        logger.warning(report)
+    else:
+        logger.info(report)
+
+    if _report_path:
+        _append_report(report)
+
+    for listener in list(_report_listeners):
+        try:
+            listener(profile)
+        except Exception as e:
+            logger.error(f"SQL profile listener failed: {str(e)}")
+
+
+def _append_report(report: str) -> None:
+    try:
+        with open(_report_path or "", "a", encoding="utf-8") as f:
+            f.write(f"[{datetime.now().isoformat(timespec='seconds')}] {report}\n")
+    except OSError as e:
+        logger.warning(f"Could not write SQL profile report: {str(e)}")
+
+
+@contextmanager
+def profile_operation(name: str, *, report: bool = True) -> Iterator[OperationProfile]:
+    profile = OperationProfile(name)
+    token = _active_profiles.set((*_active_profiles.get(), profile))
+    try:
+        yield profile
+    finally:
+        _active_profiles.reset(token)
+        profile.finished_at = time.perf_counter()
+        if report and is_sql_profiling_enabled():
+            _publish(profile)
+
+
+def profiled(name: str | None = None) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        operation_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_sql_profiling_enabled():
+                return func(*args, **kwargs)
+            with profile_operation(operation_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def max_queries(
+    engine: Engine, limit: int, *, name: str = "max_queries"
+) -> Iterator[OperationProfile]:
+    instrument_engine(engine)
+    with profile_operation(name, report=False) as profile:
+        yield profile
+
+    if profile.query_count > limit:
+        raise AssertionError(
+            f"Expected at most {limit} queries but {profile.query_count} ran\n"
+            f"{profile.format_report()}"
+        )
+
+
+def get_method_totals() -> dict[str, MethodTotals]:
+    with _method_totals_lock:
+        return {
+            name: MethodTotals(totals.queries, totals.seconds)
+            for name, totals in _method_totals.items()
+        }
+
+
+def format_method_totals() -> str:
+    totals = sorted(
+        get_method_totals().items(),
+        key=lambda item: item[1].seconds,
+        reverse=True,
+    )
+    lines = ["SQL totals by repository method"]
+    for name, method_totals in totals:
+        lines.append(
+            f"  {name}: {method_totals.queries} queries, {method_totals.seconds:.3f}s"
+        )
+    return "\n".join(lines)
+
+
+def _report_method_totals() -> None:
+    if not is_sql_profiling_enabled() or not _method_totals:
+        return
+    report = format_method_totals()
+    logger.info(report)
+    if _report_path:
+        _append_report(report)
+
+
+atexit.register(_report_method_totals)
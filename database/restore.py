@@ -4,15 +4,22 @@ import argparse
 import os
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
 from sqlalchemy.engine.url import make_url
 
+from database.backup import format_size, get_backup_size
 from database.connection import get_database_env_label, get_database_url
 
 CUSTOM_BACKUP_SUFFIXES = {".dump", ".backup"}
 SUPPORTED_BACKUP_SUFFIXES = CUSTOM_BACKUP_SUFFIXES | {".sql"}
+DIRECTORY_BACKUP_MARKER = "toc.dat"
+UNSUPPORTED_BACKUP_MESSAGE = (
+    "Backup must be a directory-format backup or use one of these extensions: "
+    ".dump, .backup, .sql"
+)
 
 
 @dataclass(slots=True)
@@ -20,12 +27,23 @@ class RestoreResult:
     environment: str
     database_name: str
     input_path: Path
+    jobs: int = 1
+    seconds: float = 0.0
+    size_bytes: int = 0
 
 
 def get_default_backup_dir() -> Path:
     return Path("backup_db")
 
 
+def is_directory_backup(path: Path) -> bool:
+    return path.is_dir() and (path / DIRECTORY_BACKUP_MARKER).is_file()
+
+
+def is_pg_restore_backup(path: Path) -> bool:
+    return path.suffix.lower() in CUSTOM_BACKUP_SUFFIXES or is_directory_backup(path)
+
+
 def list_backups(backup_dir: str | Path | None = None) -> list[Path]:
     target_dir = (
         Path(backup_dir).expanduser()
@@ -39,7 +57,8 @@ def list_backups(backup_dir: str | Path | None = None) -> list[Path]:
     backups = [
         path
         for path in target_dir.iterdir()
-        if path.is_file() and path.suffix.lower() in SUPPORTED_BACKUP_SUFFIXES
+        if (path.is_file() and path.suffix.lower() in SUPPORTED_BACKUP_SUFFIXES)
+        or is_directory_backup(path)
     ]
     return sorted(
         backups,
@@ -54,11 +73,9 @@ def get_latest_backup_path(backup_dir: str | Path | None = None) -> Path:
     if not backups:
         raise FileNotFoundError("No backup files were found in backup_db")
 
-    custom_backups = [
-        path for path in backups if path.suffix.lower() in CUSTOM_BACKUP_SUFFIXES
-    ]
+    pg_restore_backups = [path for path in backups if is_pg_restore_backup(path)]
 
-    selected = custom_backups[0] if custom_backups else backups[0]
+    selected = pg_restore_backups[0] if pg_restore_backups else backups[0]
     return selected.resolve()
 
 
@@ -70,12 +87,14 @@ def resolve_input_path(
         return get_latest_backup_path(backup_dir)
 
     selected = Path(input_path).expanduser()
-    if not selected.exists() or not selected.is_file():
+    if not selected.exists():
         raise FileNotFoundError(f"Backup file was not found: {selected}")
-    if selected.suffix.lower() not in SUPPORTED_BACKUP_SUFFIXES:
-        raise ValueError(
-            "Backup file must use one of these extensions: .dump, .backup, .sql"
-        )
+    if is_directory_backup(selected):
+        return selected.resolve()
+    if not selected.is_file() or (
+        selected.suffix.lower() not in SUPPORTED_BACKUP_SUFFIXES
+    ):
+        raise ValueError(UNSUPPORTED_BACKUP_MESSAGE)
     return selected.resolve()
 
 
@@ -109,20 +128,28 @@ def get_restore_url() -> tuple[str, str | None, str]:
     )
 
 
-def build_restore_command(input_path: Path, restore_url: str) -> list[str]:
-    if input_path.suffix.lower() in CUSTOM_BACKUP_SUFFIXES:
-        return [
+def build_restore_command(
+    input_path: Path, restore_url: str, jobs: int = 1
+) -> list[str]:
+    if jobs < 1:
+        raise ValueError("Restore jobs must be at least 1")
+
+    if is_pg_restore_backup(input_path):
+        command = [
             get_pg_restore_path(),
             "--clean",
             "--if-exists",
             "--no-owner",
             "--no-privileges",
-            "--dbname",
-            restore_url,
-            str(input_path),
         ]
+        if jobs > 1:
+            command.extend(["--jobs", str(jobs)])
+        command.extend(["--dbname", restore_url, str(input_path)])
+        return command
 
     if input_path.suffix.lower() == ".sql":
+        if jobs > 1:
+            raise ValueError("Parallel restores require a custom or directory backup")
         return [
             get_psql_path(),
             "--set",
@@ -133,9 +160,7 @@ def build_restore_command(input_path: Path, restore_url: str) -> list[str]:
             str(input_path),
         ]
 
-    raise ValueError(
-        "Backup file must use one of these extensions: .dump, .backup, .sql"
-    )
+    raise ValueError(UNSUPPORTED_BACKUP_MESSAGE)
 
 
 def confirm_restore(
@@ -155,24 +180,27 @@ def confirm_restore(
 def restore_database(
     input_path: str | Path | None = None,
     backup_dir: str | Path | None = None,
+    jobs: int = 1,
 ) -> RestoreResult:
     selected_input = resolve_input_path(input_path=input_path, backup_dir=backup_dir)
     restore_url, password, database_name = get_restore_url()
+    command = build_restore_command(selected_input, restore_url, jobs=jobs)
     env = os.environ.copy()
 
     if password:
         env["PGPASSWORD"] = password
 
-    subprocess.run(
-        build_restore_command(selected_input, restore_url),
-        check=True,
-        env=env,
-    )
+    started = time.perf_counter()
+    subprocess.run(command, check=True, env=env)
+    elapsed = time.perf_counter() - started
 
     return RestoreResult(
         environment=get_database_env_label(),
         database_name=database_name,
         input_path=selected_input,
+        jobs=jobs,
+        seconds=elapsed,
+        size_bytes=get_backup_size(selected_input),
     )
 
 
@@ -180,6 +208,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("--input")
     parser.add_argument("--backup-dir")
+    parser.add_argument("--jobs", type=int, default=1)
     parser.add_argument("--yes", action="store_true")
     parser.add_argument("--print-input", action="store_true")
     return parser
@@ -211,6 +240,7 @@ def main() -> None:
         result = restore_database(
             input_path=selected_input,
             backup_dir=args.backup_dir,
+            jobs=args.jobs,
         )
     except Exception as exc:
         print(f"Database restore failed: {exc}")
@@ -219,6 +249,9 @@ def main() -> None:
     print(f"Environment: {result.environment}")
     print(f"Database: {result.database_name}")
     print(f"Restored from: {result.input_path}")
+    print(f"Jobs: {result.jobs}")
+    print(f"Duration: {result.seconds:.1f}s")
+    print(f"Size: {format_size(result.size_bytes)}")
 
 
 if __name__ == "__main__":
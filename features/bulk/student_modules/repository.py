@@ -21,6 +21,12 @@ from database import (
     StudentSemester,
     get_engine,
 )
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    TERMS,
+    reference_data,
+)
 
 logger = get_logger(__name__)
 
@@ -52,6 +58,9 @@ class BulkStudentModulesRepository:
             yield session
 
     def list_active_schools(self):
+        return reference_data.get(SCHOOLS, self._load_active_schools)
+
+    def _load_active_schools(self):
         with self._session() as session:
             return (
                 session.query(School.cms_id.label("cms_id"), School.name)
@@ -62,6 +71,11 @@ class BulkStudentModulesRepository:
             )
 
     def list_programs(self, school_cms_id: Optional[int] = None):
+        return reference_data.get(
+            PROGRAMS, lambda: self._load_programs(school_cms_id), school_cms_id or None
+        )
+
+    def _load_programs(self, school_cms_id: Optional[int]):
         with self._session() as session:
             query = session.query(Program.cms_id.label("cms_id"), Program.name).filter(
                 Program.cms_id.isnot(None)
@@ -119,6 +133,14 @@ class BulkStudentModulesRepository:
             return [r[0] for r in results]
 
     def list_terms(self, structure_cms_id: int):
+        return reference_data.get(
+            TERMS,
+            lambda: self._load_terms(structure_cms_id),
+            "structure",
+            structure_cms_id,
+        )
+
+    def _load_terms(self, structure_cms_id: int):
         with self._session() as session:
             results = (
                 session.query(StudentSemester.term_code)
@@ -2,6 +2,8 @@ import threading
 
 import wx
 
+from base.progress import ProgressChannel
+from features.common.reference_data import SCHOOLS, reference_data
 from features.sync.students.repository import StudentRepository
 from features.sync.students.service import StudentSyncService
 from utils.formatters import format_semester
@@ -156,7 +158,7 @@ class BulkUpdateWorker(threading.Thread):
         self.student_modules = student_modules
         self.update_data = update_data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -272,6 +274,7 @@ class StudentModulesView(wx.Panel):
 
         self.init_ui()
         self.load_filter_options()
+        reference_data.subscribe(self.on_reference_data_changed)
 
     def init_ui(self):
         main_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -441,6 +444,10 @@ class StudentModulesView(wx.Panel):
         )
         self.filter_worker.start()
 
+    def on_reference_data_changed(self, categories):
+        if categories & {SCHOOLS}:
+            wx.CallAfter(self.load_filter_options)
+
     def on_filter_callback(self, event_type, *args):
         wx.CallAfter(self._handle_filter_event, event_type, *args)
 
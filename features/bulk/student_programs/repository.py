@@ -9,6 +9,12 @@ from sqlalchemy.orm import Session
 
 from base import get_logger
 from database import Program, School, Structure, Student, StudentProgram, get_engine
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    TERMS,
+    reference_data,
+)
 
 logger = get_logger(__name__)
 
@@ -51,6 +57,9 @@ class BulkStudentProgramsRepository:
             yield session
 
     def list_active_schools(self):
+        return reference_data.get(SCHOOLS, self._load_active_schools)
+
+    def _load_active_schools(self):
         with self._session() as session:
             return (
                 session.query(School.cms_id.label("cms_id"), School.name)
@@ -61,6 +70,14 @@ class BulkStudentProgramsRepository:
             )
 
     def list_programs(self, school_id: Optional[int] = None):
+        return reference_data.get(
+            PROGRAMS,
+            lambda: self._load_programs(school_id),
+            "with_code",
+            school_id or None,
+        )
+
+    def _load_programs(self, school_id: Optional[int]):
         with self._session() as session:
             query = session.query(
                 Program.cms_id.label("cms_id"), Program.name, Program.code
@@ -72,6 +89,14 @@ class BulkStudentProgramsRepository:
             return query.order_by(Program.name).all()
 
     def list_terms_for_program(self, program_id: int):
+        return reference_data.get(
+            TERMS,
+            lambda: self._load_terms_for_program(program_id),
+            "program_start",
+            program_id,
+        )
+
+    def _load_terms_for_program(self, program_id: int):
         with self._session() as session:
             results = (
                 session.query(StudentProgram.start_term)
@@ -260,6 +285,39 @@ class BulkStudentProgramsRepository:
                 )
                 return False, str(e)
 
+    def update_student_program_structures(
+        self, student_program_ids: list[int], new_structure_id: int
+    ) -> tuple[bool, str]:
+        if not student_program_ids:
+            return True, "No student programs to update"
+
+        with self._session() as session:
+            try:
+                updated = (
+                    session.query(StudentProgram)
+                    .filter(StudentProgram.id.in_(student_program_ids))
+                    .update(
+                        {StudentProgram.structure_id: new_structure_id},
+                        synchronize_session=False,
+                    )
+                )
+                session.commit()
+
+                logger.info(
+                    f"Updated {updated} student program(s) "
+                    f"structure to {new_structure_id}"
+                )
+                return True, f"Updated {updated} student program(s)"
+
+            except Exception as e:
+                session.rollback()
+                logger.error(
+                    f"Error updating student program structures - "
+                    f"student_program_ids={student_program_ids}, "
+                    f"new_structure_id={new_structure_id}, error={str(e)}"
+                )
+                return False, str(e)
+
     def get_cms_student_program_id(self, student_program_id: int) -> Optional[int]:
         with self._session() as session:
             result = (
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Callable, Optional
 
 from bs4 import BeautifulSoup, Tag
@@ -7,6 +8,7 @@ from bs4 import BeautifulSoup, Tag
 from base import get_logger
 from base.browser import BASE_URL, Browser, get_form_payload
 from features.common.cms_utils import post_cms_form
+from features.common.concurrency import run_concurrently
 
 from .repository import (
     BulkStudentProgramsRepository,
@@ -17,6 +19,12 @@ from .repository import (
 logger = get_logger(__name__)
 
 
+@dataclass
+class BulkStructureUpdateResult:
+    updated: list[StudentProgramRow] = field(default_factory=list)
+    failed: list[tuple[StudentProgramRow, str]] = field(default_factory=list)
+
+
 class StudentProgramService:
     def __init__(
         self, repository: Optional[BulkStudentProgramsRepository] = None
@@ -29,6 +37,112 @@ class StudentProgramService:
         student_program: StudentProgramRow,
         new_structure: StructureOption,
         progress_callback: Callable[[str], None],
+    ) -> tuple[bool, str]:
+        cms_success, cms_message = self.push_student_program_structure(
+            student_program, new_structure, progress_callback
+        )
+        if not cms_success:
+            return False, cms_message
+
+        progress_callback(f"Saving {student_program.std_no} to database...")
+
+        db_success, db_message = self._repository.update_student_program_structure(
+            student_program.student_program_db_id,
+            new_structure.db_id,
+        )
+
+        if db_success:
+            return True, "Structure updated successfully"
+        return (
+            False,
+            f"CMS update succeeded but database update failed: {db_message}",
+        )
+
+    def bulk_update_student_program_structures(
+        self,
+        student_programs: list[StudentProgramRow],
+        new_structure: StructureOption,
+        progress_callback: Callable[[str, int, int], None],
+        *,
+        max_workers: int = 5,
+        max_attempts: int = 2,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> BulkStructureUpdateResult:
+        result = BulkStructureUpdateResult()
+        failed_count = 0
+
+        def push(student_program: StudentProgramRow) -> tuple[bool, str]:
+            return self.push_student_program_structure(
+                student_program, new_structure, lambda _message: None
+            )
+
+        def on_item_done(item_result, completed: int, total: int):
+            nonlocal failed_count
+            if not item_result.success:
+                failed_count += 1
+            progress_callback(
+                f"Updated {completed}/{total} in CMS "
+                f"({failed_count} failed): {item_result.item.std_no}",
+                completed,
+                total,
+            )
+
+        item_results = run_concurrently(
+            student_programs,
+            push,
+            max_workers=max_workers,
+            max_attempts=max_attempts,
+            should_stop=should_stop,
+            on_item_done=on_item_done,
+        )
+
+        pushed: list[StudentProgramRow] = []
+        for item_result in item_results:
+            if item_result.success:
+                pushed.append(item_result.item)
+            else:
+                result.failed.append((item_result.item, item_result.message))
+
+        if pushed:
+            total = len(student_programs)
+            progress_callback(
+                f"Saving {len(pushed)} structure update(s) to database...",
+                total,
+                total,
+            )
+            db_success, db_message = (
+                self._repository.update_student_program_structures(
+                    [
+                        student_program.student_program_db_id
+                        for student_program in pushed
+                    ],
+                    new_structure.db_id,
+                )
+            )
+            if db_success:
+                result.updated.extend(pushed)
+            else:
+                result.failed.extend(
+                    (
+                        student_program,
+                        f"CMS update succeeded but database update failed: {db_message}",
+                    )
+                    for student_program in pushed
+                )
+
+        order = {
+            student_program.student_program_db_id: index
+            for index, student_program in enumerate(student_programs)
+        }
+        result.updated.sort(key=lambda row: order[row.student_program_db_id])
+        result.failed.sort(key=lambda entry: order[entry[0].student_program_db_id])
+        return result
+
+    def push_student_program_structure(
+        self,
+        student_program: StudentProgramRow,
+        new_structure: StructureOption,
+        progress_callback: Callable[[str], None],
     ) -> tuple[bool, str]:
         cms_program_id = student_program.student_program_cms_id
 
@@ -68,27 +182,7 @@ class StudentProgramService:
                 f"Pushing structure update for {student_program.std_no} to CMS..."
             )
 
-            cms_success, cms_message = post_cms_form(self._browser, url, form_data)
-
-            if cms_success:
-                progress_callback(f"Saving {student_program.std_no} to database...")
-
-                db_success, db_message = (
-                    self._repository.update_student_program_structure(
-                        student_program.student_program_db_id,
-                        new_structure.db_id,
-                    )
-                )
-
-                if db_success:
-                    return True, "Structure updated successfully"
-                else:
-                    return (
-                        False,
-                        f"CMS update succeeded but database update failed: {db_message}",
-                    )
-            else:
-                return False, cms_message
+            return post_cms_form(self._browser, url, form_data)
 
         except Exception as e:
             logger.error(
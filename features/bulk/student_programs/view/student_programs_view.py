@@ -2,6 +2,9 @@ import threading
 
 import wx
 
+from base.progress import ProgressChannel
+from features.common.reference_data import SCHOOLS, reference_data
+
 from ..repository import BulkStudentProgramsRepository
 from ..service import StudentProgramService
 from .update_structure_dialog import UpdateStructureDialog
@@ -100,51 +103,26 @@ class BulkUpdateStructureWorker(threading.Thread):
         self.student_programs = student_programs
         self.new_structure = new_structure
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
-        success_count = 0
-        failed_count = 0
-        total = len(self.student_programs)
-
-        for idx, student_program in enumerate(self.student_programs):
-            if self.should_stop:
-                break
-
-            try:
-
-                def progress_callback(message):
-                    self.callback(
-                        "progress",
-                        f"Updating {idx + 1}/{total}: {message}",
-                        idx + 1,
-                        total,
-                    )
-
-                success, message = self.service.update_student_program_structure(
-                    student_program,
-                    self.new_structure,
-                    progress_callback,
-                )
+        try:
+            result = self.service.bulk_update_student_program_structures(
+                self.student_programs,
+                self.new_structure,
+                self.progress_callback,
+                should_stop=lambda: self.should_stop,
+            )
+        except Exception as e:
+            self.callback("error", f"Error updating structures: {str(e)}")
+            self.callback("finished", [], [])
+            return
 
-                if success:
-                    success_count += 1
-                else:
-                    self.callback(
-                        "error",
-                        f"Failed to update {student_program.std_no}: {message}",
-                    )
-                    failed_count += 1
-
-            except Exception as e:
-                self.callback(
-                    "error",
-                    f"Error updating {student_program.std_no}: {str(e)}",
-                )
-                failed_count += 1
+        self.callback("finished", result.updated, result.failed)
 
-        self.callback("finished", success_count, failed_count)
+    def progress_callback(self, message, current, total):
+        self.callback("progress", message, current, total)
 
     def stop(self):
         self.should_stop = True
@@ -169,9 +147,12 @@ class StudentProgramsView(wx.Panel):
         self.terms_worker = None
         self.students_worker = None
         self.update_worker = None
+        self.failed_updates = []
+        self.failed_structure = None
 
         self.init_ui()
         self.load_filter_options()
+        reference_data.subscribe(self.on_reference_data_changed)
 
     def init_ui(self):
         main_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -223,6 +204,11 @@ class StudentProgramsView(wx.Panel):
 
         filters_sizer.AddStretchSpacer()
 
+        self.retry_failed_button = wx.Button(self, label="Retry Failed")
+        self.retry_failed_button.Bind(wx.EVT_BUTTON, self.on_retry_failed)
+        self.retry_failed_button.Enable(False)
+        filters_sizer.Add(self.retry_failed_button, 0, wx.RIGHT, 10)
+
         self.update_button = wx.Button(self, label="Update")
         self.update_button.Bind(wx.EVT_BUTTON, self.on_update)
         self.update_button.Enable(False)
@@ -302,6 +288,10 @@ class StudentProgramsView(wx.Panel):
         )
         self.filter_worker.start()
 
+    def on_reference_data_changed(self, categories):
+        if categories & {SCHOOLS}:
+            wx.CallAfter(self.load_filter_options)
+
     def on_filter_callback(self, event_type, *args):
         wx.CallAfter(self._handle_filter_event, event_type, *args)
 
@@ -635,20 +625,34 @@ class StudentProgramsView(wx.Panel):
             )
 
             if confirm_dlg.ShowModal() == wx.ID_YES:
-                self.update_button.Enable(False)
-
-                self.update_worker = BulkUpdateStructureWorker(
-                    selected_students,
-                    selected_structure,
-                    self.service,
-                    self.on_update_callback,
-                )
-                self.update_worker.start()
+                self.start_bulk_update(selected_students, selected_structure)
 
             confirm_dlg.Destroy()
 
         dialog.Destroy()
 
+    def start_bulk_update(self, student_programs, structure):
+        self.update_button.Enable(False)
+        self.retry_failed_button.Enable(False)
+        self.failed_structure = structure
+
+        self.update_worker = BulkUpdateStructureWorker(
+            student_programs,
+            structure,
+            self.service,
+            self.on_update_callback,
+        )
+        self.update_worker.start()
+
+    def on_retry_failed(self, event):
+        if not self.failed_updates or self.failed_structure is None:
+            return
+
+        student_programs = [
+            student_program for student_program, _ in self.failed_updates
+        ]
+        self.start_bulk_update(student_programs, self.failed_structure)
+
     def on_update_callback(self, event_type, *args):
         wx.CallAfter(self._handle_update_event, event_type, *args)
 
@@ -658,14 +662,26 @@ class StudentProgramsView(wx.Panel):
             if self.status_bar:
                 self.status_bar.show_progress(message, current, total)
         elif event_type == "finished":
-            success_count, failed_count = args
+            updated, failed = args
+            success_count = len(updated)
+            failed_count = len(failed)
+            self.failed_updates = list(failed)
             if self.status_bar:
                 self.status_bar.clear()
             self.update_update_button_state()
+            self.retry_failed_button.Enable(failed_count > 0)
 
             if failed_count > 0:
+                failure_lines = "\n".join(
+                    f"{student_program.std_no}: {message}"
+                    for student_program, message in failed[:10]
+                )
+                if failed_count > 10:
+                    failure_lines += f"\n... and {failed_count - 10} more"
                 wx.MessageBox(
-                    f"Updated structure for {success_count} student(s).\n{failed_count} failed.",
+                    f"Updated structure for {success_count} student(s).\n"
+                    f"{failed_count} failed:\n\n{failure_lines}\n\n"
+                    "Use 'Retry Failed' to re-run the failed updates.",
                     "Bulk Update Complete",
                     wx.OK | wx.ICON_INFORMATION,
                 )
@@ -20,6 +20,12 @@ from database import (
     StudentSemester,
     get_engine,
 )
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    TERMS,
+    reference_data,
+)
 
 logger = get_logger(__name__)
 
@@ -48,6 +54,9 @@ class BulkStudentSemestersRepository:
             yield session
 
     def list_active_schools(self):
+        return reference_data.get(SCHOOLS, self._load_active_schools)
+
+    def _load_active_schools(self):
         with self._session() as session:
             return (
                 session.query(School.cms_id.label("cms_id"), School.name)
@@ -58,6 +67,11 @@ class BulkStudentSemestersRepository:
             )
 
     def list_programs(self, school_id: Optional[int] = None):
+        return reference_data.get(
+            PROGRAMS, lambda: self._load_programs(school_id), school_id or None
+        )
+
+    def _load_programs(self, school_id: Optional[int]):
         with self._session() as session:
             query = session.query(Program.cms_id.label("cms_id"), Program.name).filter(
                 Program.cms_id.isnot(None)
@@ -95,6 +109,11 @@ class BulkStudentSemestersRepository:
             return results
 
     def list_terms(self, structure_id: int):
+        return reference_data.get(
+            TERMS, lambda: self._load_terms(structure_id), "structure", structure_id
+        )
+
+    def _load_terms(self, structure_id: int):
         with self._session() as session:
             results = (
                 session.query(StudentSemester.term_code)
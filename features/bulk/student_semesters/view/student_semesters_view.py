@@ -2,6 +2,8 @@ import threading
 
 import wx
 
+from base.progress import ProgressChannel
+from features.common.reference_data import SCHOOLS, reference_data
 from features.sync.students.repository import StudentRepository
 from features.sync.students.service import StudentSyncService
 from utils.formatters import format_semester
@@ -127,7 +129,7 @@ class BulkAddModuleWorker(threading.Thread):
         self.student_semesters = student_semesters
         self.module_data = module_data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -212,6 +214,7 @@ class StudentSemestersView(wx.Panel):
 
         self.init_ui()
         self.load_filter_options()
+        reference_data.subscribe(self.on_reference_data_changed)
 
     def init_ui(self):
         main_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -361,6 +364,10 @@ class StudentSemestersView(wx.Panel):
         )
         self.filter_worker.start()
 
+    def on_reference_data_changed(self, categories):
+        if categories & {SCHOOLS}:
+            wx.CallAfter(self.load_filter_options)
+
     def on_filter_callback(self, event_type, *args):
         wx.CallAfter(self._handle_filter_event, event_type, *args)
 
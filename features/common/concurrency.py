@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from base import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class ConcurrentItemResult(Generic[T]):
+    item: T
+    success: bool
+    message: str
+    attempts: int
+
+
+def run_concurrently(
+    items: Sequence[T],
+    task: Callable[[T], tuple[bool, str]],
+    *,
+    max_workers: int = 5,
+    max_attempts: int = 2,
+    retry_delay: float = 2.0,
+    should_stop: Callable[[], bool] | None = None,
+    on_item_done: Callable[[ConcurrentItemResult[T], int, int], None] | None = None,
+) -> list[ConcurrentItemResult[T]]:
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+
+    total = len(items)
+    if total == 0:
+        return []
+
+    def is_stopped() -> bool:
+        return bool(should_stop and should_stop())
+
+    def run_item(item: T) -> ConcurrentItemResult[T]:
+        message = "Cancelled"
+        attempt = 0
+
+        while attempt < max_attempts:
+            if is_stopped():
+                return ConcurrentItemResult(item, False, "Cancelled", attempt)
+
+            attempt += 1
+            try:
+                success, message = task(item)
+            except Exception as e:
+                logger.error(f"Concurrent task failed for {item!r}: {str(e)}")
+                success, message = False, f"Error: {str(e)}"
+
+            if success:
+                return ConcurrentItemResult(item, True, message, attempt)
+
+            if attempt < max_attempts and not is_stopped():
+                time.sleep(retry_delay * attempt)
+
+        return ConcurrentItemResult(item, False, message, attempt)
+
+    results: list[ConcurrentItemResult[T]] = []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as executor:
+        futures = [executor.submit(run_item, item) for item in items]
+
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_item_done:
+                on_item_done(result, len(results), total)
+
+    return results
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar, cast
+
+from base import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+SCHOOLS = "schools"
+PROGRAMS = "programs"
+TERMS = "terms"
+SEMESTERS = "semesters"
+
+DEFAULT_TTL_SECONDS = 5 * 60
+
+ReferenceDataListener = Callable[[set[str]], None]
+
+
+class ReferenceDataStore:
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[Hashable, ...], tuple[float, Any]] = {}
+        self._key_locks: dict[tuple[Hashable, ...], threading.Lock] = {}
+        self._listeners: list[Callable[[], ReferenceDataListener | None]] = []
+
+    def get(self, category: str, loader: Callable[[], T], *key: Hashable) -> T:
+        cache_key = (category, *key)
+        cached = self._lookup(cache_key)
+        if cached is not None:
+            return _copy(cached[1])
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+
+        with key_lock:
+            cached = self._lookup(cache_key)
+            if cached is not None:
+                return _copy(cached[1])
+
+            value = loader()
+            with self._lock:
+                self._entries[cache_key] = (self._clock() + self.ttl, value)
+            return _copy(value)
+
+    def _lookup(self, cache_key: tuple[Hashable, ...]) -> tuple[float, Any] | None:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[cache_key]
+                return None
+            return entry
+
+    def invalidate(self, *categories: str) -> None:
+        invalidated: set[str]
+        with self._lock:
+            if categories:
+                invalidated = set(categories)
+                for cache_key in list(self._entries):
+                    if cache_key[0] in invalidated:
+                        del self._entries[cache_key]
+            else:
+                invalidated = {str(cache_key[0]) for cache_key in self._entries}
+                invalidated.update((SCHOOLS, PROGRAMS, TERMS, SEMESTERS))
+                self._entries.clear()
+            listeners = list(self._listeners)
+
+        logger.info(f"Invalidated reference data: {', '.join(sorted(invalidated))}")
+
+        for listener_ref in listeners:
+            listener = listener_ref()
+            if listener is None:
+                continue
+            try:
+                listener(invalidated)
+            except Exception as e:
+                logger.error(f"Reference data listener failed: {str(e)}")
+
+        self._prune_listeners()
+
+    def subscribe(self, listener: ReferenceDataListener) -> Callable[[], None]:
+        if hasattr(listener, "__self__") and hasattr(listener, "__func__"):
+            listener_ref: Callable[[], ReferenceDataListener | None] = (
+                weakref.WeakMethod(listener)
+            )
+        else:
+            listener_ref = lambda: listener
+
+        with self._lock:
+            self._listeners.append(listener_ref)
+
+        def unsubscribe():
+            with self._lock:
+                if listener_ref in self._listeners:
+                    self._listeners.remove(listener_ref)
+
+        return unsubscribe
+
+    def _prune_listeners(self) -> None:
+        with self._lock:
+            self._listeners = [
+                listener_ref
+                for listener_ref in self._listeners
+                if listener_ref() is not None
+            ]
+
+
+def _copy(value: T) -> T:
+    if isinstance(value, list):
+        return cast(T, list(value))
+    return value
+
+
+reference_data = ReferenceDataStore()
+
+
+def invalidate_reference_data(*categories: str) -> None:
+    reference_data.invalidate(*categories)
@@ -24,6 +24,13 @@ from database import (
     Term,
     get_engine,
 )
+from database.instrumentation import profiled
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    TERMS,
+    reference_data,
+)
 
 logger = get_logger(__name__)
 
@@ -54,6 +61,9 @@ class EnrollmentRequestRepository:
             yield session
 
     def list_active_schools(self):
+        return reference_data.get(SCHOOLS, self._load_active_schools)
+
+    def _load_active_schools(self):
         with self._session() as session:
             return (
                 session.query(School.cms_id.label("cms_id"), School.name)
@@ -64,6 +74,11 @@ class EnrollmentRequestRepository:
             )
 
     def list_programs(self, school_cms_id: Optional[int] = None):
+        return reference_data.get(
+            PROGRAMS, lambda: self._load_programs(school_cms_id), school_cms_id or None
+        )
+
+    def _load_programs(self, school_cms_id: Optional[int]):
         with self._session() as session:
             query = session.query(Program.cms_id.label("cms_id"), Program.name).filter(
                 Program.cms_id.isnot(None)
@@ -75,6 +90,9 @@ class EnrollmentRequestRepository:
             return query.order_by(Program.name).all()
 
     def list_terms(self):
+        return reference_data.get(TERMS, self._load_terms, "catalog")
+
+    def _load_terms(self):
         with self._session() as session:
             rows = (
                 session.query(distinct(Term.code).label("code"))
@@ -91,6 +109,7 @@ class EnrollmentRequestRepository:
             ("registered", "Registered"),
         ]
 
+    @profiled()
     def fetch_registration_requests(
         self,
         *,
@@ -299,10 +318,20 @@ class EnrollmentRequestRepository:
             }
 
     def get_enrollment_data(self, registration_request_id: int):
+        return self.get_enrollment_data_for_requests([registration_request_id]).get(
+            registration_request_id
+        )
+
+    def get_enrollment_data_for_requests(
+        self, registration_request_ids: list[int]
+    ) -> dict[int, dict]:
+        if not registration_request_ids:
+            return {}
+
         with self._session() as session:
             from database import Structure, StudentProgram
 
-            result = (
+            results = (
                 session.query(
                     RegistrationRequest.id.label("request_id"),
                     Student.std_no,
@@ -322,15 +351,13 @@ class EnrollmentRequestRepository:
                     & (StudentProgram.status == "Active"),
                 )
                 .outerjoin(Structure, StudentProgram.structure_id == Structure.id)
-                .filter(RegistrationRequest.id == registration_request_id)
-                .first()
+                .filter(RegistrationRequest.id.in_(registration_request_ids))
+                .all()
             )
 
-            if not result:
-                return None
-
             modules = (
                 session.query(
+                    RequestedModule.registration_request_id,
                     Module.code.label("module_code"),
                     RequestedModule.module_status,
                     RequestedModule.semester_module_id.label("semester_module_db_id"),
@@ -343,13 +370,25 @@ class EnrollmentRequestRepository:
                 )
                 .join(Module, SemesterModule.module_id == Module.id)
                 .filter(
-                    RequestedModule.registration_request_id == registration_request_id
+                    RequestedModule.registration_request_id.in_(
+                        registration_request_ids
+                    )
                 )
                 .order_by(Module.code)
                 .all()
             )
 
-            return {
+        modules_by_request: dict[int, list] = {}
+        for module in modules:
+            modules_by_request.setdefault(module.registration_request_id, []).append(
+                module
+            )
+
+        enrollment_data: dict[int, dict] = {}
+        for result in results:
+            if result.request_id in enrollment_data:
+                continue
+            enrollment_data[result.request_id] = {
                 "request_id": result.request_id,
                 "std_no": result.std_no,
                 "term_code": result.term_code,
@@ -359,9 +398,11 @@ class EnrollmentRequestRepository:
                 "student_program_cms_id": result.student_program_cms_id,
                 "structure_db_id": result.structure_db_id,
                 "structure_cms_id": result.structure_cms_id,
-                "modules": modules,
+                "modules": modules_by_request.get(result.request_id, []),
             }
 
+        return enrollment_data
+
     def get_requested_modules(self, registration_request_id: int):
         with self._session() as session:
             modules = (
@@ -704,3 +745,41 @@ class EnrollmentRequestRepository:
                 .all()
             )
             return clearances
+
+    def get_clearances_for_requests(
+        self, registration_request_ids: list[int]
+    ) -> dict[int, list]:
+        if not registration_request_ids:
+            return {}
+
+        with self._session() as session:
+            rows = (
+                session.query(
+                    RegistrationClearance.registration_request_id,
+                    Clearance.id,
+                    Clearance.department,
+                    Clearance.status,
+                    Clearance.message,
+                    Clearance.responded_by,
+                    Clearance.response_date,
+                )
+                .join(
+                    RegistrationClearance,
+                    RegistrationClearance.clearance_id == Clearance.id,
+                )
+                .filter(
+                    RegistrationClearance.registration_request_id.in_(
+                        registration_request_ids
+                    )
+                )
+                .order_by(
+                    RegistrationClearance.registration_request_id,
+                    Clearance.department,
+                )
+                .all()
+            )
+
+        clearances: dict[int, list] = {}
+        for row in rows:
+            clearances.setdefault(row.registration_request_id, []).append(row)
+        return clearances
@@ -1,11 +1,15 @@
 import threading
+from functools import partial
 
 import wx
 
+from base.progress import ProgressChannel
+from features.common.reference_data import PROGRAMS, SCHOOLS, TERMS, reference_data
+
 from .loader_control import LoadableControl
 from .registration_detail_panel import RegistrationDetailPanel
 from .repository import EnrollmentRequestRepository
-from .service import EnrollmentService
+from .service import DEFAULT_ENROLLMENT_WORKERS, EnrollmentService
 
 
 class EnrollStudentsWorker(threading.Thread):
@@ -14,11 +18,13 @@ class EnrollStudentsWorker(threading.Thread):
         service: EnrollmentService,
         request_ids: list[int],
         callback,
+        max_workers: int = 1,
     ):
         super().__init__(daemon=True)
         self.service = service
         self.request_ids = request_ids
-        self.callback = callback
+        self.callback = ProgressChannel(partial(wx.CallAfter, callback))
+        self.max_workers = max_workers
         self.should_stop = False
 
     def run(self):
@@ -27,21 +33,22 @@ class EnrollStudentsWorker(threading.Thread):
             def progress_callback(message: str, current: int, total: int):
                 if self.should_stop:
                     return
-                wx.CallAfter(self.callback, "progress", message, current, total)
+                self.callback("progress", message, current, total)
 
             success_count, failed_count = self.service.enroll_students(
-                self.request_ids, progress_callback
+                self.request_ids,
+                progress_callback,
+                max_workers=self.max_workers,
+                should_stop=lambda: self.should_stop,
             )
 
-            wx.CallAfter(
-                self.callback,
-                "complete",
-                success_count,
-                failed_count,
-            )
+            self.callback("complete", success_count, failed_count)
 
         except Exception as e:
-            wx.CallAfter(self.callback, "error", str(e))
+            self.callback("error", str(e))
+
+    def stop(self):
+        self.should_stop = True
 
 
 class LoadFilterOptionsWorker(threading.Thread):
@@ -165,6 +172,7 @@ class RequestsView(wx.Panel):
 
         self.init_ui()
         self.load_filter_options()
+        reference_data.subscribe(self.on_reference_data_changed)
         self.load_registration_requests()
 
     def init_ui(self):
@@ -253,6 +261,18 @@ class RequestsView(wx.Panel):
 
         search_sizer.AddStretchSpacer()
 
+        workers_label = wx.StaticText(self, label="Workers:")
+        search_sizer.Add(workers_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+
+        self.workers_spin = wx.SpinCtrl(
+            self,
+            min=1,
+            max=10,
+            initial=DEFAULT_ENROLLMENT_WORKERS,
+            size=wx.Size(60, -1),
+        )
+        search_sizer.Add(self.workers_spin, 0, wx.RIGHT, 10)
+
         self.enroll_button = wx.Button(self, label="Enroll")
         self.enroll_button.Bind(wx.EVT_BUTTON, self.enroll_students)
         self.enroll_button.Enable(False)
@@ -541,6 +561,10 @@ class RequestsView(wx.Panel):
         )
         self.filter_worker.start()
 
+    def on_reference_data_changed(self, categories):
+        if categories & {PROGRAMS, SCHOOLS, TERMS}:
+            wx.CallAfter(self.load_filter_options)
+
     def load_programs_for_school(self, school_cms_id, trigger_load_requests=False):
         self.pending_load_requests = trigger_load_requests
 
@@ -726,7 +750,10 @@ class RequestsView(wx.Panel):
         dlg.Destroy()
 
         self.enroll_worker = EnrollStudentsWorker(
-            self.service, selected_requests, self.on_enroll_progress
+            self.service,
+            selected_requests,
+            self.on_enroll_progress,
+            max_workers=self.workers_spin.GetValue(),
         )
         self.enroll_worker.start()
 
@@ -783,18 +810,24 @@ class RequestsView(wx.Panel):
         if event_type == "filters_loaded":
             schools, programs, terms = args
 
+            while self.school_filter.GetCount() > 1:
+                self.school_filter.Delete(1)
             self.school_filter.SetString(0, "All Schools")
             for school in schools:
                 self.school_filter.Append(str(school.name), school.cms_id)
             self.school_filter.SetSelection(0)
             self.school_filter.Enable(True)
 
+            while self.program_filter.GetCount() > 1:
+                self.program_filter.Delete(1)
             self.program_filter.SetString(0, "All Programs")
             for program in programs:
                 self.program_filter.Append(str(program.name), program.cms_id)
             self.program_filter.SetSelection(0)
             self.program_filter.Enable(True)
 
+            while self.term_filter.GetCount() > 1:
+                self.term_filter.Delete(1)
             self.term_filter.SetString(0, "All Terms")
             for term in terms:
                 self.term_filter.Append(str(term.code), term.code)
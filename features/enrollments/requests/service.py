@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import datetime
+import threading
 from typing import Callable, Optional
 
 from base import get_logger
 from base.browser import Browser
+from features.common.concurrency import run_concurrently
 from features.enrollments.semester import SemesterEnrollmentService
 
 from .repository import EnrollmentRequestRepository
@@ -12,6 +14,8 @@ from .scraper import get_cms_semester_modules, get_cms_semesters
 
 logger = get_logger(__name__)
 
+DEFAULT_ENROLLMENT_WORKERS = 4
+
 
 def today() -> str:
     return datetime.date.today().strftime("%Y-%m-%d")
@@ -29,20 +33,42 @@ class EnrollmentService:
         self,
         registration_request_ids: list[int],
         progress_callback: Callable[[str, int, int], None],
+        *,
+        max_workers: int = 1,
+        should_stop: Optional[Callable[[], bool]] = None,
     ) -> tuple[int, int]:
+        total = len(registration_request_ids)
+        progress_callback(f"Loading enrollment data for {total} request(s)...", 0, total)
+        enrollment_data = self._repository.get_enrollment_data_for_requests(
+            registration_request_ids
+        )
+
+        if max_workers > 1:
+            return self._enroll_students_concurrently(
+                registration_request_ids,
+                enrollment_data,
+                progress_callback,
+                max_workers,
+                should_stop,
+            )
 
         success_count = 0
         failed_count = 0
 
         for idx, request_id in enumerate(registration_request_ids):
+            if should_stop and should_stop():
+                break
+
             progress_callback(
                 f"Processing registration request {request_id}...",
                 idx + 1,
-                len(registration_request_ids),
+                total,
             )
 
             try:
-                success = self._enroll_single_request(request_id, progress_callback)
+                success = self._enroll_single_request(
+                    request_id, progress_callback, enrollment_data.get(request_id)
+                )
 
                 if success:
                     success_count += 1
@@ -55,14 +81,73 @@ class EnrollmentService:
 
         return success_count, failed_count
 
+    def _enroll_students_concurrently(
+        self,
+        registration_request_ids: list[int],
+        enrollment_data: dict[int, dict],
+        progress_callback: Callable[[str, int, int], None],
+        max_workers: int,
+        should_stop: Optional[Callable[[], bool]],
+    ) -> tuple[int, int]:
+        requests_by_student: dict[str, list[int]] = {}
+        for request_id in registration_request_ids:
+            data = enrollment_data.get(request_id)
+            key = str(data["std_no"]) if data else f"request:{request_id}"
+            requests_by_student.setdefault(key, []).append(request_id)
+
+        total = len(registration_request_ids)
+        counts = {"completed": 0, "success": 0, "failed": 0}
+        counts_lock = threading.Lock()
+
+        def record(request_id: int, success: bool):
+            with counts_lock:
+                counts["completed"] += 1
+                counts["success" if success else "failed"] += 1
+                completed = counts["completed"]
+                failed = counts["failed"]
+            progress_callback(
+                f"Enrolled {completed}/{total} request(s) ({failed} failed), "
+                f"last request {request_id}",
+                completed,
+                total,
+            )
+
+        def enroll_student_requests(request_ids: list[int]) -> tuple[bool, str]:
+            for request_id in request_ids:
+                if should_stop and should_stop():
+                    return False, "Cancelled"
+                try:
+                    success = self._enroll_single_request(
+                        request_id,
+                        lambda *_: None,
+                        enrollment_data.get(request_id),
+                    )
+                except Exception as e:
+                    logger.error(f"Error enrolling request {request_id}: {str(e)}")
+                    success = False
+                record(request_id, success)
+            return True, "Processed"
+
+        run_concurrently(
+            list(requests_by_student.values()),
+            enroll_student_requests,
+            max_workers=max_workers,
+            max_attempts=1,
+            should_stop=should_stop,
+        )
+
+        return counts["success"], counts["failed"]
+
     def _enroll_single_request(
         self,
         request_id: int,
         progress_callback: Callable[[str, int, int], None],
+        enrollment_data: Optional[dict] = None,
     ) -> bool:
-        progress_callback(f"Fetching enrollment data...", 0, 100)
+        if enrollment_data is None:
+            progress_callback(f"Fetching enrollment data...", 0, 100)
+            enrollment_data = self._repository.get_enrollment_data(request_id)
 
-        enrollment_data = self._repository.get_enrollment_data(request_id)
         if not enrollment_data:
             logger.error(f"Registration request {request_id} not found")
             return False
@@ -364,8 +449,11 @@ class EnrollmentService:
 
     def check_clearances_for_requests(self, request_ids: list[int]) -> str:
         issues = []
+        clearances_by_request = self._repository.get_clearances_for_requests(
+            request_ids
+        )
         for request_id in request_ids:
-            clearances = self._repository.get_clearances_for_request(request_id)
+            clearances = clearances_by_request.get(request_id)
             if not clearances:
                 issues.append(f"Request #{request_id}: No clearances found")
                 continue
@@ -3,6 +3,9 @@ from typing import Optional
 
 import wx
 
+from base.progress import ProgressChannel
+from database.instrumentation import profiled
+from features.common.reference_data import SCHOOLS, reference_data
 from utils.formatters import format_semester
 
 from .preview_dialog import GradePreviewItem, RecalculatePreviewDialog
@@ -138,9 +141,10 @@ class BuildPreviewWorker(threading.Thread):
         super().__init__(daemon=True)
         self.student_modules = student_modules
         self.repository = repository
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
+    @profiled("BuildPreviewWorker")
     def run(self):
         preview_items: list[GradePreviewItem] = []
         total = len(self.student_modules)
@@ -286,7 +290,7 @@ class ApplyGradesWorker(threading.Thread):
         super().__init__(daemon=True)
         self.items_to_update = items_to_update
         self.repository = repository
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -349,6 +353,7 @@ class ModuleGradesView(wx.Panel):
 
         self.init_ui()
         self.load_filter_options()
+        reference_data.subscribe(self.on_reference_data_changed)
 
     def init_ui(self):
         main_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -501,6 +506,10 @@ class ModuleGradesView(wx.Panel):
         )
         self.filter_worker.start()
 
+    def on_reference_data_changed(self, categories):
+        if categories & {SCHOOLS}:
+            wx.CallAfter(self.load_filter_options)
+
     def on_filter_callback(self, event_type, *args):
         wx.CallAfter(self._handle_filter_event, event_type, *args)
 
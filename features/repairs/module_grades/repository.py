@@ -25,6 +25,12 @@ from database import (
     get_engine,
 )
 from database.models import Grade
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    TERMS,
+    reference_data,
+)
 
 logger = get_logger(__name__)
 
@@ -70,6 +76,9 @@ class ModuleGradesRepository:
             yield session
 
     def list_active_schools(self):
+        return reference_data.get(SCHOOLS, self._load_active_schools)
+
+    def _load_active_schools(self):
         with self._session() as session:
             return (
                 session.query(School.cms_id.label("cms_id"), School.name)
@@ -80,6 +89,11 @@ class ModuleGradesRepository:
             )
 
     def list_programs(self, school_id: Optional[int] = None):
+        return reference_data.get(
+            PROGRAMS, lambda: self._load_programs(school_id), school_id or None
+        )
+
+    def _load_programs(self, school_id: Optional[int]):
         with self._session() as session:
             query = session.query(Program.cms_id.label("cms_id"), Program.name).filter(
                 Program.cms_id.isnot(None)
@@ -125,6 +139,11 @@ class ModuleGradesRepository:
             return results
 
     def list_terms(self, structure_id: int):
+        return reference_data.get(
+            TERMS, lambda: self._load_terms(structure_id), "structure", structure_id
+        )
+
+    def _load_terms(self, structure_id: int):
         with self._session() as session:
             results = (
                 session.query(StudentSemester.term_code)
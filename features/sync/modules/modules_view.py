@@ -1,7 +1,10 @@
 import threading
+from functools import partial
 
 import wx
 
+from base.progress import ProgressChannel
+
 from .fetch_module_dialog import FetchModuleDialog
 from .module_form import ModuleFormDialog, NewModuleFormDialog
 from .repository import ModuleRepository
@@ -9,23 +12,30 @@ from .service import ModuleSyncService
 
 
 class FetchAllModulesWorker(threading.Thread):
-    def __init__(self, service, callback):
+    def __init__(self, service, callback, changed_only=False):
         super().__init__(daemon=True)
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(partial(wx.CallAfter, callback))
+        self.changed_only = changed_only
         self.should_stop = False
 
     def run(self):
         try:
-            self.service.fetch_and_save_all_modules(progress_callback=self.progress)
-            wx.CallAfter(lambda: self.callback("complete", None))
+            if self.changed_only:
+                saved_count = self.service.fetch_and_save_changed_modules(
+                    progress_callback=self.progress
+                )
+            else:
+                saved_count = self.service.fetch_and_save_all_modules(
+                    progress_callback=self.progress
+                )
+            self.callback("complete", saved_count)
         except Exception as e:
-            error_msg = str(e)
-            wx.CallAfter(lambda: self.callback("error", error_msg))
+            self.callback("error", str(e))
 
     def progress(self, message, current, total):
         if not self.should_stop:
-            wx.CallAfter(lambda: self.callback("progress", message, current, total))
+            self.callback("progress", message, current, total)
 
 
 class LoadModulesWorker(threading.Thread):
@@ -61,7 +71,7 @@ class UpdateModuleWorker(threading.Thread):
         self.module_id = module_id
         self.module_data = module_data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
         self.current_step = 0
         self.total_steps = 4
@@ -150,6 +160,10 @@ class ModulesView(wx.Panel):
         self.fetch_button.Bind(wx.EVT_BUTTON, self.on_fetch)
         filters_sizer.Add(self.fetch_button, 0, wx.RIGHT, 10)
 
+        self.fetch_changes_button = wx.Button(self, label="Fetch Changes")
+        self.fetch_changes_button.Bind(wx.EVT_BUTTON, self.on_fetch_changes)
+        filters_sizer.Add(self.fetch_changes_button, 0, wx.RIGHT, 10)
+
         self.fetch_all_button = wx.Button(self, label="Fetch All")
         self.fetch_all_button.Bind(wx.EVT_BUTTON, self.on_fetch_all)
         filters_sizer.Add(self.fetch_all_button, 0, wx.RIGHT, 10)
@@ -324,14 +338,41 @@ class ModulesView(wx.Panel):
         )
 
         if dialog.ShowModal() == wx.ID_YES:
-            self.fetch_button.Enable(False)
-            self.fetch_all_button.Enable(False)
+            self._set_fetch_buttons_enabled(False)
 
             worker = FetchAllModulesWorker(self.service, self.on_fetch_all_callback)
             worker.start()
 
         dialog.Destroy()
 
+    def on_fetch_changes(self, event):
+        self._set_fetch_buttons_enabled(False)
+
+        worker = FetchAllModulesWorker(
+            self.service, self.on_fetch_changes_callback, changed_only=True
+        )
+        worker.start()
+
+    def _set_fetch_buttons_enabled(self, enabled):
+        self.fetch_button.Enable(enabled)
+        self.fetch_changes_button.Enable(enabled)
+        self.fetch_all_button.Enable(enabled)
+
+    def on_fetch_changes_callback(self, event_type, *args):
+        if event_type == "complete":
+            saved_count = args[0] if args else 0
+            if self.status_bar:
+                self.status_bar.clear()
+            self._set_fetch_buttons_enabled(True)
+            self.load_modules()
+            wx.MessageBox(
+                f"Saved {saved_count} new or changed module(s).",
+                "Success",
+                wx.OK | wx.ICON_INFORMATION,
+            )
+        else:
+            self.on_fetch_all_callback(event_type, *args)
+
     def on_fetch_all_callback(self, event_type, *args):
         if event_type == "progress":
             message, current, total = args
@@ -340,8 +381,7 @@ class ModulesView(wx.Panel):
         elif event_type == "complete":
             if self.status_bar:
                 self.status_bar.clear()
-            self.fetch_button.Enable(True)
-            self.fetch_all_button.Enable(True)
+            self._set_fetch_buttons_enabled(True)
             self.load_modules()
             wx.MessageBox(
                 "All modules have been fetched and saved successfully!",
@@ -352,8 +392,7 @@ class ModulesView(wx.Panel):
             error_message = args[0] if args else "Unknown error"
             if self.status_bar:
                 self.status_bar.clear()
-            self.fetch_button.Enable(True)
-            self.fetch_all_button.Enable(True)
+            self._set_fetch_buttons_enabled(True)
             wx.MessageBox(
                 f"Error fetching modules: {error_message}",
                 "Error",
@@ -401,8 +440,7 @@ class ModulesView(wx.Panel):
         if dialog.ShowModal() == wx.ID_OK:
             updated_data = dialog.get_updated_data()
 
-            self.fetch_button.Enable(False)
-            self.fetch_all_button.Enable(False)
+            self._set_fetch_buttons_enabled(False)
             self.new_button.Enable(False)
             self.edit_button.Enable(False)
 
@@ -426,8 +464,7 @@ class ModulesView(wx.Panel):
         if dialog.ShowModal() == wx.ID_OK:
             new_data = dialog.get_new_data()
 
-            self.fetch_button.Enable(False)
-            self.fetch_all_button.Enable(False)
+            self._set_fetch_buttons_enabled(False)
             self.new_button.Enable(False)
             self.edit_button.Enable(False)
 
@@ -448,8 +485,7 @@ class ModulesView(wx.Panel):
             if self.status_bar:
                 self.status_bar.clear()
 
-            self.fetch_button.Enable(True)
-            self.fetch_all_button.Enable(True)
+            self._set_fetch_buttons_enabled(True)
             self.new_button.Enable(True)
             self.edit_button.Enable(self.selected_module_item is not None)
 
@@ -478,8 +514,7 @@ class ModulesView(wx.Panel):
             success, message = args
             if self.status_bar:
                 self.status_bar.clear()
-            self.fetch_button.Enable(True)
-            self.fetch_all_button.Enable(True)
+            self._set_fetch_buttons_enabled(True)
             self.new_button.Enable(True)
             self.edit_button.Enable(self.selected_module_item is not None)
 
@@ -534,7 +569,7 @@ class CreateModuleWorker(threading.Thread):
         super().__init__(daemon=True)
         self.module_data = module_data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
 
     def run(self):
         try:
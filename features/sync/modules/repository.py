@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -10,6 +11,9 @@ from sqlalchemy.orm import Session
 from base import get_logger
 from database import Module, get_engine
 
+if TYPE_CHECKING:
+    from .scraper import ModuleScrapeData
+
 logger = get_logger(__name__)
 
 
@@ -118,6 +122,81 @@ class ModuleRepository:
                 session.refresh(new_module)
                 return new_module
 
+    def get_module_timestamps(self) -> dict[int, str]:
+        with self._session() as session:
+            rows = (
+                session.query(Module.cms_id, Module.timestamp)
+                .filter(Module.cms_id.isnot(None))
+                .all()
+            )
+
+        return {
+            int(cms_id): timestamp or "" for cms_id, timestamp in rows if cms_id
+        }
+
+    def save_modules(
+        self,
+        modules: Sequence[ModuleScrapeData],
+        *,
+        chunk_size: int = 500,
+    ) -> int:
+        if not modules:
+            return 0
+
+        saved_count = 0
+        with self._session() as session:
+            for start in range(0, len(modules), chunk_size):
+                chunk = modules[start : start + chunk_size]
+                cms_ids = [int(module["cms_id"]) for module in chunk]
+                codes = [str(module["code"]).strip() for module in chunk]
+
+                by_cms_id = {
+                    module.cms_id: module
+                    for module in session.query(Module)
+                    .filter(Module.cms_id.in_(cms_ids))
+                    .all()
+                    if module.cms_id is not None
+                }
+                by_code = {
+                    str(module.code): module
+                    for module in session.query(Module)
+                    .filter(Module.code.in_(codes))
+                    .all()
+                }
+
+                for data in chunk:
+                    cms_id = int(data["cms_id"])
+                    normalized_code = str(data["code"]).strip()
+                    normalized_name = str(data["name"]).strip()
+                    existing_module = by_cms_id.get(cms_id) or by_code.get(
+                        normalized_code
+                    )
+
+                    if existing_module is None:
+                        existing_module = Module(
+                            cms_id=cms_id,
+                            code=normalized_code,
+                            name=normalized_name,
+                            status=data["status"],
+                            timestamp=data.get("timestamp"),
+                        )
+                        session.add(existing_module)
+                    else:
+                        existing_module.code = normalized_code  # type: ignore
+                        if normalized_name or not existing_module.name:
+                            existing_module.name = normalized_name  # type: ignore
+                        existing_module.status = data["status"]  # type: ignore
+                        existing_module.timestamp = data.get("timestamp")  # type: ignore
+                        existing_module.cms_id = cms_id  # type: ignore
+
+                    by_cms_id[cms_id] = existing_module
+                    by_code[normalized_code] = existing_module
+                    saved_count += 1
+
+            session.commit()
+
+        return saved_count
+
     def find_missing_cms_ids(
         self,
         cms_ids: list[int],
@@ -1,5 +1,6 @@
 import re
 from collections.abc import Callable
+from datetime import datetime
 from typing import TypedDict
 
 from bs4 import BeautifulSoup
@@ -335,5 +336,133 @@ def scrape_all_modules(
     raise ModuleScrapeIntegrityError("Module scrape failed")
 
 
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y",
+)
+
+
+def parse_module_timestamp(value: str | None) -> datetime | None:
+    normalized = (value or "").strip()
+    if not normalized:
+        return None
+
+    for fmt in _TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(normalized, fmt)
+        except ValueError:
+            continue
+
+    return None
+
+
+def _changed_modules_url(start: int) -> str:
+    base_url = f"{BASE_URL}/f_modulelist.php?order=DateStamp&ordertype=DESC"
+    if start <= 1:
+        return base_url
+    return f"{base_url}&start={start}"
+
+
+def _is_sorted_by_timestamp_desc(
+    modules: list[ModuleScrapeData], previous: datetime | None
+) -> tuple[bool, datetime | None]:
+    last = previous
+    for module in modules:
+        parsed = parse_module_timestamp(module["timestamp"])
+        if parsed is None:
+            return False, last
+        if last is not None and parsed > last:
+            return False, last
+        last = parsed
+    return True, last
+
+
+def is_module_unchanged(
+    module: ModuleScrapeData, known_timestamps: dict[int, str]
+) -> bool:
+    stored = known_timestamps.get(int(module["cms_id"]))
+    if stored is None:
+        return False
+    return stored.strip() == str(module["timestamp"]).strip()
+
+
+def scrape_changed_modules(
+    known_timestamps: dict[int, str],
+    progress_callback: Callable[[str, int, int], None] | None = None,
+) -> list[ModuleScrapeData] | None:
+    browser = Browser()
+    changed_by_id: dict[int, ModuleScrapeData] = {}
+    visited_starts: set[int] = set()
+    current_start = 1
+    current_page = 0
+    last_timestamp: datetime | None = None
+
+    while True:
+        if current_start in visited_starts:
+            raise ModuleScrapeIntegrityError(
+                f"Module pager loop detected at record {current_start}"
+            )
+
+        visited_starts.add(current_start)
+        response = browser.fetch(_changed_modules_url(current_start))
+        page = BeautifulSoup(response.text, "lxml")
+        pager_bounds = _extract_pager_bounds(page)
+        page_modules = _dedupe_modules(_extract_modules_from_page(page))
+        _validate_scrape_page(current_start, pager_bounds, page_modules)
+
+        is_sorted, last_timestamp = _is_sorted_by_timestamp_desc(
+            page_modules, last_timestamp
+        )
+        if not is_sorted:
+            logger.info(
+                "Module list is not sorted by timestamp, incremental scrape unavailable"
+            )
+            return None
+
+        current_page += 1
+        page_changes = [
+            module
+            for module in page_modules
+            if not is_module_unchanged(module, known_timestamps)
+        ]
+        for module in page_changes:
+            changed_by_id.setdefault(int(module["cms_id"]), module)
+
+        if progress_callback:
+            progress_callback(
+                f"Scanning changes page {current_page} "
+                f"({len(changed_by_id)} changed modules so far)",
+                current_page,
+                current_page + 1,
+            )
+
+        if page_modules and not page_changes:
+            break
+
+        if pager_bounds is None:
+            break
+
+        _, last_record, total_records = pager_bounds
+        if last_record >= total_records:
+            break
+
+        next_start = last_record + 1
+        if next_start <= current_start:
+            raise ModuleScrapeIntegrityError(
+                f"Module pager did not advance after record {current_start}"
+            )
+
+        current_start = next_start
+
+    changed_modules = list(changed_by_id.values())
+    logger.info(
+        f"Found {len(changed_modules)} changed modules after scanning {current_page} page(s)"
+    )
+    return changed_modules
+
+
 def _extract_modules_from_page(page: BeautifulSoup) -> list[ModuleScrapeData]:
     return _extract_module_rows(page)
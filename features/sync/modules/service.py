@@ -9,7 +9,12 @@ from base.browser import BASE_URL, Browser, get_form_payload
 from features.common.cms_utils import post_cms_form
 
 from .repository import ModuleRepository
-from .scraper import scrape_all_modules, scrape_modules
+from .scraper import (
+    is_module_unchanged,
+    scrape_all_modules,
+    scrape_changed_modules,
+    scrape_modules,
+)
 
 logger = get_logger(__name__)
 
@@ -118,6 +123,56 @@ class ModuleSyncService:
 
         return saved_count
 
+    def fetch_and_save_changed_modules(
+        self, progress_callback: Callable[[str, int, int], None]
+    ) -> int:
+        progress_callback("Loading stored module timestamps...", 0, 1)
+        known_timestamps = self.repository.get_module_timestamps()
+
+        changed_modules = None
+        if known_timestamps:
+            changed_modules = scrape_changed_modules(
+                known_timestamps, progress_callback=progress_callback
+            )
+
+        if changed_modules is None:
+            logger.info("Falling back to a full module catalog scrape")
+            scraped_modules = scrape_all_modules(progress_callback=progress_callback)
+            changed_modules = [
+                module
+                for module in scraped_modules
+                if not is_module_unchanged(module, known_timestamps)
+            ]
+
+        if not changed_modules:
+            progress_callback("Module catalog is already up to date", 1, 1)
+            return 0
+
+        total_changed = len(changed_modules)
+        progress_callback(
+            f"Saving {total_changed} new or changed module(s)...",
+            0,
+            total_changed,
+        )
+        saved_count = self.repository.save_modules(changed_modules)
+
+        missing_cms_ids = self.repository.find_missing_cms_ids(
+            [int(module["cms_id"]) for module in changed_modules]
+        )
+        if missing_cms_ids:
+            missing_preview = ", ".join(str(cms_id) for cms_id in missing_cms_ids[:10])
+            raise RuntimeError(
+                f"Saved modules could not be verified in the database. Missing CMS IDs: {missing_preview}"
+            )
+
+        progress_callback(
+            f"Successfully saved {saved_count} new or changed module(s)",
+            total_changed,
+            total_changed,
+        )
+
+        return saved_count
+
     def push_module(
         self,
         module_id: int,
@@ -2,6 +2,8 @@ import threading
 
 import wx
 
+from base.progress import ProgressChannel
+
 from .repository import StructureRepository
 from .service import SchoolSyncService
 
@@ -11,7 +13,7 @@ class FetchProgramsWorker(threading.Thread):
         super().__init__(daemon=True)
         self.school_code = school_code
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -49,7 +51,7 @@ class ImportSchoolWorker(threading.Thread):
         self.school_data = school_data
         self.programs = programs
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.fetch_structures = fetch_structures
         self.fetch_semesters = fetch_semesters
         self.should_stop = False
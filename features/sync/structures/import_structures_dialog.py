@@ -2,6 +2,8 @@ import threading
 
 import wx
 
+from base.progress import ProgressChannel
+
 from .repository import StructureRepository
 from .service import SchoolSyncService
 
@@ -17,7 +19,7 @@ class ImportStructuresWorker(threading.Thread):
     ):
         super().__init__(daemon=True)
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.school_id = school_id
         self.program_id = program_id
         self.fetch_semesters = fetch_semesters
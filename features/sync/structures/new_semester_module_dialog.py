@@ -6,6 +6,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 from wx.lib.intctrl import IntCtrl
 
+from base.progress import ProgressChannel
 from database import Module, get_engine
 from database.models import ModuleType
 from features.sync.modules.module_form import NewModuleFormDialog
@@ -23,7 +24,7 @@ class CreateModuleWorker(threading.Thread):
         super().__init__(daemon=True)
         self.module_data = module_data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
 
     def run(self):
         try:
@@ -18,6 +18,11 @@ from database import (
     get_engine,
 )
 from database.models import ProgramLevel
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    reference_data,
+)
 
 logger = get_logger(__name__)
 
@@ -49,6 +54,55 @@ class SemesterModuleRow:
     hidden: bool
 
 
+@dataclass
+class StructureTree:
+    structure_id: int
+    semesters: list[SemesterRow]
+    modules_by_semester: dict[int, list[SemesterModuleRow]]
+
+    def has_semester(self, semester_id: int) -> bool:
+        return semester_id in self.modules_by_semester
+
+    def get_semesters(self) -> list[SemesterRow]:
+        return list(self.semesters)
+
+    def get_modules(self, semester_id: int) -> list[SemesterModuleRow]:
+        return list(self.modules_by_semester.get(semester_id, []))
+
+    def apply_semesters(self, semesters: list[SemesterRow]) -> None:
+        merged = {semester.cms_id: semester for semester in self.semesters}
+        for semester in semesters:
+            merged[semester.cms_id] = semester
+            self.modules_by_semester.setdefault(semester.cms_id, [])
+        self.semesters = sorted(
+            merged.values(), key=lambda semester: semester.semester_number
+        )
+
+    def apply_semester_modules(
+        self, semester_id: int, modules: list[SemesterModuleRow]
+    ) -> None:
+        saved_cms_ids = {module.cms_id for module in modules}
+        for other_id, other_modules in self.modules_by_semester.items():
+            if other_id != semester_id:
+                self.modules_by_semester[other_id] = [
+                    module
+                    for module in other_modules
+                    if module.cms_id not in saved_cms_ids
+                ]
+        if semester_id not in self.modules_by_semester:
+            return
+
+        merged = {
+            module.cms_id: module
+            for module in self.modules_by_semester.get(semester_id, [])
+        }
+        for module in modules:
+            merged[module.cms_id] = module
+        self.modules_by_semester[semester_id] = sorted(
+            merged.values(), key=lambda module: module.module_code
+        )
+
+
 class StructureRepository:
     def __init__(self) -> None:
         self._engine = get_engine()
@@ -172,6 +226,9 @@ class StructureRepository:
         return [cms_id for cms_id in pending_ids if cms_id not in existing_ids]
 
     def list_active_schools(self):
+        return reference_data.get(SCHOOLS, self._load_active_schools)
+
+    def _load_active_schools(self):
         with self._session() as session:
             return (
                 session.query(School.cms_id.label("cms_id"), School.name)
@@ -182,6 +239,11 @@ class StructureRepository:
             )
 
     def list_programs(self, school_id: Optional[int] = None):
+        return reference_data.get(
+            PROGRAMS, lambda: self._load_programs(school_id), school_id or None
+        )
+
+    def _load_programs(self, school_id: Optional[int]):
         with self._session() as session:
             query = session.query(Program.cms_id.label("cms_id"), Program.name).filter(
                 Program.cms_id.isnot(None)
@@ -280,6 +342,69 @@ class StructureRepository:
             for result in results
         ]
 
+    def get_structure_tree(self, structure_id: int) -> StructureTree:
+        with self._session() as session:
+            results = (
+                session.query(
+                    StructureSemester.cms_id.label("semester_cms_id"),
+                    StructureSemester.semester_number,
+                    StructureSemester.name,
+                    StructureSemester.total_credits,
+                    SemesterModule.cms_id.label("module_cms_id"),
+                    Module.code.label("module_code"),
+                    Module.name.label("module_name"),
+                    SemesterModule.type,
+                    SemesterModule.credits,
+                    SemesterModule.hidden,
+                )
+                .join(Structure, StructureSemester.structure_id == Structure.id)
+                .outerjoin(
+                    SemesterModule,
+                    (SemesterModule.semester_id == StructureSemester.id)
+                    & SemesterModule.cms_id.isnot(None),
+                )
+                .outerjoin(Module, SemesterModule.module_id == Module.id)
+                .filter(
+                    or_(Structure.id == structure_id, Structure.cms_id == structure_id)
+                )
+                .filter(StructureSemester.cms_id.isnot(None))
+                .order_by(StructureSemester.semester_number, Module.code)
+                .all()
+            )
+
+        tree = StructureTree(
+            structure_id=structure_id,
+            semesters=[],
+            modules_by_semester={},
+        )
+        for result in results:
+            if result.semester_cms_id not in tree.modules_by_semester:
+                tree.modules_by_semester[result.semester_cms_id] = []
+                tree.semesters.append(
+                    SemesterRow(
+                        cms_id=result.semester_cms_id,
+                        semester_number=result.semester_number,
+                        name=result.name,
+                        total_credits=result.total_credits,
+                    )
+                )
+
+            if result.module_cms_id is None or result.module_code is None:
+                continue
+
+            tree.modules_by_semester[result.semester_cms_id].append(
+                SemesterModuleRow(
+                    cms_id=result.module_cms_id,
+                    module_code=result.module_code,
+                    module_name=result.module_name,
+                    type=result.type,
+                    credits=result.credits,
+                    hidden=result.hidden,
+                )
+            )
+
+        return tree
+
     def get_semester_modules(self, semester_id: int):
         with self._session() as session:
             results = (
@@ -319,6 +444,33 @@ class StructureRepository:
             for result in results
         ]
 
+    def get_semester_module_row(
+        self, semester_module: SemesterModule
+    ) -> SemesterModuleRow:
+        with self._session() as session:
+            result = (
+                session.query(
+                    SemesterModule.cms_id.label("cms_id"),
+                    Module.code,
+                    Module.name,
+                    SemesterModule.type,
+                    SemesterModule.credits,
+                    SemesterModule.hidden,
+                )
+                .join(Module, SemesterModule.module_id == Module.id)
+                .filter(SemesterModule.id == semester_module.id)
+                .one()
+            )
+
+        return SemesterModuleRow(
+            cms_id=result.cms_id,
+            module_code=result.code,
+            module_name=result.name,
+            type=result.type,
+            credits=result.credits,
+            hidden=result.hidden,
+        )
+
     def find_missing_school_cms_ids(
         self,
         cms_ids: list[int],
@@ -7,9 +7,14 @@ from base import get_logger
 from base.browser import BASE_URL, Browser, get_form_payload
 from database.models import ProgramLevel
 from features.common.cms_utils import post_cms_form
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    invalidate_reference_data,
+)
 from utils.normalizers import normalize_module_type
 
-from .repository import StructureRepository
+from .repository import SemesterModuleRow, SemesterRow, StructureRepository
 from .scraper import (
     scrape_all_schools,
     scrape_programs,
@@ -67,6 +72,7 @@ class SchoolSyncService:
         semester_code: str,
         credits: float | None,
         progress_callback: Callable[[str], None],
+        on_saved: Callable[[list[SemesterRow]], None] | None = None,
     ) -> tuple[bool, str]:
         url = f"{BASE_URL}/f_semesteradd.php?showmaster=1&StructureID={structure_id}"
 
@@ -103,6 +109,7 @@ class SchoolSyncService:
 
             progress_callback("Refreshing semesters from CMS...")
             semesters = scrape_semesters(structure_id)
+            saved_semesters: list[SemesterRow] = []
             for semester in semesters:
                 self.repository.save_semester(
                     int(semester["cms_id"]),
@@ -111,6 +118,17 @@ class SchoolSyncService:
                     float(semester["total_credits"]),
                     structure_id,
                 )
+                saved_semesters.append(
+                    SemesterRow(
+                        cms_id=int(semester["cms_id"]),
+                        semester_number=str(semester["semester_number"]),
+                        name=str(semester["name"]),
+                        total_credits=float(semester["total_credits"]),
+                    )
+                )
+
+            if on_saved:
+                on_saved(saved_semesters)
 
             return True, "Semester created successfully"
 
@@ -125,6 +143,7 @@ class SchoolSyncService:
         semester_id: int,
         data: dict,
         progress_callback: Callable[[str], None],
+        on_saved: Callable[[list[SemesterModuleRow]], None] | None = None,
     ) -> tuple[bool, str]:
         url = f"{BASE_URL}/f_semmoduleadd.php?showmaster=1&SemesterID={semester_id}"
 
@@ -189,9 +208,10 @@ class SchoolSyncService:
             progress_callback("Refreshing semester modules from CMS...")
 
             semester_modules = scrape_semester_modules(int(semester_id))
+            saved_modules: list[SemesterModuleRow] = []
             for sem_module in semester_modules:
                 normalized_type = normalize_module_type(str(sem_module["type"]))
-                self.repository.save_semester_module(
+                saved = self.repository.save_semester_module(
                     int(sem_module["cms_id"]),
                     str(sem_module["module_code"]),
                     str(sem_module["module_name"]),
@@ -200,6 +220,10 @@ class SchoolSyncService:
                     int(semester_id),
                     bool(sem_module["hidden"]),
                 )
+                saved_modules.append(self.repository.get_semester_module_row(saved))
+
+            if on_saved:
+                on_saved(saved_modules)
 
             return True, "Semester module created successfully"
         except Exception as e:
@@ -375,6 +399,8 @@ class SchoolSyncService:
                     progress_callback,
                 )
 
+        invalidate_reference_data(SCHOOLS, PROGRAMS)
+
         self._verify_saved_cms_ids(
             "Schools",
             school_cms_ids,
@@ -420,6 +446,8 @@ class SchoolSyncService:
             program["_db_id"] = saved_program.id
             program_cms_ids.append(self._row_int(program, "cms_id"))
 
+        invalidate_reference_data(PROGRAMS)
+
         self._verify_saved_cms_ids(
             "Programs",
             program_cms_ids,
@@ -533,6 +561,8 @@ class SchoolSyncService:
             program["_db_id"] = saved_program.id
             program_cms_ids.append(self._row_int(program, "cms_id"))
 
+        invalidate_reference_data(SCHOOLS, PROGRAMS)
+
         self._verify_saved_cms_ids(
             "Programs",
             program_cms_ids,
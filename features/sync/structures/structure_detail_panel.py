@@ -3,11 +3,13 @@ from typing import Any, cast
 
 import wx
 
+from base.progress import ProgressChannel
+
 from .loader_control import LoadableControl
 from .new_semester_dialog import NewSemesterDialog
 from .new_semester_module_dialog import NewSemesterModuleDialog
 from .new_structure_dialog import NewStructureDialog
-from .repository import StructureRepository
+from .repository import SemesterModuleRow, StructureRepository
 from .service import SchoolSyncService
 
 
@@ -18,7 +20,7 @@ class FetchSemesterModulesWorker(threading.Thread):
         self.semester_name = semester_name
         self.service = service
         self.repository = repository
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -38,8 +40,9 @@ class FetchSemesterModulesWorker(threading.Thread):
                 "progress", f"Saving modules for {self.semester_name}...", 1, 1
             )
 
+            saved_modules: list[SemesterModuleRow] = []
             for sem_module in semester_modules:
-                self.repository.save_semester_module(
+                saved = self.repository.save_semester_module(
                     int(sem_module["cms_id"]),
                     str(sem_module["module_code"]),
                     str(sem_module["module_name"]),
@@ -48,8 +51,9 @@ class FetchSemesterModulesWorker(threading.Thread):
                     self.semester_id,
                     bool(sem_module["hidden"]),
                 )
+                saved_modules.append(self.repository.get_semester_module_row(saved))
 
-            self.callback("finished", len(semester_modules))
+            self.callback("finished", self.semester_id, saved_modules)
 
         except Exception as e:
             self.callback("error", str(e))
@@ -70,7 +74,7 @@ class CreateSemesterModuleWorker(threading.Thread):
         self.semester_id = semester_id
         self.data = data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -81,14 +85,16 @@ class CreateSemesterModuleWorker(threading.Thread):
             def progress(message: str):
                 self.callback("progress", message)
 
+            saved_modules = []
             success, message = self.service.create_semester_module(
                 self.semester_id,
                 self.data,
                 progress,
+                on_saved=saved_modules.extend,
             )
 
             if success:
-                self.callback("finished")
+                self.callback("finished", self.semester_id, saved_modules)
             else:
                 self.callback("error", message)
         except Exception as e:
@@ -110,7 +116,7 @@ class CreateSemesterWorker(threading.Thread):
         self.structure_id = structure_id
         self.data = data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -121,15 +127,17 @@ class CreateSemesterWorker(threading.Thread):
             def progress(message: str):
                 self.callback("progress", message)
 
+            saved_semesters = []
             success, message = self.service.create_semester(
                 self.structure_id,
                 str(self.data.get("semester_code") or "").strip(),
                 self.data.get("credits"),
                 progress,
+                on_saved=saved_semesters.extend,
             )
 
             if success:
-                self.callback("finished")
+                self.callback("finished", self.structure_id, saved_semesters)
             else:
                 self.callback("error", message)
         except Exception as e:
@@ -151,7 +159,7 @@ class CreateStructureWorker(threading.Thread):
         self.program_id = program_id
         self.data = data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -185,7 +193,7 @@ class FetchStructureDataWorker(threading.Thread):
         self.structure_id = structure_id
         self.structure_code = structure_code
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -228,6 +236,7 @@ class StructureDetailPanel(wx.Panel):
         self.create_structure_worker = None
         self.create_semester_worker = None
         self.create_semester_module_worker = None
+        self.structure_tree = None
         self.semesters_loader: LoadableControl
         self.modules_loader: LoadableControl
 
@@ -363,15 +372,23 @@ class StructureDetailPanel(wx.Panel):
             self.program_label.SetLabel(str(program))
 
             self.modules_list.DeleteAllItems()
+            self.structure_tree = None
 
-            def load_data():
-                return self.repository.get_structure_semesters(structure_id)
-
-            self.semesters_loader.load_async(load_data, "Loading semesters...")
+            self.reload_structure_tree()
 
         except Exception as e:
             print(f"Error loading structure details: {str(e)}")
 
+    def reload_structure_tree(self):
+        structure_id = self.selected_structure_cms_id
+        if structure_id is None:
+            return
+
+        def load_data():
+            return self.repository.get_structure_tree(int(structure_id))
+
+        self.semesters_loader.load_async(load_data, "Loading semesters...")
+
     def on_semesters_loaded(self, success, data):
         if not success:
             wx.MessageBox(
@@ -379,14 +396,31 @@ class StructureDetailPanel(wx.Panel):
             )
             return
 
-        semesters = data
+        if data.structure_id != self.selected_structure_cms_id:
+            return
+
+        self.structure_tree = data
+        self.show_semesters()
+
+    def show_semesters(self):
+        if self.structure_tree is None:
+            return
+
         self.semesters_list.DeleteAllItems()
+        selected_index = wx.NOT_FOUND
 
-        for row, semester in enumerate(semesters):
+        for row, semester in enumerate(self.structure_tree.get_semesters()):
             index = self.semesters_list.InsertItem(row, semester.semester_number)
             self.semesters_list.SetItem(index, 1, semester.name)
             self.semesters_list.SetItem(index, 2, f"{semester.total_credits:.1f}")
             self.semesters_list.SetItemData(index, semester.cms_id)
+            if semester.cms_id == self.selected_semester_cms_id:
+                selected_index = index
+
+        if selected_index != wx.NOT_FOUND:
+            self.semesters_list.Select(selected_index)
+        else:
+            self.modules_list.DeleteAllItems()
 
         self.Layout()
 
@@ -541,13 +575,15 @@ class StructureDetailPanel(wx.Panel):
 
             self.add_semester_button.Enable(True)
 
-            structure_id = self.selected_structure_cms_id
-            if structure_id is not None:
-
-                def load_data():
-                    return self.repository.get_structure_semesters(int(structure_id))
-
-                self.semesters_loader.load_async(load_data, "Loading semesters...")
+            structure_id, saved_semesters = args
+            if (
+                self.structure_tree is not None
+                and self.structure_tree.structure_id == structure_id
+            ):
+                self.structure_tree.apply_semesters(saved_semesters)
+                self.show_semesters()
+            elif structure_id == self.selected_structure_cms_id:
+                self.reload_structure_tree()
 
             wx.MessageBox(
                 "Semester created successfully.",
@@ -621,13 +657,8 @@ class StructureDetailPanel(wx.Panel):
 
             if self.selected_structure_cms_id:
                 self.modules_list.DeleteAllItems()
-
-                def load_data():
-                    return self.repository.get_structure_semesters(
-                        self.selected_structure_cms_id
-                    )
-
-                self.semesters_loader.load_async(load_data, "Loading semesters...")
+                self.structure_tree = None
+                self.reload_structure_tree()
 
             wx.MessageBox(
                 f"Successfully fetched structure data for {self.selected_structure_code}.",
@@ -664,7 +695,10 @@ class StructureDetailPanel(wx.Panel):
             return
 
         semester_id = int(self.selected_semester_cms_id)
-        existing_modules = self.repository.get_semester_modules(semester_id)
+        if self.structure_tree and self.structure_tree.has_semester(semester_id):
+            existing_modules = self.structure_tree.get_modules(semester_id)
+        else:
+            existing_modules = self.repository.get_semester_modules(semester_id)
 
         dialog = NewSemesterModuleDialog(
             self,
@@ -740,8 +774,8 @@ class StructureDetailPanel(wx.Panel):
             self.new_semester_module_button.Enable(True)
             self.fetch_modules_button.Enable(True)
 
-            if self.selected_semester_cms_id:
-                self.load_semester_modules(int(self.selected_semester_cms_id))
+            semester_id, saved_modules = args
+            self.apply_semester_modules(semester_id, saved_modules)
 
             wx.MessageBox(
                 "Module added to semester successfully.",
@@ -791,14 +825,14 @@ class StructureDetailPanel(wx.Panel):
             if self.status_bar:
                 self.status_bar.show_progress(message, current, total)
         elif event_type == "finished":
-            modules_count = args[0]
+            semester_id, saved_modules = args
+            modules_count = len(saved_modules)
             if self.status_bar:
                 self.status_bar.clear()
 
             self.fetch_modules_button.Enable(True)
 
-            if self.selected_semester_cms_id:
-                self.load_semester_modules(self.selected_semester_cms_id)
+            self.apply_semester_modules(semester_id, saved_modules)
 
             wx.MessageBox(
                 f"Successfully fetched {modules_count} module(s) for {self.selected_semester_name}.",
@@ -815,7 +849,19 @@ class StructureDetailPanel(wx.Panel):
 
             wx.MessageBox(f"Fetch failed: {error_msg}", "Error", wx.OK | wx.ICON_ERROR)
 
+    def apply_semester_modules(self, semester_id, saved_modules):
+        if self.structure_tree:
+            self.structure_tree.apply_semester_modules(semester_id, saved_modules)
+
+        if semester_id == self.selected_semester_cms_id:
+            self.load_semester_modules(semester_id)
+
     def load_semester_modules(self, semester_id):
+        if self.structure_tree and self.structure_tree.has_semester(semester_id):
+            self.modules_loader.hide_loader()
+            self.on_modules_loaded(True, self.structure_tree.get_modules(semester_id))
+            return
+
         def load_data():
             return self.repository.get_semester_modules(semester_id)
 
@@ -843,6 +889,7 @@ class StructureDetailPanel(wx.Panel):
         self.Layout()
 
     def clear(self):
+        self.structure_tree = None
         self.selected_structure_cms_id = None
         self.selected_structure_code = None
         self.selected_semester_cms_id = None
@@ -2,6 +2,8 @@ import threading
 
 import wx
 
+from base.progress import ProgressChannel
+
 from .add_school_dialog import AddSchoolDialog
 from .import_structures_dialog import ImportStructuresDialog
 from .repository import StructureRepository
@@ -84,7 +86,7 @@ class ImportAllWorker(threading.Thread):
     def __init__(self, service, callback):
         super().__init__(daemon=True)
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
 
     def run(self):
@@ -3,16 +3,20 @@ from __future__ import annotations
 import argparse
 import queue
 import sys
+import time
 from dataclasses import dataclass
 from typing import Callable, Protocol, Sequence, TextIO, cast, runtime_checkable
 
+from base.http_telemetry import get_http_telemetry
 from base.runtime_config import (
     get_current_country_code,
     has_complete_runtime_configuration,
 )
+from base.session_monitor import SessionMonitor, get_session_monitor
 from database.connection import configure_database_urls_for_country
 from features.sync.students.scraper import detect_student_range
 
+from .import_timings import ImportTimingLog, format_timing_summary
 from .importer_project import ImporterProject, ImporterProjectManager
 from .importer_worker import ImporterRetryWorker, ImporterWorker
 from .service import StudentSyncService
@@ -20,6 +24,8 @@ from .service import StudentSyncService
 MenuOption = tuple[str, str]
 WorkerEvent = tuple[str, tuple[object, ...]]
 
+SESSION_CHECK_INTERVAL = 30.0
+
 
 @dataclass(frozen=True)
 class ImportCliOptions:
@@ -36,6 +42,7 @@ class ImportCliOptions:
     addresses: bool
     skip_active_term: bool
     delete_programs_before_import: bool
+    timings_only: bool = False
 
 
 class ImportProjectStore(Protocol):
@@ -114,6 +121,8 @@ class StudentImportCli:
         sync_service: StudentSyncService | None = None,
         project_manager: ImportProjectStore = ImporterProjectManager,
         range_detector: Callable[[], tuple[str, str, int]] = detect_student_range,
+        session_monitor: SessionMonitor | None = None,
+        timing_log: ImportTimingLog | None = None,
     ):
         self.console = console or TerminalConsole()
         self.sync_service = sync_service or StudentSyncService()
@@ -125,8 +134,18 @@ class StudentImportCli:
         self.event_queue: queue.Queue[WorkerEvent] = queue.Queue()
         self.exit_requested = False
         self.last_progress_signature: tuple[str, int, int, int, int] | None = None
+        self.session_monitor = session_monitor
+        self.last_session_check: float | None = None
+        self.last_session_warning: str | None = None
+        self.timing_log = timing_log or ImportTimingLog(
+            ImporterProjectManager.TIMINGS_FILE
+        )
 
     def run(self, options: ImportCliOptions) -> int:
+        if options.timings_only:
+            self._print_timing_summary(always=True)
+            return 0
+
         self._ensure_runtime_configuration(options.country)
         project, should_start = self._load_or_create_project(options)
 
@@ -284,6 +303,7 @@ class StudentImportCli:
 
     def _run_worker_loop(self) -> str:
         while self.project is not None and self.project.status == "running":
+            self._check_session_health()
             try:
                 event_type, args = self.event_queue.get(timeout=0.2)
             except queue.Empty:
@@ -298,6 +318,21 @@ class StudentImportCli:
 
         return "paused"
 
+    def _check_session_health(self) -> None:
+        now = time.monotonic()
+        if (
+            self.last_session_check is not None
+            and now - self.last_session_check < SESSION_CHECK_INTERVAL
+        ):
+            return
+        self.last_session_check = now
+
+        monitor = self.session_monitor or get_session_monitor()
+        message = monitor.get_health().describe()
+        if message and message != self.last_session_warning:
+            self.console.print(f"Warning: {message}")
+        self.last_session_warning = message
+
     def _retry_all_failed_students(self) -> str | None:
         if self.project is None or not self.project.failed_students:
             self.console.print("There are no failed students to retry.")
@@ -432,6 +467,8 @@ class StudentImportCli:
             )
             if project.failed_students:
                 self._print_failed_students(project)
+            self._print_timing_summary()
+            self._print_http_telemetry()
             self.project_manager.delete_project()
             self.project = None
             return "completed"
@@ -588,6 +625,21 @@ class StudentImportCli:
             preview = ", ".join(self.project.failed_students[:10])
             self.console.print(f"Failed students: {preview}")
 
+    def _print_timing_summary(self, always: bool = False) -> None:
+        records = self.timing_log.read()
+        if not records and not always:
+            return
+        for line in format_timing_summary(records):
+            self.console.print(line)
+
+    def _print_http_telemetry(self) -> None:
+        summary = get_http_telemetry().describe()
+        if summary:
+            self.console.print(summary)
+            self.console.print(
+                f"Request telemetry saved to {ImporterProjectManager.TELEMETRY_FILE}"
+            )
+
     def _print_failed_students(self, project: ImporterProject | None = None) -> None:
         active_project = project or self.project
         if active_project is None or not active_project.failed_students:
@@ -622,6 +674,12 @@ def build_parser() -> argparse.ArgumentParser:
         dest="status_only",
         help="Show the saved import project status and exit",
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        dest="timings_only",
+        help="Show p50/p95 phase timings and the slowest students of the last import run and exit",
+    )
     parser.add_argument(
         "--student-info",
         action=argparse.BooleanOptionalAction,
@@ -676,6 +734,7 @@ def parse_options(argv: Sequence[str] | None = None) -> ImportCliOptions:
         auto_detect=args.auto_detect,
         resume=args.resume,
         status_only=args.status_only,
+        timings_only=args.timings_only,
         student_info=args.student_info,
         personal_info=args.personal_info,
         education_history=args.education_history,
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from base import get_logger
+from base.phase_timing import PhaseTimings
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class StudentTimingRecord:
+    student_number: str
+    success: bool
+    total_seconds: float
+    phases: dict[str, float]
+
+
+@dataclass(frozen=True)
+class PhaseSummary:
+    phase: str
+    students: int
+    total_seconds: float
+    p50_seconds: float
+    p95_seconds: float
+
+
+class ImportTimingLog:
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, timings: PhaseTimings, success: bool) -> None:
+        record = {
+            "std_no": timings.key,
+            "ok": success,
+            "total": round(timings.total_seconds, 4),
+            "phases": {
+                name: round(seconds, 4)
+                for name, seconds in sorted(timings.phases.items())
+            },
+        }
+        line = json.dumps(record, separators=(",", ":"))
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(f"{line}\n")
+        except OSError as e:
+            logger.warning(f"Could not write import timing log: {str(e)}")
+
+    def read(self) -> list[StudentTimingRecord]:
+        if not self.path.exists():
+            return []
+
+        records: list[StudentTimingRecord] = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                    records.append(
+                        StudentTimingRecord(
+                            student_number=str(data["std_no"]),
+                            success=bool(data.get("ok")),
+                            total_seconds=float(data.get("total", 0.0)),
+                            phases={
+                                str(name): float(seconds)
+                                for name, seconds in data.get("phases", {}).items()
+                            },
+                        )
+                    )
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue
+        return records
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_phases(records: list[StudentTimingRecord]) -> list[PhaseSummary]:
+    by_phase: dict[str, list[float]] = {"total": []}
+    for record in records:
+        by_phase["total"].append(record.total_seconds)
+        for name, seconds in record.phases.items():
+            by_phase.setdefault(name, []).append(seconds)
+
+    summaries = [
+        PhaseSummary(
+            phase=name,
+            students=len(values),
+            total_seconds=sum(values),
+            p50_seconds=percentile(values, 0.5),
+            p95_seconds=percentile(values, 0.95),
+        )
+        for name, values in by_phase.items()
+        if values
+    ]
+    return sorted(
+        summaries,
+        key=lambda summary: (summary.phase != "total", -summary.total_seconds),
+    )
+
+
+def slowest_students(
+    records: list[StudentTimingRecord], limit: int = 5
+) -> list[StudentTimingRecord]:
+    return sorted(records, key=lambda record: record.total_seconds, reverse=True)[
+        :limit
+    ]
+
+
+def format_timing_summary(
+    records: list[StudentTimingRecord], slowest: int = 5
+) -> list[str]:
+    if not records:
+        return ["No import timings were recorded."]
+
+    width = max(len(summary.phase) for summary in summarize_phases(records))
+    lines = [
+        f"Phase timings for {len(records)} students (seconds per student)",
+        f"{'phase'.ljust(width)}  {'p50':>8}  {'p95':>8}  {'total':>9}",
+    ]
+    for summary in summarize_phases(records):
+        lines.append(
+            f"{summary.phase.ljust(width)}  {summary.p50_seconds:8.3f}  "
+            f"{summary.p95_seconds:8.3f}  {summary.total_seconds:9.1f}"
+        )
+
+    lines.append("Slowest students:")
+    for record in slowest_students(records, slowest):
+        top_phase = max(
+            record.phases.items(), key=lambda item: item[1], default=("-", 0.0)
+        )
+        lines.append(
+            f"- {record.student_number}: {record.total_seconds:.2f}s "
+            f"({top_phase[0]} {top_phase[1]:.2f}s)"
+            f"{'' if record.success else ' failed'}"
+        )
+    return lines
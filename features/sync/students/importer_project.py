@@ -32,6 +32,8 @@ class ImporterProject:
 
 class ImporterProjectManager:
     PROJECT_FILE = Path.home() / ".registry" / "import_project.json"
+    TELEMETRY_FILE = Path.home() / ".registry" / "import_http_telemetry.json"
+    TIMINGS_FILE = Path.home() / ".registry" / "import_timings.jsonl"
 
     @classmethod
     def _ensure_directory(cls):
@@ -52,6 +54,8 @@ class ImporterProjectManager:
         )
 
         cls.save_project(project)
+        cls.TIMINGS_FILE.unlink(missing_ok=True)
+        cls.TELEMETRY_FILE.unlink(missing_ok=True)
         return project
 
     @classmethod
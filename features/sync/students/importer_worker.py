@@ -2,7 +2,11 @@ import threading
 from typing import Callable
 
 from base import get_logger
+from base.http_telemetry import get_http_telemetry
+from base.phase_timing import PhaseTimings, record_phases
+from base.progress import ProgressChannel
 
+from .import_timings import ImportTimingLog
 from .importer_project import ImporterProject, ImporterProjectManager
 from .service import SponsorResolutionError
 
@@ -14,8 +18,9 @@ class ImporterWorker(threading.Thread):
         super().__init__(daemon=True)
         self.project = project
         self.sync_service = sync_service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self._stop_flag = threading.Event()
+        self._timing_log = ImportTimingLog(ImporterProjectManager.TIMINGS_FILE)
 
     def stop(self):
         self._stop_flag.set()
@@ -40,10 +45,27 @@ class ImporterWorker(threading.Thread):
         response_event.wait()
         return bool(response_holder["create"])
 
+    def _record_timings(self, timings: PhaseTimings | None, success: bool):
+        if timings is None or not timings.phases:
+            return
+        self._timing_log.append(timings, success)
+
+    def _save_http_telemetry(self):
+        telemetry = get_http_telemetry()
+        if not telemetry.totals().requests:
+            return
+        try:
+            telemetry.write_summary(ImporterProjectManager.TELEMETRY_FILE)
+        except OSError as e:
+            logger.warning(f"Could not save CMS request telemetry: {str(e)}")
+
     def run(self):
         logger.info(
             f"Importer worker starting for range {self.project.start_student} to {self.project.end_student}"
         )
+        telemetry = get_http_telemetry()
+        telemetry.reset()
+        telemetry.load_summary(ImporterProjectManager.TELEMETRY_FILE)
 
         self.project.status = "running"
         ImporterProjectManager.save_project(self.project)
@@ -63,6 +85,7 @@ class ImporterWorker(threading.Thread):
                 )
                 self.project.status = "paused"
                 ImporterProjectManager.save_project(self.project)
+                self._save_http_telemetry()
                 self.callback("stopped", self.project)
                 return
 
@@ -72,6 +95,7 @@ class ImporterWorker(threading.Thread):
             current_overall = total_students - len(remaining_students) + idx + 1
 
             student_started = True
+            timings: PhaseTimings | None = None
 
             try:
 
@@ -86,12 +110,14 @@ class ImporterWorker(threading.Thread):
                         self.project,
                     )
 
-                was_updated = self.sync_service.fetch_student(
-                    std_no,
-                    progress_callback,
-                    self.project.import_options,
-                    self._request_missing_sponsor,
-                )
+                with record_phases(std_no) as timings:
+                    was_updated = self.sync_service.fetch_student(
+                        std_no,
+                        progress_callback,
+                        self.project.import_options,
+                        self._request_missing_sponsor,
+                    )
+                self._record_timings(timings, was_updated)
 
                 if was_updated:
                     self.project.success_count += 1
@@ -109,12 +135,14 @@ class ImporterWorker(threading.Thread):
                 ImporterProjectManager.add_failed_student(self.project, std_no)
                 self.project.status = "paused"
                 ImporterProjectManager.save_project(self.project)
+                self._save_http_telemetry()
                 self.callback("cancelled", self.project, str(e))
                 return
             except Exception as e:
                 logger.error(
                     f"Error importing student {std_no}: {str(e)}",
                 )
+                self._record_timings(timings, False)
                 self.callback("error", f"Error importing student {std_no}: {str(e)}")
                 ImporterProjectManager.add_failed_student(self.project, std_no)
                 ImporterProjectManager.save_project(self.project)
@@ -142,6 +170,7 @@ class ImporterWorker(threading.Thread):
 
                 self.project.status = "paused"
                 ImporterProjectManager.save_project(self.project)
+                self._save_http_telemetry()
                 self.callback("stopped", self.project)
                 return
 
@@ -152,6 +181,7 @@ class ImporterWorker(threading.Thread):
                 f"Importer worker completed. Success: {self.project.success_count}, "
                 f"Failed: {self.project.failed_count}"
             )
+            self._save_http_telemetry()
             self.callback("finished", self.project)
 
 
@@ -167,7 +197,8 @@ class ImporterRetryWorker(threading.Thread):
         self.project = project
         self.student_number = student_number
         self.sync_service = sync_service
-        self.callback = callback
+        self.callback = ProgressChannel(callback, coalesce=("retry_progress",))
+        self._timing_log = ImportTimingLog(ImporterProjectManager.TIMINGS_FILE)
 
     def _request_missing_sponsor(
         self, sponsor_code: str, semester_id: str, term: str | None
@@ -185,8 +216,14 @@ class ImporterRetryWorker(threading.Thread):
         response_event.wait()
         return bool(response_holder["create"])
 
+    def _record_timings(self, timings: PhaseTimings | None, success: bool):
+        if timings is None or not timings.phases:
+            return
+        self._timing_log.append(timings, success)
+
     def run(self):
         logger.info(f"Retry worker starting for student {self.student_number}")
+        timings: PhaseTimings | None = None
 
         try:
 
@@ -200,12 +237,14 @@ class ImporterRetryWorker(threading.Thread):
                     self.project,
                 )
 
-            was_updated = self.sync_service.fetch_student(
-                self.student_number,
-                progress_callback,
-                self.project.import_options,
-                self._request_missing_sponsor,
-            )
+            with record_phases(self.student_number) as timings:
+                was_updated = self.sync_service.fetch_student(
+                    self.student_number,
+                    progress_callback,
+                    self.project.import_options,
+                    self._request_missing_sponsor,
+                )
+            self._record_timings(timings, was_updated)
 
             if was_updated:
                 if not ImporterProjectManager.resolve_failed_student(
@@ -247,6 +286,7 @@ class ImporterRetryWorker(threading.Thread):
         except Exception as e:
             error_msg = f"Error importing student {self.student_number}: {str(e)}"
             logger.error(error_msg)
+            self._record_timings(timings, False)
             ImporterProjectManager.add_failed_student(self.project, self.student_number)
             ImporterProjectManager.save_project(self.project)
             self.callback(
@@ -11,6 +11,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from base import get_logger
+from base.phase_timing import timed_phase
 from database import (
     Module,
     NextOfKin,
@@ -28,6 +29,14 @@ from database import (
     Term,
     get_engine,
 )
+from database.instrumentation import profiled
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    SEMESTERS,
+    TERMS,
+    reference_data,
+)
 from utils.normalizers import normalize_student_module_status
 
 logger = get_logger(__name__)
@@ -221,6 +230,52 @@ class StudentRow:
     phone1: Optional[str]
 
 
+@dataclass(frozen=True)
+class StudentSemesterDetail:
+    student_semester_db_id: int
+    student_semester_cms_id: Optional[int]
+    term_code: Optional[str]
+    structure_semester_db_id: int
+    structure_semester_cms_id: Optional[int]
+    semester_number: Optional[str]
+    status: Optional[str]
+    caf_date: Optional[str]
+
+
+@dataclass(frozen=True)
+class StudentModuleDetail:
+    student_module_db_id: int
+    student_module_cms_id: Optional[int]
+    semester_module_db_id: int
+    semester_module_cms_id: Optional[int]
+    module_code: Optional[str]
+    module_name: Optional[str]
+    status: Optional[str]
+    marks: Optional[str]
+    grade: Optional[str]
+    credits: Optional[float]
+
+
+@dataclass
+class StudentGraph:
+    std_no: str
+    programs: list
+    semesters_by_program: dict[int, list[StudentSemesterDetail]]
+    modules_by_semester: dict[int, list[StudentModuleDetail]]
+
+    def has_program(self, student_program_db_id: int) -> bool:
+        return student_program_db_id in self.semesters_by_program
+
+    def has_semester(self, student_semester_db_id: int) -> bool:
+        return student_semester_db_id in self.modules_by_semester
+
+    def get_semesters(self, student_program_db_id: int) -> list[StudentSemesterDetail]:
+        return list(self.semesters_by_program.get(student_program_db_id, []))
+
+    def get_modules(self, student_semester_db_id: int) -> list[StudentModuleDetail]:
+        return list(self.modules_by_semester.get(student_semester_db_id, []))
+
+
 class StudentRepository:
     def __init__(self) -> None:
         self._engine = get_engine()
@@ -232,6 +287,9 @@ class StudentRepository:
             yield session
 
     def list_active_schools(self):
+        return reference_data.get(SCHOOLS, self._load_active_schools)
+
+    def _load_active_schools(self):
         with self._session() as session:
             return (
                 session.query(School.cms_id.label("cms_id"), School.name)
@@ -242,6 +300,11 @@ class StudentRepository:
             )
 
     def list_programs(self, school_cms_id: Optional[int] = None):
+        return reference_data.get(
+            PROGRAMS, lambda: self._load_programs(school_cms_id), school_cms_id or None
+        )
+
+    def _load_programs(self, school_cms_id: Optional[int]):
         with self._session() as session:
             query = session.query(Program.cms_id.label("cms_id"), Program.name).filter(
                 Program.cms_id.isnot(None)
@@ -253,6 +316,9 @@ class StudentRepository:
             return query.order_by(Program.name).all()
 
     def list_terms(self):
+        return reference_data.get(TERMS, self._load_terms, "student_semesters")
+
+    def _load_terms(self):
         with self._session() as session:
             rows = (
                 session.query(distinct(StudentSemester.term_code))
@@ -263,6 +329,9 @@ class StudentRepository:
             return [row[0] for row in rows]
 
     def list_semesters(self):
+        return reference_data.get(SEMESTERS, self._load_semesters)
+
+    def _load_semesters(self):
         with self._session() as session:
             from database import StructureSemester
 
@@ -363,6 +432,61 @@ class StudentRepository:
         ]
         return rows, total
 
+    def fetch_students_by_numbers(self, std_nos: list[str]) -> list[StudentRow]:
+        numeric_std_nos: list[int] = []
+        for std_no in std_nos:
+            try:
+                numeric_std_nos.append(int(str(std_no).strip()))
+            except (TypeError, ValueError):
+                continue
+
+        if not numeric_std_nos:
+            return []
+
+        with self._session() as session:
+            results = (
+                session.query(
+                    Student.std_no,
+                    Student.name,
+                    Student.gender,
+                    Student.date_of_birth,
+                    School.code.label("faculty_code"),
+                    Program.name.label("program_name"),
+                    Student.phone1,
+                )
+                .outerjoin(
+                    StudentProgram,
+                    (Student.std_no == StudentProgram.std_no)
+                    & (StudentProgram.status == "Active"),
+                )
+                .outerjoin(Structure, StudentProgram.structure_id == Structure.id)
+                .outerjoin(Program, Structure.program_id == Program.id)
+                .outerjoin(School, Program.school_id == School.id)
+                .filter(Student.std_no.in_(numeric_std_nos))
+                .order_by(Student.std_no, StudentProgram.id.desc())
+                .all()
+            )
+
+        rows_by_std_no: dict[int, StudentRow] = {}
+        for result in results:
+            if result.std_no in rows_by_std_no:
+                continue
+            rows_by_std_no[result.std_no] = StudentRow(
+                std_no=str(result.std_no),
+                name=result.name,
+                gender=result.gender,
+                date_of_birth=result.date_of_birth,
+                faculty_code=result.faculty_code,
+                program_name=result.program_name,
+                phone1=result.phone1,
+            )
+
+        return [
+            rows_by_std_no[std_no]
+            for std_no in dict.fromkeys(numeric_std_nos)
+            if std_no in rows_by_std_no
+        ]
+
     def get_student_programs(self, student_number: str):
         try:
             numeric_student_number = int(student_number)
@@ -370,33 +494,146 @@ class StudentRepository:
             return []
 
         with self._session() as session:
-            programs = (
+            return self._query_student_programs(session, numeric_student_number)
+
+    def _query_student_programs(self, session: Session, std_no: int):
+        return (
+            session.query(
+                StudentProgram.id.label("student_program_db_id"),
+                StudentProgram.cms_id.label("student_program_cms_id"),
+                StudentProgram.intake_date,
+                StudentProgram.reg_date,
+                StudentProgram.start_term,
+                StudentProgram.status,
+                StudentProgram.stream,
+                StudentProgram.graduation_date,
+                Structure.id.label("structure_db_id"),
+                Structure.cms_id.label("structure_cms_id"),
+                Program.name.label("program_name"),
+                Program.code.label("program_code"),
+                Program.cms_id.label("program_cms_id"),
+                School.name.label("school_name"),
+                School.cms_id.label("school_cms_id"),
+            )
+            .join(Structure, StudentProgram.structure_id == Structure.id)
+            .join(Program, Structure.program_id == Program.id)
+            .join(School, Program.school_id == School.id)
+            .filter(StudentProgram.std_no == std_no)
+            .order_by(StudentProgram.id.desc())
+            .all()
+        )
+
+    def get_student_graph(self, student_number: str) -> StudentGraph:
+        graph = StudentGraph(
+            std_no=str(student_number),
+            programs=[],
+            semesters_by_program={},
+            modules_by_semester={},
+        )
+
+        try:
+            numeric_student_number = int(student_number)
+        except (TypeError, ValueError):
+            return graph
+
+        with self._session() as session:
+            graph.programs = self._query_student_programs(
+                session, numeric_student_number
+            )
+            if not graph.programs:
+                return graph
+
+            for program in graph.programs:
+                graph.semesters_by_program[program.student_program_db_id] = []
+
+            rows = (
                 session.query(
-                    StudentProgram.id.label("student_program_db_id"),
-                    StudentProgram.cms_id.label("student_program_cms_id"),
-                    StudentProgram.intake_date,
-                    StudentProgram.reg_date,
-                    StudentProgram.start_term,
-                    StudentProgram.status,
-                    StudentProgram.stream,
-                    StudentProgram.graduation_date,
-                    Structure.id.label("structure_db_id"),
-                    Structure.cms_id.label("structure_cms_id"),
-                    Program.name.label("program_name"),
-                    Program.code.label("program_code"),
-                    Program.cms_id.label("program_cms_id"),
-                    School.name.label("school_name"),
-                    School.cms_id.label("school_cms_id"),
+                    StudentSemester.student_program_id,
+                    StudentSemester.id.label("student_semester_db_id"),
+                    StudentSemester.cms_id.label("student_semester_cms_id"),
+                    StudentSemester.term_code,
+                    StructureSemester.id.label("structure_semester_db_id"),
+                    StructureSemester.cms_id.label("structure_semester_cms_id"),
+                    StructureSemester.semester_number,
+                    StudentSemester.status.label("semester_status"),
+                    StudentSemester.caf_date,
+                    StudentModule.id.label("student_module_db_id"),
+                    StudentModule.cms_id.label("student_module_cms_id"),
+                    SemesterModule.id.label("semester_module_db_id"),
+                    SemesterModule.cms_id.label("semester_module_cms_id"),
+                    Module.id.label("module_db_id"),
+                    Module.code.label("module_code"),
+                    Module.name.label("module_name"),
+                    StudentModule.status.label("module_status"),
+                    StudentModule.marks,
+                    StudentModule.grade,
+                    StudentModule.credits,
                 )
-                .join(Structure, StudentProgram.structure_id == Structure.id)
-                .join(Program, Structure.program_id == Program.id)
-                .join(School, Program.school_id == School.id)
+                .join(
+                    StructureSemester,
+                    StudentSemester.structure_semester_id == StructureSemester.id,
+                )
+                .join(
+                    StudentProgram,
+                    StudentSemester.student_program_id == StudentProgram.id,
+                )
+                .outerjoin(
+                    StudentModule,
+                    StudentModule.student_semester_id == StudentSemester.id,
+                )
+                .outerjoin(
+                    SemesterModule,
+                    StudentModule.semester_module_id == SemesterModule.id,
+                )
+                .outerjoin(Module, SemesterModule.module_id == Module.id)
                 .filter(StudentProgram.std_no == numeric_student_number)
-                .order_by(StudentProgram.id.desc())
+                .order_by(
+                    StudentSemester.term_code,
+                    StructureSemester.semester_number,
+                    StudentSemester.id,
+                    Module.code,
+                )
                 .all()
             )
 
-            return programs
+        for row in rows:
+            semesters = graph.semesters_by_program.setdefault(
+                row.student_program_id, []
+            )
+            if row.student_semester_db_id not in graph.modules_by_semester:
+                graph.modules_by_semester[row.student_semester_db_id] = []
+                semesters.append(
+                    StudentSemesterDetail(
+                        student_semester_db_id=row.student_semester_db_id,
+                        student_semester_cms_id=row.student_semester_cms_id,
+                        term_code=row.term_code,
+                        structure_semester_db_id=row.structure_semester_db_id,
+                        structure_semester_cms_id=row.structure_semester_cms_id,
+                        semester_number=row.semester_number,
+                        status=row.semester_status,
+                        caf_date=row.caf_date,
+                    )
+                )
+
+            if row.student_module_db_id is None or row.module_db_id is None:
+                continue
+
+            graph.modules_by_semester[row.student_semester_db_id].append(
+                StudentModuleDetail(
+                    student_module_db_id=row.student_module_db_id,
+                    student_module_cms_id=row.student_module_cms_id,
+                    semester_module_db_id=row.semester_module_db_id,
+                    semester_module_cms_id=row.semester_module_cms_id,
+                    module_code=row.module_code,
+                    module_name=row.module_name,
+                    status=row.module_status,
+                    marks=row.marks,
+                    grade=row.grade,
+                    credits=row.credits,
+                )
+            )
+
+        return graph
 
     def get_student_program_details(self, student_number: str):
         try:
@@ -509,6 +746,7 @@ class StudentRepository:
             )
             return semester[0] if semester else None
 
+    @timed_phase("upsert.student")
     def update_student(self, student_number: str, data: dict):
         try:
             numeric_student_number = int(student_number)
@@ -570,6 +808,7 @@ class StudentRepository:
 
             return None
 
+    @timed_phase("resolve_structure")
     def resolve_student_program_structure_id(
         self,
         program_code: str | None,
@@ -856,6 +1095,7 @@ class StudentRepository:
                 for r in results
             ]
 
+    @timed_phase("upsert.program")
     def upsert_student_program(
         self, student_program_id: str, std_no: int, data: dict
     ) -> tuple[bool, str, Optional[int]]:
@@ -957,6 +1197,7 @@ class StudentRepository:
                 )
                 return False, error_msg, None
 
+    @timed_phase("upsert.semester")
     def upsert_student_semester(
         self, std_program_id: int, data: dict
     ) -> tuple[bool, str, Optional[int]]:
@@ -1200,6 +1441,8 @@ class StudentRepository:
             )
             return semester_module[0] if semester_module else None
 
+    @timed_phase("upsert.module")
+    @profiled()
     def upsert_student_module(self, data: dict) -> tuple[bool, str]:
         std_module_id: int = 0
         student_semester_db_id: Optional[int] = None
@@ -1364,6 +1607,7 @@ class StudentRepository:
                 )
                 return False, error_msg
 
+    @timed_phase("upsert.next_of_kin")
     def upsert_next_of_kin(
         self, student_number: str, next_of_kin_list: list[dict]
     ) -> tuple[bool, str]:
@@ -1432,6 +1676,7 @@ class StudentRepository:
                 )
                 return False, error_msg
 
+    @timed_phase("upsert.education")
     def upsert_student_education(self, data: dict) -> tuple[bool, str]:
         education_id: int = 0
         std_no: Optional[int] = None
@@ -1737,6 +1982,7 @@ class StudentRepository:
                 )
                 return None
 
+    @timed_phase("resolve_structure")
     def preload_structure_semesters(self, structure_id: int) -> int:
         logger.info(f"Preloading structure semesters for structure {structure_id}")
 
@@ -1,3 +1,4 @@
+import contextvars
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
@@ -7,6 +8,7 @@ from bs4 import BeautifulSoup, Tag
 
 from base import get_logger
 from base.browser import BASE_URL, Browser
+from base.phase_timing import timed_phase
 from utils.modules import extract_module_code_and_name
 from utils.normalizers import (
     normalize_credits,
@@ -100,6 +102,7 @@ def _extract_student_id_from_row(row: Tag) -> str | None:
     return None
 
 
+@timed_phase("program_list", split_network=True)
 def extract_student_program_ids(std_no: str) -> list[str]:
     browser = Browser()
     url = f"{BASE_URL}/r_stdprogramlist.php?showmaster=1&StudentID={std_no}"
@@ -127,6 +130,7 @@ def extract_student_program_ids(std_no: str) -> list[str]:
     return program_ids
 
 
+@timed_phase("program", split_network=True)
 def scrape_student_program_data(std_program_id: str) -> dict:
     browser = Browser()
     url = f"{BASE_URL}/r_stdprogramview.php?StdProgramID={std_program_id}"
@@ -207,7 +211,7 @@ def scrape_student_program_data(std_program_id: str) -> dict:
         if normalized_date:
             data["graduation_date"] = normalized_date
 
-    logger.info(f"Scraped program data for student program {std_program_id}")
+    logger.debug(f"Scraped program data for student program {std_program_id}")
     return data
 
 
@@ -265,6 +269,7 @@ def get_table_value(table: Tag, header_text: str) -> Optional[str]:
     return None
 
 
+@timed_phase("personal_view", split_network=True)
 def scrape_student_personal_view(std_no: str) -> dict:
     browser = Browser()
     url = f"{BASE_URL}/r_stdpersonalview.php?StudentID={std_no}"
@@ -387,6 +392,7 @@ def scrape_student_personal_view(std_no: str) -> dict:
     return data
 
 
+@timed_phase("student_view", split_network=True)
 def scrape_student_view(std_no: str) -> dict:
     browser = Browser()
     url = f"{BASE_URL}/r_studentview.php?StudentID={std_no}"
@@ -445,6 +451,7 @@ def scrape_student_view(std_no: str) -> dict:
     return data
 
 
+@timed_phase("semester_list", split_network=True)
 def extract_student_semester_ids(std_program_id: str) -> list[str]:
     browser = Browser()
     url = f"{BASE_URL}/r_stdsemesterlist.php?showmaster=1&StdProgramID={std_program_id}"
@@ -474,6 +481,7 @@ def extract_student_semester_ids(std_program_id: str) -> list[str]:
     return semester_ids
 
 
+@timed_phase("semester", split_network=True)
 def scrape_student_semester_data(
     std_semester_id: str,
     structure_id: Optional[int] = None,
@@ -586,7 +594,7 @@ def scrape_student_semester_data(
                 f"sponsor_code={assist_provider}, term={data.get('term')}"
             )
 
-    logger.info(f"Scraped semester data for student semester {std_semester_id}")
+    logger.debug(f"Scraped semester data for student semester {std_semester_id}")
     return data
 
 
@@ -604,6 +612,7 @@ def scrape_student_data(std_no: str) -> dict:
     return merged_data
 
 
+@timed_phase("module_list", split_network=True)
 def extract_student_module_ids(std_semester_id: str) -> list[str]:
     browser = Browser()
     url = f"{BASE_URL}/r_stdmodulelist.php?showmaster=1&StdSemesterID={std_semester_id}"
@@ -633,6 +642,7 @@ def extract_student_module_ids(std_semester_id: str) -> list[str]:
     return module_ids
 
 
+@timed_phase("modules", split_network=True)
 def scrape_student_module_data(std_module_id: str, student_semester_id: int) -> dict:
     browser = Browser()
     url = f"{BASE_URL}/r_stdmoduleview.php?StdModuleID={std_module_id}"
@@ -695,10 +705,11 @@ def scrape_student_module_data(std_module_id: str, student_semester_id: int) ->
     elif grade:
         data["grade"] = normalize_grade_symbol(grade)
 
-    logger.info(f"Scraped module data for student module {std_module_id}")
+    logger.debug(f"Scraped module data for student module {std_module_id}")
     return data
 
 
+@timed_phase("modules.wall")
 def scrape_student_modules_concurrent(
     std_semester_id: str, db_semester_id: int, max_workers: int = 10
 ) -> list[dict]:
@@ -717,7 +728,10 @@ def scrape_student_modules_concurrent(
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_module_id = {
             executor.submit(
-                scrape_student_module_data, module_id, db_semester_id
+                contextvars.copy_context().run,
+                scrape_student_module_data,
+                module_id,
+                db_semester_id,
             ): module_id
             for module_id in module_ids
         }
@@ -743,6 +757,7 @@ def scrape_student_modules_concurrent(
     return modules_data
 
 
+@timed_phase("education_list", split_network=True)
 def extract_student_education_ids(std_no: str) -> list[str]:
     browser = Browser()
     url = f"{BASE_URL}/r_stdeducationlist.php?showmaster=1&StudentID={std_no}"
@@ -770,6 +785,7 @@ def extract_student_education_ids(std_no: str) -> list[str]:
     return education_ids
 
 
+@timed_phase("education", split_network=True)
 def scrape_student_education_data(std_education_id: str) -> dict:
     browser = Browser()
     url = f"{BASE_URL}/r_stdeducationview.php?StdEducationID={std_education_id}"
@@ -822,10 +838,11 @@ def scrape_student_education_data(std_education_id: str) -> dict:
         if normalized_date:
             data["end_date"] = normalized_date
 
-    logger.info(f"Scraped education data for student education {std_education_id}")
+    logger.debug(f"Scraped education data for student education {std_education_id}")
     return data
 
 
+@timed_phase("addresses", split_network=True)
 def scrape_student_addresses(std_no: str) -> list[dict]:
     browser = Browser()
     url = f"{BASE_URL}/r_stdrelationlist.php?showmaster=1&StudentID={std_no}"
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import datetime
+import time
 from typing import TYPE_CHECKING, Callable, Optional
 
 from bs4 import BeautifulSoup
 
 from base import get_logger
-from base.browser import BASE_URL, Browser, get_form_payload
+from base.browser import BASE_URL, Browser, get_form_payload, track_requests
 from features.common.cms_utils import post_cms_form
 
 from .repository import StudentRepository
@@ -95,6 +96,33 @@ class StudentSyncService:
         missing_sponsor_prompt: Optional[
             Callable[[str, str, Optional[str]], bool]
         ] = None,
+    ) -> bool:
+        started = time.perf_counter()
+        success = False
+        with track_requests() as tally:
+            try:
+                success = self._fetch_student(
+                    student_number,
+                    progress_callback,
+                    import_options,
+                    missing_sponsor_prompt,
+                )
+                return success
+            finally:
+                logger.info(
+                    f"Student {student_number} {'synced' if success else 'failed'} "
+                    f"in {time.perf_counter() - started:.2f}s - "
+                    f"requests={tally.requests}, bytes={tally.bytes}"
+                )
+
+    def _fetch_student(
+        self,
+        student_number: str,
+        progress_callback: Callable[[str, int, int], None],
+        import_options: Optional[dict] = None,
+        missing_sponsor_prompt: Optional[
+            Callable[[str, str, Optional[str]], bool]
+        ] = None,
     ) -> bool:
         if import_options is None:
             import_options = {
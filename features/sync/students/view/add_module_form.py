@@ -3,6 +3,7 @@ import threading
 import wx
 
 from base import get_logger
+from base.progress import ProgressChannel
 from database.models import StudentModuleStatus
 from features.sync.students.repository import StudentRepository
 from features.sync.students.service import StudentSyncService
@@ -332,7 +333,7 @@ class PushStudentModuleWorker(threading.Thread):
         self.module_status = module_status
         self.module_code = module_code
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
 
     def run(self):
         try:
@@ -3,6 +3,7 @@ import threading
 import wx
 
 from base import get_logger
+from base.http_telemetry import get_http_telemetry
 
 from .importer_project import ImporterProject, ImporterProjectManager
 from .importer_worker import ImporterRetryWorker, ImporterWorker
@@ -1096,6 +1097,10 @@ class ImporterDialog(wx.Dialog):
                     if len(project.failed_students) > 10:
                         message += f"\n... and {len(project.failed_students) - 10} more"
 
+                telemetry = get_http_telemetry().describe()
+                if telemetry:
+                    message += f"\n\n{telemetry}"
+
                 wx.MessageBox(message, "Import Complete", wx.OK | wx.ICON_INFORMATION)
 
             ImporterProjectManager.delete_project()
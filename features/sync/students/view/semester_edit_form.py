@@ -4,6 +4,7 @@ from typing import get_args
 import wx
 
 from base import get_logger
+from base.progress import ProgressChannel
 from database.models import SemesterStatus
 from features.sync.students.repository import StudentRepository
 from features.sync.students.service import StudentSyncService
@@ -256,7 +257,7 @@ class PushSemesterEditWorker(threading.Thread):
         super().__init__(daemon=True)
         self.data = data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
 
     def run(self):
         try:
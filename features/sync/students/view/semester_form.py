@@ -4,6 +4,7 @@ from datetime import datetime
 import wx
 
 from base import get_logger
+from base.progress import ProgressChannel
 from base.widgets.date_picker import DatePickerCtrl
 from features.sync.students.repository import StudentRepository
 from features.sync.students.service import StudentSyncService
@@ -235,7 +236,7 @@ class PushSemesterWorker(threading.Thread):
         super().__init__(daemon=True)
         self.data = data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
 
     def run(self):
         try:
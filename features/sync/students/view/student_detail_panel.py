@@ -2,6 +2,7 @@ import threading
 
 import wx
 
+from base.progress import ProgressChannel
 from features.sync.students.view.loader_control import LoadableControl
 from utils.formatters import format_semester
 
@@ -21,6 +22,7 @@ class StudentDetailPanel(wx.Panel):
         self.repository = StudentRepository()
         self.service = StudentSyncService(self.repository)
         self.current_student_no = None
+        self.student_graphs = {}
         self.current_semesters = []
         self.current_modules = []
         self.push_worker = None
@@ -30,6 +32,10 @@ class StudentDetailPanel(wx.Panel):
 
         self.init_ui()
 
+    @property
+    def student_graph(self):
+        return self.student_graphs.get(str(self.current_student_no))
+
     def init_ui(self):
         main_sizer = wx.BoxSizer(wx.VERTICAL)
 
@@ -142,6 +148,10 @@ class StudentDetailPanel(wx.Panel):
         self.current_semesters = []
         self.current_modules = []
 
+        if self.student_graph:
+            self._populate_programs(True, self.student_graph.programs)
+            return
+
         try:
             if self.semesters_loader:
                 self.semesters_loader.show_loader("Loading semesters...")
@@ -155,10 +165,10 @@ class StudentDetailPanel(wx.Panel):
         self.program_combobox.Enable(False)
 
         def load_programs():
-            return self.repository.get_student_programs(student_no)
+            return self.repository.get_student_graph(student_no)
 
         def on_programs_loaded(success, data):
-            wx.CallAfter(self._populate_programs, success, data)
+            wx.CallAfter(self._populate_student_graph, success, data)
 
         loader_thread = threading.Thread(
             target=lambda: self._load_programs_async(load_programs, on_programs_loaded),
@@ -173,6 +183,17 @@ class StudentDetailPanel(wx.Panel):
         except Exception as e:
             callback(False, str(e))
 
+    def _populate_student_graph(self, success, data):
+        if not success:
+            self._populate_programs(False, data)
+            return
+
+        self.student_graphs[data.std_no] = data
+        if data.std_no != str(self.current_student_no):
+            return
+
+        self._populate_programs(True, data.programs)
+
     def _populate_programs(self, success, data):
         self.program_combobox.Clear()
 
@@ -229,6 +250,13 @@ class StudentDetailPanel(wx.Panel):
         self.modules_list.DeleteAllItems()
         self.current_semesters = []
 
+        if self.student_graph and self.student_graph.has_program(student_program_db_id):
+            self.semesters_loader.hide_loader()
+            self._show_semesters(
+                self.student_graph.get_semesters(student_program_db_id)
+            )
+            return
+
         def load_data():
             return self.repository.get_student_semesters(student_program_db_id)
 
@@ -241,7 +269,9 @@ class StudentDetailPanel(wx.Panel):
             )
             return
 
-        semesters = data
+        self._show_semesters(data)
+
+    def _show_semesters(self, semesters, selected_semester_db_id=None):
         self.current_semesters = list(semesters)
 
         for row, semester in enumerate(semesters):
@@ -258,8 +288,17 @@ class StudentDetailPanel(wx.Panel):
             self.semesters_list.SetItem(index, 4, "✎ Edit")
 
         if semesters:
-            self.semesters_list.Select(0)
-            self.load_modules_for_semester(semesters[0].student_semester_db_id)
+            selected_index = 0
+            for index, semester in enumerate(self.current_semesters):
+                if semester.student_semester_db_id == selected_semester_db_id:
+                    selected_index = index
+                    break
+            self.semesters_list.Select(selected_index)
+            self.load_modules_for_semester(
+                self.current_semesters[selected_index].student_semester_db_id
+            )
+        else:
+            self.modules_loader.hide_loader()
 
     def on_semester_selected(self, event):
         item = event.GetIndex()
@@ -271,6 +310,15 @@ class StudentDetailPanel(wx.Panel):
         self.modules_list.DeleteAllItems()
         self.current_modules = []
 
+        if self.student_graph and self.student_graph.has_semester(
+            student_semester_db_id
+        ):
+            self.modules_loader.hide_loader()
+            self.on_modules_loaded(
+                True, self.student_graph.get_modules(student_semester_db_id)
+            )
+            return
+
         def load_data():
             return self.repository.get_semester_modules(student_semester_db_id)
 
@@ -316,14 +364,12 @@ class StudentDetailPanel(wx.Panel):
             )
             return
 
-        student_program_db_id = program.student_program_db_id
-
         dialog = SemesterEditFormDialog(
             semester.student_semester_db_id, parent=self, status_bar=self.status_bar
         )
 
         if dialog.ShowModal() == wx.ID_OK:
-            self.load_semesters(student_program_db_id)
+            self.refresh_student_graph(semester.student_semester_db_id)
 
         dialog.Destroy()
 
@@ -348,7 +394,7 @@ class StudentDetailPanel(wx.Panel):
         )
 
         if dialog.ShowModal() == wx.ID_OK:
-            self.load_modules_for_semester(current_semester.student_semester_db_id)
+            self.refresh_student_graph(current_semester.student_semester_db_id)
 
         dialog.Destroy()
 
@@ -369,7 +415,7 @@ class StudentDetailPanel(wx.Panel):
         )
 
         if dialog.ShowModal() == wx.ID_OK:
-            self.load_semesters(student_program_db_id)
+            self.refresh_student_graph()
 
         dialog.Destroy()
 
@@ -494,7 +540,65 @@ class StudentDetailPanel(wx.Panel):
                 self.current_semesters
             ):
                 semester = self.current_semesters[selected_item]
-                self.load_modules_for_semester(semester.student_semester_db_id)
+                self.refresh_student_graph(semester.student_semester_db_id)
+
+    def refresh_student_graph(self, selected_semester_db_id=None):
+        student_no = self.current_student_no
+        program = self.get_selected_program()
+        if (
+            not student_no
+            or not program
+            or not hasattr(program, "student_program_db_id")
+        ):
+            return
+
+        self.student_graphs.pop(str(student_no), None)
+        self.semesters_loader.show_loader("Loading semesters...")
+        self.modules_loader.show_loader("Loading modules...")
+
+        def load_graph():
+            try:
+                graph = self.repository.get_student_graph(student_no)
+                wx.CallAfter(
+                    self._apply_refreshed_graph,
+                    graph,
+                    program.student_program_db_id,
+                    selected_semester_db_id,
+                )
+            except Exception as e:
+                wx.CallAfter(self._on_graph_refresh_failed, str(e))
+
+        threading.Thread(target=load_graph, daemon=True).start()
+
+    def _apply_refreshed_graph(
+        self, graph, student_program_db_id, selected_semester_db_id
+    ):
+        self.student_graphs[graph.std_no] = graph
+        if graph.std_no != str(self.current_student_no):
+            return
+
+        self.semesters_loader.hide_loader()
+        program = self.get_selected_program()
+        if not program or not hasattr(program, "student_program_db_id"):
+            self.modules_loader.hide_loader()
+            return
+        if program.student_program_db_id != student_program_db_id:
+            selected_semester_db_id = None
+
+        self.clear_tables()
+        self._show_semesters(
+            graph.get_semesters(program.student_program_db_id),
+            selected_semester_db_id,
+        )
+
+    def _on_graph_refresh_failed(self, error):
+        self.semesters_loader.hide_loader()
+        self.modules_loader.hide_loader()
+        wx.MessageBox(
+            f"Error loading student details: {error}",
+            "Load Error",
+            wx.OK | wx.ICON_ERROR,
+        )
 
     def on_close(self, event):
         if self.semesters_loader:
@@ -510,7 +614,7 @@ class PushModuleWorker(threading.Thread):
         super().__init__(daemon=True)
         self.module_data = module_data
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
 
     def run(self):
         def progress_callback(message):
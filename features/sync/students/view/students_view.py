@@ -4,6 +4,15 @@ from datetime import datetime
 import wx
 import wx.dataview as dv
 
+from base.progress import ProgressChannel
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    SEMESTERS,
+    TERMS,
+    reference_data,
+)
+
 from ..repository import StudentRepository
 from ..service import SponsorResolutionError, StudentSyncService
 from .fetch_options_dialog import FetchOptionsDialog
@@ -17,7 +26,7 @@ class FetchStudentsWorker(threading.Thread):
         super().__init__(daemon=True)
         self.student_numbers = student_numbers
         self.sync_service = sync_service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.import_options = import_options
         self.should_stop = False
 
@@ -84,7 +93,7 @@ class UpdateStudentsWorker(threading.Thread):
         self.student_number = student_number
         self.student_data = student_data
         self.sync_service = sync_service
-        self.callback = callback
+        self.callback = ProgressChannel(callback)
         self.should_stop = False
         self.current_step = 0
         self.total_steps = 4
@@ -198,26 +207,17 @@ class GetSelectedStudentsWorker(threading.Thread):
         if self.should_stop:
             return
         try:
-            selected = []
-            for std_no in self.student_numbers:
-                if self.should_stop:
-                    break
-                students, _ = self.repository.fetch_students(
-                    search_query=std_no,
-                    page=1,
-                    page_size=1,
-                )
-                if students:
-                    student = students[0]
-                    selected.append(
-                        {
-                            "std_no": student.std_no,
-                            "name": student.name,
-                            "gender": student.gender,
-                            "date_of_birth": student.date_of_birth,
-                            "phone1": student.phone1,
-                        }
-                    )
+            students = self.repository.fetch_students_by_numbers(self.student_numbers)
+            selected = [
+                {
+                    "std_no": student.std_no,
+                    "name": student.name,
+                    "gender": student.gender,
+                    "date_of_birth": student.date_of_birth,
+                    "phone1": student.phone1,
+                }
+                for student in students
+            ]
             self.callback("students_data_loaded", selected)
         except Exception as e:
             self.callback("students_data_error", str(e))
@@ -253,6 +253,7 @@ class StudentsView(wx.Panel):
 
         self.init_ui()
         self.load_filter_options()
+        reference_data.subscribe(self.on_reference_data_changed)
         self.load_students()
 
     def init_ui(self):
@@ -565,6 +566,10 @@ class StudentsView(wx.Panel):
         )
         self.filter_worker.start()
 
+    def on_reference_data_changed(self, categories):
+        if categories & {PROGRAMS, SCHOOLS, SEMESTERS, TERMS}:
+            wx.CallAfter(self.load_filter_options)
+
     def load_programs_for_school(self, school_cms_id, trigger_load_students=False):
         self.pending_update_callback = trigger_load_students
 
@@ -982,24 +987,32 @@ class StudentsView(wx.Panel):
         if event_type == "filters_loaded":
             schools, programs, terms, semesters = args
 
+            while self.school_filter.GetCount() > 1:
+                self.school_filter.Delete(1)
             self.school_filter.SetString(0, "All Schools")
             for school in schools:
                 self.school_filter.Append(str(school.name), school.cms_id)
             self.school_filter.SetSelection(0)
             self.school_filter.Enable(True)
 
+            while self.program_filter.GetCount() > 1:
+                self.program_filter.Delete(1)
             self.program_filter.SetString(0, "All Programs")
             for program in programs:
                 self.program_filter.Append(str(program.name), program.cms_id)
             self.program_filter.SetSelection(0)
             self.program_filter.Enable(True)
 
+            while self.term_filter.GetCount() > 1:
+                self.term_filter.Delete(1)
             self.term_filter.SetString(0, "All Terms")
             for term in terms:
                 self.term_filter.Append(str(term), term)
             self.term_filter.SetSelection(0)
             self.term_filter.Enable(True)
 
+            while self.semester_filter.GetCount() > 1:
+                self.semester_filter.Delete(1)
             self.semester_filter.SetString(0, "All Semesters")
             for sem in semesters:
                 self.semester_filter.Append(f"Semester {sem}", sem)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Callable
 
 from base import get_logger
+from features.common.reference_data import TERMS, invalidate_reference_data
 
 from .repository import TermRepository
 from .scraper import scrape_all_terms
@@ -48,6 +49,8 @@ class TermSyncService:
             except Exception as e:
                 logger.error(f"Error saving term {term['code']}: {e}")
 
+        invalidate_reference_data(TERMS)
+
         progress_callback(
             f"Successfully saved {saved_count}/{total_terms} terms",
             total_terms,
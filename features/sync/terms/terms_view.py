@@ -1,7 +1,10 @@
 import threading
+from functools import partial
 
 import wx
 
+from base.progress import ProgressChannel
+
 from .repository import TermRepository
 from .service import TermSyncService
 
@@ -10,20 +13,19 @@ class FetchAllTermsWorker(threading.Thread):
     def __init__(self, service, callback):
         super().__init__(daemon=True)
         self.service = service
-        self.callback = callback
+        self.callback = ProgressChannel(partial(wx.CallAfter, callback))
         self.should_stop = False
 
     def run(self):
         try:
             self.service.fetch_and_save_all_terms(progress_callback=self.progress)
-            wx.CallAfter(lambda: self.callback("complete", None))
+            self.callback("complete", None)
         except Exception as e:
-            error_msg = str(e)
-            wx.CallAfter(lambda: self.callback("error", error_msg))
+            self.callback("error", str(e))
 
     def progress(self, message, current, total):
         if not self.should_stop:
-            wx.CallAfter(lambda: self.callback("progress", message, current, total))
+            self.callback("progress", message, current, total)
 
 
 class LoadTermsWorker(threading.Thread):
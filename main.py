@@ -1,3 +1,4 @@
+import importlib
 import json
 import logging
 import os
@@ -22,27 +23,80 @@ from base.status.status_bar import StatusBar
 from base.widgets.country_selection_dialog import CountrySelectionDialog
 from base.widgets.loading_panel import LoadingPanel
 from base.widgets.update_dialog import UpdateDialog
-from database.bootstrap import bootstrap_current_database
+from database.bootstrap import (
+    bootstrap_current_database,
+    check_current_database_schema,
+)
 from database.connection import (
     configure_database_urls_for_country,
     get_database_env_label,
 )
-from features.bulk.student_modules import StudentModulesView
-from features.bulk.student_programs import StudentProgramsView
-from features.bulk.student_semesters import StudentSemestersView
-from features.enrollments.module.module_view import ModuleView
-from features.enrollments.requests.requests_view import RequestsView
-from features.enrollments.student.student_view import StudentView
-from features.export.certificates.certificates_view import CertificatesView
-from features.export.reports.reports_view import ReportsView
-from features.repairs.module_grades import ModuleGradesView
-from features.sync.modules.modules_view import ModulesView
-from features.sync.structures.structures_view import StructuresView
-from features.sync.students import StudentsView
-from features.sync.terms.terms_view import TermsView
 
 logger = logging.getLogger(__name__)
 
+VIEW_CLASS_PATHS = {
+    "sync_students": "features.sync.students:StudentsView",
+    "sync_structures": "features.sync.structures.structures_view:StructuresView",
+    "sync_modules": "features.sync.modules.modules_view:ModulesView",
+    "sync_terms": "features.sync.terms.terms_view:TermsView",
+    "bulk_student_modules": "features.bulk.student_modules:StudentModulesView",
+    "bulk_student_semesters": "features.bulk.student_semesters:StudentSemestersView",
+    "bulk_student_programs": "features.bulk.student_programs:StudentProgramsView",
+    "enrollment_requests": "features.enrollments.requests.requests_view:RequestsView",
+    "enrollments_module": "features.enrollments.module.module_view:ModuleView",
+    "enrollments_student": "features.enrollments.student.student_view:StudentView",
+    "repair_module_grades": "features.repairs.module_grades:ModuleGradesView",
+    "export_certificates": "features.export.certificates.certificates_view:CertificatesView",
+    "export_reports": "features.export.reports.reports_view:ReportsView",
+}
+
+PREWARM_VIEW_ACTIONS = [
+    "sync_structures",
+    "sync_modules",
+    "enrollment_requests",
+    "bulk_student_modules",
+    "bulk_student_semesters",
+    "bulk_student_programs",
+]
+
+_view_class_cache: dict[str, type] = {}
+_view_class_lock = threading.Lock()
+
+
+def resolve_view_class(action: str) -> type:
+    view_class = _view_class_cache.get(action)
+    if view_class is not None:
+        return view_class
+
+    module_path, _, class_name = VIEW_CLASS_PATHS[action].partition(":")
+    with _view_class_lock:
+        view_class = _view_class_cache.get(action)
+        if view_class is None:
+            view_class = getattr(importlib.import_module(module_path), class_name)
+            _view_class_cache[action] = view_class
+    return view_class
+
+
+def is_view_prewarm_enabled() -> bool:
+    value = os.getenv("REGISTRY_PREWARM_VIEWS", "1").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def prewarm_views_async(actions: list[str]) -> threading.Thread | None:
+    if not is_view_prewarm_enabled():
+        return None
+
+    def prewarm():
+        for action in actions:
+            try:
+                resolve_view_class(action)
+            except Exception as exc:
+                logger.warning(f"Failed to pre-warm view {action}: {exc}")
+
+    prewarm_thread = threading.Thread(target=prewarm, daemon=True)
+    prewarm_thread.start()
+    return prewarm_thread
+
 
 class MainWindow(wx.Frame):
     def __init__(self):
@@ -73,21 +127,7 @@ class MainWindow(wx.Frame):
 
         self.status_bar = StatusBar(panel)
 
-        self.view_classes = {
-            "sync_students": StudentsView,
-            "sync_structures": StructuresView,
-            "sync_modules": ModulesView,
-            "sync_terms": TermsView,
-            "bulk_student_modules": StudentModulesView,
-            "bulk_student_semesters": StudentSemestersView,
-            "bulk_student_programs": StudentProgramsView,
-            "enrollment_requests": RequestsView,
-            "enrollments_module": ModuleView,
-            "enrollments_student": StudentView,
-            "repair_module_grades": ModuleGradesView,
-            "export_certificates": CertificatesView,
-            "export_reports": ReportsView,
-        }
+        self.view_classes = VIEW_CLASS_PATHS
 
         self.view_titles = self._load_view_titles()
 
@@ -140,7 +180,7 @@ class MainWindow(wx.Frame):
     def _get_or_create_view(self, action):
         view = self.views.get(action)
         if view is None:
-            view_class = self.view_classes[action]
+            view_class = resolve_view_class(action)
             view = view_class(self.content_panel, self.status_bar)
             self.views[action] = view
             self.content_sizer.Add(view, 1, wx.EXPAND)
@@ -217,6 +257,7 @@ def show_main_window():
         window.Maximize()
         window.Show()
 
+        wx.CallAfter(prewarm_views_async, PREWARM_VIEW_ACTIONS)
         check_for_updates_async(window)
     except Exception as e:
         logger.exception(f"Fatal error in application: {e}")
@@ -280,7 +321,12 @@ def ensure_runtime_configuration() -> bool:
     return True
 
 
-def bootstrap_runtime_database() -> None:
+def is_schema_bootstrap_forced() -> bool:
+    value = os.getenv("REGISTRY_BOOTSTRAP_SCHEMA", "").strip().lower()
+    return value in {"1", "true", "yes", "on"}
+
+
+def run_runtime_database_bootstrap() -> None:
     result = bootstrap_current_database()
     action = "Created" if result.database_created else "Using existing"
     logger.info(
@@ -290,6 +336,21 @@ def bootstrap_runtime_database() -> None:
     )
 
 
+def bootstrap_runtime_database() -> None:
+    if not is_schema_bootstrap_forced():
+        status = check_current_database_schema()
+        if status.is_current:
+            logger.info(f"Database schema for {status.database_name} is up to date")
+            return
+        if status.database_exists:
+            logger.info(
+                f"Database schema for {status.database_name} is missing or "
+                "out of date, updating it before startup"
+            )
+
+    run_runtime_database_bootstrap()
+
+
 def check_for_updates_async(parent_window):
     def check_updates():
         updater = AutoUpdater()
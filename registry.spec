@@ -19,6 +19,19 @@ a = Analysis(
         'bs4',
         'selenium',
         'requests',
+        'features.sync.students',
+        'features.sync.structures.structures_view',
+        'features.sync.modules.modules_view',
+        'features.sync.terms.terms_view',
+        'features.bulk.student_modules',
+        'features.bulk.student_semesters',
+        'features.bulk.student_programs',
+        'features.enrollments.requests.requests_view',
+        'features.enrollments.module.module_view',
+        'features.enrollments.student.student_view',
+        'features.repairs.module_grades',
+        'features.export.certificates.certificates_view',
+        'features.export.reports.reports_view',
     ],
     hookspath=[],
     hooksconfig={},
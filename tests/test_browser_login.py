@@ -0,0 +1,463 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+from unittest.mock import patch
+
+import requests
+
+from base.browser import Browser, is_login_response, track_requests
+from base.http_telemetry import HttpTelemetry
+from base.login import (
+    LOGGED_IN_LINK_TEXT,
+    PASSWORD_INPUT_SELECTOR,
+    USERNAME_INPUT_SELECTOR,
+    ChromeLoginProvider,
+    CookieFileLoginProvider,
+    get_default_login_provider,
+)
+from base.session_monitor import SessionMonitor
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def build_response(
+    url: str,
+    body: str = "",
+    *,
+    content_type: str = "text/html",
+    history: list[requests.Response] | None = None,
+    location: str | None = None,
+) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response._content = body.encode()
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = content_type
+    if location:
+        response.headers["Location"] = location
+    response.history = history or []
+    return response
+
+
+class FakeLoginProvider:
+    def __init__(self, cookies):
+        self.cookies = cookies
+        self.login_urls = []
+
+    def login(self, login_url):
+        self.login_urls.append(login_url)
+        return self.cookies
+
+
+class BrowserLoginProviderTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Browser.session_monitor = SessionMonitor(
+            os.path.join(self.temp_dir.name, "session.health.json")
+        )
+        Browser.telemetry = HttpTelemetry()
+        self.browser = object.__new__(Browser)
+        self.session = requests.Session()
+        self.browser.session = self.session
+
+    def tearDown(self):
+        Browser.set_login_provider(None)
+        Browser.session_monitor = None
+        Browser.telemetry = None
+        self.temp_dir.cleanup()
+
+    def test_importing_browser_does_not_import_selenium(self):
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, base.browser; print('selenium' in sys.modules)",
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip(), "False")
+
+    def test_login_applies_cookies_from_configured_provider(self):
+        provider = FakeLoginProvider(
+            [
+                {"name": "PHPSESSID", "value": "abc", "domain": "cms.example"},
+                {"name": "lang", "value": "en"},
+            ]
+        )
+        Browser.set_login_provider(provider)
+        self.session.cookies.set("stale", "1")
+
+        with patch.object(Browser, "save_session") as save_session:
+            self.browser.login()
+
+        self.assertEqual(len(provider.login_urls), 1)
+        self.assertTrue(provider.login_urls[0].endswith("/login.php"))
+        self.assertEqual(
+            self.session.cookies.get("PHPSESSID", domain="cms.example"),
+            "abc",
+        )
+        self.assertEqual(self.session.cookies.get("lang"), "en")
+        self.assertIsNone(self.session.cookies.get("stale"))
+        save_session.assert_called_once_with()
+
+    def test_cookie_file_provider_accepts_name_value_mapping(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cookie_file = Path(temp_dir) / "cookies.json"
+            cookie_file.write_text(json.dumps({"PHPSESSID": "xyz"}), encoding="utf-8")
+
+            cookies = CookieFileLoginProvider(cookie_file).login("ignored")
+
+        self.assertEqual(cookies, [{"name": "PHPSESSID", "value": "xyz"}])
+
+    def test_default_provider_is_selected_from_environment(self):
+        with patch.dict(
+            os.environ,
+            {
+                "REGISTRY_LOGIN_COOKIES": "",
+                "REGISTRY_LOGIN_HEADLESS": "true",
+                "REGISTRY_LOGIN_USERNAME": "registry",
+                "REGISTRY_LOGIN_PASSWORD": "secret",
+            },
+        ):
+            provider = get_default_login_provider()
+
+        if not isinstance(provider, ChromeLoginProvider):
+            self.fail(f"expected ChromeLoginProvider, got {provider!r}")
+        self.assertTrue(provider.headless)
+        self.assertEqual(provider.username, "registry")
+
+        with patch.dict(os.environ, {"REGISTRY_LOGIN_COOKIES": "cookies.json"}):
+            provider = get_default_login_provider()
+
+        self.assertIsInstance(provider, CookieFileLoginProvider)
+
+
+class FakeElement:
+    def __init__(self, name):
+        self.name = name
+        self.typed = []
+        self.submitted = False
+
+    def send_keys(self, value):
+        self.typed.append(value)
+
+    def submit(self):
+        self.submitted = True
+
+
+class FakeChromeDriver:
+    instances: ClassVar[list["FakeChromeDriver"]] = []
+
+    def __init__(self, options):
+        self.options = options
+        self.inputs = {
+            USERNAME_INPUT_SELECTOR: FakeElement("username"),
+            PASSWORD_INPUT_SELECTOR: FakeElement("password"),
+        }
+        self.visited = []
+        self.quit_called = False
+        FakeChromeDriver.instances.append(self)
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def find_element(self, by, value):
+        from selenium.common.exceptions import NoSuchElementException
+        from selenium.webdriver.common.by import By
+
+        if by == By.CSS_SELECTOR and value in self.inputs:
+            return self.inputs[value]
+        if (
+            by == By.LINK_TEXT
+            and value == LOGGED_IN_LINK_TEXT
+            and self.inputs[PASSWORD_INPUT_SELECTOR].submitted
+        ):
+            return FakeElement("logout")
+        raise NoSuchElementException(value)
+
+    def get_cookies(self):
+        return [{"name": "PHPSESSID", "value": "headless"}]
+
+    def quit(self):
+        self.quit_called = True
+
+
+class HeadlessLoginTests(unittest.TestCase):
+    def setUp(self):
+        FakeChromeDriver.instances = []
+        patcher = patch(
+            "selenium.webdriver.chrome.webdriver.WebDriver", FakeChromeDriver
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_headless_login_fills_the_cms_form_from_credentials(self):
+        provider = ChromeLoginProvider(
+            headless=True, timeout=1, username="registry", password="secret"
+        )
+
+        cookies = provider.login("https://cms.example/login.php")
+
+        driver = FakeChromeDriver.instances[0]
+        self.assertEqual(cookies, [{"name": "PHPSESSID", "value": "headless"}])
+        self.assertIn("--headless=new", driver.options.arguments)
+        self.assertEqual(driver.visited, ["https://cms.example/login.php"])
+        self.assertEqual(driver.inputs[USERNAME_INPUT_SELECTOR].typed, ["registry"])
+        self.assertEqual(driver.inputs[PASSWORD_INPUT_SELECTOR].typed, ["secret"])
+        self.assertTrue(driver.quit_called)
+
+    def test_headless_login_without_credentials_fails_before_opening_chrome(self):
+        with (
+            patch.dict(
+                os.environ,
+                {
+                    "REGISTRY_LOGIN_COOKIES": "",
+                    "REGISTRY_LOGIN_HEADLESS": "1",
+                    "REGISTRY_LOGIN_USERNAME": "",
+                    "REGISTRY_LOGIN_PASSWORD": "",
+                },
+            ),
+            self.assertRaises(ValueError),
+        ):
+            get_default_login_provider()
+
+        self.assertEqual(FakeChromeDriver.instances, [])
+
+
+class SlowLoginProvider:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def login(self, login_url):
+        with self.lock:
+            self.calls += 1
+        time.sleep(0.1)
+        return [{"name": "PHPSESSID", "value": "fresh"}]
+
+
+class BrowserSessionExpiryTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.monitor = SessionMonitor(
+            os.path.join(self.temp_dir.name, "session.health.json")
+        )
+        Browser.session_monitor = self.monitor
+        self.telemetry = HttpTelemetry()
+        Browser.telemetry = self.telemetry
+        self.browser = object.__new__(Browser)
+        self.session = requests.Session()
+        self.browser.session = self.session
+
+    def tearDown(self):
+        Browser.set_login_provider(None)
+        Browser.session_monitor = None
+        Browser.telemetry = None
+        self.temp_dir.cleanup()
+
+    def test_is_login_response_detects_redirect_to_login_page(self):
+        redirect = build_response(
+            "https://cms.example/f_modulelist.php",
+            location="login.php",
+        )
+        response = build_response(
+            "https://cms.example/login.php", "<html></html>", history=[redirect]
+        )
+
+        self.assertTrue(is_login_response(response))
+        self.assertTrue(
+            is_login_response(
+                build_response(
+                    "https://cms.example/f_modulelist.php",
+                    history=[redirect],
+                )
+            )
+        )
+
+    def test_is_login_response_skips_parsing_when_login_form_is_absent(self):
+        response = build_response(
+            "https://cms.example/f_modulelist.php",
+            "<form action='f_modulelist.php'></form><a href='logout.php'>[ Logout ]</a>",
+        )
+
+        with patch("base.browser.check_logged_in") as check_logged_in:
+            self.assertFalse(is_login_response(response))
+
+        check_logged_in.assert_not_called()
+        self.assertFalse(
+            is_login_response(
+                build_response(
+                    "https://cms.example/report.php",
+                    "login.php",
+                    content_type="application/pdf",
+                )
+            )
+        )
+
+    def test_is_login_response_detects_inline_login_form(self):
+        response = build_response(
+            "https://cms.example/f_modulelist.php",
+            "<form action='login.php'><input type='text' name='username'></form>",
+        )
+
+        self.assertTrue(is_login_response(response))
+
+    def test_concurrent_expiries_trigger_a_single_login(self):
+        provider = SlowLoginProvider()
+        Browser.set_login_provider(provider)
+        generation = Browser.login_generation
+        barrier = threading.Barrier(5)
+
+        def expire():
+            barrier.wait()
+            self.browser.relogin(generation)
+
+        with patch.object(Browser, "save_session"):
+            threads = [threading.Thread(target=expire) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual(Browser.login_generation, generation + 1)
+        self.assertEqual(self.session.cookies.get("PHPSESSID"), "fresh")
+
+    def test_fetch_retries_with_fresh_cookies_after_relogin(self):
+        provider = FakeLoginProvider([{"name": "PHPSESSID", "value": "fresh"}])
+        Browser.set_login_provider(provider)
+        url = "https://cms.example/f_modulelist.php"
+        responses = [
+            build_response("https://cms.example/login.php"),
+            build_response(url, "<table></table>"),
+        ]
+
+        with (
+            patch.object(self.browser.session, "get", side_effect=responses) as get,
+            patch.object(Browser, "save_session"),
+        ):
+            response = self.browser.fetch(url)
+
+        self.assertEqual(response.text, "<table></table>")
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(len(provider.login_urls), 1)
+        self.assertFalse(self.monitor.expired)
+
+    def test_keep_alive_records_expiry_without_logging_in(self):
+        provider = FakeLoginProvider([])
+        Browser.set_login_provider(provider)
+        monitor = self.monitor
+        monitor.record_login()
+
+        with patch.object(
+            self.browser.session,
+            "get",
+            return_value=build_response("https://cms.example/login.php"),
+        ):
+            self.assertFalse(self.browser.keep_alive())
+
+        self.assertTrue(monitor.expired)
+        self.assertEqual(provider.login_urls, [])
+
+    def test_track_requests_tallies_fetches_and_posts_in_scope(self):
+        url = "https://cms.example/f_modulelist.php"
+
+        with (
+            patch.object(
+                self.browser.session,
+                "get",
+                return_value=build_response(url, "<table></table>"),
+            ),
+            patch.object(
+                self.browser.session,
+                "post",
+                return_value=build_response(url, "ok"),
+            ),
+        ):
+            with track_requests() as tally:
+                self.browser.fetch(url)
+                self.browser.post(url, {"x_Code": "BIT101"})
+            self.browser.fetch(url)
+
+        self.assertEqual(tally.requests, 2)
+        self.assertEqual(tally.bytes, len("<table></table>") + len("ok"))
+
+    def test_fetch_records_endpoint_telemetry_for_retries_and_relogins(self):
+        provider = FakeLoginProvider([{"name": "PHPSESSID", "value": "fresh"}])
+        Browser.set_login_provider(provider)
+        url = "https://cms.example/r_stdmoduleview.php?StdSemesterID=1"
+        server_error = build_response(url, "busy")
+        server_error.status_code = 503
+        responses = [
+            server_error,
+            build_response("https://cms.example/login.php"),
+            build_response(url, "<table></table>"),
+        ]
+
+        with (
+            patch.object(self.browser.session, "get", side_effect=responses),
+            patch.object(Browser, "save_session"),
+            patch("base.browser.time.sleep"),
+        ):
+            self.browser.fetch(url)
+
+        endpoint = self.telemetry.snapshot()["endpoints"]["r_stdmoduleview.php"]
+        self.assertEqual(endpoint["requests"], 3)
+        self.assertEqual(endpoint["server_errors"], 1)
+        self.assertEqual(endpoint["retries"], 1)
+        self.assertEqual(endpoint["relogins"], 1)
+        self.assertEqual(endpoint["bytes"], len("busy") + len("<table></table>"))
+
+    def test_server_errors_reach_fetch_through_the_real_adapter(self):
+        hits = []
+
+        class FlakyHandler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                return
+
+            def do_GET(self):
+                hits.append(self.path)
+                status = 503 if len(hits) == 1 else 200
+                body = b"<table></table>"
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.browser._configure_session_pool()
+        host, port = server.server_address[:2]
+        url = f"http://{host}:{port}/r_stdmoduleview.php?StdSemesterID=1"
+
+        with patch("base.browser.time.sleep"):
+            response = self.browser.fetch(url)
+
+        endpoint = self.telemetry.snapshot()["endpoints"]["r_stdmoduleview.php"]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(hits), 2)
+        self.assertEqual(endpoint["requests"], 2)
+        self.assertEqual(endpoint["server_errors"], 1)
+        self.assertEqual(endpoint["retries"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from features.bulk.student_programs.repository import (
+    StructureOption,
+    StudentProgramRow,
+)
+from features.bulk.student_programs.service import StudentProgramService
+from features.common.concurrency import run_concurrently
+
+
+def _student_program(db_id: int) -> StudentProgramRow:
+    return StudentProgramRow(
+        std_no=f"90100000{db_id}",
+        name=f"Student {db_id}",
+        student_program_db_id=db_id,
+        student_program_cms_id=1000 + db_id,
+        structure_db_id=1,
+        structure_cms_id=11,
+        structure_code="OLD",
+        intake_date=None,
+        reg_date=None,
+        start_term="2024-08",
+        stream=None,
+        status="Active",
+        assist_provider=None,
+        graduation_date=None,
+        program_cms_id=5,
+        program_code="BIT",
+    )
+
+
+class RunConcurrentlyTests(unittest.TestCase):
+    def test_retries_failed_items_until_max_attempts(self):
+        attempts: dict[int, int] = {}
+
+        def task(item: int) -> tuple[bool, str]:
+            attempts[item] = attempts.get(item, 0) + 1
+            if item == 2 and attempts[item] < 2:
+                return False, "transient"
+            if item == 3:
+                raise RuntimeError("boom")
+            return True, "ok"
+
+        progress = Mock()
+        results = run_concurrently(
+            [1, 2, 3],
+            task,
+            max_workers=3,
+            max_attempts=2,
+            retry_delay=0,
+            on_item_done=progress,
+        )
+
+        by_item = {result.item: result for result in results}
+        self.assertTrue(by_item[1].success)
+        self.assertTrue(by_item[2].success)
+        self.assertEqual(by_item[2].attempts, 2)
+        self.assertFalse(by_item[3].success)
+        self.assertEqual(by_item[3].attempts, 2)
+        self.assertEqual(
+            sorted(call.args[1] for call in progress.call_args_list), [1, 2, 3]
+        )
+
+    def test_marks_items_cancelled_when_stopped(self):
+        results = run_concurrently(
+            [1, 2], lambda _item: (True, "ok"), should_stop=lambda: True
+        )
+
+        self.assertEqual([result.message for result in results], ["Cancelled"] * 2)
+
+
+class BulkStructureUpdateTests(unittest.TestCase):
+    def test_batches_database_update_and_collects_failures(self):
+        repository = Mock()
+        repository.update_student_program_structures.return_value = (True, "ok")
+        with patch("features.bulk.student_programs.service.Browser"):
+            service = StudentProgramService(repository)
+
+        student_programs = [_student_program(db_id) for db_id in (1, 2, 3)]
+        new_structure = StructureOption(db_id=9, cms_id=99, code="NEW", desc=None)
+
+        def push(student_program, _structure, _progress):
+            if student_program.student_program_db_id == 2:
+                return False, "CMS rejected"
+            return True, "Operation successful"
+
+        with patch.object(
+            service, "push_student_program_structure", side_effect=push
+        ):
+            result = service.bulk_update_student_program_structures(
+                student_programs,
+                new_structure,
+                lambda *_: None,
+                max_attempts=1,
+            )
+
+        self.assertEqual(
+            [row.student_program_db_id for row in result.updated], [1, 3]
+        )
+        self.assertEqual(
+            [(row.student_program_db_id, message) for row, message in result.failed],
+            [(2, "CMS rejected")],
+        )
+        repository.update_student_program_structures.assert_called_once()
+        ids, structure_id = repository.update_student_program_structures.call_args.args
+        self.assertEqual(sorted(ids), [1, 3])
+        self.assertEqual(structure_id, 9)
+        repository.update_student_program_structure.assert_not_called()
+
+    def test_marks_pushed_items_failed_when_database_batch_fails(self):
+        repository = Mock()
+        repository.update_student_program_structures.return_value = (False, "db down")
+        with patch("features.bulk.student_programs.service.Browser"):
+            service = StudentProgramService(repository)
+
+        with patch.object(
+            service,
+            "push_student_program_structure",
+            return_value=(True, "Operation successful"),
+        ):
+            result = service.bulk_update_student_program_structures(
+                [_student_program(1)],
+                StructureOption(db_id=9, cms_id=99, code="NEW", desc=None),
+                lambda *_: None,
+            )
+
+        self.assertEqual(result.updated, [])
+        self.assertIn("db down", result.failed[0][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from base.browser import Browser
+from base.http_telemetry import HttpTelemetry
+from base.runtime_config import get_current_cms_base_url, get_current_session_file
+from base.session_monitor import SessionMonitor
+from features.sync.modules.scraper import scrape_modules
+from features.sync.structures.scraper import scrape_all_schools, scrape_programs
+from features.sync.students.scraper import (
+    detect_student_range,
+    extract_student_module_ids,
+    extract_student_program_ids,
+    extract_student_semester_ids,
+    scrape_student_data,
+    scrape_student_module_data,
+    scrape_student_program_data,
+    scrape_student_semester_data,
+)
+from features.sync.terms.scraper import scrape_all_terms
+from tools.cms_standin import CmsStandInServer, StandInConfig, SyntheticCms
+
+
+class CmsStandInTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.site = SyntheticCms(StandInConfig(students=25, page_size=10))
+        self.server = CmsStandInServer(self.site)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        env = patch.dict(os.environ, {"REGISTRY_CMS_BASE_URL": self.server.base_url})
+        env.start()
+        self.addCleanup(env.stop)
+
+        Browser.session_monitor = SessionMonitor(
+            os.path.join(self.temp_dir.name, "session.health.json")
+        )
+        self.telemetry = HttpTelemetry()
+        Browser.telemetry = self.telemetry
+        browser = object.__new__(Browser)
+        browser.session = requests.Session()
+        instance = patch.object(Browser, "_instance", browser)
+        instance.start()
+        self.addCleanup(instance.stop)
+        self.addCleanup(setattr, Browser, "session_monitor", None)
+        self.addCleanup(setattr, Browser, "telemetry", None)
+
+    def test_runtime_config_points_at_the_override(self):
+        self.assertEqual(get_current_cms_base_url(), self.server.base_url)
+        self.assertTrue(get_current_session_file().endswith("_override.pkl"))
+
+    def test_student_pages_round_trip_through_the_scrapers(self):
+        first, last, total = detect_student_range()
+        self.assertEqual((first, last, total), ("901000001", "901000025", 25))
+
+        student = scrape_student_data("901000003")
+        self.assertEqual(student["name"], "Student 901000003")
+
+        program_ids = extract_student_program_ids("901000003")
+        self.assertEqual(len(program_ids), 1)
+        program = scrape_student_program_data(program_ids[0])
+        self.assertEqual(program["std_no"], 901000003)
+        self.assertEqual(program["status"], "Active")
+
+        semester_ids = extract_student_semester_ids(program_ids[0])
+        self.assertEqual(len(semester_ids), 4)
+        semester = scrape_student_semester_data(semester_ids[1])
+        self.assertEqual(semester["term"], self.site.terms[3].code)
+        self.assertEqual(semester["semester_status"], "Active")
+
+        module_ids = extract_student_module_ids(semester_ids[1])
+        self.assertEqual(len(module_ids), 5)
+        module = scrape_student_module_data(module_ids[0], int(semester_ids[1]))
+        self.assertIn(module["grade"], {"A", "B", "C", "D", "F"})
+
+        telemetry = self.telemetry.snapshot()
+        self.assertIn("r_stdmoduleview.php", telemetry["endpoints"])
+
+    def test_catalog_pages_support_paging_and_searches(self):
+        terms = scrape_all_terms()
+        self.assertEqual(len(terms), len(self.site.terms))
+        self.assertEqual(
+            [term["code"] for term in terms if term["is_active"]],
+            [self.site.terms[-1].code],
+        )
+
+        schools = scrape_all_schools()
+        self.assertEqual(
+            [school["code"] for school in schools], ["FICT", "FBMG", "FCMB"]
+        )
+        programs = scrape_programs(int(schools[0]["cms_id"]))
+        self.assertEqual(len(programs), 4)
+
+        code = self.site.semester_modules[0].code
+        self.assertEqual([module["code"] for module in scrape_modules(code)], [code])
+
+    def test_error_injection_and_latency_are_applied(self):
+        site = SyntheticCms(StandInConfig(students=5, error_rate=1.0, latency=0.05))
+        with CmsStandInServer(site) as server:
+            response = requests.get(f"{server.base_url}/f_termlist.php", timeout=5)
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(site.stats.errors, 1)
+        self.assertGreaterEqual(response.elapsed.total_seconds(), 0.05)
+
+    def test_recorded_pages_take_precedence(self):
+        recordings = Path(self.temp_dir.name) / "recordings"
+        (recordings / "r_studentview.php").mkdir(parents=True)
+        (recordings / "r_studentview.php" / "StudentID=901000001.html").write_text(
+            "<html><body>recorded</body></html>", encoding="utf-8"
+        )
+
+        site = SyntheticCms(StandInConfig(students=5, recordings=recordings))
+        self.assertEqual(
+            site.render("r_studentview.php", {"StudentID": "901000001"}),
+            "<html><body>recorded</body></html>",
+        )
+        self.assertIn(
+            "Student 901000002",
+            site.render("r_studentview.php", {"StudentID": "901000002"}) or "",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
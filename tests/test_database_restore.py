@@ -6,12 +6,21 @@ from tempfile import TemporaryDirectory
 from unittest.mock import ANY, patch
 
 from database.restore import (
+    build_restore_command,
     get_latest_backup_path,
+    list_backups,
     resolve_input_path,
     restore_database,
 )
 
 
+def _write_directory_backup(path: Path) -> Path:
+    path.mkdir()
+    (path / "toc.dat").write_bytes(b"toc")
+    (path / "3001.dat.gz").write_bytes(b"x" * 64)
+    return path
+
+
 class DatabaseRestoreTests(unittest.TestCase):
     def test_get_latest_backup_path_prefers_newest_custom_backup(self):
         with TemporaryDirectory() as temp_dir:
@@ -131,6 +140,86 @@ class DatabaseRestoreTests(unittest.TestCase):
         )
         self.assertNotIn("PGPASSWORD", run.call_args.kwargs["env"])
 
+    def test_directory_backups_are_listed_and_preferred_over_sql(self):
+        with TemporaryDirectory() as temp_dir:
+            backup_dir = Path(temp_dir)
+            sql_backup = backup_dir / "cms_lesotho-2026-04-14_13-32-36.sql"
+            older_dump = backup_dir / "cms_lesotho-2026-04-12_13-32-36.dump"
+            directory_backup = _write_directory_backup(
+                backup_dir / "cms_lesotho-2026-04-13_13-32-36.dir"
+            )
+            (backup_dir / "scratch").mkdir()
+
+            sql_backup.write_text("select 1;", encoding="utf-8")
+            older_dump.write_text("dump", encoding="utf-8")
+
+            os.utime(older_dump, (100, 100))
+            os.utime(directory_backup, (200, 200))
+            os.utime(sql_backup, (300, 300))
+
+            backups = list_backups(backup_dir)
+            selected = get_latest_backup_path(backup_dir)
+            resolved = resolve_input_path(directory_backup)
+
+        self.assertEqual(backups, [sql_backup, directory_backup, older_dump])
+        self.assertEqual(selected, directory_backup.resolve())
+        self.assertEqual(resolved, directory_backup.resolve())
+
+    def test_resolve_input_path_rejects_directories_without_a_toc(self):
+        with TemporaryDirectory() as temp_dir, self.assertRaises(ValueError):
+            resolve_input_path(temp_dir)
+
+    def test_build_restore_command_adds_jobs_for_pg_restore_backups(self):
+        with patch("database.restore.get_pg_restore_path", return_value="pg_restore"):
+            command = build_restore_command(
+                Path("cms_lesotho.dump"), "postgresql://localhost/cms", jobs=4
+            )
+
+        self.assertEqual(
+            command[-5:],
+            [
+                "--jobs",
+                "4",
+                "--dbname",
+                "postgresql://localhost/cms",
+                "cms_lesotho.dump",
+            ],
+        )
+        with (
+            patch("database.restore.get_psql_path", return_value="psql"),
+            self.assertRaises(ValueError),
+        ):
+            build_restore_command(
+                Path("cms_lesotho.sql"), "postgresql://localhost/cms", jobs=4
+            )
+
+    def test_restore_database_reports_timing_and_size_for_directory_backup(self):
+        with TemporaryDirectory() as temp_dir:
+            backup_path = _write_directory_backup(Path(temp_dir) / "cms_lesotho.dir")
+
+            with (
+                patch(
+                    "database.restore.get_restore_url",
+                    return_value=(
+                        "postgresql://dev@localhost:5432/cms_lesotho",
+                        None,
+                        "cms_lesotho",
+                    ),
+                ),
+                patch("database.restore.get_database_env_label", return_value="local"),
+                patch(
+                    "database.restore.get_pg_restore_path", return_value="pg_restore"
+                ),
+                patch("database.restore.subprocess.run") as run,
+            ):
+                result = restore_database(input_path=backup_path, jobs=3)
+
+        self.assertEqual(result.jobs, 3)
+        self.assertEqual(result.size_bytes, 67)
+        self.assertGreaterEqual(result.seconds, 0)
+        self.assertEqual(run.call_args.args[0][5:7], ["--jobs", "3"])
+        self.assertEqual(run.call_args.args[0][-1], str(backup_path.resolve()))
+
     def test_restore_database_raises_when_restore_command_fails(self):
         with TemporaryDirectory() as temp_dir:
             backup_path = Path(temp_dir) / "cms_lesotho.dump"
@@ -0,0 +1,224 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from database import (
+    Clearance,
+    Module,
+    RegistrationClearance,
+    RegistrationRequest,
+    RequestedModule,
+    SemesterModule,
+    Structure,
+    Student,
+    StudentProgram,
+    Term,
+)
+from features.enrollments.requests.repository import EnrollmentRequestRepository
+from features.enrollments.requests.service import EnrollmentService
+
+
+class EnrollmentRequestRepositoryTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        for model in (
+            Student,
+            Term,
+            Structure,
+            StudentProgram,
+            Module,
+            SemesterModule,
+            RegistrationRequest,
+            RequestedModule,
+            Clearance,
+            RegistrationClearance,
+        ):
+            model.__table__.create(self.engine)
+
+        self.repository = EnrollmentRequestRepository()
+        self.repository._engine = self.engine
+
+        with Session(self.engine) as session:
+            session.add_all(
+                [
+                    Student(std_no=901000001, name="Alpha"),
+                    Student(std_no=901000002, name="Beta"),
+                    Term(id=1, code="2025-02"),
+                    Structure(id=7, code="S7", program_id=1, cms_id=70),
+                    StudentProgram(
+                        id=11,
+                        std_no=901000001,
+                        structure_id=7,
+                        status="Active",
+                        cms_id=110,
+                    ),
+                    Module(id=1, code="MOD1", name="One", status="Active"),
+                    Module(id=2, code="MOD2", name="Two", status="Active"),
+                    SemesterModule(
+                        id=21, module_id=1, type="Core", credits=10, cms_id=210
+                    ),
+                    SemesterModule(
+                        id=22, module_id=2, type="Core", credits=12, cms_id=220
+                    ),
+                    RegistrationRequest(
+                        id=100,
+                        sponsored_student_id=1,
+                        std_no=901000001,
+                        term_id=1,
+                        semester_status="Active",
+                        semester_number="01",
+                    ),
+                    RegistrationRequest(
+                        id=101,
+                        sponsored_student_id=1,
+                        std_no=901000002,
+                        term_id=1,
+                        semester_status="Repeat",
+                        semester_number="02",
+                    ),
+                    RequestedModule(registration_request_id=100, semester_module_id=22),
+                    RequestedModule(registration_request_id=100, semester_module_id=21),
+                    RequestedModule(registration_request_id=101, semester_module_id=21),
+                    Clearance(id=1, department="finance", status="approved"),
+                    Clearance(id=2, department="library", status="pending"),
+                    Clearance(id=3, department="finance", status="rejected"),
+                    RegistrationClearance(registration_request_id=100, clearance_id=1),
+                    RegistrationClearance(registration_request_id=100, clearance_id=2),
+                    RegistrationClearance(registration_request_id=101, clearance_id=3),
+                ]
+            )
+            session.commit()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_get_enrollment_data_for_requests_groups_modules_per_request(self):
+        data = self.repository.get_enrollment_data_for_requests([100, 101, 999])
+
+        self.assertEqual(sorted(data), [100, 101])
+        self.assertEqual(data[100]["student_program_cms_id"], 110)
+        self.assertEqual(data[100]["structure_cms_id"], 70)
+        self.assertEqual(
+            [module.module_code for module in data[100]["modules"]], ["MOD1", "MOD2"]
+        )
+        self.assertIsNone(data[101]["student_program_db_id"])
+        self.assertEqual(
+            [module.semester_module_cms_id for module in data[101]["modules"]], [210]
+        )
+
+    def test_get_enrollment_data_matches_bulk_result(self):
+        single = self.repository.get_enrollment_data(100)
+
+        self.assertEqual(
+            single, self.repository.get_enrollment_data_for_requests([100])[100]
+        )
+
+
+    def test_get_clearances_for_requests_groups_by_request(self):
+        clearances = self.repository.get_clearances_for_requests([100, 101, 999])
+
+        self.assertEqual(sorted(clearances), [100, 101])
+        self.assertEqual(
+            [clearance.department for clearance in clearances[100]],
+            ["finance", "library"],
+        )
+        self.assertEqual(clearances[101][0].status, "rejected")
+
+
+class EnrollmentServiceClearanceTests(unittest.TestCase):
+    def test_check_clearances_builds_report_from_single_bulk_lookup(self):
+        repository = Mock()
+        repository.get_clearances_for_requests.return_value = {
+            100: [
+                Mock(department="finance", status="approved"),
+                Mock(department="library", status="pending"),
+            ],
+            101: [Mock(department="finance", status="rejected")],
+            102: [Mock(department="finance", status="approved")],
+        }
+        with patch("features.enrollments.requests.service.Browser"), patch(
+            "features.enrollments.requests.service.SemesterEnrollmentService"
+        ):
+            service = EnrollmentService(repository)
+
+        report = service.check_clearances_for_requests([100, 101, 102, 103])
+
+        self.assertEqual(
+            report.splitlines(),
+            [
+                "Request #100: Pending: library",
+                "Request #101: Rejected: finance",
+                "Request #103: No clearances found",
+            ],
+        )
+        repository.get_clearances_for_requests.assert_called_once_with(
+            [100, 101, 102, 103]
+        )
+        repository.get_clearances_for_request.assert_not_called()
+
+
+class EnrollmentServiceConcurrencyTests(unittest.TestCase):
+    def _service(self, enrollment_data: dict[int, dict]) -> EnrollmentService:
+        self.repository = Mock()
+        self.repository.get_enrollment_data_for_requests.return_value = enrollment_data
+        with patch("features.enrollments.requests.service.Browser"), patch(
+            "features.enrollments.requests.service.SemesterEnrollmentService"
+        ):
+            return EnrollmentService(self.repository)
+
+    def test_concurrent_enrollment_serializes_requests_for_same_student(self):
+        enrollment_data = {
+            1: {"std_no": 901000001},
+            2: {"std_no": 901000001},
+            3: {"std_no": 901000002},
+            4: {"std_no": 901000003},
+        }
+        service = self._service(enrollment_data)
+        active: dict[str, int] = {}
+        overlaps: list[str] = []
+        lock = threading.Lock()
+
+        def enroll(request_id, _progress, data):
+            std_no = str(data["std_no"])
+            with lock:
+                active[std_no] = active.get(std_no, 0) + 1
+                if active[std_no] > 1:
+                    overlaps.append(std_no)
+            time.sleep(0.02)
+            with lock:
+                active[std_no] -= 1
+            return request_id != 3
+
+        progress = Mock()
+        with patch.object(service, "_enroll_single_request", side_effect=enroll):
+            success_count, failed_count = service.enroll_students(
+                [1, 2, 3, 4], progress, max_workers=4
+            )
+
+        self.assertEqual((success_count, failed_count), (3, 1))
+        self.assertEqual(overlaps, [])
+        self.repository.get_enrollment_data_for_requests.assert_called_once_with(
+            [1, 2, 3, 4]
+        )
+        self.assertEqual(progress.call_args_list[-1].args[1:], (4, 4))
+
+    def test_sequential_enrollment_uses_prefetched_data(self):
+        enrollment_data = {1: {"std_no": 901000001}}
+        service = self._service(enrollment_data)
+
+        with patch.object(
+            service, "_enroll_single_request", return_value=True
+        ) as enroll:
+            result = service.enroll_students([1], lambda *_: None)
+
+        self.assertEqual(result, (1, 0))
+        self.assertIs(enroll.call_args.args[2], enrollment_data[1])
+        self.repository.get_enrollment_data.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from database.bulk_copy import CopyStream
+from database.models import Base
+from features.bulk.student_modules.repository import BulkStudentModulesRepository
+from features.enrollments.requests.repository import EnrollmentRequestRepository
+from features.sync.students.repository import StudentRepository
+from tools.generate_dataset import DatasetScale, SyntheticDataset, load_dataset
+
+SMALL_SCALE = DatasetScale(
+    students=60,
+    schools=2,
+    programs_per_school=2,
+    structures_per_program=2,
+    semesters_per_structure=4,
+    modules_per_semester=3,
+    catalog_modules=40,
+    semesters_per_student=3,
+    terms=6,
+    sponsors=3,
+    registration_requests=15,
+)
+
+
+class SyntheticDatasetTests(unittest.TestCase):
+    def test_rows_are_reproducible_for_a_seed(self):
+        first = SyntheticDataset(SMALL_SCALE)
+        second = SyntheticDataset(SMALL_SCALE)
+        reseeded = SyntheticDataset(DatasetScale(**{**SMALL_SCALE.__dict__, "seed": 7}))
+
+        self.assertEqual(
+            list(first.student_module_rows()), list(second.student_module_rows())
+        )
+        self.assertNotEqual(list(first.student_rows()), list(reseeded.student_rows()))
+
+    def test_scaling_multiplies_students_and_requests(self):
+        scale = DatasetScale().scaled(0.01)
+
+        self.assertEqual(scale.students, 2_000)
+        self.assertEqual(scale.registration_requests, 200)
+        self.assertEqual(scale.structures, DatasetScale().structures)
+        with self.assertRaises(ValueError):
+            SyntheticDataset(DatasetScale().scaled(300))
+
+    def test_copy_stream_escapes_values_and_reads_in_chunks(self):
+        stream = CopyStream([(1, None, True, "a\tb"), (2, "line\nbreak", False, "\\")])
+
+        data = stream.read(5) + stream.read()
+
+        self.assertEqual(data, "1\t\\N\tt\ta\\tb\n2\tline\\nbreak\tf\t\\\\\n")
+        self.assertEqual(stream.rows, 2)
+        self.assertEqual(stream.read(), "")
+
+
+class LoadDatasetTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.engine = create_engine(
+            f"sqlite:///{Path(self.temp_dir.name) / 'dataset.db'}"
+        )
+        self.addCleanup(self.engine.dispose)
+        Base.metadata.create_all(self.engine)
+        self.dataset = SyntheticDataset(SMALL_SCALE)
+        self.loads = load_dataset(self.engine, self.dataset, batch_size=50)
+
+    def _scalar(self, sql: str) -> int:
+        with self.engine.connect() as conn:
+            return conn.execute(text(sql)).scalar_one()
+
+    def test_rows_load_with_consistent_foreign_keys(self):
+        loaded = {load.table: load.rows for load in self.loads}
+
+        self.assertEqual(loaded["students"], 60)
+        self.assertEqual(loaded["structures"], 8)
+        self.assertEqual(loaded["requested_modules"], 45)
+        self.assertEqual(
+            self._scalar("SELECT COUNT(*) FROM student_modules"),
+            loaded["student_modules"],
+        )
+        self.assertEqual(
+            self._scalar(
+                "SELECT COUNT(*) FROM student_modules sm "
+                "LEFT JOIN student_semesters ss ON ss.id = sm.student_semester_id "
+                "LEFT JOIN semester_modules m ON m.id = sm.semester_module_id "
+                "WHERE ss.id IS NULL OR m.id IS NULL"
+            ),
+            0,
+        )
+        self.assertEqual(
+            self._scalar(
+                "SELECT COUNT(*) FROM student_semesters ss "
+                "JOIN student_programs sp ON sp.id = ss.student_program_id "
+                "JOIN structure_semesters st ON st.id = ss.structure_semester_id "
+                "WHERE st.structure_id != sp.structure_id"
+            ),
+            0,
+        )
+
+    def test_list_queries_run_against_the_generated_data(self):
+        students = StudentRepository()
+        students._engine = self.engine
+        rows, total = students.fetch_students(search_query="9010000", page_size=10)
+        self.assertEqual(total, 60)
+        self.assertEqual(len(rows), 10)
+
+        requests = EnrollmentRequestRepository()
+        requests._engine = self.engine
+        request_rows, request_total = requests.fetch_registration_requests()
+        self.assertEqual(request_total, 15)
+        self.assertEqual(request_rows[0].module_count, 3)
+
+        with self.engine.connect() as conn:
+            semester_module_cms_id, structure_cms_id = conn.execute(
+                text(
+                    "SELECT m.cms_id, st.cms_id FROM student_modules sm "
+                    "JOIN semester_modules m ON m.id = sm.semester_module_id "
+                    "JOIN structure_semesters ss ON ss.id = m.semester_id "
+                    "JOIN structures st ON st.id = ss.structure_id LIMIT 1"
+                )
+            ).one()
+        modules = BulkStudentModulesRepository()
+        modules._engine = self.engine
+        self.assertTrue(
+            modules.fetch_students_with_module(semester_module_cms_id, structure_cms_id)
+        )
+
+    def test_loading_twice_requires_truncate(self):
+        with self.assertRaises(ValueError):
+            load_dataset(self.engine, self.dataset)
+
+        load_dataset(self.engine, self.dataset, truncate=True)
+        self.assertEqual(self._scalar("SELECT COUNT(*) FROM students"), 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
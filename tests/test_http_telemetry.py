@@ -0,0 +1,84 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from base.http_telemetry import HttpTelemetry, endpoint_name
+
+
+class HttpTelemetryTests(unittest.TestCase):
+    def test_endpoint_name_drops_host_and_query(self):
+        self.assertEqual(
+            endpoint_name(
+                "https://cms.example/cms/r_stdmoduleview.php?StdSemesterID=9"
+            ),
+            "r_stdmoduleview.php",
+        )
+
+    def test_snapshot_reports_latency_histogram_and_error_rate(self):
+        telemetry = HttpTelemetry()
+        url = "https://cms.example/r_studentviewlist.php"
+        for seconds in (0.05, 0.2, 0.3, 0.4, 3.0):
+            telemetry.record_response(url, 200, seconds, 100)
+        telemetry.record_response(url, 502, 70.0, 0)
+
+        endpoint = telemetry.snapshot()["endpoints"]["r_studentviewlist.php"]
+
+        self.assertEqual(endpoint["requests"], 6)
+        self.assertEqual(endpoint["bytes"], 500)
+        self.assertEqual(endpoint["server_errors"], 1)
+        self.assertEqual(endpoint["server_error_rate"], round(1 / 6, 4))
+        self.assertEqual(endpoint["p50_seconds"], 0.5)
+        self.assertEqual(endpoint["p95_seconds"], 70.0)
+        self.assertEqual(endpoint["latency_histogram"]["le_0.1s"], 1)
+        self.assertEqual(endpoint["latency_histogram"]["le_0.5s"], 2)
+        self.assertEqual(endpoint["latency_histogram"]["overflow"], 1)
+
+    def test_describe_and_write_summary_cover_all_endpoints(self):
+        telemetry = HttpTelemetry()
+        self.assertIsNone(telemetry.describe())
+
+        telemetry.record_response("https://cms.example/a.php", 200, 0.2, 10)
+        telemetry.record_response("https://cms.example/b.php", 200, 0.2, 10)
+        telemetry.record_retry("https://cms.example/b.php")
+        telemetry.record_relogin("https://cms.example/a.php")
+
+        self.assertIn("CMS 2 req", telemetry.describe() or "")
+        self.assertIn("1 retries, 1 relogins", telemetry.describe() or "")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = telemetry.write_summary(Path(temp_dir) / "run" / "telemetry.json")
+            summary = json.loads(path.read_text(encoding="utf-8"))
+
+        self.assertEqual(summary["totals"]["requests"], 2)
+        self.assertEqual(sorted(summary["endpoints"]), ["a.php", "b.php"])
+
+        telemetry.reset()
+        self.assertEqual(telemetry.snapshot()["endpoints"], {})
+
+    def test_load_summary_merges_a_previous_run(self):
+        previous = HttpTelemetry(clock=lambda: 1_000.0)
+        previous.record_response("https://cms.example/a.php", 503, 0.3, 10)
+        previous.record_retry("https://cms.example/a.php")
+        current = HttpTelemetry(clock=lambda: 2_000.0)
+        current.record_response("https://cms.example/a.php", 200, 70.0, 5)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = previous.write_summary(Path(temp_dir) / "telemetry.json")
+            self.assertTrue(current.load_summary(path))
+            path.write_text("{", encoding="utf-8")
+            self.assertFalse(current.load_summary(path))
+            self.assertFalse(current.load_summary(Path(temp_dir) / "missing.json"))
+
+        endpoint = current.snapshot()["endpoints"]["a.php"]
+        self.assertEqual(endpoint["requests"], 2)
+        self.assertEqual(endpoint["bytes"], 15)
+        self.assertEqual(endpoint["server_errors"], 1)
+        self.assertEqual(endpoint["retries"], 1)
+        self.assertEqual(endpoint["latency_histogram"]["le_0.5s"], 1)
+        self.assertEqual(endpoint["latency_histogram"]["overflow"], 1)
+        self.assertEqual(current.started_at, 1_000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
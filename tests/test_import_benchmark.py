@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+import database.connection as connection
+from base.browser import Browser
+from base.http_telemetry import get_http_telemetry
+from base.session_monitor import SessionMonitor
+from tools.cms_standin import StandInConfig, SyntheticCms
+from tools.import_benchmark import (
+    compare_reports,
+    find_regressions,
+    prepare_database,
+    run_structures,
+    run_suite,
+)
+
+
+def build_report(version: str, per_minute: float, statements: float) -> dict:
+    return {
+        "version": version,
+        "benchmarks": {
+            "students": {
+                "unit": "students",
+                "items_per_minute": per_minute,
+                "requests_per_item": 36.0,
+                "statements_per_item": statements,
+                "peak_memory_mb": 3.0,
+            }
+        },
+    }
+
+
+class ImportBenchmarkReportTests(unittest.TestCase):
+    def test_compare_reports_shows_percentage_changes(self):
+        lines = compare_reports(
+            build_report("0.6.0", 90.0, 150.0), build_report("0.5.0", 60.0, 150.0)
+        )
+
+        self.assertEqual(lines[0], "Baseline 0.5.0 -> current 0.6.0")
+        self.assertIn("students students/minute: 60.00 -> 90.00 (+50.0%)", lines)
+        self.assertIn("  DB statements per student: 150.00 -> 150.00 (+0.0%)", lines)
+
+    def test_find_regressions_flags_throughput_and_per_item_costs(self):
+        regressions = find_regressions(
+            build_report("0.6.0", 50.0, 200.0),
+            build_report("0.5.0", 60.0, 150.0),
+            tolerance=0.1,
+        )
+
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("throughput dropped", regressions[0])
+        self.assertIn("DB statements per item rose", regressions[1])
+        self.assertEqual(
+            find_regressions(
+                build_report("0.6.0", 58.0, 155.0),
+                build_report("0.5.0", 60.0, 150.0),
+                tolerance=0.1,
+            ),
+            [],
+        )
+
+
+class ImportBenchmarkSuiteTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        for name in ("DATABASE_ENV", "DATABASE_LOCAL_URL", "DATABASE_REMOTE_URL"):
+            patcher = patch.object(connection, name, getattr(connection, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        Browser.session_monitor = SessionMonitor(
+            os.path.join(self.temp_dir.name, "session.health.json")
+        )
+        Browser.telemetry = None
+        self.addCleanup(get_http_telemetry().reset)
+        browser = object.__new__(Browser)
+        browser.session = requests.Session()
+        instance = patch.object(Browser, "_instance", browser)
+        instance.start()
+        self.addCleanup(instance.stop)
+        self.addCleanup(setattr, Browser, "session_monitor", None)
+
+    def test_suite_imports_from_the_stand_in_and_reports_per_item_costs(self):
+        database_path = Path(self.temp_dir.name) / "benchmark.db"
+
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("REGISTRY_CMS_BASE_URL", None)
+            report = run_suite(
+                f"sqlite:///{database_path}",
+                StandInConfig(
+                    students=3,
+                    schools=1,
+                    programs_per_school=1,
+                    semesters_per_structure=2,
+                    modules_per_semester=2,
+                    student_semesters=2,
+                ),
+                trace_memory=False,
+            )
+
+        benchmarks = report["benchmarks"]
+        self.assertEqual(list(benchmarks), ["structures", "modules", "students"])
+        self.assertEqual(benchmarks["structures"]["items"], 1)
+        self.assertEqual(benchmarks["structures"]["failures"], 0)
+        self.assertEqual(benchmarks["structures"]["details"]["semester_modules"], 4)
+        self.assertEqual(benchmarks["modules"]["items"], 4)
+        self.assertEqual(benchmarks["students"]["items"], 3)
+        self.assertEqual(benchmarks["students"]["failures"], 0)
+        self.assertGreater(benchmarks["students"]["requests_per_item"], 10)
+        self.assertGreater(benchmarks["students"]["statements_per_item"], 10)
+        self.assertIn("fetch.modules", benchmarks["students"]["details"]["phases"])
+        self.assertIsNone(benchmarks["students"]["peak_memory_mb"])
+        self.assertNotIn("REGISTRY_CMS_BASE_URL", os.environ)
+
+    def test_structures_missing_from_the_target_are_reported_as_failures(self):
+        prepare_database(f"sqlite:///{Path(self.temp_dir.name) / 'partial.db'}")
+        site = SyntheticCms(StandInConfig(students=1, schools=1))
+
+        with patch(
+            "features.sync.structures.service.SchoolSyncService"
+            ".import_all_schools_structures"
+        ):
+            saved, failures, details = run_structures(site)
+
+        self.assertEqual(saved, 0)
+        self.assertEqual(failures, len(site.structures))
+        self.assertEqual(
+            details["missing_semester_modules"], len(site.semester_modules)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import contextvars
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from base.phase_timing import (
+    phase,
+    record_network_time,
+    record_phases,
+    timed_phase,
+)
+from features.sync.students.import_timings import (
+    ImportTimingLog,
+    format_timing_summary,
+    percentile,
+    summarize_phases,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class PhaseTimingTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("base.phase_timing.time.perf_counter", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_network_time_splits_section_into_fetch_and_parse(self):
+        with record_phases("901000001") as timings:
+            with phase("student_view", split_network=True):
+                self.clock.now += 0.75
+                record_network_time(0.75)
+                self.clock.now += 0.25
+
+        self.assertEqual(timings.phases["fetch.student_view"], 0.75)
+        self.assertEqual(timings.phases["parse.student_view"], 0.25)
+        self.assertEqual(timings.total_seconds, 1.0)
+
+    def test_nested_phases_only_count_their_own_time(self):
+        @timed_phase("upsert.module")
+        def upsert():
+            self.clock.now += 0.5
+
+        with record_phases("901000001") as timings:
+            with phase("modules", split_network=True):
+                self.clock.now += 1.0
+                upsert()
+                upsert()
+
+        self.assertEqual(timings.phases["upsert.module"], 1.0)
+        self.assertEqual(timings.calls["upsert.module"], 2)
+        self.assertEqual(timings.phases["parse.modules"], 1.0)
+        self.assertEqual(timings.phases["fetch.modules"], 0.0)
+
+    def test_pool_thread_phases_are_summed_without_clamping_the_caller(self):
+        @timed_phase("modules", split_network=True)
+        def scrape_module():
+            self.clock.now += 0.75
+            record_network_time(0.5)
+
+        with record_phases("901000001") as timings, phase("modules.wall"):
+            for _ in range(3):
+                thread = threading.Thread(
+                    target=contextvars.copy_context().run, args=(scrape_module,)
+                )
+                thread.start()
+                thread.join()
+
+        self.assertEqual(timings.phases["fetch.modules"], 1.5)
+        self.assertEqual(timings.phases["parse.modules"], 0.75)
+        self.assertEqual(timings.calls["fetch.modules"], 3)
+        self.assertEqual(timings.phases["modules.wall"], 2.25)
+
+    def test_timed_phase_is_a_pass_through_outside_a_recording(self):
+        @timed_phase("upsert.student")
+        def update():
+            return "done"
+
+        self.assertEqual(update(), "done")
+        record_network_time(1.0)
+
+
+class ImportTimingLogTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.log = ImportTimingLog(Path(self.temp_dir.name) / "timings.jsonl")
+
+    def _append(self, std_no: str, total: float, phases: dict[str, float], ok=True):
+        with record_phases(std_no) as timings:
+            for name, seconds in phases.items():
+                timings.add(name, seconds)
+        timings.total_seconds = total
+        self.log.append(timings, ok)
+
+    def test_log_round_trips_records_and_summarizes_percentiles(self):
+        for index in range(1, 21):
+            self._append(
+                f"9010000{index:02d}",
+                float(index),
+                {"fetch.modules": index * 0.5, "upsert.module": 0.1},
+            )
+        self._append("901000099", 90.0, {"fetch.modules": 80.0}, ok=False)
+
+        records = self.log.read()
+        summaries = {summary.phase: summary for summary in summarize_phases(records)}
+
+        self.assertEqual(len(records), 21)
+        self.assertEqual(summaries["total"].p50_seconds, 11.0)
+        self.assertEqual(summaries["total"].p95_seconds, 20.0)
+        self.assertEqual(summaries["upsert.module"].students, 20)
+
+        lines = format_timing_summary(records, slowest=2)
+        self.assertIn("- 901000099: 90.00s (fetch.modules 80.00s) failed", lines)
+        self.assertIn("- 901000020: 20.00s (fetch.modules 10.00s)", lines)
+
+    def test_percentile_uses_nearest_rank(self):
+        self.assertEqual(percentile([], 0.95), 0.0)
+        self.assertEqual(percentile([3.0, 1.0, 2.0], 0.5), 2.0)
+        self.assertEqual(percentile([3.0, 1.0, 2.0], 0.95), 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
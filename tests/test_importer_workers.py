@@ -1,9 +1,14 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
+from base.http_telemetry import get_http_telemetry
+from base.phase_timing import phase, record_network_time
 from database import (
     Module,
     NextOfKin,
@@ -20,6 +25,7 @@ from database import (
     StudentSemester,
     Term,
 )
+from features.sync.students.import_timings import ImportTimingLog
 from features.sync.students.repository import StudentRepository
 from features.sync.students.service import StudentSyncService
 from features.sync.students.view.importer.importer_project import (
@@ -133,6 +139,52 @@ class ImporterWorkerTests(unittest.TestCase):
         self.assertEqual(len(failed_students), 8)
         self.assertEqual(callback.call_args_list[-1].args[0], "finished")
 
+    def test_resumed_worker_keeps_telemetry_from_before_the_pause(self):
+        telemetry = get_http_telemetry()
+        self.addCleanup(telemetry.reset)
+        sync_service = Mock()
+
+        def fetch_student(std_no, *_args):
+            telemetry.record_response(
+                "https://cms.example/r_studentview.php", 200, 0.1, 1
+            )
+            return True
+
+        sync_service.fetch_student.side_effect = fetch_student
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            with (
+                patch.object(
+                    ImporterProjectManager, "PROJECT_FILE", directory / "project.json"
+                ),
+                patch.object(
+                    ImporterProjectManager, "TELEMETRY_FILE", directory / "http.json"
+                ),
+                patch.object(
+                    ImporterProjectManager, "TIMINGS_FILE", directory / "timings.jsonl"
+                ),
+            ):
+                project = ImporterProjectManager.create_project(
+                    "901000001", "901000004", {}
+                )
+                for std_no in ("901000001", "901000002"):
+                    fetch_student(std_no)
+                ImporterWorker(project, sync_service, Mock())._save_http_telemetry()
+                project.current_student = "901000003"
+                project.status = "paused"
+
+                telemetry.reset()
+                ImporterWorker(project, sync_service, Mock()).run()
+                summary = json.loads(
+                    ImporterProjectManager.TELEMETRY_FILE.read_text(encoding="utf-8")
+                )
+
+                ImporterProjectManager.create_project("901000001", "901000002", {})
+                self.assertFalse(ImporterProjectManager.TELEMETRY_FILE.exists())
+
+        self.assertEqual(summary["endpoints"]["r_studentview.php"]["requests"], 4)
+
     def test_worker_resume_starts_from_saved_student(self):
         project = ImporterProject(
             start_student="901000001",
@@ -248,6 +300,32 @@ class ImporterRetryWorkerTests(unittest.TestCase):
         self.assertEqual(callback.call_args_list[-1].args[0], "retry_finished")
         self.assertFalse(callback.call_args_list[-1].args[3])
 
+    def test_retry_worker_records_phase_timings(self):
+        project = _project()
+        sync_service = Mock()
+
+        def fetch_student(std_no, *_args):
+            with phase("student_view", split_network=True):
+                record_network_time(0.0)
+            return True
+
+        sync_service.fetch_student.side_effect = fetch_student
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            timings_file = Path(temp_dir) / "import_timings.jsonl"
+            with (
+                patch.object(ImporterProjectManager, "save_project"),
+                patch.object(ImporterProjectManager, "TIMINGS_FILE", timings_file),
+            ):
+                ImporterRetryWorker(project, "901000001", sync_service, Mock()).run()
+            timing_records = ImportTimingLog(timings_file).read()
+
+        self.assertEqual(
+            [record.student_number for record in timing_records], ["901000001"]
+        )
+        self.assertIn("fetch.student_view", timing_records[0].phases)
+        self.assertTrue(timing_records[0].success)
+
 
 class StudentSyncServiceTests(unittest.TestCase):
     def test_fetch_student_returns_false_when_selected_sections_have_no_data(self):
@@ -982,14 +1060,20 @@ class ImporterDatabaseBatchTests(unittest.TestCase):
                 side_effect=scrape_student_modules_concurrent,
             ),
             patch.object(ImporterProjectManager, "save_project"),
+            tempfile.TemporaryDirectory() as temp_dir,
         ):
-            worker = ImporterWorker(project, service, callback)
-            worker.run()
+            timings_file = Path(temp_dir) / "import_timings.jsonl"
+            with patch.object(ImporterProjectManager, "TIMINGS_FILE", timings_file):
+                worker = ImporterWorker(project, service, callback)
+                worker.run()
+            timing_records = ImportTimingLog(timings_file).read()
 
         self.assertEqual(project.status, "completed")
         self.assertEqual(project.success_count, 600)
         self.assertEqual(project.failed_count, 0)
         self.assertEqual(callback.call_args_list[-1].args[0], "finished")
+        self.assertEqual(len(timing_records), 600)
+        self.assertIn("upsert.module", timing_records[0].phases)
 
         with Session(self.engine) as session:
             self.assertEqual(session.query(Student).count(), 600)
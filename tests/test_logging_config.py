@@ -0,0 +1,66 @@
+import logging
+import tempfile
+import unittest
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+from base import get_logger
+from base.logging_config import LogSampler, setup_logging, shutdown_logging
+
+
+class LoggingConfigTests(unittest.TestCase):
+    def setUp(self):
+        self.root_logger = logging.getLogger()
+        self.original_handlers = list(self.root_logger.handlers)
+        self.original_level = self.root_logger.level
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        shutdown_logging()
+        for handler in list(self.root_logger.handlers):
+            self.root_logger.removeHandler(handler)
+        for handler in self.original_handlers:
+            self.root_logger.addHandler(handler)
+        self.root_logger.setLevel(self.original_level)
+        self.temp_dir.cleanup()
+
+    def test_setup_logging_routes_root_through_a_single_queue_handler(self):
+        setup_logging(Path(self.temp_dir.name))
+        setup_logging(Path(self.temp_dir.name))
+
+        self.assertEqual(len(self.root_logger.handlers), 1)
+        self.assertIsInstance(self.root_logger.handlers[0], QueueHandler)
+
+    def test_get_logger_does_not_attach_duplicate_handlers(self):
+        setup_logging(Path(self.temp_dir.name))
+
+        logger = get_logger("tests.logging_config.dedupe")
+        get_logger("tests.logging_config.dedupe")
+
+        self.assertEqual(logger.handlers, [])
+        self.assertTrue(logger.propagate)
+
+    def test_errors_are_written_once_by_the_background_listener(self):
+        log_dir = Path(self.temp_dir.name)
+        setup_logging(log_dir)
+
+        get_logger("tests.logging_config.errors").error("listener wrote this")
+        shutdown_logging()
+
+        error_logs = list(log_dir.glob("registry_errors_*.log"))
+        self.assertEqual(len(error_logs), 1)
+        contents = error_logs[0].read_text(encoding="utf-8")
+        self.assertEqual(contents.count("listener wrote this"), 1)
+
+    def test_log_sampler_keeps_every_nth_record(self):
+        sampler = LogSampler(3)
+
+        self.assertEqual(
+            [sampler.should_log() for _ in range(7)],
+            [True, False, False, True, False, False, True],
+        )
+        self.assertTrue(all(LogSampler(0).should_log() for _ in range(3)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import patch
+
+import main
+from database.bootstrap import SchemaStatus
+
+
+def _status(database_exists: bool, stored: str | None) -> SchemaStatus:
+    return SchemaStatus(
+        database_name="cms_lesotho",
+        database_exists=database_exists,
+        stored_fingerprint=stored,
+        expected_fingerprint="expected",
+    )
+
+
+class RuntimeDatabaseBootstrapTests(unittest.TestCase):
+    def _bootstrap(self, status: SchemaStatus, forced: bool = False):
+        with (
+            patch.object(main, "is_schema_bootstrap_forced", return_value=forced),
+            patch.object(main, "check_current_database_schema", return_value=status),
+            patch.object(main, "run_runtime_database_bootstrap") as run_bootstrap,
+        ):
+            main.bootstrap_runtime_database()
+        return run_bootstrap
+
+    def test_matching_stamp_skips_the_bootstrap(self):
+        self._bootstrap(_status(True, "expected")).assert_not_called()
+
+    def test_missing_or_stale_stamp_bootstraps_before_startup(self):
+        for status in (
+            _status(True, None),
+            _status(True, "stale"),
+            _status(False, None),
+        ):
+            with self.subTest(status=status):
+                self._bootstrap(status).assert_called_once_with()
+
+    def test_forced_bootstrap_runs_even_when_current(self):
+        self._bootstrap(
+            _status(True, "expected"), forced=True
+        ).assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
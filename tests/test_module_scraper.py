@@ -3,13 +3,17 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 from bs4 import BeautifulSoup
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 
 from base.browser import BASE_URL
+from database import Module
 from features.sync.modules import scraper as modules_scraper
 from features.sync.modules.scraper import (
     ModuleScrapeIntegrityError,
     _extract_modules_from_page,
 )
+from features.sync.modules.repository import ModuleRepository
 from features.sync.modules.service import ModuleSyncService
 
 
@@ -221,7 +225,203 @@ class ModuleScraperTests(unittest.TestCase):
                 modules_scraper.scrape_all_modules(max_attempts=1)
 
 
+    def test_scrape_changed_modules_stops_at_first_unchanged_page(self):
+        sorted_url = f"{BASE_URL}/f_modulelist.php?order=DateStamp&ordertype=DESC"
+        browser = _SequencedBrowser(
+            {
+                sorted_url: _module_page(
+                    1,
+                    2,
+                    6,
+                    [
+                        _module_row(303, "CCC303", "Gamma", "Active", "2024-03-01"),
+                        _module_row(202, "BBB202", "Beta", "Active", "2024-02-02"),
+                    ],
+                ),
+                f"{sorted_url}&start=3": _module_page(
+                    3,
+                    4,
+                    6,
+                    [
+                        _module_row(101, "AAA101", "Alpha", "Active", "2024-01-01"),
+                        _module_row(99, "ZZZ099", "Omega", "Active", "2023-12-01"),
+                    ],
+                ),
+            }
+        )
+        known_timestamps = {
+            202: "2024-01-02",
+            101: "2024-01-01",
+            99: "2023-12-01",
+        }
+
+        with patch.object(modules_scraper, "Browser", return_value=browser):
+            modules = modules_scraper.scrape_changed_modules(known_timestamps)
+
+        self.assertIsNotNone(modules)
+        assert modules is not None
+        self.assertEqual([module["cms_id"] for module in modules], [303, 202])
+
+    def test_scrape_changed_modules_returns_none_when_list_is_not_sorted(self):
+        sorted_url = f"{BASE_URL}/f_modulelist.php?order=DateStamp&ordertype=DESC"
+        browser = _SequencedBrowser(
+            {
+                sorted_url: _module_page(
+                    1,
+                    2,
+                    2,
+                    [
+                        _module_row(101, "AAA101", "Alpha", "Active", "2024-01-01"),
+                        _module_row(202, "BBB202", "Beta", "Active", "2024-02-02"),
+                    ],
+                )
+            }
+        )
+
+        with patch.object(modules_scraper, "Browser", return_value=browser):
+            modules = modules_scraper.scrape_changed_modules({101: "2024-01-01"})
+
+        self.assertIsNone(modules)
+
+
+class ModuleRepositoryTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Module.__table__.create(self.engine)
+        with patch(
+            "features.sync.modules.repository.get_engine", return_value=self.engine
+        ):
+            self.repository = ModuleRepository()
+
+        with Session(self.engine) as session:
+            session.add_all(
+                [
+                    Module(
+                        cms_id=101,
+                        code="AAA101",
+                        name="Alpha",
+                        status="Active",
+                        timestamp="2024-01-01",
+                    ),
+                    Module(code="BBB202", name="Beta", status="Active"),
+                ]
+            )
+            session.commit()
+
+    def test_save_modules_inserts_and_updates_by_cms_id_or_code(self):
+        saved_count = self.repository.save_modules(
+            [
+                {
+                    "cms_id": 101,
+                    "code": "AAA101 ",
+                    "name": "Alpha Renamed",
+                    "status": "Defunct",
+                    "timestamp": "2024-02-01",
+                },
+                {
+                    "cms_id": 202,
+                    "code": "BBB202",
+                    "name": "",
+                    "status": "Active",
+                    "timestamp": "2024-02-02",
+                },
+                {
+                    "cms_id": 303,
+                    "code": "CCC303",
+                    "name": "Gamma",
+                    "status": "Active",
+                    "timestamp": "2024-02-03",
+                },
+            ],
+            chunk_size=2,
+        )
+
+        with Session(self.engine) as session:
+            rows = {
+                module.code: (module.cms_id, module.name, module.status)
+                for module in session.query(Module).all()
+            }
+
+        self.assertEqual(saved_count, 3)
+        self.assertEqual(
+            rows,
+            {
+                "AAA101": (101, "Alpha Renamed", "Defunct"),
+                "BBB202": (202, "Beta", "Active"),
+                "CCC303": (303, "Gamma", "Active"),
+            },
+        )
+        self.assertEqual(
+            self.repository.get_module_timestamps(),
+            {101: "2024-02-01", 202: "2024-02-02", 303: "2024-02-03"},
+        )
+
+
 class ModuleSyncServiceTests(unittest.TestCase):
+    def test_fetch_and_save_changed_modules_saves_only_changes_in_bulk(self):
+        repository = Mock()
+        repository.get_module_timestamps.return_value = {101: "2024-01-01"}
+        repository.save_modules.return_value = 1
+        repository.find_missing_cms_ids.return_value = []
+        service = ModuleSyncService(repository)
+
+        changed = [
+            {
+                "cms_id": 202,
+                "code": "BBB202",
+                "name": "Beta",
+                "status": "Active",
+                "timestamp": "2024-01-02",
+            }
+        ]
+
+        with patch(
+            "features.sync.modules.service.scrape_changed_modules",
+            return_value=changed,
+        ), patch("features.sync.modules.service.scrape_all_modules") as full_scrape:
+            saved_count = service.fetch_and_save_changed_modules(lambda *_: None)
+
+        self.assertEqual(saved_count, 1)
+        full_scrape.assert_not_called()
+        repository.save_modules.assert_called_once_with(changed)
+        repository.save_module.assert_not_called()
+
+    def test_fetch_and_save_changed_modules_falls_back_to_full_scrape(self):
+        repository = Mock()
+        repository.get_module_timestamps.return_value = {101: "2024-01-01 "}
+        repository.save_modules.return_value = 1
+        repository.find_missing_cms_ids.return_value = []
+        service = ModuleSyncService(repository)
+
+        modules = [
+            {
+                "cms_id": 101,
+                "code": "AAA101",
+                "name": "Alpha",
+                "status": "Active",
+                "timestamp": "2024-01-01",
+            },
+            {
+                "cms_id": 202,
+                "code": "BBB202",
+                "name": "Beta",
+                "status": "Active",
+                "timestamp": "2024-01-02",
+            },
+        ]
+
+        with patch(
+            "features.sync.modules.service.scrape_changed_modules",
+            return_value=None,
+        ), patch(
+            "features.sync.modules.service.scrape_all_modules", return_value=modules
+        ):
+            saved_count = service.fetch_and_save_changed_modules(lambda *_: None)
+
+        self.assertEqual(saved_count, 1)
+        repository.save_modules.assert_called_once_with([modules[1]])
+
+
     def test_fetch_and_save_all_modules_raises_when_save_fails(self):
         repository = Mock()
         repository.save_module.side_effect = [None, RuntimeError("db failure")]
@@ -0,0 +1,93 @@
+import threading
+import unittest
+
+from base.progress import ProgressChannel
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProgressChannelTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.events: list[tuple] = []
+
+    def _channel(self, **kwargs) -> ProgressChannel:
+        return ProgressChannel(
+            lambda *event: self.events.append(event),
+            clock=self.clock,
+            **kwargs,
+        )
+
+    def test_coalesces_progress_and_flushes_latest_before_terminal_event(self):
+        channel = self._channel(rate=1 / 3600)
+
+        for current in range(1, 1001):
+            channel("progress", f"Row {current}", current, 1000)
+        channel("finished", 1000)
+
+        self.assertEqual(
+            self.events,
+            [
+                ("progress", "Row 1", 1, 1000),
+                ("progress", "Row 1000", 1000, 1000),
+                ("finished", 1000),
+            ],
+        )
+        self.assertEqual(channel.received, 1000)
+        self.assertEqual(channel.delivered, 2)
+        self.assertEqual(channel.dropped, 998)
+
+    def test_delivers_progress_once_interval_has_elapsed(self):
+        channel = self._channel(rate=10)
+
+        channel("progress", "first", 1, 3)
+        self.clock.now = 0.05
+        channel("progress", "second", 2, 3)
+        self.clock.now = 0.2
+        channel("progress", "third", 3, 3)
+
+        self.assertEqual(
+            [event[1] for event in self.events],
+            ["first", "third"],
+        )
+        channel.flush()
+        self.assertEqual(len(self.events), 2)
+
+    def test_pending_progress_is_delivered_without_further_events(self):
+        delivered = threading.Event()
+        events: list[tuple] = []
+
+        def callback(*event):
+            events.append(event)
+            if len(events) == 2:
+                delivered.set()
+
+        channel = ProgressChannel(callback, rate=50)
+        channel("progress", "first", 1, 2)
+        channel("progress", "last", 2, 2)
+
+        self.assertTrue(delivered.wait(2))
+        self.assertEqual(events[-1], ("progress", "last", 2, 2))
+
+    def test_passes_other_events_through_in_order(self):
+        channel = self._channel(coalesce=("retry_progress",))
+
+        channel("progress", "a", 1, 2)
+        channel("progress", "b", 2, 2)
+        channel("retry_progress", "c", 1, 1)
+        channel("error", "boom")
+
+        self.assertEqual(
+            [event[0] for event in self.events],
+            ["progress", "progress", "retry_progress", "error"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
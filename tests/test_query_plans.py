@@ -0,0 +1,228 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+import database.connection as connection
+from database.connection import create_database_engine
+from database.models import Base
+from tests.test_generate_dataset import SMALL_SCALE
+from tools.generate_dataset import DatasetScale, SyntheticDataset, load_dataset
+from tools.import_benchmark import prepare_database
+from tools.query_plans import (
+    HOT_QUERIES,
+    HotQuery,
+    capture_statements,
+    check_plans,
+    ensure_dataset,
+    run_checks,
+    sample_parameters,
+    summarize_plan,
+)
+
+PLAN_DATABASE_URL = os.getenv("REGISTRY_PLAN_DATABASE_URL", "")
+
+INDEXED_PLAN = [
+    {
+        "Plan": {
+            "Node Type": "Nested Loop",
+            "Plan Rows": 36,
+            "Total Cost": 42.5,
+            "Plans": [
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": "student_programs",
+                    "Index Name": "fk_student_programs_std_no",
+                    "Plan Rows": 1,
+                },
+                {
+                    "Node Type": "Bitmap Heap Scan",
+                    "Relation Name": "student_semesters",
+                    "Plan Rows": 6,
+                    "Plans": [
+                        {
+                            "Node Type": "Bitmap Index Scan",
+                            "Index Name": "fk_student_semesters_student_program_id",
+                            "Plan Rows": 6,
+                        }
+                    ],
+                },
+                {
+                    "Node Type": "Seq Scan",
+                    "Relation Name": "structure_semesters",
+                    "Plan Rows": 8,
+                },
+            ],
+        }
+    }
+]
+
+SCANNED_PLAN = [
+    {
+        "Plan": {
+            "Node Type": "Hash Join",
+            "Plan Rows": 1200000,
+            "Total Cost": 98000.0,
+            "Plans": [
+                {
+                    "Node Type": "Seq Scan",
+                    "Parallel Aware": True,
+                    "Relation Name": "student_semesters",
+                    "Plan Rows": 1200000,
+                },
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": "student_programs",
+                    "Index Name": "student_programs_pkey",
+                    "Plan Rows": 1,
+                },
+            ],
+        }
+    }
+]
+
+SIZES = {
+    "student_programs": 200_000.0,
+    "student_semesters": 1_200_000.0,
+    "structure_semesters": 15_360.0,
+}
+
+GRAPH_QUERY = HotQuery(
+    "student_graph",
+    lambda engine, params: None,
+    expected_indexes=(
+        "fk_student_programs_std_no",
+        "fk_student_semesters_student_program_id",
+    ),
+    max_rows=1_000,
+)
+
+
+class PlanCheckTests(unittest.TestCase):
+    def test_summarize_plan_collects_scans_and_estimates(self):
+        plan = summarize_plan("SELECT 1", INDEXED_PLAN)
+
+        self.assertEqual(
+            plan.indexes,
+            {"fk_student_programs_std_no", "fk_student_semesters_student_program_id"},
+        )
+        self.assertEqual(
+            [scan.relation for scan in plan.sequential_scans], ["structure_semesters"]
+        )
+        self.assertEqual(plan.max_rows, 36)
+        self.assertEqual(plan.total_cost, 42.5)
+
+    def test_indexed_plan_passes_when_only_small_tables_are_scanned(self):
+        plan = summarize_plan("SELECT 1", INDEXED_PLAN)
+
+        self.assertEqual(
+            check_plans(GRAPH_QUERY, [plan], SIZES, large_table_rows=50_000), []
+        )
+        self.assertEqual(
+            check_plans(GRAPH_QUERY, [plan], SIZES, large_table_rows=10_000),
+            ["sequential scan on structure_semesters (~15,360 rows): SELECT 1"],
+        )
+
+    def test_row_estimates_above_the_limit_are_reported(self):
+        plan = summarize_plan("SELECT 1", INDEXED_PLAN)
+        query = HotQuery(
+            GRAPH_QUERY.name,
+            GRAPH_QUERY.run,
+            expected_indexes=(),
+            max_rows=10,
+        )
+
+        self.assertEqual(
+            check_plans(query, [plan], SIZES),
+            ["estimated 36 rows, above the 10 limit: SELECT 1"],
+        )
+
+    def test_full_scan_regression_is_reported(self):
+        plan = summarize_plan("SELECT 2", SCANNED_PLAN)
+        query = HotQuery(
+            GRAPH_QUERY.name,
+            GRAPH_QUERY.run,
+            expected_indexes=GRAPH_QUERY.expected_indexes,
+            max_rows=2_000_000,
+        )
+
+        problems = check_plans(query, [plan], SIZES)
+
+        self.assertEqual(
+            problems,
+            [
+                "expected index fk_student_programs_std_no was not used",
+                "expected index fk_student_semesters_student_program_id was not used",
+                "sequential scan on student_semesters (~1,200,000 rows): SELECT 2",
+            ],
+        )
+        allowed = HotQuery(
+            query.name,
+            query.run,
+            expected_indexes=(),
+            max_rows=query.max_rows,
+            allowed_scans=("student_semesters",),
+        )
+        self.assertEqual(check_plans(allowed, [plan], SIZES), [])
+
+
+class HotQueryTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.engine = create_engine(
+            f"sqlite:///{Path(self.temp_dir.name) / 'plans.db'}"
+        )
+        self.addCleanup(self.engine.dispose)
+        Base.metadata.create_all(self.engine)
+        load_dataset(self.engine, SyntheticDataset(SMALL_SCALE), batch_size=50)
+
+    def test_every_hot_query_runs_against_sampled_parameters(self):
+        params = sample_parameters(self.engine)
+        self.assertEqual(len(params["std_nos"]), 30)
+
+        for query in HOT_QUERIES:
+            with self.subTest(query=query.name):
+                statements = capture_statements(
+                    self.engine, lambda query=query: query.run(self.engine, params)
+                )
+                self.assertTrue(statements)
+                self.assertTrue(
+                    all(
+                        statement.lstrip().upper().startswith("SELECT")
+                        for statement, _ in statements
+                    )
+                )
+
+    def test_ensure_dataset_only_loads_an_empty_database(self):
+        self.assertFalse(ensure_dataset(self.engine, DatasetScale()))
+
+
+@unittest.skipUnless(
+    PLAN_DATABASE_URL.startswith("postgresql"),
+    "set REGISTRY_PLAN_DATABASE_URL to a throwaway Postgres database",
+)
+class PostgresQueryPlanTests(unittest.TestCase):
+    def setUp(self):
+        for name in ("DATABASE_ENV", "DATABASE_LOCAL_URL", "DATABASE_REMOTE_URL"):
+            patcher = patch.object(connection, name, getattr(connection, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        prepare_database(PLAN_DATABASE_URL)
+        self.engine = create_database_engine(PLAN_DATABASE_URL)
+        self.addCleanup(self.engine.dispose)
+        scale = float(os.getenv("REGISTRY_PLAN_DATASET_SCALE", "1"))
+        ensure_dataset(self.engine, DatasetScale().scaled(scale))
+
+    def test_hot_queries_keep_their_index_plans(self):
+        for check in run_checks(self.engine):
+            with self.subTest(query=check.name):
+                self.assertEqual(check.problems, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
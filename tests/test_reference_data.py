@@ -0,0 +1,119 @@
+import threading
+import time
+import unittest
+
+from features.common.reference_data import (
+    PROGRAMS,
+    SCHOOLS,
+    TERMS,
+    ReferenceDataStore,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Listener:
+    def __init__(self):
+        self.calls: list[set[str]] = []
+
+    def on_change(self, categories):
+        self.calls.append(categories)
+
+
+class ReferenceDataStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = ReferenceDataStore(ttl=60, clock=self.clock)
+        self.loads: list[str] = []
+
+    def loader(self, value):
+        def load():
+            self.loads.append(value)
+            return [value]
+
+        return load
+
+    def test_get_reuses_cached_value_until_ttl_expires(self):
+        first = self.store.get(SCHOOLS, self.loader("fict"))
+        second = self.store.get(SCHOOLS, self.loader("fict"))
+
+        self.clock.now = 61
+        third = self.store.get(SCHOOLS, self.loader("fict"))
+
+        self.assertEqual(first, ["fict"])
+        self.assertEqual(second, ["fict"])
+        self.assertEqual(third, ["fict"])
+        self.assertEqual(self.loads, ["fict", "fict"])
+
+    def test_keys_separate_variants_within_a_category(self):
+        self.store.get(PROGRAMS, self.loader("all"), None)
+        self.store.get(PROGRAMS, self.loader("school-1"), 1)
+        self.store.get(PROGRAMS, self.loader("school-1"), 1)
+
+        self.assertEqual(self.loads, ["all", "school-1"])
+
+    def test_returned_lists_do_not_share_cache_storage(self):
+        first = self.store.get(SCHOOLS, self.loader("fict"))
+        first.append("mutated")
+
+        self.assertEqual(self.store.get(SCHOOLS, self.loader("fict")), ["fict"])
+
+    def test_invalidate_clears_only_named_categories_and_notifies(self):
+        listener = Listener()
+        self.store.subscribe(listener.on_change)
+        self.store.get(SCHOOLS, self.loader("school"))
+        self.store.get(TERMS, self.loader("term"), "catalog")
+
+        self.store.invalidate(SCHOOLS)
+        self.store.get(SCHOOLS, self.loader("school"))
+        self.store.get(TERMS, self.loader("term"), "catalog")
+
+        self.assertEqual(self.loads, ["school", "term", "school"])
+        self.assertEqual(listener.calls, [{SCHOOLS}])
+
+    def test_unsubscribe_and_collected_listeners_stop_receiving_events(self):
+        kept = Listener()
+        dropped = Listener()
+        unsubscribe = self.store.subscribe(kept.on_change)
+        self.store.subscribe(dropped.on_change)
+        calls = dropped.calls
+        del dropped
+
+        self.store.invalidate(PROGRAMS)
+        unsubscribe()
+        self.store.invalidate(PROGRAMS)
+
+        self.assertEqual(kept.calls, [{PROGRAMS}])
+        self.assertEqual(calls, [])
+
+    def test_concurrent_misses_load_once(self):
+        barrier = threading.Barrier(4)
+        results = []
+
+        def slow_loader():
+            self.loads.append("slow")
+            time.sleep(0.05)
+            return ["value"]
+
+        def worker():
+            barrier.wait()
+            results.append(self.store.get(SCHOOLS, slow_loader))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.loads, ["slow"])
+        self.assertEqual(results, [["value"]] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
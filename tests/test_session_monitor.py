@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+
+from base.session_monitor import (
+    EXPIRY_WARNING_SECONDS,
+    MIN_KEEP_ALIVE_INTERVAL,
+    SessionMonitor,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class SessionMonitorTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_file = os.path.join(self.temp_dir.name, "session.health.json")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build_monitor(self, keep_alive_interval: float = 300) -> SessionMonitor:
+        return SessionMonitor(
+            self.state_file,
+            keep_alive_interval=keep_alive_interval,
+            clock=self.clock,
+        )
+
+    def test_expiry_after_idle_shortens_keep_alive_interval(self):
+        monitor = self.build_monitor()
+        monitor.record_login()
+        self.clock.advance(1440)
+
+        monitor.record_expiry()
+
+        self.assertEqual(monitor.observed_idle_timeout, 1440)
+        self.assertIsNone(monitor.observed_lifetime)
+        self.assertEqual(monitor.keep_alive_interval, 300)
+
+        monitor.record_login()
+        self.clock.advance(400)
+        monitor.record_expiry()
+
+        self.assertEqual(monitor.observed_idle_timeout, 400)
+        self.assertEqual(monitor.keep_alive_interval, 200)
+
+    def test_expiry_while_active_records_session_lifetime(self):
+        monitor = self.build_monitor()
+        monitor.record_login()
+        for _ in range(6):
+            self.clock.advance(100)
+            monitor.record_activity()
+        self.clock.advance(10)
+
+        monitor.record_expiry()
+        monitor.record_expiry()
+
+        health = monitor.get_health()
+        self.assertTrue(health.expired)
+        self.assertEqual(health.observed_lifetime, 610)
+        self.assertIsNone(health.observed_idle_timeout)
+        self.assertIn("expired", health.describe() or "")
+
+    def test_health_warns_before_predicted_expiry(self):
+        monitor = self.build_monitor()
+        monitor.observed_lifetime = 3600
+        monitor.record_login()
+
+        self.clock.advance(3600 - EXPIRY_WARNING_SECONDS - 60)
+        self.assertIsNone(monitor.get_health().describe())
+
+        self.clock.advance(120)
+        health = monitor.get_health()
+        self.assertTrue(health.needs_login_soon)
+        self.assertEqual(health.seconds_until_expiry, EXPIRY_WARNING_SECONDS - 60)
+        self.assertIn("~14m", health.describe() or "")
+
+    def test_needs_keep_alive_after_idle_interval(self):
+        monitor = self.build_monitor(keep_alive_interval=10)
+        self.assertFalse(monitor.needs_keep_alive())
+
+        monitor.record_activity()
+        self.clock.advance(MIN_KEEP_ALIVE_INTERVAL - 1)
+        self.assertFalse(monitor.needs_keep_alive())
+
+        self.clock.advance(1)
+        self.assertTrue(monitor.needs_keep_alive())
+
+        monitor.record_expiry()
+        self.assertFalse(monitor.needs_keep_alive())
+
+    def test_observations_persist_between_runs(self):
+        monitor = self.build_monitor()
+        monitor.record_login()
+        self.clock.advance(50)
+        monitor.record_activity()
+        self.clock.advance(10)
+        monitor.record_expiry()
+
+        reloaded = self.build_monitor()
+
+        self.assertEqual(reloaded.observed_lifetime, 60)
+        self.assertEqual(reloaded.logged_in_at, 1000.0)
+        self.assertFalse(reloaded.expired)
+
+
+if __name__ == "__main__":
+    unittest.main()
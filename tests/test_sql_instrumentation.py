@@ -0,0 +1,99 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from database.instrumentation import (
+    add_report_listener,
+    configure_sql_profiling,
+    instrument_engine,
+    max_queries,
+    profile_operation,
+    profiled,
+)
+
+
+class SqlInstrumentationTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        instrument_engine(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            conn.execute(text("INSERT INTO items (id) VALUES (1), (2), (3)"))
+
+    def tearDown(self):
+        configure_sql_profiling(False)
+        self.engine.dispose()
+
+    def _run_queries(self, count: int):
+        with self.engine.connect() as conn:
+            for item_id in range(count):
+                conn.execute(
+                    text("SELECT id FROM items WHERE id = :id"), {"id": item_id}
+                )
+
+    def test_profile_counts_queries_and_flags_repeated_statements(self):
+        with profile_operation("load_items", report=False) as profile:
+            self._run_queries(6)
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT count(*) FROM items"))
+
+        self.assertEqual(profile.query_count, 7)
+        self.assertGreaterEqual(profile.query_seconds, 0)
+        repeated = profile.repeated_statements()
+        self.assertEqual(len(repeated), 1)
+        self.assertEqual(repeated[0][1], 6)
+        self.assertIn("repeated 6x", profile.format_report())
+
+    def test_nested_profiles_each_see_inner_queries(self):
+        with profile_operation("outer", report=False) as outer:
+            self._run_queries(1)
+            with profile_operation("inner", report=False) as inner:
+                self._run_queries(2)
+
+        self.assertEqual(outer.query_count, 3)
+        self.assertEqual(inner.query_count, 2)
+
+    def test_max_queries_raises_with_report_when_limit_exceeded(self):
+        with max_queries(self.engine, 3):
+            self._run_queries(3)
+
+        with self.assertRaises(AssertionError) as ctx:
+            with max_queries(self.engine, 2, name="too_many"):
+                self._run_queries(5)
+
+        self.assertIn("at most 2 queries but 5 ran", str(ctx.exception))
+        self.assertIn("too_many", str(ctx.exception))
+
+    def test_profiled_reports_to_listeners_and_file_only_when_enabled(self):
+        reports = []
+        remove = add_report_listener(reports.append)
+        self.addCleanup(remove)
+
+        @profiled("load_items")
+        def load_items():
+            self._run_queries(2)
+
+        load_items()
+        self.assertEqual(reports, [])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = Path(temp_dir) / "sql.log"
+            configure_sql_profiling(True, str(report_path))
+
+            load_items()
+
+            self.assertEqual(len(reports), 1)
+            self.assertEqual(reports[0].name, "load_items")
+            self.assertEqual(reports[0].query_count, 2)
+            self.assertIn("load_items: 2 queries", report_path.read_text("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from tools.startup_profile import compare_reports, parse_importtime, summarize_timings
+
+SAMPLE_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        50 |         50 |     selenium.webdriver.common
+import time:       400 |        450 |   selenium.webdriver
+import time:        30 |        600 | main
+import time:       200 |        200 |   bs4
+"""
+
+
+class StartupProfileTests(unittest.TestCase):
+    def test_parse_importtime_reads_nesting_depth(self):
+        timings = parse_importtime(SAMPLE_OUTPUT)
+
+        self.assertEqual(
+            [(timing.module, timing.depth) for timing in timings],
+            [
+                ("_io", 1),
+                ("selenium.webdriver.common", 2),
+                ("selenium.webdriver", 1),
+                ("main", 0),
+                ("bs4", 1),
+            ],
+        )
+        self.assertEqual(timings[2].cumulative_us, 450)
+
+    def test_summarize_timings_groups_self_time_by_package(self):
+        summary = summarize_timings(parse_importtime(SAMPLE_OUTPUT), top=2)
+
+        self.assertEqual(summary["import_total_us"], 600)
+        self.assertEqual(summary["packages_us"]["selenium"], 450)
+        self.assertEqual(
+            [timing["module"] for timing in summary["top_imports"]],
+            ["selenium.webdriver", "bs4"],
+        )
+
+    def test_compare_reports_includes_package_deltas(self):
+        lines = compare_reports(
+            {
+                "version": "0.6.0",
+                "wall_seconds_min": 0.5,
+                "import_total_us": 1000,
+                "packages_us": {"selenium": 0},
+            },
+            {
+                "version": "0.5.0",
+                "wall_seconds_min": 0.8,
+                "import_total_us": 3000,
+                "packages_us": {"selenium": 2000},
+            },
+        )
+
+        self.assertEqual(lines[0], "Baseline 0.5.0 -> current 0.6.0")
+        self.assertIn("selenium: 2.000ms -> 0.000ms (-2.000ms)", lines[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from database import (
+    Module,
+    Program,
+    School,
+    SemesterModule,
+    Structure,
+    StructureSemester,
+)
+from features.sync.structures.repository import (
+    SemesterModuleRow,
+    SemesterRow,
+    StructureRepository,
+)
+
+
+class StructureRepositoryTreeTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        for table in [
+            School.__table__,
+            Program.__table__,
+            Structure.__table__,
+            StructureSemester.__table__,
+            Module.__table__,
+            SemesterModule.__table__,
+        ]:
+            table.create(self.engine)
+
+        with patch(
+            "features.sync.structures.repository.get_engine",
+            return_value=self.engine,
+        ):
+            self.repository = StructureRepository()
+
+        with Session(self.engine) as session:
+            school = School(code="FICT", name="ICT")
+            session.add(school)
+            session.flush()
+            program = Program(
+                code="BIT",
+                name="Information Technology",
+                level="degree",
+                school_id=school.id,
+            )
+            session.add(program)
+            session.flush()
+            structure = Structure(cms_id=500, code="2024-BIT", program_id=program.id)
+            session.add(structure)
+            session.flush()
+            second_semester = StructureSemester(
+                cms_id=602,
+                structure_id=structure.id,
+                semester_number="02",
+                name="Year 1 Sem 2",
+                total_credits=20.0,
+            )
+            first_semester = StructureSemester(
+                cms_id=601,
+                structure_id=structure.id,
+                semester_number="01",
+                name="Year 1 Sem 1",
+                total_credits=18.0,
+            )
+            session.add_all([second_semester, first_semester])
+            session.flush()
+            programming = Module(code="BIT102", name="Programming", status="Active")
+            databases = Module(code="BIT101", name="Databases", status="Active")
+            draft = Module(code="BIT100", name="Draft", status="Active")
+            session.add_all([programming, databases, draft])
+            session.flush()
+            session.add_all(
+                [
+                    SemesterModule(
+                        cms_id=702,
+                        module_id=programming.id,
+                        type="Core",
+                        credits=4.0,
+                        semester_id=first_semester.id,
+                    ),
+                    SemesterModule(
+                        cms_id=701,
+                        module_id=databases.id,
+                        type="Core",
+                        credits=4.0,
+                        semester_id=first_semester.id,
+                        hidden=True,
+                    ),
+                    SemesterModule(
+                        module_id=draft.id,
+                        type="Core",
+                        credits=4.0,
+                        semester_id=first_semester.id,
+                    ),
+                ]
+            )
+            session.commit()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_get_structure_tree_loads_semesters_and_modules_together(self):
+        tree = self.repository.get_structure_tree(500)
+
+        self.assertEqual(tree.structure_id, 500)
+        self.assertEqual(
+            [semester.cms_id for semester in tree.get_semesters()], [601, 602]
+        )
+        self.assertEqual(
+            [module.module_code for module in tree.get_modules(601)],
+            ["BIT101", "BIT102"],
+        )
+        self.assertTrue(tree.get_modules(601)[0].hidden)
+        self.assertTrue(tree.has_semester(602))
+        self.assertEqual(tree.get_modules(602), [])
+
+    def test_get_structure_tree_matches_per_semester_queries(self):
+        tree = self.repository.get_structure_tree(500)
+
+        self.assertEqual(
+            tree.get_semesters(), self.repository.get_structure_semesters(500)
+        )
+        for semester in tree.get_semesters():
+            self.assertEqual(
+                tree.get_modules(semester.cms_id),
+                self.repository.get_semester_modules(semester.cms_id),
+            )
+
+    def test_structure_tree_applies_saved_rows_in_place(self):
+        tree = self.repository.get_structure_tree(500)
+
+        tree.apply_semesters(
+            [
+                SemesterRow(
+                    cms_id=603,
+                    semester_number="03",
+                    name="Year 2 Sem 1",
+                    total_credits=20.0,
+                ),
+                SemesterRow(
+                    cms_id=601,
+                    semester_number="01",
+                    name="Year 1 Sem 1",
+                    total_credits=20.0,
+                ),
+            ]
+        )
+        tree.apply_semester_modules(
+            601,
+            [
+                SemesterModuleRow(
+                    cms_id=700,
+                    module_code="BIT099",
+                    module_name="Foundations",
+                    type="Core",
+                    credits=2.0,
+                    hidden=False,
+                )
+            ],
+        )
+
+        self.assertEqual(
+            [semester.cms_id for semester in tree.get_semesters()],
+            [601, 602, 603],
+        )
+        self.assertEqual(tree.get_semesters()[0].total_credits, 20.0)
+        self.assertEqual(tree.get_modules(603), [])
+        self.assertEqual(
+            [module.module_code for module in tree.get_modules(601)],
+            ["BIT099", "BIT101", "BIT102"],
+        )
+
+    def test_structure_tree_moves_a_module_to_its_new_semester(self):
+        tree = self.repository.get_structure_tree(500)
+        moved = self.repository.save_semester_module(
+            701, "BIT101", "", "Elective", 3.0, 602
+        )
+
+        tree.apply_semester_modules(
+            602, [self.repository.get_semester_module_row(moved)]
+        )
+
+        self.assertEqual(
+            [module.module_code for module in tree.get_modules(601)], ["BIT102"]
+        )
+        self.assertEqual(
+            tree.get_modules(602),
+            [
+                SemesterModuleRow(
+                    cms_id=701,
+                    module_code="BIT101",
+                    module_name="Databases",
+                    type="Elective",
+                    credits=3.0,
+                    hidden=False,
+                )
+            ],
+        )
+        self.assertEqual(
+            tree.get_modules(602), self.repository.get_semester_modules(602)
+        )
+
+    def test_structure_tree_drops_a_module_moved_outside_the_tree(self):
+        tree = self.repository.get_structure_tree(500)
+
+        tree.apply_semester_modules(
+            699,
+            [
+                SemesterModuleRow(
+                    cms_id=702,
+                    module_code="BIT102",
+                    module_name="Programming",
+                    type="Core",
+                    credits=4.0,
+                    hidden=False,
+                )
+            ],
+        )
+
+        self.assertEqual(
+            [module.module_code for module in tree.get_modules(601)], ["BIT101"]
+        )
+        self.assertFalse(tree.has_semester(699))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -270,6 +270,50 @@ class SchoolSyncServiceTests(unittest.TestCase):
             ("Completed import for 1 school(s)", 1, 1),
         )
 
+    def test_create_semester_module_reports_saved_rows(self):
+        repository = _repository()
+        service = SchoolSyncService(repository)
+        service._browser = Mock()
+        service._browser.fetch.return_value = SimpleNamespace(
+            text='<form id="ff_semmoduleadd"></form>'
+        )
+        saved: list = []
+
+        with (
+            patch(
+                "features.sync.structures.service.post_cms_form",
+                return_value=(True, "Saved"),
+            ),
+            patch(
+                "features.sync.structures.service.scrape_semester_modules",
+                return_value=[
+                    {
+                        "cms_id": 701,
+                        "module_code": " BIT101 ",
+                        "module_name": "Databases",
+                        "type": "Core",
+                        "credits": "4",
+                        "hidden": False,
+                    }
+                ],
+            ),
+        ):
+            success, _ = service.create_semester_module(
+                601,
+                {"module_id": 9, "module_type": "Core", "credits": "4"},
+                lambda *_: None,
+                on_saved=saved.extend,
+            )
+
+        self.assertTrue(success)
+        self.assertEqual(saved, [repository.get_semester_module_row.return_value])
+        repository.get_semester_module_row.assert_called_once_with(
+            repository.save_semester_module.return_value
+        )
+        repository.save_semester_module.assert_called_once_with(
+            701, " BIT101 ", "Databases", "Core", 4.0, 601, False
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
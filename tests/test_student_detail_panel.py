@@ -0,0 +1,86 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from features.sync.students.repository import StudentGraph, StudentSemesterDetail
+from features.sync.students.view.student_detail_panel import StudentDetailPanel
+
+
+def _semester(student_semester_db_id: int) -> StudentSemesterDetail:
+    return StudentSemesterDetail(
+        student_semester_db_id=student_semester_db_id,
+        student_semester_cms_id=None,
+        term_code="2025-08",
+        structure_semester_db_id=1,
+        structure_semester_cms_id=None,
+        semester_number="01",
+        status="Active",
+        caf_date=None,
+    )
+
+
+def _graph(std_no: str) -> StudentGraph:
+    return StudentGraph(
+        std_no=std_no,
+        programs=[],
+        semesters_by_program={
+            1: [_semester(11)],
+            2: [_semester(21)],
+        },
+        modules_by_semester={11: [], 21: []},
+    )
+
+
+class StudentDetailPanelGraphTests(unittest.TestCase):
+    def setUp(self):
+        self.repository = Mock()
+        self.panel = StudentDetailPanel.__new__(StudentDetailPanel)
+        self.panel.repository = self.repository
+        self.panel.current_student_no = None
+        self.panel.student_graphs = {}
+        self.panel.semesters_list = Mock()
+        self.panel.modules_list = Mock()
+        self.panel.semesters_loader = Mock()
+        self.panel.modules_loader = Mock()
+
+    def test_graphs_stay_cached_per_student(self):
+        self.panel.current_student_no = "901000002"
+        self.panel._populate_student_graph(True, _graph("901000001"))
+
+        with patch.object(self.panel, "_populate_programs") as populate:
+            self.panel.load_student_programs("901000001")
+
+        populate.assert_called_once_with(True, [])
+        self.assertIn("901000001", self.panel.student_graphs)
+        self.repository.get_student_graph.assert_not_called()
+
+    def test_refresh_applies_the_program_selected_when_it_finishes(self):
+        self.panel.current_student_no = "901000001"
+        graph = _graph("901000001")
+
+        with (
+            patch.object(
+                self.panel,
+                "get_selected_program",
+                return_value=SimpleNamespace(student_program_db_id=2),
+            ),
+            patch.object(self.panel, "_show_semesters") as show_semesters,
+        ):
+            self.panel._apply_refreshed_graph(graph, 1, 11)
+
+        show_semesters.assert_called_once_with(graph.get_semesters(2), None)
+        self.assertIs(self.panel.student_graph, graph)
+
+    def test_refresh_for_another_student_is_cached_but_not_shown(self):
+        self.panel.current_student_no = "901000002"
+        graph = _graph("901000001")
+
+        with patch.object(self.panel, "_show_semesters") as show_semesters:
+            self.panel._apply_refreshed_graph(graph, 1, 11)
+
+        show_semesters.assert_not_called()
+        self.assertIs(self.panel.student_graphs["901000001"], graph)
+
+
+if __name__ == "__main__":
+    unittest.main()
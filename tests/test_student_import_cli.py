@@ -282,6 +282,30 @@ class StudentImportCliTests(unittest.TestCase):
         self.assertTrue(cli.exit_requested)
         worker.stop.assert_called_once()
 
+    def test_check_session_health_warns_once_per_message(self):
+        console = FakeConsole()
+        monitor = Mock()
+        monitor.get_health.return_value.describe.return_value = (
+            "CMS session expected to expire in ~10m"
+        )
+        cli = StudentImportCli(
+            console=console,
+            sync_service=Mock(),
+            project_manager=FakeProjectManager(),
+            session_monitor=monitor,
+        )
+
+        cli._check_session_health()
+        cli.last_session_check = None
+        cli._check_session_health()
+        cli._check_session_health()
+
+        self.assertEqual(
+            console.messages,
+            ["Warning: CMS session expected to expire in ~10m"],
+        )
+        self.assertEqual(monitor.get_health.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -529,5 +529,271 @@ class StudentRepositoryStudentModuleTests(unittest.TestCase):
         self.assertEqual(semester_module_types, ["Major", "Minor"])
 
 
+class StudentRepositoryBatchLookupTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        for table in [
+            Student.__table__,
+            School.__table__,
+            Program.__table__,
+            Structure.__table__,
+            StudentProgram.__table__,
+        ]:
+            table.create(self.engine)
+
+        self.repository = StudentRepository()
+        self.repository._engine = self.engine
+
+        with Session(self.engine) as session:
+            school = School(code="FICT", name="ICT")
+            session.add(school)
+            session.flush()
+            program = Program(
+                code="BIT",
+                name="Information Technology",
+                level="degree",
+                school_id=school.id,
+            )
+            session.add(program)
+            session.flush()
+            structure = Structure(code="2024-BIT", program_id=program.id)
+            session.add(structure)
+            session.flush()
+            session.add_all(
+                [
+                    Student(std_no=901000001, name="Alpha", phone1="111"),
+                    Student(std_no=901000002, name="Beta"),
+                    Student(std_no=901000003, name="Gamma"),
+                    StudentProgram(
+                        std_no=901000001,
+                        structure_id=structure.id,
+                        status="Active",
+                    ),
+                ]
+            )
+            session.commit()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_fetch_students_by_numbers_preserves_selection_order(self):
+        rows = self.repository.fetch_students_by_numbers(
+            ["901000002", "901000001", "999999999", "bad", "901000002"]
+        )
+
+        self.assertEqual([row.std_no for row in rows], ["901000002", "901000001"])
+        self.assertEqual(rows[1].faculty_code, "FICT")
+        self.assertEqual(rows[1].program_name, "Information Technology")
+        self.assertEqual(rows[1].phone1, "111")
+        self.assertIsNone(rows[0].program_name)
+
+    def test_fetch_students_by_numbers_returns_empty_for_no_numbers(self):
+        self.assertEqual(self.repository.fetch_students_by_numbers([]), [])
+
+
+class StudentRepositoryGraphTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        for table in [
+            School.__table__,
+            Program.__table__,
+            Structure.__table__,
+            StructureSemester.__table__,
+            Module.__table__,
+            SemesterModule.__table__,
+            Student.__table__,
+            StudentProgram.__table__,
+            StudentSemester.__table__,
+            StudentModule.__table__,
+        ]:
+            table.create(self.engine)
+
+        self.repository = StudentRepository()
+        self.repository._engine = self.engine
+
+        with Session(self.engine) as session:
+            school = School(code="FICT", name="ICT")
+            session.add(school)
+            session.flush()
+            program = Program(
+                code="BIT",
+                name="Information Technology",
+                level="degree",
+                school_id=school.id,
+            )
+            session.add(program)
+            session.flush()
+            structure = Structure(code="2024-BIT", program_id=program.id)
+            session.add(structure)
+            session.flush()
+            first_semester = StructureSemester(
+                structure_id=structure.id,
+                semester_number="01",
+                name="Year 1 Sem 1",
+                total_credits=20.0,
+            )
+            second_semester = StructureSemester(
+                structure_id=structure.id,
+                semester_number="02",
+                name="Year 1 Sem 2",
+                total_credits=20.0,
+            )
+            session.add_all([first_semester, second_semester])
+            session.flush()
+            programming = Module(code="BIT102", name="Programming", status="Active")
+            databases = Module(code="BIT101", name="Databases", status="Active")
+            session.add_all([programming, databases])
+            session.flush()
+            programming_offering = SemesterModule(
+                module_id=programming.id,
+                type="Core",
+                credits=4.0,
+                semester_id=first_semester.id,
+            )
+            databases_offering = SemesterModule(
+                module_id=databases.id,
+                type="Core",
+                credits=4.0,
+                semester_id=first_semester.id,
+            )
+            session.add_all([programming_offering, databases_offering])
+            session.add_all(
+                [
+                    Student(std_no=901000001, name="Alpha"),
+                    Student(std_no=901000002, name="Beta"),
+                ]
+            )
+            session.flush()
+            student_program = StudentProgram(
+                std_no=901000001,
+                structure_id=structure.id,
+                status="Active",
+            )
+            other_program = StudentProgram(
+                std_no=901000002,
+                structure_id=structure.id,
+                status="Active",
+            )
+            session.add_all([student_program, other_program])
+            session.flush()
+            later_semester = StudentSemester(
+                term_code="2024-08",
+                structure_semester_id=second_semester.id,
+                status="Active",
+                student_program_id=student_program.id,
+            )
+            earlier_semester = StudentSemester(
+                term_code="2024-02",
+                structure_semester_id=first_semester.id,
+                status="Active",
+                student_program_id=student_program.id,
+            )
+            other_semester = StudentSemester(
+                term_code="2024-02",
+                structure_semester_id=first_semester.id,
+                status="Active",
+                student_program_id=other_program.id,
+            )
+            session.add_all([later_semester, earlier_semester, other_semester])
+            session.flush()
+            session.add_all(
+                [
+                    StudentModule(
+                        semester_module_id=programming_offering.id,
+                        status="Compulsory",
+                        credits=4.0,
+                        marks="70",
+                        grade="B",
+                        student_semester_id=earlier_semester.id,
+                    ),
+                    StudentModule(
+                        semester_module_id=databases_offering.id,
+                        status="Compulsory",
+                        credits=4.0,
+                        marks="80",
+                        grade="A",
+                        student_semester_id=earlier_semester.id,
+                    ),
+                    StudentModule(
+                        semester_module_id=databases_offering.id,
+                        status="Compulsory",
+                        credits=4.0,
+                        marks="50",
+                        grade="C",
+                        student_semester_id=other_semester.id,
+                    ),
+                ]
+            )
+            session.commit()
+            self.student_program_id = student_program.id
+            self.earlier_semester_id = earlier_semester.id
+            self.later_semester_id = later_semester.id
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_get_student_graph_groups_semesters_and_modules(self):
+        graph = self.repository.get_student_graph("901000001")
+
+        self.assertEqual(graph.std_no, "901000001")
+        self.assertEqual(
+            [program.student_program_db_id for program in graph.programs],
+            [self.student_program_id],
+        )
+        semesters = graph.get_semesters(self.student_program_id)
+        self.assertEqual(
+            [semester.student_semester_db_id for semester in semesters],
+            [self.earlier_semester_id, self.later_semester_id],
+        )
+        modules = graph.get_modules(self.earlier_semester_id)
+        self.assertEqual(
+            [module.module_code for module in modules], ["BIT101", "BIT102"]
+        )
+        self.assertEqual(modules[0].grade, "A")
+        self.assertTrue(graph.has_semester(self.later_semester_id))
+        self.assertEqual(graph.get_modules(self.later_semester_id), [])
+
+    def test_get_student_graph_matches_per_level_queries(self):
+        graph = self.repository.get_student_graph("901000001")
+
+        self.assertEqual(
+            [
+                program.student_program_db_id
+                for program in self.repository.get_student_programs("901000001")
+            ],
+            [program.student_program_db_id for program in graph.programs],
+        )
+        self.assertEqual(
+            [
+                semester.student_semester_db_id
+                for semester in self.repository.get_student_semesters(
+                    self.student_program_id
+                )
+            ],
+            [
+                semester.student_semester_db_id
+                for semester in graph.get_semesters(self.student_program_id)
+            ],
+        )
+        self.assertEqual(
+            sorted(
+                module.module_code
+                for module in self.repository.get_semester_modules(
+                    self.earlier_semester_id
+                )
+            ),
+            [
+                module.module_code
+                for module in graph.get_modules(self.earlier_semester_id)
+            ],
+        )
+
+    def test_get_student_graph_returns_empty_graph_for_unknown_student(self):
+        graph = self.repository.get_student_graph("bad")
+
+        self.assertEqual(graph.programs, [])
+        self.assertFalse(graph.has_program(self.student_program_id))
+
+
 if __name__ == "__main__":
     unittest.main()
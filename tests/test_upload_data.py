@@ -1,20 +1,28 @@
 import unittest
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
 from database.models import Base, NextOfKin, Student, StudentEducation
 from tools.upload_data import (
+    MERGE_CHECKPOINTS,
     STUDENT_FILLABLE_FIELDS,
     AnalysisResult,
     Conflict,
+    MergeCheckpoint,
     MergeStats,
     analyze_differences,
+    analyze_staged_differences,
+    load_merge_checkpoint,
     merge_next_of_kins,
     merge_student_education,
     merge_students,
+    run_chunked_merge,
     run_merge,
+    run_staged_merge,
+    save_merge_checkpoint,
 )
 
 
@@ -1454,3 +1462,287 @@ class TestMergeStudentsWithResolutions(unittest.TestCase):
             s = tgt.query(Student).filter_by(std_no=100001).one()
             self.assertEqual(s.country, "Lesotho")
         self.assertEqual(stats.students_updated, 1)
+
+
+def _seed_staged_scenario(source_engine, target_engine) -> None:
+    with Session(source_engine) as src:
+        _add_student(src, 100001, "New A", national_id="N1", phone1="  ")
+        _add_student(
+            src,
+            100002,
+            "Shared B",
+            country="Lesotho",
+            race="African",
+            national_id="N2",
+        )
+        _add_student(src, 100003, "New C", national_id="N2", country="Lesotho")
+        _add_student(src, 100004, "New D", national_id="TAKEN")
+        _add_student(src, 100005, "Same E", country="SA")
+        _add_student(
+            src, 100006, "Dated F", date_of_birth=datetime(2000, 1, 1), gender="Male"
+        )
+        src.add(StudentEducation(std_no=100001, school_name="S1", cms_id=1))
+        src.add(StudentEducation(std_no=100002, school_name="S2", cms_id=2))
+        src.add(StudentEducation(std_no=100003, school_name="S3", cms_id=3))
+        src.add(StudentEducation(std_no=100003, school_name="S3 again", cms_id=3))
+        src.add(StudentEducation(std_no=100005, school_name="No CMS id"))
+        src.add(StudentEducation(std_no=999999, school_name="Ghost", cms_id=9))
+        src.add(NextOfKin(std_no=100001, name="Mom", relationship="Mother"))
+        src.add(NextOfKin(std_no=100002, name="Dad", relationship="Father"))
+        src.add(NextOfKin(std_no=100003, name="Aunt", relationship="Relative"))
+        src.add(NextOfKin(std_no=100003, name="aunt ", relationship="Relative"))
+        src.add(NextOfKin(std_no=999999, name="Ghost", relationship="Other"))
+        src.commit()
+
+    with Session(target_engine) as tgt:
+        _add_student(tgt, 100002, "Shared B", country="SA")
+        _add_student(tgt, 100005, "Same E", country="SA")
+        _add_student(tgt, 100006, "Dated F", date_of_birth=datetime(1999, 1, 1))
+        _add_student(tgt, 200001, "Target Only", national_id="TAKEN")
+        tgt.add(StudentEducation(std_no=100002, school_name="S2", cms_id=2))
+        tgt.add(NextOfKin(std_no=100002, name=" dad ", relationship="Father"))
+        tgt.commit()
+
+
+def _snapshot(engine) -> dict[str, list[tuple]]:
+    with Session(engine) as session:
+        return {
+            "students": [
+                (s.std_no, s.name, s.status)
+                + tuple(getattr(s, fname) for fname in STUDENT_FILLABLE_FIELDS)
+                for s in session.query(Student).order_by(Student.std_no)
+            ],
+            "education": sorted(
+                (e.std_no, e.school_name, e.cms_id)
+                for e in session.query(StudentEducation)
+            ),
+            "kins": sorted(
+                (k.std_no, k.name, k.relationship) for k in session.query(NextOfKin)
+            ),
+        }
+
+
+class TestStagedMerge(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source_engine = _create_test_engine()
+        self.python_target = _create_test_engine()
+        self.staged_target = _create_test_engine()
+        _seed_staged_scenario(self.source_engine, self.python_target)
+        _seed_staged_scenario(_create_test_engine(), self.staged_target)
+
+    def tearDown(self) -> None:
+        self.source_engine.dispose()
+        self.python_target.dispose()
+        self.staged_target.dispose()
+
+    def test_analysis_matches_in_memory_analysis(self) -> None:
+        expected = analyze_differences(self.source_engine, self.python_target)
+        staged = analyze_staged_differences(self.source_engine, self.staged_target)
+
+        self.assertEqual(staged, expected)
+        self.assertEqual(staged.students_to_add, 3)
+        self.assertEqual(
+            [(c.std_no, c.field_name) for c in staged.conflicts],
+            [(100002, "country"), (100006, "date_of_birth")],
+        )
+        self.assertEqual(staged.conflicts[1].target_value, "1999-01-01 00:00:00")
+
+    def test_analysis_leaves_the_target_untouched(self) -> None:
+        before = _snapshot(self.staged_target)
+
+        analyze_staged_differences(self.source_engine, self.staged_target)
+
+        self.assertEqual(_snapshot(self.staged_target), before)
+
+    def test_merge_matches_in_memory_merge(self) -> None:
+        resolutions = {(100002, "country"): "Lesotho"}
+
+        expected = run_merge(
+            self.source_engine, self.python_target, resolutions=resolutions
+        )
+        staged = run_staged_merge(
+            self.source_engine, self.staged_target, resolutions=resolutions
+        )
+
+        self.assertEqual(staged, expected)
+        self.assertEqual(_snapshot(self.staged_target), _snapshot(self.python_target))
+        self.assertEqual(staged.students_added, 3)
+        self.assertEqual(staged.students_fields_filled["national_id"], 1)
+        with Session(self.staged_target) as tgt:
+            national_ids = dict(tgt.query(Student.std_no, Student.national_id).all())
+        self.assertEqual(national_ids[100002], "N2")
+        self.assertIsNone(national_ids[100003])
+        self.assertIsNone(national_ids[100004])
+
+    def test_second_merge_only_repeats_education_without_cms_id(self) -> None:
+        run_staged_merge(self.source_engine, self.staged_target)
+        after_first = _snapshot(self.staged_target)
+
+        stats = run_staged_merge(self.source_engine, self.staged_target)
+
+        after_second = _snapshot(self.staged_target)
+        self.assertEqual(after_second["students"], after_first["students"])
+        self.assertEqual(after_second["kins"], after_first["kins"])
+        self.assertEqual(stats.students_added, 0)
+        self.assertEqual(stats.students_updated, 0)
+        self.assertEqual(stats.education_added, 1)
+        self.assertEqual(stats.kins_added, 0)
+
+    def test_date_resolution_and_progress(self) -> None:
+        calls: list[tuple[str, int, int]] = []
+
+        run_staged_merge(
+            self.source_engine,
+            self.staged_target,
+            lambda msg, current, total: calls.append((msg, current, total)),
+            {(100006, "date_of_birth"): "2000-01-01 00:00:00"},
+        )
+
+        with Session(self.staged_target) as tgt:
+            student = tgt.query(Student).filter_by(std_no=100006).one()
+        self.assertEqual(student.date_of_birth, datetime(2000, 1, 1))
+        self.assertEqual(student.gender, "Male")
+        self.assertEqual([current for _, current, _ in calls], [1, 2, 3, 4, 5, 6])
+        self.assertTrue(all(total == 6 for _, _, total in calls))
+
+    def test_postgres_targets_use_the_staged_engine(self) -> None:
+        target = MagicMock()
+        target.dialect.name = "postgresql"
+
+        with patch("tools.upload_data.run_staged_merge") as staged_merge:
+            run_merge(self.source_engine, target)
+        with patch("tools.upload_data.analyze_staged_differences") as staged_analysis:
+            analyze_differences(self.source_engine, target)
+
+        staged_merge.assert_called_once_with(self.source_engine, target, None, None)
+        staged_analysis.assert_called_once_with(self.source_engine, target)
+
+
+class TestChunkedMerge(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source_engine = _create_test_engine()
+        self.target_engine = _create_test_engine()
+        self.reference_engine = _create_test_engine()
+        _seed_staged_scenario(self.source_engine, self.target_engine)
+        _seed_staged_scenario(_create_test_engine(), self.reference_engine)
+
+    def tearDown(self) -> None:
+        self.source_engine.dispose()
+        self.target_engine.dispose()
+        self.reference_engine.dispose()
+
+    def test_small_batches_match_a_single_batch(self) -> None:
+        expected = run_chunked_merge(
+            self.source_engine, self.reference_engine, batch_size=500
+        )
+        stats = run_chunked_merge(self.source_engine, self.target_engine, batch_size=2)
+
+        self.assertEqual(stats, expected)
+        self.assertEqual(
+            _snapshot(self.target_engine), _snapshot(self.reference_engine)
+        )
+
+    def test_interrupted_merge_resumes_from_checkpoint(self) -> None:
+        real_merge_kins = merge_next_of_kins
+        calls = 0
+
+        def fail_second_batch(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError("connection lost")
+            return real_merge_kins(*args, **kwargs)
+
+        with (
+            patch("tools.upload_data.merge_next_of_kins", fail_second_batch),
+            self.assertRaises(RuntimeError),
+        ):
+            run_merge(
+                self.source_engine,
+                self.target_engine,
+                batch_size=2,
+                resumable=True,
+            )
+
+        checkpoint = load_merge_checkpoint(self.source_engine, self.target_engine)
+        if checkpoint is None:
+            self.fail("the interrupted merge should leave a checkpoint")
+        self.assertEqual(checkpoint.last_std_no, 100002)
+        self.assertEqual(checkpoint.batches, 1)
+        with Session(self.target_engine) as tgt:
+            self.assertIsNotNone(tgt.get(Student, 100001))
+            self.assertIsNone(tgt.get(Student, 100003))
+
+        calls_after_resume: list[int] = []
+        stats = run_merge(
+            self.source_engine,
+            self.target_engine,
+            lambda msg, current, total: calls_after_resume.append(current),
+            batch_size=2,
+            resumable=True,
+        )
+
+        expected = run_chunked_merge(self.source_engine, self.reference_engine)
+        self.assertEqual(stats, expected)
+        self.assertEqual(
+            _snapshot(self.target_engine), _snapshot(self.reference_engine)
+        )
+        self.assertEqual(calls_after_resume[0], 3)
+        self.assertIsNone(load_merge_checkpoint(self.source_engine, self.target_engine))
+
+    def test_checkpoint_for_other_databases_is_ignored(self) -> None:
+        MERGE_CHECKPOINTS.create(self.target_engine)
+        with Session(self.target_engine) as tgt:
+            save_merge_checkpoint(
+                tgt,
+                MergeCheckpoint(
+                    source="sqlite:///other.db",
+                    target="sqlite:///other.db",
+                    last_std_no=100004,
+                    stats={"students_added": 2},
+                ),
+            )
+            tgt.commit()
+
+        self.assertIsNone(load_merge_checkpoint(self.source_engine, self.target_engine))
+
+    def test_failed_batch_rolls_back_with_its_checkpoint(self) -> None:
+        before = _snapshot(self.target_engine)
+
+        def fail_saving(target: Session, checkpoint: MergeCheckpoint) -> None:
+            save_merge_checkpoint(target, checkpoint)
+            raise RuntimeError("connection lost")
+
+        with (
+            patch("tools.upload_data.save_merge_checkpoint", fail_saving),
+            self.assertRaises(RuntimeError),
+        ):
+            run_merge(
+                self.source_engine,
+                self.target_engine,
+                batch_size=2,
+                resumable=True,
+            )
+
+        self.assertIsNone(load_merge_checkpoint(self.source_engine, self.target_engine))
+        self.assertEqual(_snapshot(self.target_engine), before)
+
+    def test_merge_without_resume_is_all_or_nothing(self) -> None:
+        before = _snapshot(self.target_engine)
+        real_merge_kins = merge_next_of_kins
+        calls = 0
+
+        def fail_second_batch(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError("connection lost")
+            return real_merge_kins(*args, **kwargs)
+
+        with (
+            patch("tools.upload_data.merge_next_of_kins", fail_second_batch),
+            self.assertRaises(RuntimeError),
+        ):
+            run_merge(self.source_engine, self.target_engine, batch_size=2)
+
+        self.assertEqual(_snapshot(self.target_engine), before)
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 import database.connection as db_connection
 from base.browser import BASE_URL, Browser
+from base.http_telemetry import get_http_telemetry
 from database import (
     Module,
     Program,
@@ -664,6 +665,7 @@ def main() -> None:
         "module_placeholders": placeholder_comparison,
         "db_metadata": db_metadata,
         "comparison": comparison,
+        "http": get_http_telemetry().snapshot(),
     }
 
     print(json.dumps(summary, indent=2, sort_keys=True), flush=True)
@@ -0,0 +1,923 @@
+import argparse
+import html
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import cast
+from urllib.parse import parse_qs, urlparse
+
+BASE_PATH = "/campus/registry"
+
+SCHOOL_CODES = ("FICT", "FBMG", "FCMB", "FDI", "FABE", "FCTH")
+PROGRAM_CATEGORIES = ("Degree", "Diploma", "Certificate")
+TERM_MONTHS = ("02", "08")
+FIRST_TERM_YEAR = 2019
+
+PROGRAM_ID_BASE = 3_000_000
+SEMESTER_ID_BASE = 4_000_000
+MODULE_ID_BASE = 50_000_000
+EDUCATION_ID_BASE = 6_000_000
+MAX_STUDENT_SEMESTERS = 20
+MAX_SEMESTER_MODULES = 20
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    students: int = 200
+    first_student: int = 901000001
+    schools: int = 3
+    programs_per_school: int = 4
+    semesters_per_structure: int = 8
+    modules_per_semester: int = 5
+    student_semesters: int = 4
+    page_size: int = 10
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 7
+    recordings: Path | None = None
+
+
+@dataclass(frozen=True)
+class School:
+    cms_id: int
+    code: str
+    name: str
+
+
+@dataclass(frozen=True)
+class Program:
+    cms_id: int
+    code: str
+    name: str
+    category: str
+    school: School
+
+
+@dataclass(frozen=True)
+class Structure:
+    cms_id: int
+    code: str
+    desc: str
+    program: Program
+
+
+@dataclass(frozen=True)
+class StructureSemester:
+    cms_id: int
+    number: str
+    name: str
+    credits: float
+    structure: Structure
+
+
+@dataclass(frozen=True)
+class SemesterModule:
+    cms_id: int
+    module_cms_id: int
+    code: str
+    name: str
+    type: str
+    credits: float
+    semester: StructureSemester
+
+
+@dataclass(frozen=True)
+class Term:
+    code: str
+    name: str
+    start_date: str
+    end_date: str
+    year: int
+    is_current: bool
+
+
+@dataclass
+class RequestStats:
+    gets: int = 0
+    posts: int = 0
+    errors: int = 0
+    pages: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, method: str, page: str, failed: bool) -> None:
+        with self._lock:
+            if method == "POST":
+                self.posts += 1
+            else:
+                self.gets += 1
+            if failed:
+                self.errors += 1
+            self.pages[page] = self.pages.get(page, 0) + 1
+
+
+def detail_page(title: str, fields: list[tuple[str, object]]) -> str:
+    rows = "".join(
+        '<tr><td class="ewTableHeader"><span>'
+        f"{html.escape(label)}</span></td>"
+        f'<td class="ewTableAltRow"><span>{html.escape(str(value))}</span></td></tr>'
+        for label, value in fields
+    )
+    return (
+        f"<html><head><title>{html.escape(title)}</title></head><body>"
+        f'<table class="ewTable">{rows}</table></body></html>'
+    )
+
+
+def list_page(
+    title: str,
+    rows: list[str],
+    start: int,
+    page_size: int,
+    *,
+    paged: bool = True,
+) -> str:
+    total = len(rows)
+    if paged and total:
+        start = min(max(start, 1), total)
+        page_rows = rows[start - 1 : start - 1 + page_size]
+        end = start + len(page_rows) - 1
+        pager = (
+            '<form id="ewpagerform" name="ewpagerform">'
+            f"<span>Records {start} to {end} of {total}</span></form>"
+        )
+    else:
+        page_rows = rows
+        pager = ""
+
+    body = "".join(
+        f'<tr class="{"ewTableRow" if index % 2 == 0 else "ewTableAltRow"}">{row}</tr>'
+        for index, row in enumerate(page_rows)
+    )
+    return (
+        f"<html><head><title>{html.escape(title)}</title></head><body>{pager}"
+        '<table id="ewlistmain" class="ewTable">'
+        '<tr class="ewTableHeader"><td>Header</td></tr>'
+        f"{body}</table></body></html>"
+    )
+
+
+def form_page(page: str) -> str:
+    form_id = f"f{page.removesuffix('.php')}"
+    return (
+        f'<html><body><form id="{form_id}" name="{form_id}" method="post">'
+        '<input type="hidden" name="a_edit" value="U">'
+        '<input type="hidden" name="k_key" value="1">'
+        "</form></body></html>"
+    )
+
+
+def cell(value: object) -> str:
+    return f"<td><span>{html.escape(str(value))}</span></td>"
+
+
+def link_cell(href: str, label: str = "View") -> str:
+    return f'<td><a href="{html.escape(href)}">{html.escape(label)}</a></td>'
+
+
+class SyntheticCms:
+    def __init__(self, config: StandInConfig):
+        self.config = config
+        self.stats = RequestStats()
+        self._random = random.Random(config.seed)
+        self._random_lock = threading.Lock()
+
+        self.schools: list[School] = []
+        self.programs: list[Program] = []
+        self.structures: list[Structure] = []
+        self.semesters: list[StructureSemester] = []
+        self.semester_modules: list[SemesterModule] = []
+        self.terms: list[Term] = []
+        self._build_catalog()
+        self._build_terms()
+
+    def _build_catalog(self) -> None:
+        config = self.config
+        semesters_per_structure = min(
+            config.semesters_per_structure, MAX_STUDENT_SEMESTERS
+        )
+        modules_per_semester = min(config.modules_per_semester, MAX_SEMESTER_MODULES)
+
+        for school_index in range(config.schools):
+            prefix = SCHOOL_CODES[school_index % len(SCHOOL_CODES)]
+            suffix = school_index // len(SCHOOL_CODES)
+            code = f"{prefix}{suffix}" if suffix else prefix
+            self.schools.append(
+                School(10 + school_index, code, f"Faculty of {code.title()}")
+            )
+
+        for school in self.schools:
+            for number in range(1, config.programs_per_school + 1):
+                index = len(self.programs)
+                program = Program(
+                    cms_id=100 + index,
+                    code=f"{school.code}P{number}",
+                    name=f"{school.code} Programme {number}",
+                    category=PROGRAM_CATEGORIES[index % len(PROGRAM_CATEGORIES)],
+                    school=school,
+                )
+                self.programs.append(program)
+                structure = Structure(
+                    cms_id=1000 + index,
+                    code=f"{program.code}2020",
+                    desc=f"{program.name} 2020",
+                    program=program,
+                )
+                self.structures.append(structure)
+
+                for semester_index in range(semesters_per_structure):
+                    number_text = f"{semester_index + 1:02d}"
+                    semester = StructureSemester(
+                        cms_id=10_000 + index * MAX_STUDENT_SEMESTERS + semester_index,
+                        number=number_text,
+                        name=(
+                            f"Year {semester_index // 2 + 1} "
+                            f"Sem {semester_index % 2 + 1}"
+                        ),
+                        credits=float(modules_per_semester * 10),
+                        structure=structure,
+                    )
+                    self.semesters.append(semester)
+
+                    for module_index in range(modules_per_semester):
+                        code = (
+                            f"{school.code[:3]}"
+                            f"{index:02d}{semester_index + 1:02d}{module_index + 1}"
+                        )
+                        self.semester_modules.append(
+                            SemesterModule(
+                                cms_id=100_000
+                                + semester.cms_id * MAX_SEMESTER_MODULES
+                                + module_index,
+                                module_cms_id=500_000 + len(self.semester_modules),
+                                code=code,
+                                name=f"Module {code}",
+                                type="Core" if module_index < 3 else "Elective",
+                                credits=10.0,
+                                semester=semester,
+                            )
+                        )
+
+        self._semesters_by_id = {
+            semester.cms_id: semester for semester in self.semesters
+        }
+        self._modules_by_semester: dict[int, list[SemesterModule]] = {}
+        for semester_module in self.semester_modules:
+            self._modules_by_semester.setdefault(
+                semester_module.semester.cms_id, []
+            ).append(semester_module)
+
+        base_timestamp = datetime(2024, 1, 1, 8, 0, 0)
+        self.module_timestamps = {
+            semester_module.module_cms_id: (
+                base_timestamp + timedelta(minutes=position)
+            ).strftime("%Y-%m-%d %H:%M:%S")
+            for position, semester_module in enumerate(self.semester_modules)
+        }
+
+    def _build_terms(self) -> None:
+        years = max(
+            (self.config.student_semesters + 1) // len(TERM_MONTHS) + 3,
+            4,
+        )
+        for year in range(FIRST_TERM_YEAR, FIRST_TERM_YEAR + years):
+            for month in TERM_MONTHS:
+                end_month = "06" if month == "02" else "12"
+                self.terms.append(
+                    Term(
+                        code=f"{year}-{month}",
+                        name=f"{year} {'February' if month == '02' else 'August'}",
+                        start_date=f"{year}-{month}-01",
+                        end_date=f"{year}-{end_month}-30",
+                        year=year,
+                        is_current=False,
+                    )
+                )
+        last = self.terms[-1]
+        self.terms[-1] = Term(
+            last.code, last.name, last.start_date, last.end_date, last.year, True
+        )
+
+    @property
+    def student_numbers(self) -> list[str]:
+        first = self.config.first_student
+        return [str(first + index) for index in range(self.config.students)]
+
+    def _student_index(self, std_no: str | None) -> int | None:
+        try:
+            index = int(std_no or "") - self.config.first_student
+        except ValueError:
+            return None
+        if 0 <= index < self.config.students:
+            return index
+        return None
+
+    def _student_semester_count(self) -> int:
+        return min(
+            self.config.student_semesters,
+            self.config.semesters_per_structure,
+            MAX_STUDENT_SEMESTERS,
+        )
+
+    def _student_structure(self, index: int) -> Structure:
+        return self.structures[index % len(self.structures)]
+
+    def _student_start_term(self, index: int) -> int:
+        span = max(len(self.terms) - self._student_semester_count(), 1)
+        return index % span
+
+    def _decode_semester(self, cms_id: int) -> tuple[int, int] | None:
+        offset = cms_id - SEMESTER_ID_BASE
+        if offset < 0:
+            return None
+        index, semester_index = divmod(offset, MAX_STUDENT_SEMESTERS)
+        if index >= self.config.students:
+            return None
+        if semester_index >= self._student_semester_count():
+            return None
+        return index, semester_index
+
+    def _student_semester_modules(
+        self, index: int, semester_index: int
+    ) -> list[SemesterModule]:
+        structure = self._student_structure(index)
+        semester = next(
+            semester
+            for semester in self.semesters
+            if semester.structure == structure
+            and semester.number == f"{semester_index + 1:02d}"
+        )
+        return self._modules_by_semester.get(semester.cms_id, [])
+
+    def should_fail(self) -> bool:
+        if self.config.error_rate <= 0:
+            return False
+        with self._random_lock:
+            return self._random.random() < self.config.error_rate
+
+    def delay(self) -> float:
+        if self.config.jitter <= 0:
+            return self.config.latency
+        with self._random_lock:
+            return self.config.latency + self._random.uniform(0, self.config.jitter)
+
+    def recorded_page(self, page: str, query: dict[str, str]) -> str | None:
+        if self.config.recordings is None:
+            return None
+
+        key = "&".join(f"{name}={value}" for name, value in sorted(query.items()))
+        safe_key = re.sub(r"[^A-Za-z0-9=&_.-]", "_", key)
+        recordings = Path(self.config.recordings)
+        for candidate in (
+            recordings / page / f"{safe_key}.html",
+            recordings / f"{page}.html",
+        ):
+            if candidate.exists():
+                return candidate.read_text(encoding="utf-8", errors="replace")
+        return None
+
+    def render(self, page: str, query: dict[str, str]) -> str | None:
+        recorded = self.recorded_page(page, query)
+        if recorded is not None:
+            return recorded
+
+        handler = getattr(self, f"_page_{page.removesuffix('.php')}", None)
+        if handler is not None:
+            return handler(query)
+        if page.endswith(("add.php", "edit.php")):
+            return form_page(page)
+        return None
+
+    def _start(self, query: dict[str, str]) -> int:
+        try:
+            return int(query.get("start", "1"))
+        except ValueError:
+            return 1
+
+    def _page_f_schoollist(self, query: dict[str, str]) -> str:
+        rows = [
+            cell(school.code)
+            + cell(school.name)
+            + link_cell(f"f_schoolview.php?SchoolID={school.cms_id}")
+            for school in self.schools
+        ]
+        return list_page("Schools", rows, self._start(query), self.config.page_size)
+
+    def _page_f_programlist(self, query: dict[str, str]) -> str:
+        school_id = int(query.get("SchoolID", "0") or 0)
+        rows = [
+            cell(program.code)
+            + cell(program.name)
+            + cell(program.category)
+            + link_cell(f"f_programview.php?ProgramID={program.cms_id}")
+            for program in self.programs
+            if program.school.cms_id == school_id
+        ]
+        return list_page("Programs", rows, self._start(query), self.config.page_size)
+
+    def _page_f_programview(self, query: dict[str, str]) -> str | None:
+        program_id = int(query.get("ProgramID", "0") or 0)
+        for program in self.programs:
+            if program.cms_id == program_id:
+                return detail_page(
+                    "Program",
+                    [
+                        ("Code", program.code),
+                        ("Name", program.name),
+                        ("Category", program.category),
+                    ],
+                )
+        return None
+
+    def _page_f_structurelist(self, query: dict[str, str]) -> str:
+        program_id = int(query.get("ProgramID", "0") or 0)
+        rows = [
+            cell(structure.code)
+            + cell(structure.desc)
+            + link_cell(f"f_structureview.php?StructureID={structure.cms_id}")
+            for structure in self.structures
+            if structure.program.cms_id == program_id
+        ]
+        return list_page("Structures", rows, self._start(query), self.config.page_size)
+
+    def _page_f_semesterlist(self, query: dict[str, str]) -> str:
+        structure_id = int(query.get("StructureID", "0") or 0)
+        rows = [
+            cell(f"{semester.number} {semester.name}")
+            + cell(f"{semester.credits:g}")
+            + link_cell(f"f_semesterview.php?SemesterID={semester.cms_id}")
+            for semester in self.semesters
+            if semester.structure.cms_id == structure_id
+        ]
+        return list_page("Semesters", rows, self._start(query), self.config.page_size)
+
+    def _page_f_semmodulelist(self, query: dict[str, str]) -> str:
+        semester_id = int(query.get("SemesterID", "0") or 0)
+        rows = [
+            cell(f"{module.code} {module.name}")
+            + cell(module.type)
+            + cell("")
+            + cell(f"{module.credits:g}")
+            + link_cell(f"f_semmoduleview.php?SemModuleID={module.cms_id}")
+            for module in self._modules_by_semester.get(semester_id, [])
+        ]
+        return list_page(
+            "Semester Modules", rows, self._start(query), self.config.page_size
+        )
+
+    def _page_f_semmoduleview(self, query: dict[str, str]) -> str | None:
+        sem_module_id = int(query.get("SemModuleID", "0") or 0)
+        for module in self.semester_modules:
+            if module.cms_id == sem_module_id:
+                return detail_page(
+                    "Semester Module",
+                    [
+                        ("Module", f"{module.code} {module.name}"),
+                        ("Type", module.type),
+                        ("Credits", f"{module.credits:g}"),
+                    ],
+                )
+        return None
+
+    def _page_f_modulelist(self, query: dict[str, str]) -> str:
+        modules = self.semester_modules
+        search = query.get("x_ModuleCode", "").strip().upper()
+        if search:
+            modules = [module for module in modules if search in module.code]
+        if query.get("order") == "DateStamp":
+            modules = sorted(
+                modules,
+                key=lambda module: self.module_timestamps[module.module_cms_id],
+                reverse=query.get("ordertype", "").upper() == "DESC",
+            )
+
+        rows = [
+            cell(module.code)
+            + cell(module.name)
+            + cell("Active")
+            + link_cell(f"f_moduleview.php?ModuleID={module.module_cms_id}")
+            + cell(self.module_timestamps[module.module_cms_id])
+            for module in modules
+        ]
+        return list_page(
+            "Modules",
+            rows,
+            self._start(query),
+            self.config.page_size,
+            paged=not search,
+        )
+
+    def _page_f_termlist(self, query: dict[str, str]) -> str:
+        rows = [
+            cell(term.code)
+            + cell(term.name)
+            + cell(term.start_date)
+            + cell(term.end_date)
+            + (
+                '<td><input type="checkbox" checked></td>'
+                if term.is_current
+                else '<td><input type="checkbox"></td>'
+            )
+            + cell("")
+            + cell(term.year)
+            for term in self.terms
+        ]
+        return list_page("Terms", rows, self._start(query), 10)
+
+    def _page_r_studentviewlist(self, query: dict[str, str]) -> str:
+        rows = [
+            cell(std_no)
+            + cell(f"Student {std_no}")
+            + link_cell(f"r_studentview.php?StudentID={std_no}")
+            for std_no in self.student_numbers
+        ]
+        return list_page("Students", rows, self._start(query), self.config.page_size)
+
+    def _page_r_studentview(self, query: dict[str, str]) -> str | None:
+        std_no = query.get("StudentID")
+        index = self._student_index(std_no)
+        if index is None:
+            return None
+        return detail_page(
+            "Student",
+            [
+                ("StudentID", std_no),
+                ("Name", f"Student {std_no}"),
+                ("IC/Passport", f"ID{std_no}"),
+                ("Sem", self._student_semester_count()),
+                ("House Phone No", f"2222{index % 10000:04d}"),
+                ("Current Mobile", f"5{index % 10_000_000:07d}"),
+                ("Country", "Lesotho"),
+            ],
+        )
+
+    def _page_r_stdpersonalview(self, query: dict[str, str]) -> str | None:
+        std_no = query.get("StudentID")
+        index = self._student_index(std_no)
+        if index is None:
+            return None
+        return detail_page(
+            "Personal",
+            [
+                ("Birthdate", f"{1995 + index % 8}-{index % 12 + 1:02d}-15"),
+                ("Sex", "Female" if index % 2 else "Male"),
+                ("Marital", "Single"),
+                ("Religion", "Christian"),
+                ("Race", "African"),
+                ("Nationality", "Mosotho"),
+                ("Birth Place", "Maseru"),
+                ("Emergency Contact Relation", "Mother"),
+                ("Emergency Contact Name", f"Parent {std_no}"),
+                ("Emergency Contact Phone", f"6{index % 10_000_000:07d}"),
+            ],
+        )
+
+    def _page_r_stdeducationlist(self, query: dict[str, str]) -> str:
+        index = self._student_index(query.get("StudentID"))
+        rows = []
+        if index is not None:
+            rows.append(
+                cell("LGCSE")
+                + link_cell(
+                    f"r_stdeducationview.php?StdEducationID={EDUCATION_ID_BASE + index}"
+                )
+            )
+        return list_page("Education", rows, 1, self.config.page_size, paged=False)
+
+    def _page_r_stdeducationview(self, query: dict[str, str]) -> str | None:
+        index = int(query.get("StdEducationID", "0") or 0) - EDUCATION_ID_BASE
+        if not 0 <= index < self.config.students:
+            return None
+        std_no = self.student_numbers[index]
+        return detail_page(
+            "Education",
+            [
+                ("Student", f"{std_no} Student {std_no}"),
+                ("Type", "Secondary"),
+                ("Standard", "LGCSE"),
+                ("School", "Maseru High School"),
+                ("Exam Date", f"{2012 + index % 8}-11-30"),
+            ],
+        )
+
+    def _page_r_stdrelationlist(self, query: dict[str, str]) -> str:
+        std_no = query.get("StudentID")
+        index = self._student_index(std_no)
+        rows = []
+        if index is not None:
+            rows.append(
+                cell("Guardian")
+                + cell(f"Guardian {std_no}")
+                + cell(f"5{(index + 7) % 10_000_000:07d}")
+                + cell("Teacher")
+                + cell("Maseru")
+                + cell("Lesotho")
+            )
+        return list_page("Relations", rows, 1, self.config.page_size, paged=False)
+
+    def _page_r_stdprogramlist(self, query: dict[str, str]) -> str:
+        index = self._student_index(query.get("StudentID"))
+        rows = []
+        if index is not None:
+            rows.append(
+                cell(self._student_structure(index).program.code)
+                + link_cell(
+                    f"r_stdprogramview.php?StdProgramID={PROGRAM_ID_BASE + index}"
+                )
+            )
+        return list_page("Programs", rows, 1, self.config.page_size, paged=False)
+
+    def _page_r_stdprogramview(self, query: dict[str, str]) -> str | None:
+        index = int(query.get("StdProgramID", "0") or 0) - PROGRAM_ID_BASE
+        if not 0 <= index < self.config.students:
+            return None
+        std_no = self.student_numbers[index]
+        structure = self._student_structure(index)
+        start_term = self.terms[self._student_start_term(index)]
+        return detail_page(
+            "Student Program",
+            [
+                ("StudentID", f"{std_no} Student {std_no}"),
+                ("Program", f"{structure.program.code} {structure.program.name}"),
+                ("RegDate", start_term.start_date),
+                ("Intake Date", start_term.start_date),
+                ("StartTerm", start_term.code),
+                ("Version", structure.code),
+                ("Stream", "Full Time"),
+                ("Status", "Active"),
+            ],
+        )
+
+    def _page_r_stdsemesterlist(self, query: dict[str, str]) -> str:
+        index = int(query.get("StdProgramID", "0") or 0) - PROGRAM_ID_BASE
+        rows = []
+        if 0 <= index < self.config.students:
+            start_term = self._student_start_term(index)
+            for semester_index in range(self._student_semester_count()):
+                semester_id = (
+                    SEMESTER_ID_BASE + index * MAX_STUDENT_SEMESTERS + semester_index
+                )
+                rows.append(
+                    cell(self.terms[start_term + semester_index].code)
+                    + link_cell(f"r_stdsemesterview.php?StdSemesterID={semester_id}")
+                )
+        return list_page("Semesters", rows, 1, self.config.page_size, paged=False)
+
+    def _page_r_stdsemesterview(self, query: dict[str, str]) -> str | None:
+        decoded = self._decode_semester(int(query.get("StdSemesterID", "0") or 0))
+        if decoded is None:
+            return None
+        index, semester_index = decoded
+        term = self.terms[self._student_start_term(index) + semester_index]
+        return detail_page(
+            "Student Semester",
+            [
+                ("Term", term.code),
+                (
+                    "Semester",
+                    f"{semester_index + 1:02d} Year {semester_index // 2 + 1} "
+                    f"Sem {semester_index % 2 + 1}",
+                ),
+                ("SemStatus", "Active"),
+                ("CAF Date", term.start_date),
+            ],
+        )
+
+    def _page_r_stdmodulelist(self, query: dict[str, str]) -> str:
+        semester_id = int(query.get("StdSemesterID", "0") or 0)
+        decoded = self._decode_semester(semester_id)
+        rows = []
+        if decoded is not None:
+            modules = self._student_semester_modules(*decoded)
+            offset = (semester_id - SEMESTER_ID_BASE) * MAX_SEMESTER_MODULES
+            for module_index, module in enumerate(modules):
+                std_module_id = MODULE_ID_BASE + offset + module_index
+                rows.append(
+                    cell(f"{module.code} {module.name}")
+                    + link_cell(f"r_stdmoduleview.php?StdModuleID={std_module_id}")
+                )
+        return list_page("Modules", rows, 1, self.config.page_size, paged=False)
+
+    def _page_r_stdmoduleview(self, query: dict[str, str]) -> str | None:
+        offset = int(query.get("StdModuleID", "0") or 0) - MODULE_ID_BASE
+        if offset < 0:
+            return None
+        semester_offset, module_index = divmod(offset, MAX_SEMESTER_MODULES)
+        decoded = self._decode_semester(SEMESTER_ID_BASE + semester_offset)
+        if decoded is None:
+            return None
+        modules = self._student_semester_modules(*decoded)
+        if module_index >= len(modules):
+            return None
+        module = modules[module_index]
+        marks = 45 + (decoded[0] * 7 + module_index * 11) % 50
+        return detail_page(
+            "Student Module",
+            [
+                ("Module", f"{module.code} {module.name}"),
+                ("ModuleStatus", "Compulsory"),
+                ("Type", module.type),
+                ("Credits", f"{module.credits:g}"),
+                ("Marks", marks),
+                ("Grade", _grade_for(marks)),
+            ],
+        )
+
+
+def _grade_for(marks: int) -> str:
+    for threshold, grade in ((80, "A"), (70, "B"), (60, "C"), (50, "D")):
+        if marks >= threshold:
+            return grade
+    return "F"
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        return
+
+    def _respond(self, status: int, body: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self, method: str) -> None:
+        site = cast(_StandInHttpServer, self.server).site
+        parsed = urlparse(self.path)
+        page = parsed.path.rstrip("/").rsplit("/", 1)[-1]
+        query = {name: values[-1] for name, values in parse_qs(parsed.query).items()}
+
+        delay = site.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        if site.should_fail():
+            site.stats.record(method, page, True)
+            self._respond(500, "<html><body>Internal Server Error</body></html>")
+            return
+
+        if method == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            site.stats.record(method, page, False)
+            self._respond(200, "<html><body>Add/Update Successful</body></html>")
+            return
+
+        body = site.render(page, query)
+        site.stats.record(method, page, body is None)
+        if body is None:
+            self._respond(404, "<html><body>Not Found</body></html>")
+            return
+        self._respond(200, body)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+
+class _StandInHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], site: SyntheticCms):
+        super().__init__(address, _StandInRequestHandler)
+        self.site = site
+
+
+class CmsStandInServer:
+    def __init__(self, site: SyntheticCms, host: str = "127.0.0.1", port: int = 0):
+        self.site = site
+        self._server = _StandInHttpServer((host, port), site)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "CmsStandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = StandInConfig()
+    parser = argparse.ArgumentParser(
+        description="Serve synthetic or recorded CMS pages for offline imports and benchmarks."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--students", type=int, default=defaults.students)
+    parser.add_argument("--first-student", type=int, default=defaults.first_student)
+    parser.add_argument("--schools", type=int, default=defaults.schools)
+    parser.add_argument(
+        "--programs-per-school", type=int, default=defaults.programs_per_school
+    )
+    parser.add_argument(
+        "--semesters-per-structure",
+        type=int,
+        default=defaults.semesters_per_structure,
+    )
+    parser.add_argument(
+        "--modules-per-semester", type=int, default=defaults.modules_per_semester
+    )
+    parser.add_argument(
+        "--student-semesters", type=int, default=defaults.student_semesters
+    )
+    parser.add_argument("--page-size", type=int, default=defaults.page_size)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=defaults.latency,
+        help="seconds to wait before every response",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=defaults.jitter,
+        help="extra random delay of up to this many seconds",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=defaults.error_rate,
+        help="fraction of requests answered with HTTP 500",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--recordings",
+        type=Path,
+        help="directory of saved pages served in preference to synthetic ones",
+    )
+    return parser
+
+
+def config_from_args(args: argparse.Namespace) -> StandInConfig:
+    return StandInConfig(
+        students=args.students,
+        first_student=args.first_student,
+        schools=args.schools,
+        programs_per_school=args.programs_per_school,
+        semesters_per_structure=args.semesters_per_structure,
+        modules_per_semester=args.modules_per_semester,
+        student_semesters=args.student_semesters,
+        page_size=args.page_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        recordings=args.recordings,
+    )
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    site = SyntheticCms(config_from_args(args))
+    server = CmsStandInServer(site, args.host, args.port)
+    print(f"CMS stand-in serving {args.students} students at {server.base_url}")
+    print(f"Point the app at it with REGISTRY_CMS_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(
+            f"Served {site.stats.gets} GET and {site.stats.posts} POST requests "
+            f"({site.stats.errors} errors)"
+        )
+
+
+if __name__ == "__main__":
+    main()
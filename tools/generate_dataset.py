@@ -0,0 +1,981 @@
+import argparse
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+
+from sqlalchemy import Table, text
+from sqlalchemy.engine import Engine
+
+from base import get_logger
+from database.bootstrap import quote_identifier
+from database.bulk_copy import copy_rows
+from database.connection import create_database_engine
+from database.models import Base
+from tools.import_benchmark import prepare_database
+
+logger = get_logger(__name__)
+
+MASK_64 = (1 << 64) - 1
+FIRST_STUDENT_NUMBER = 901_000_001
+BASE_TIMESTAMP = datetime(2018, 1, 8, 8, 0, 0)
+
+SCHOOL_CODES = (
+    "FICT",
+    "FBMG",
+    "FCMB",
+    "FDI",
+    "FABE",
+    "FCTH",
+    "FHT",
+    "FMS",
+    "FEG",
+    "FLA",
+    "FSE",
+    "FIS",
+)
+PROGRAM_LEVELS = ("degree", "diploma", "certificate", "short_course")
+SUBJECTS = (
+    "Accounting",
+    "Architecture",
+    "Business",
+    "Communication",
+    "Design",
+    "Economics",
+    "Fashion",
+    "Finance",
+    "Graphics",
+    "Hospitality",
+    "Information Technology",
+    "Journalism",
+    "Law",
+    "Marketing",
+    "Multimedia",
+    "Networking",
+    "Photography",
+    "Programming",
+    "Statistics",
+    "Tourism",
+)
+TOPICS = (
+    "Principles",
+    "Fundamentals",
+    "Studio",
+    "Practice",
+    "Theory",
+    "Management",
+    "Research Methods",
+    "Project",
+    "Ethics",
+    "Analysis",
+)
+FIRST_NAMES = (
+    "Thabo",
+    "Lerato",
+    "Palesa",
+    "Teboho",
+    "Mpho",
+    "Lineo",
+    "Tumelo",
+    "Nthabiseng",
+    "Retselisitsoe",
+    "Mamello",
+    "Kabelo",
+    "Refiloe",
+    "Sipho",
+    "Nomvula",
+    "Kagiso",
+    "Boitumelo",
+    "Neo",
+    "Tshepo",
+    "Karabo",
+    "Relebohile",
+    "Lebohang",
+    "Rethabile",
+    "Tsepang",
+    "Puleng",
+)
+LAST_NAMES = (
+    "Mokoena",
+    "Mohapi",
+    "Molapo",
+    "Letsie",
+    "Ramakatane",
+    "Sekhesa",
+    "Motsamai",
+    "Nkhahle",
+    "Lebona",
+    "Mofokeng",
+    "Dlamini",
+    "Khumalo",
+    "Masilo",
+    "Tau",
+    "Phiri",
+    "Mothibeli",
+    "Ntsane",
+    "Makhetha",
+    "Lekhanya",
+    "Mabote",
+    "Mahase",
+    "Thamae",
+    "Seeiso",
+    "Moshoeshoe",
+)
+COUNTRIES = ("Lesotho", "Lesotho", "Lesotho", "South Africa", "Eswatini", "Botswana")
+MARITAL_STATUSES = ("Single", "Single", "Single", "Married", "Other")
+RELIGIONS = ("Christian", "Catholic", "Methodist", "Other")
+RELATIONSHIPS = ("Mother", "Father", "Guardian", "Sister", "Brother", "Spouse")
+STUDENT_STATUSES = (
+    ("Active", 80),
+    ("Graduated", 12),
+    ("Withdrawn", 4),
+    ("Suspended", 2),
+    ("Terminated", 2),
+)
+REQUEST_STATUSES = (
+    ("pending", 45),
+    ("approved", 20),
+    ("registered", 20),
+    ("rejected", 10),
+    ("partial", 5),
+)
+MODULE_TYPES = ("Core", "Core", "Core", "Major", "Minor", "Elective")
+CLEARANCE_DEPARTMENTS = ("finance", "library")
+GRADE_BOUNDARIES = (
+    (90, "A+"),
+    (85, "A"),
+    (80, "A-"),
+    (75, "B+"),
+    (70, "B"),
+    (65, "B-"),
+    (60, "C+"),
+    (55, "C"),
+    (50, "C-"),
+    (45, "PP"),
+)
+
+
+@dataclass(frozen=True)
+class DatasetScale:
+    students: int = 200_000
+    schools: int = 12
+    programs_per_school: int = 20
+    structures_per_program: int = 8
+    semesters_per_structure: int = 8
+    modules_per_semester: int = 6
+    catalog_modules: int = 6_000
+    semesters_per_student: int = 6
+    terms: int = 20
+    sponsors: int = 40
+    registration_requests: int = 20_000
+    seed: int = 42
+
+    def scaled(self, factor: float) -> "DatasetScale":
+        return replace(
+            self,
+            students=max(int(self.students * factor), 1),
+            registration_requests=max(int(self.registration_requests * factor), 0),
+        )
+
+    @property
+    def structures(self) -> int:
+        return self.schools * self.programs_per_school * self.structures_per_program
+
+    def validate(self) -> None:
+        if min(self.students, self.schools, self.terms, self.sponsors) < 1:
+            raise ValueError("Students, schools, terms and sponsors must be positive")
+        if min(self.programs_per_school, self.structures_per_program) < 1:
+            raise ValueError("Every school needs at least one program and structure")
+        if min(self.semesters_per_structure, self.modules_per_semester) < 1:
+            raise ValueError("Structures need at least one semester and module")
+        if self.catalog_modules < self.modules_per_semester:
+            raise ValueError("The module catalog is smaller than one semester")
+        largest_id = (
+            self.students * self.semesters_per_structure * self.modules_per_semester
+        )
+        if largest_id >= 2**31:
+            raise ValueError("Too many student modules for 32-bit ids; lower the scale")
+
+
+@dataclass(frozen=True)
+class StudentPlan:
+    index: int
+    structure_index: int
+    semester_count: int
+    start_term: int
+    sponsor_id: int
+
+    @property
+    def std_no(self) -> int:
+        return FIRST_STUDENT_NUMBER + self.index
+
+    @property
+    def last_term(self) -> int:
+        return self.start_term + self.semester_count - 1
+
+
+@dataclass(frozen=True)
+class TableLoad:
+    table: str
+    rows: int
+    seconds: float
+
+
+def _mix(*values: int) -> int:
+    state = 0x9E3779B97F4A7C15
+    for value in values:
+        state = ((state ^ (value & MASK_64)) * 0xBF58476D1CE4E5B9) & MASK_64
+        state ^= state >> 31
+        state = (state * 0x94D049BB133111EB) & MASK_64
+        state ^= state >> 29
+    return state
+
+
+def _weighted(choices: tuple[tuple[str, int], ...], roll: int) -> str:
+    point = roll % sum(weight for _, weight in choices)
+    for value, weight in choices:
+        if point < weight:
+            return value
+        point -= weight
+    return choices[-1][0]
+
+
+def grade_for_marks(marks: int) -> str:
+    for boundary, grade in GRADE_BOUNDARIES:
+        if marks >= boundary:
+            return grade
+    return "F"
+
+
+TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "schools": ("id", "code", "name", "is_active", "created_at", "cms_id"),
+    "programs": (
+        "id",
+        "code",
+        "name",
+        "level",
+        "school_id",
+        "created_at",
+        "cms_id",
+    ),
+    "structures": ("id", "code", "desc", "program_id", "created_at", "cms_id"),
+    "structure_semesters": (
+        "id",
+        "structure_id",
+        "semester_number",
+        "name",
+        "total_credits",
+        "created_at",
+        "cms_id",
+    ),
+    "modules": ("id", "code", "name", "status", "timestamp", "cms_id"),
+    "semester_modules": (
+        "id",
+        "module_id",
+        "type",
+        "credits",
+        "semester_id",
+        "hidden",
+        "created_at",
+        "cms_id",
+    ),
+    "terms": (
+        "id",
+        "code",
+        "name",
+        "year",
+        "start_date",
+        "end_date",
+        "is_active",
+        "semester",
+        "created_at",
+    ),
+    "sponsors": ("id", "name", "code", "created_at"),
+    "students": (
+        "std_no",
+        "name",
+        "national_id",
+        "status",
+        "date_of_birth",
+        "phone1",
+        "gender",
+        "marital_status",
+        "country",
+        "nationality",
+        "religion",
+        "created_at",
+    ),
+    "student_education": (
+        "id",
+        "std_no",
+        "school_name",
+        "type",
+        "level",
+        "end_date",
+        "created_at",
+        "cms_id",
+    ),
+    "next_of_kins": (
+        "id",
+        "std_no",
+        "name",
+        "relationship",
+        "phone",
+        "country",
+        "created_at",
+    ),
+    "sponsored_students": ("id", "sponsor_id", "std_no", "created_at"),
+    "student_programs": (
+        "id",
+        "std_no",
+        "intake_date",
+        "reg_date",
+        "start_term",
+        "structure_id",
+        "stream",
+        "status",
+        "created_at",
+        "cms_id",
+    ),
+    "student_semesters": (
+        "id",
+        "term_code",
+        "structure_semester_id",
+        "status",
+        "student_program_id",
+        "sponsor_id",
+        "caf_date",
+        "created_at",
+        "cms_id",
+    ),
+    "student_modules": (
+        "id",
+        "semester_module_id",
+        "status",
+        "credits",
+        "marks",
+        "grade",
+        "student_semester_id",
+        "created_at",
+        "cms_id",
+    ),
+    "registration_requests": (
+        "id",
+        "sponsored_student_id",
+        "std_no",
+        "term_id",
+        "status",
+        "mail_sent",
+        "count",
+        "semester_status",
+        "semester_number",
+        "created_at",
+    ),
+    "requested_modules": (
+        "id",
+        "module_status",
+        "registration_request_id",
+        "semester_module_id",
+        "status",
+        "created_at",
+    ),
+    "clearance": ("id", "department", "status", "created_at"),
+    "registration_clearance": (
+        "id",
+        "registration_request_id",
+        "clearance_id",
+        "created_at",
+    ),
+}
+
+
+class SyntheticDataset:
+    def __init__(self, scale: DatasetScale):
+        scale.validate()
+        self.scale = scale
+        self.seed = scale.seed
+        self.current_term = scale.terms - 1
+        self.tables: list[tuple[str, Callable[[], Iterator[tuple]]]] = [
+            ("schools", self.school_rows),
+            ("programs", self.program_rows),
+            ("structures", self.structure_rows),
+            ("structure_semesters", self.structure_semester_rows),
+            ("modules", self.module_rows),
+            ("semester_modules", self.semester_module_rows),
+            ("terms", self.term_rows),
+            ("sponsors", self.sponsor_rows),
+            ("students", self.student_rows),
+            ("student_education", self.education_rows),
+            ("next_of_kins", self.next_of_kin_rows),
+            ("sponsored_students", self.sponsored_student_rows),
+            ("student_programs", self.student_program_rows),
+            ("student_semesters", self.student_semester_rows),
+            ("student_modules", self.student_module_rows),
+            ("registration_requests", self.registration_request_rows),
+            ("requested_modules", self.requested_module_rows),
+            ("clearance", self.clearance_rows),
+            ("registration_clearance", self.registration_clearance_rows),
+        ]
+
+    def estimated_rows(self) -> dict[str, int]:
+        scale = self.scale
+        semesters = scale.structures * scale.semesters_per_structure
+        student_semesters = int(scale.students * (1 + self._semester_spread()) / 2)
+        return {
+            "structures": scale.structures,
+            "semester_modules": semesters * scale.modules_per_semester,
+            "students": scale.students,
+            "student_semesters": student_semesters,
+            "student_modules": student_semesters * scale.modules_per_semester,
+            "registration_requests": scale.registration_requests,
+        }
+
+    def _semester_spread(self) -> int:
+        scale = self.scale
+        most = min(scale.semesters_per_structure, scale.terms)
+        return max(min(scale.semesters_per_student * 2 - 1, most), 1)
+
+    def _school_code(self, school: int) -> str:
+        code = SCHOOL_CODES[school % len(SCHOOL_CODES)]
+        suffix = school // len(SCHOOL_CODES)
+        return f"{code}{suffix}" if suffix else code
+
+    def _program_code(self, program: int) -> str:
+        school = program // self.scale.programs_per_school
+        number = program % self.scale.programs_per_school + 1
+        level = PROGRAM_LEVELS[program % len(PROGRAM_LEVELS)]
+        return f"{self._school_code(school)}{level[0].upper()}{number:02d}"
+
+    def _term(self, index: int) -> tuple[str, int, int]:
+        year = BASE_TIMESTAMP.year + index // 2
+        semester = index % 2 + 1
+        return f"{year}-{'02' if semester == 1 else '08'}", year, semester
+
+    def _timestamp(self, *values: int) -> datetime:
+        return BASE_TIMESTAMP + timedelta(seconds=_mix(self.seed, *values) % 2**27)
+
+    def plan(self, index: int) -> StudentPlan:
+        scale = self.scale
+        semester_count = 1 + _mix(self.seed, index, 2) % self._semester_spread()
+        latest_start = scale.terms - semester_count
+        if _mix(self.seed, index, 3) % 3 == 0:
+            start_term = latest_start
+        else:
+            start_term = _mix(self.seed, index, 4) % (latest_start + 1)
+        return StudentPlan(
+            index=index,
+            structure_index=_mix(self.seed, index, 1) % scale.structures,
+            semester_count=semester_count,
+            start_term=start_term,
+            sponsor_id=1 + _mix(self.seed, index, 5) % scale.sponsors,
+        )
+
+    def plans(self) -> Iterator[StudentPlan]:
+        for index in range(self.scale.students):
+            yield self.plan(index)
+
+    def _structure_semester_index(self, structure_index: int, semester: int) -> int:
+        return structure_index * self.scale.semesters_per_structure + semester
+
+    def school_rows(self) -> Iterator[tuple]:
+        for school in range(self.scale.schools):
+            code = self._school_code(school)
+            yield (
+                school + 1,
+                code,
+                f"Faculty of {SUBJECTS[school % len(SUBJECTS)]} {code}",
+                True,
+                BASE_TIMESTAMP,
+                100 + school,
+            )
+
+    def program_rows(self) -> Iterator[tuple]:
+        for program in range(self.scale.schools * self.scale.programs_per_school):
+            level = PROGRAM_LEVELS[program % len(PROGRAM_LEVELS)]
+            subject = SUBJECTS[_mix(self.seed, program, 10) % len(SUBJECTS)]
+            yield (
+                program + 1,
+                self._program_code(program),
+                f"{level.replace('_', ' ').title()} in {subject}",
+                level,
+                program // self.scale.programs_per_school + 1,
+                BASE_TIMESTAMP,
+                1_000 + program,
+            )
+
+    def structure_rows(self) -> Iterator[tuple]:
+        for structure in range(self.scale.structures):
+            program = structure // self.scale.structures_per_program
+            version = structure % self.scale.structures_per_program
+            code = f"{self._program_code(program)}-{2010 + version}"
+            yield (
+                structure + 1,
+                code,
+                f"{code} intake structure",
+                program + 1,
+                BASE_TIMESTAMP,
+                10_000 + structure,
+            )
+
+    def structure_semester_rows(self) -> Iterator[tuple]:
+        credits = float(self.scale.modules_per_semester * 12)
+        for structure in range(self.scale.structures):
+            for semester in range(self.scale.semesters_per_structure):
+                index = self._structure_semester_index(structure, semester)
+                yield (
+                    index + 1,
+                    structure + 1,
+                    f"{semester + 1:02d}",
+                    f"Year {semester // 2 + 1} Sem {semester % 2 + 1}",
+                    credits,
+                    BASE_TIMESTAMP,
+                    100_000 + index,
+                )
+
+    def module_rows(self) -> Iterator[tuple]:
+        for module in range(self.scale.catalog_modules):
+            subject = SUBJECTS[module % len(SUBJECTS)]
+            prefix = "".join(word[0] for word in subject.split())[:2].upper()
+            prefix = (prefix + subject[1:3].upper())[:3]
+            topic = TOPICS[_mix(self.seed, module, 20) % len(TOPICS)]
+            level = module // len(SUBJECTS) % 4 + 1
+            yield (
+                module + 1,
+                f"{prefix}{level}{module:04d}",
+                f"{subject} {topic} {level}",
+                "Defunct" if _mix(self.seed, module, 21) % 20 == 0 else "Active",
+                self._timestamp(module, 22).strftime("%Y-%m-%d %H:%M:%S"),
+                500_000 + module,
+            )
+
+    def semester_module_rows(self) -> Iterator[tuple]:
+        per_semester = self.scale.modules_per_semester
+        semesters = self.scale.structures * self.scale.semesters_per_structure
+        for semester in range(semesters):
+            for position in range(per_semester):
+                index = semester * per_semester + position
+                yield (
+                    index + 1,
+                    1
+                    + _mix(self.seed, semester, position, 30)
+                    % self.scale.catalog_modules,
+                    MODULE_TYPES[position % len(MODULE_TYPES)],
+                    12.0,
+                    semester + 1,
+                    False,
+                    BASE_TIMESTAMP,
+                    1_000_000 + index,
+                )
+
+    def term_rows(self) -> Iterator[tuple]:
+        for index in range(self.scale.terms):
+            code, year, semester = self._term(index)
+            start_month, end_month = ("02", "06") if semester == 1 else ("08", "12")
+            yield (
+                index + 1,
+                code,
+                f"{year} {'February' if semester == 1 else 'August'}",
+                year,
+                f"{year}-{start_month}-01",
+                f"{year}-{end_month}-30",
+                index == self.current_term,
+                semester,
+                BASE_TIMESTAMP,
+            )
+
+    def sponsor_rows(self) -> Iterator[tuple]:
+        for index in range(self.scale.sponsors):
+            yield (
+                index + 1,
+                f"Sponsor {index + 1:03d} Bursary Fund",
+                f"SP{index + 1:03d}",
+                BASE_TIMESTAMP,
+            )
+
+    def student_rows(self) -> Iterator[tuple]:
+        for index in range(self.scale.students):
+            roll = _mix(self.seed, index, 40)
+            first = FIRST_NAMES[roll % len(FIRST_NAMES)]
+            middle = FIRST_NAMES[(roll >> 8) % len(FIRST_NAMES)]
+            last = LAST_NAMES[(roll >> 16) % len(LAST_NAMES)]
+            country = COUNTRIES[(roll >> 24) % len(COUNTRIES)]
+            yield (
+                FIRST_STUDENT_NUMBER + index,
+                f"{first} {middle} {last}",
+                f"{(roll >> 32) % 10**9:09d}",
+                _weighted(STUDENT_STATUSES, roll >> 40),
+                datetime(1990 + (roll >> 44) % 14, 1 + (roll >> 48) % 12, 1)
+                + timedelta(days=(roll >> 52) % 28),
+                f"5{(roll >> 20) % 10**7:07d}",
+                "Female" if roll & 1 else "Male",
+                MARITAL_STATUSES[(roll >> 4) % len(MARITAL_STATUSES)],
+                country,
+                "Mosotho" if country == "Lesotho" else country,
+                RELIGIONS[(roll >> 12) % len(RELIGIONS)],
+                self._timestamp(index, 41),
+            )
+
+    def education_rows(self) -> Iterator[tuple]:
+        for index in range(self.scale.students):
+            roll = _mix(self.seed, index, 50)
+            yield (
+                index + 1,
+                FIRST_STUDENT_NUMBER + index,
+                f"{LAST_NAMES[roll % len(LAST_NAMES)]} High School",
+                "Secondary",
+                "LGCSE" if roll & 2 else "IGCSE",
+                datetime(2010 + (roll >> 8) % 12, 11, 30),
+                BASE_TIMESTAMP,
+                2_000_000 + index,
+            )
+
+    def next_of_kin_rows(self) -> Iterator[tuple]:
+        for index in range(self.scale.students):
+            roll = _mix(self.seed, index, 60)
+            yield (
+                index + 1,
+                FIRST_STUDENT_NUMBER + index,
+                f"{FIRST_NAMES[roll % len(FIRST_NAMES)]} {LAST_NAMES[(roll >> 8) % len(LAST_NAMES)]}",
+                RELATIONSHIPS[(roll >> 16) % len(RELATIONSHIPS)],
+                f"6{(roll >> 24) % 10**7:07d}",
+                "Lesotho",
+                BASE_TIMESTAMP,
+            )
+
+    def sponsored_student_rows(self) -> Iterator[tuple]:
+        for plan in self.plans():
+            yield (plan.index + 1, plan.sponsor_id, plan.std_no, BASE_TIMESTAMP)
+
+    def student_program_rows(self) -> Iterator[tuple]:
+        for plan in self.plans():
+            start_code, _, _ = self._term(plan.start_term)
+            if plan.last_term == self.current_term:
+                status = "Active"
+            elif _mix(self.seed, plan.index, 70) % 4:
+                status = "Completed"
+            else:
+                status = "Inactive"
+            yield (
+                plan.index + 1,
+                plan.std_no,
+                f"{start_code}-01",
+                f"{start_code}-05",
+                start_code,
+                plan.structure_index + 1,
+                "Full Time",
+                status,
+                BASE_TIMESTAMP,
+                3_000_000 + plan.index,
+            )
+
+    def student_semester_rows(self) -> Iterator[tuple]:
+        per_structure = self.scale.semesters_per_structure
+        for plan in self.plans():
+            for semester in range(plan.semester_count):
+                semester_id = plan.index * per_structure + semester + 1
+                term_code, _, _ = self._term(plan.start_term + semester)
+                repeat = _mix(self.seed, semester_id, 80) % 30 == 0
+                yield (
+                    semester_id,
+                    term_code,
+                    self._structure_semester_index(plan.structure_index, semester) + 1,
+                    "Repeat" if repeat else "Active",
+                    plan.index + 1,
+                    plan.sponsor_id,
+                    f"{term_code}-10",
+                    BASE_TIMESTAMP,
+                    semester_id,
+                )
+
+    def student_module_rows(self) -> Iterator[tuple]:
+        per_structure = self.scale.semesters_per_structure
+        per_semester = self.scale.modules_per_semester
+        for plan in self.plans():
+            for semester in range(plan.semester_count):
+                semester_id = plan.index * per_structure + semester + 1
+                structure_semester = self._structure_semester_index(
+                    plan.structure_index, semester
+                )
+                for position in range(per_semester):
+                    module_id = (semester_id - 1) * per_semester + position + 1
+                    roll = _mix(self.seed, module_id, 90)
+                    marks = 25 + roll % 76
+                    yield (
+                        module_id,
+                        structure_semester * per_semester + position + 1,
+                        "Repeat1" if (roll >> 8) & 31 == 0 else "Compulsory",
+                        12.0,
+                        str(marks),
+                        grade_for_marks(marks),
+                        semester_id,
+                        BASE_TIMESTAMP,
+                        module_id,
+                    )
+
+    def _request(self, request: int) -> tuple[StudentPlan, int, str]:
+        plan = self.plan(_mix(self.seed, request, 100) % self.scale.students)
+        term = self.current_term - (1 if _mix(self.seed, request, 101) % 10 < 3 else 0)
+        status = _weighted(REQUEST_STATUSES, _mix(self.seed, request, 102))
+        return plan, max(term, 0), status
+
+    def _request_semester(self, plan: StudentPlan) -> int:
+        return min(plan.semester_count, self.scale.semesters_per_structure - 1)
+
+    def registration_request_rows(self) -> Iterator[tuple]:
+        for request in range(self.scale.registration_requests):
+            plan, term, status = self._request(request)
+            yield (
+                request + 1,
+                plan.index + 1,
+                plan.std_no,
+                term + 1,
+                status,
+                status == "registered",
+                1,
+                "Active",
+                f"{self._request_semester(plan) + 1:02d}",
+                self._timestamp(request, 103),
+            )
+
+    def requested_module_rows(self) -> Iterator[tuple]:
+        per_semester = self.scale.modules_per_semester
+        for request in range(self.scale.registration_requests):
+            plan, _, status = self._request(request)
+            structure_semester = self._structure_semester_index(
+                plan.structure_index, self._request_semester(plan)
+            )
+            module_status = {"registered": "registered", "rejected": "rejected"}.get(
+                status, "pending"
+            )
+            for position in range(per_semester):
+                yield (
+                    request * per_semester + position + 1,
+                    "Compulsory",
+                    request + 1,
+                    structure_semester * per_semester + position + 1,
+                    module_status,
+                    BASE_TIMESTAMP,
+                )
+
+    def _clearance_status(self, request: int, department: int) -> str:
+        _, _, status = self._request(request)
+        if status in {"approved", "registered", "partial"}:
+            return "approved"
+        if status == "rejected" and department == 0:
+            return "rejected"
+        return "pending"
+
+    def clearance_rows(self) -> Iterator[tuple]:
+        departments = len(CLEARANCE_DEPARTMENTS)
+        for request in range(self.scale.registration_requests):
+            for position, department in enumerate(CLEARANCE_DEPARTMENTS):
+                yield (
+                    request * departments + position + 1,
+                    department,
+                    self._clearance_status(request, position),
+                    BASE_TIMESTAMP,
+                )
+
+    def registration_clearance_rows(self) -> Iterator[tuple]:
+        departments = len(CLEARANCE_DEPARTMENTS)
+        for request in range(self.scale.registration_requests):
+            for position in range(departments):
+                clearance_id = request * departments + position + 1
+                yield (clearance_id, request + 1, clearance_id, BASE_TIMESTAMP)
+
+
+def _copy_rows(
+    engine: Engine, table: Table, columns: tuple[str, ...], rows: Iterable[tuple]
+) -> int:
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SET synchronous_commit TO OFF")
+        count = copy_rows(cursor, table.name, columns, rows)
+        connection.commit()
+    finally:
+        connection.close()
+    return count
+
+
+def _insert_rows(
+    engine: Engine,
+    table: Table,
+    columns: tuple[str, ...],
+    rows: Iterable[tuple],
+    batch_size: int,
+) -> int:
+    count = 0
+    batch: list[dict] = []
+    with engine.begin() as conn:
+        for row in rows:
+            batch.append(dict(zip(columns, row)))
+            if len(batch) >= batch_size:
+                conn.execute(table.insert(), batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            conn.execute(table.insert(), batch)
+            count += len(batch)
+    return count
+
+
+def _is_postgres(engine: Engine) -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+def clear_tables(engine: Engine, table_names: list[str]) -> None:
+    with engine.begin() as conn:
+        if _is_postgres(engine):
+            names = ", ".join(quote_identifier(name) for name in table_names)
+            conn.execute(text(f"TRUNCATE {names} CASCADE"))
+            return
+        for name in reversed(table_names):
+            conn.execute(Base.metadata.tables[name].delete())
+
+
+def _reset_sequences(engine: Engine, table_names: list[str]) -> None:
+    with engine.begin() as conn:
+        for name in table_names:
+            if "id" not in Base.metadata.tables[name].columns:
+                continue
+            quoted = quote_identifier(name)
+            conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence(:table, 'id'), "
+                    f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {quoted}), false)"
+                ),
+                {"table": name},
+            )
+        conn.execute(text("ANALYZE"))
+
+
+def load_dataset(
+    engine: Engine,
+    dataset: SyntheticDataset,
+    *,
+    truncate: bool = False,
+    batch_size: int = 5_000,
+    progress: Callable[[TableLoad], None] | None = None,
+) -> list[TableLoad]:
+    table_names = [name for name, _ in dataset.tables]
+
+    with engine.connect() as conn:
+        existing = conn.execute(
+            Base.metadata.tables["students"].select().limit(1)
+        ).first()
+    if existing is not None:
+        if not truncate:
+            raise ValueError(
+                "The target database already has students; pass truncate=True to replace them"
+            )
+        clear_tables(engine, table_names)
+
+    loads: list[TableLoad] = []
+    for name, rows in dataset.tables:
+        table = Base.metadata.tables[name]
+        columns = TABLE_COLUMNS[name]
+        started = time.perf_counter()
+        if _is_postgres(engine):
+            count = _copy_rows(engine, table, columns, rows())
+        else:
+            count = _insert_rows(engine, table, columns, rows(), batch_size)
+        load = TableLoad(name, count, time.perf_counter() - started)
+        logger.info(f"Loaded {load.rows} rows into {name} in {load.seconds:.1f}s")
+        loads.append(load)
+        if progress:
+            progress(load)
+
+    if _is_postgres(engine):
+        _reset_sequences(engine, table_names)
+    return loads
+
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = DatasetScale()
+    parser = argparse.ArgumentParser(
+        description="Fill a throwaway database with a seeded, production-sized synthetic dataset."
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("REGISTRY_BENCHMARK_DATABASE_URL"),
+        help="database to fill (default: REGISTRY_BENCHMARK_DATABASE_URL)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply the student and registration request counts",
+    )
+    parser.add_argument("--students", type=int, default=defaults.students)
+    parser.add_argument(
+        "--registration-requests",
+        type=int,
+        default=defaults.registration_requests,
+    )
+    parser.add_argument(
+        "--structures-per-program",
+        type=int,
+        default=defaults.structures_per_program,
+    )
+    parser.add_argument(
+        "--semesters-per-student",
+        type=int,
+        default=defaults.semesters_per_student,
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="replace the data already in the target database",
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if not args.database_url:
+        raise SystemExit(
+            "Pass --database-url or set REGISTRY_BENCHMARK_DATABASE_URL to a throwaway database."
+        )
+
+    scale = replace(
+        DatasetScale(),
+        students=args.students,
+        registration_requests=args.registration_requests,
+        structures_per_program=args.structures_per_program,
+        semesters_per_student=args.semesters_per_student,
+        seed=args.seed,
+    ).scaled(args.scale)
+    dataset = SyntheticDataset(scale)
+
+    print(f"Generating dataset with seed {scale.seed}:")
+    for name, rows in dataset.estimated_rows().items():
+        print(f"  ~{rows:,} {name}")
+
+    prepare_database(args.database_url)
+    engine = create_database_engine(args.database_url)
+    started = time.perf_counter()
+    try:
+        loads = load_dataset(
+            engine,
+            dataset,
+            truncate=args.truncate,
+            progress=lambda load: print(
+                f"  {load.table}: {load.rows:,} rows in {load.seconds:.1f}s"
+            ),
+        )
+    finally:
+        engine.dispose()
+
+    total_rows = sum(load.rows for load in loads)
+    elapsed = time.perf_counter() - started
+    print(
+        f"Loaded {total_rows:,} rows in {elapsed:.1f}s "
+        f"({total_rows / elapsed if elapsed else 0:,.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,504 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine, make_url
+
+from base.__version__ import __version__
+from base.http_telemetry import get_http_telemetry
+from base.runtime_config import set_cms_base_url_override
+from database.bootstrap import ensure_database_exists, ensure_database_schema
+from database.connection import (
+    create_database_engine,
+    get_database_url,
+    use_database_url,
+)
+from database.models import Base
+from tools.cms_standin import CmsStandInServer, StandInConfig, SyntheticCms
+
+BENCHMARKS = ("structures", "modules", "students")
+DEFAULT_IMPORT_OPTIONS = {
+    "student_info": True,
+    "personal_info": True,
+    "education_history": True,
+    "enrollment_data": True,
+    "addresses": True,
+    "skip_active_term": False,
+    "delete_programs_before_import": False,
+}
+
+ScenarioOutcome = tuple[int, int, dict]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    unit: str
+    items: int
+    seconds: float
+    http_requests: int
+    db_statements: int
+    peak_memory_mb: float | None
+    failures: int = 0
+    details: dict = field(default_factory=dict)
+
+    @property
+    def items_per_minute(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.items * 60 / self.seconds
+
+    @property
+    def requests_per_item(self) -> float:
+        return self.http_requests / self.items if self.items else 0.0
+
+    @property
+    def statements_per_item(self) -> float:
+        return self.db_statements / self.items if self.items else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["seconds"] = round(self.seconds, 3)
+        data["items_per_minute"] = round(self.items_per_minute, 2)
+        data["requests_per_item"] = round(self.requests_per_item, 2)
+        data["statements_per_item"] = round(self.statements_per_item, 2)
+        return data
+
+
+class StatementCounter:
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            self.count += 1
+
+    def __enter__(self) -> "StatementCounter":
+        event.listen(Engine, "after_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(Engine, "after_cursor_execute", self._on_execute)
+
+
+def measure(
+    name: str,
+    unit: str,
+    scenario: Callable[[], ScenarioOutcome],
+    *,
+    trace_memory: bool = True,
+) -> BenchmarkResult:
+    telemetry = get_http_telemetry()
+    telemetry.reset()
+    if trace_memory:
+        tracemalloc.start()
+
+    try:
+        with StatementCounter() as statements:
+            started = time.perf_counter()
+            items, failures, details = scenario()
+            elapsed = time.perf_counter() - started
+        peak_memory_mb = None
+        if trace_memory:
+            peak_memory_mb = round(tracemalloc.get_traced_memory()[1] / 1_048_576, 2)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        unit=unit,
+        items=items,
+        seconds=elapsed,
+        http_requests=telemetry.totals().requests,
+        db_statements=statements.count,
+        peak_memory_mb=peak_memory_mb,
+        failures=failures,
+        details=details,
+    )
+
+
+def prepare_database(database_url: str) -> str:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        ensure_database_exists(url)
+
+    engine = create_database_engine(url)
+    try:
+        if backend == "postgresql":
+            ensure_database_schema(engine)
+        else:
+            Base.metadata.create_all(engine)
+    finally:
+        engine.dispose()
+
+    use_database_url(url.render_as_string(hide_password=False))
+    return backend
+
+
+def _progress(message: str, current: int, total: int) -> None:
+    return
+
+
+@contextmanager
+def _importer_files(directory: Path) -> Iterator[None]:
+    from features.sync.students.importer_project import ImporterProjectManager
+
+    saved = (
+        ImporterProjectManager.PROJECT_FILE,
+        ImporterProjectManager.TELEMETRY_FILE,
+        ImporterProjectManager.TIMINGS_FILE,
+    )
+    ImporterProjectManager.PROJECT_FILE = directory / "import_project.json"
+    ImporterProjectManager.TELEMETRY_FILE = directory / "import_http_telemetry.json"
+    ImporterProjectManager.TIMINGS_FILE = directory / "import_timings.jsonl"
+    try:
+        yield
+    finally:
+        (
+            ImporterProjectManager.PROJECT_FILE,
+            ImporterProjectManager.TELEMETRY_FILE,
+            ImporterProjectManager.TIMINGS_FILE,
+        ) = saved
+
+
+def import_terms() -> None:
+    from features.sync.terms.repository import TermRepository
+    from features.sync.terms.service import TermSyncService
+
+    TermSyncService(TermRepository()).fetch_and_save_all_terms(_progress)
+
+
+def _committed_cms_ids(model, expected: set[int]) -> int:
+    engine = create_database_engine(get_database_url())
+    try:
+        with engine.connect() as conn:
+            stored = set(
+                conn.scalars(select(model.cms_id).where(model.cms_id.is_not(None)))
+            )
+    finally:
+        engine.dispose()
+    return len(expected & stored)
+
+
+def run_structures(site: SyntheticCms) -> ScenarioOutcome:
+    from database.models import SemesterModule, Structure
+    from features.sync.structures.repository import StructureRepository
+    from features.sync.structures.service import SchoolSyncService
+
+    SchoolSyncService(StructureRepository()).import_all_schools_structures(
+        _progress, fetch_semesters=True
+    )
+    saved = _committed_cms_ids(
+        Structure, {structure.cms_id for structure in site.structures}
+    )
+    saved_semester_modules = _committed_cms_ids(
+        SemesterModule, {module.cms_id for module in site.semester_modules}
+    )
+    return (
+        saved,
+        len(site.structures) - saved,
+        {
+            "semester_modules": saved_semester_modules,
+            "missing_semester_modules": len(site.semester_modules)
+            - saved_semester_modules,
+        },
+    )
+
+
+def run_modules(site: SyntheticCms) -> ScenarioOutcome:
+    from features.sync.modules.repository import ModuleRepository
+    from features.sync.modules.service import ModuleSyncService
+
+    saved = ModuleSyncService(ModuleRepository()).fetch_and_save_all_modules(_progress)
+    return saved, len(site.semester_modules) - saved, {}
+
+
+def run_students(
+    site: SyntheticCms,
+    workdir: Path,
+    import_options: dict[str, bool] | None = None,
+) -> ScenarioOutcome:
+    from features.sync.students.import_timings import (
+        ImportTimingLog,
+        summarize_phases,
+    )
+    from features.sync.students.importer_project import ImporterProjectManager
+    from features.sync.students.importer_worker import ImporterWorker
+    from features.sync.students.service import StudentSyncService
+
+    def callback(event_type: str, *args) -> None:
+        if event_type == "missing_sponsor":
+            response_holder, response_event = args[3], args[4]
+            response_holder["create"] = True
+            response_event.set()
+
+    student_numbers = site.student_numbers
+    with _importer_files(workdir):
+        project = ImporterProjectManager.create_project(
+            student_numbers[0],
+            student_numbers[-1],
+            dict(import_options or DEFAULT_IMPORT_OPTIONS),
+        )
+        ImporterWorker(project, StudentSyncService(), callback).run()
+        records = ImportTimingLog(ImporterProjectManager.TIMINGS_FILE).read()
+
+    phases = {
+        summary.phase: {
+            "p50_seconds": round(summary.p50_seconds, 4),
+            "p95_seconds": round(summary.p95_seconds, 4),
+        }
+        for summary in summarize_phases(records)
+    }
+    return project.success_count, project.failed_count, {"phases": phases}
+
+
+def run_suite(
+    database_url: str,
+    cms_config: StandInConfig,
+    *,
+    benchmarks: tuple[str, ...] = BENCHMARKS,
+    trace_memory: bool = True,
+) -> dict:
+    backend = prepare_database(database_url)
+    site = SyntheticCms(cms_config)
+    previous_override = os.environ.get("REGISTRY_CMS_BASE_URL")
+    results: list[BenchmarkResult] = []
+
+    with CmsStandInServer(site) as server, tempfile.TemporaryDirectory() as temp_dir:
+        set_cms_base_url_override(server.base_url)
+        try:
+            import_terms()
+            scenarios: dict[str, tuple[str, Callable[[], ScenarioOutcome]]] = {
+                "structures": ("structures", lambda: run_structures(site)),
+                "modules": ("modules", lambda: run_modules(site)),
+                "students": (
+                    "students",
+                    lambda: run_students(site, Path(temp_dir)),
+                ),
+            }
+            for name in BENCHMARKS:
+                if name not in benchmarks:
+                    continue
+                unit, scenario = scenarios[name]
+                results.append(measure(name, unit, scenario, trace_memory=trace_memory))
+        finally:
+            set_cms_base_url_override(previous_override)
+
+    return {
+        "version": __version__,
+        "python": sys.version.split()[0],
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "database": backend,
+        "cms": {
+            "students": cms_config.students,
+            "latency": cms_config.latency,
+            "jitter": cms_config.jitter,
+            "error_rate": cms_config.error_rate,
+            "requests": site.stats.gets + site.stats.posts,
+        },
+        "benchmarks": {result.name: result.to_dict() for result in results},
+    }
+
+
+def _delta_line(label: str, before: float, after: float) -> str:
+    change = ""
+    if before:
+        change = f" ({(after - before) / before * 100:+.1f}%)"
+    return f"{label}: {before:.2f} -> {after:.2f}{change}"
+
+
+def compare_reports(current: dict, baseline: dict) -> list[str]:
+    lines = [
+        f"Baseline {baseline.get('version', '?')} -> current {current.get('version', '?')}"
+    ]
+    baseline_benchmarks = baseline.get("benchmarks", {})
+    for name, result in current.get("benchmarks", {}).items():
+        previous = baseline_benchmarks.get(name)
+        if previous is None:
+            lines.append(f"{name}: no baseline")
+            continue
+        unit = result.get("unit", "items")
+        lines.append(
+            _delta_line(
+                f"{name} {unit}/minute",
+                previous.get("items_per_minute", 0.0),
+                result.get("items_per_minute", 0.0),
+            )
+        )
+        lines.append(
+            _delta_line(
+                f"  HTTP requests per {unit.rstrip('s')}",
+                previous.get("requests_per_item", 0.0),
+                result.get("requests_per_item", 0.0),
+            )
+        )
+        lines.append(
+            _delta_line(
+                f"  DB statements per {unit.rstrip('s')}",
+                previous.get("statements_per_item", 0.0),
+                result.get("statements_per_item", 0.0),
+            )
+        )
+        if result.get("peak_memory_mb") is not None:
+            lines.append(
+                _delta_line(
+                    "  Peak memory (MB)",
+                    previous.get("peak_memory_mb") or 0.0,
+                    result.get("peak_memory_mb") or 0.0,
+                )
+            )
+    return lines
+
+
+def find_regressions(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    baseline_benchmarks = baseline.get("benchmarks", {})
+    for name, result in current.get("benchmarks", {}).items():
+        previous = baseline_benchmarks.get(name)
+        if previous is None:
+            continue
+
+        before = previous.get("items_per_minute", 0.0)
+        after = result.get("items_per_minute", 0.0)
+        if before and after < before * (1 - tolerance):
+            regressions.append(
+                f"{name} throughput dropped from {before:.2f} to {after:.2f} per minute"
+            )
+
+        for key, label in (
+            ("requests_per_item", "HTTP requests"),
+            ("statements_per_item", "DB statements"),
+        ):
+            before = previous.get(key, 0.0)
+            after = result.get(key, 0.0)
+            if before and after > before * (1 + tolerance):
+                regressions.append(
+                    f"{name} {label} per item rose from {before:.2f} to {after:.2f}"
+                )
+    return regressions
+
+
+def print_report(report: dict) -> None:
+    cms = report["cms"]
+    print(
+        f"Import benchmarks (v{report['version']}) on {report['database']}, "
+        f"{cms['students']} students, {cms['latency'] * 1000:.0f}ms CMS latency"
+    )
+    for name, result in report["benchmarks"].items():
+        memory = (
+            f", peak {result['peak_memory_mb']:.1f}MB"
+            if result["peak_memory_mb"] is not None
+            else ""
+        )
+        failures = f", {result['failures']} failed" if result["failures"] else ""
+        print(
+            f"  {name}: {result['items']} {result['unit']} in {result['seconds']:.1f}s "
+            f"({result['items_per_minute']:.1f}/min), "
+            f"{result['requests_per_item']:.1f} requests and "
+            f"{result['statements_per_item']:.1f} statements each{memory}{failures}"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the structure, module and student imports against a simulated CMS."
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("REGISTRY_BENCHMARK_DATABASE_URL"),
+        help="throwaway database to import into (default: REGISTRY_BENCHMARK_DATABASE_URL)",
+    )
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="simulated CMS response time in seconds",
+    )
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=BENCHMARKS,
+        help="run only this benchmark (repeatable)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc peak memory tracking",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="write the JSON report to this path",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="compare against a JSON report from a previous version",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="exit with status 1 when a metric is this many percent worse than the baseline",
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if not args.database_url:
+        raise SystemExit(
+            "Pass --database-url or set REGISTRY_BENCHMARK_DATABASE_URL to a throwaway database."
+        )
+
+    report = run_suite(
+        args.database_url,
+        StandInConfig(
+            students=args.students,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+        ),
+        benchmarks=tuple(args.only or BENCHMARKS),
+        trace_memory=not args.no_memory,
+    )
+    print_report(report)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print()
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        print()
+        for line in compare_reports(report, baseline):
+            print(line)
+
+        if args.max_regression is not None:
+            regressions = find_regressions(report, baseline, args.max_regression / 100)
+            for regression in regressions:
+                print(f"Regression: {regression}")
+            if regressions:
+                raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+import argparse
+import json
+import os
+import sys
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+from sqlalchemy import event, make_url, text
+from sqlalchemy.engine import Engine
+
+from database.connection import create_database_engine
+from database.models import Base
+from features.bulk.student_modules.repository import BulkStudentModulesRepository
+from features.enrollments.requests.repository import EnrollmentRequestRepository
+from features.sync.students.repository import StudentRepository
+from tools.generate_dataset import DatasetScale, SyntheticDataset, load_dataset
+from tools.import_benchmark import prepare_database
+
+LARGE_TABLE_ROWS = 50_000
+SEQUENTIAL_SCAN_NODES = {"Seq Scan", "Parallel Seq Scan"}
+STATEMENT_PREVIEW_LENGTH = 120
+
+
+@dataclass(frozen=True)
+class PlanScan:
+    node_type: str
+    relation: str | None
+    index: str | None
+    rows: float
+
+
+@dataclass
+class PlanSummary:
+    statement: str
+    scans: list[PlanScan]
+    max_rows: float
+    total_cost: float
+
+    @property
+    def indexes(self) -> set[str]:
+        return {scan.index for scan in self.scans if scan.index}
+
+    @property
+    def sequential_scans(self) -> list[PlanScan]:
+        return [scan for scan in self.scans if scan.node_type in SEQUENTIAL_SCAN_NODES]
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    name: str
+    run: Callable[[Engine, dict], object]
+    expected_indexes: tuple[str, ...]
+    max_rows: float
+    allowed_scans: tuple[str, ...] = ()
+
+
+@dataclass
+class QueryCheck:
+    name: str
+    plans: list[PlanSummary] = field(default_factory=list)
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.problems
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "problems": self.problems,
+            "plans": [
+                {
+                    "statement": _preview(plan.statement),
+                    "indexes": sorted(plan.indexes),
+                    "sequential_scans": sorted(
+                        {scan.relation or "" for scan in plan.sequential_scans}
+                    ),
+                    "max_rows": plan.max_rows,
+                    "total_cost": plan.total_cost,
+                }
+                for plan in self.plans
+            ],
+        }
+
+
+def _preview(statement: str) -> str:
+    text_value = " ".join(statement.split())
+    if len(text_value) > STATEMENT_PREVIEW_LENGTH:
+        return f"{text_value[:STATEMENT_PREVIEW_LENGTH]}..."
+    return text_value
+
+
+def iter_plan_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def summarize_plan(statement: str, explain_output) -> PlanSummary:
+    if isinstance(explain_output, str):
+        explain_output = json.loads(explain_output)
+    root = explain_output[0]["Plan"]
+
+    scans: list[PlanScan] = []
+    max_rows = 0.0
+    for node in iter_plan_nodes(root):
+        rows = float(node.get("Plan Rows", 0))
+        max_rows = max(max_rows, rows)
+        if "Relation Name" in node or "Index Name" in node:
+            node_type = node["Node Type"]
+            if node_type == "Seq Scan" and node.get("Parallel Aware"):
+                node_type = "Parallel Seq Scan"
+            scans.append(
+                PlanScan(
+                    node_type=node_type,
+                    relation=node.get("Relation Name"),
+                    index=node.get("Index Name"),
+                    rows=rows,
+                )
+            )
+
+    return PlanSummary(
+        statement=statement,
+        scans=scans,
+        max_rows=max_rows,
+        total_cost=float(root.get("Total Cost", 0)),
+    )
+
+
+def capture_statements(
+    engine: Engine, run: Callable[[], object]
+) -> list[tuple[str, object]]:
+    statements: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def explain(engine: Engine, statement: str, parameters) -> PlanSummary:
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        row = cursor.fetchone()
+        cursor.close()
+        if row is None:
+            raise RuntimeError(f"EXPLAIN returned no plan for: {statement}")
+        output = row[0]
+    finally:
+        connection.close()
+    return summarize_plan(statement, output)
+
+
+def table_sizes(engine: Engine) -> dict[str, float]:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT c.relname, c.reltuples FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relkind = 'r' AND n.nspname = current_schema()"
+            )
+        ).all()
+    return {name: float(tuples) for name, tuples in rows}
+
+
+def check_plans(
+    query: HotQuery,
+    plans: list[PlanSummary],
+    sizes: dict[str, float],
+    large_table_rows: float = LARGE_TABLE_ROWS,
+) -> list[str]:
+    problems: list[str] = []
+
+    used = set().union(*(plan.indexes for plan in plans)) if plans else set()
+    for index in query.expected_indexes:
+        if index not in used:
+            problems.append(f"expected index {index} was not used")
+
+    for plan in plans:
+        for scan in plan.sequential_scans:
+            relation = scan.relation or ""
+            table_rows = sizes.get(relation, 0.0)
+            if relation in query.allowed_scans or table_rows < large_table_rows:
+                continue
+            problems.append(
+                f"sequential scan on {relation} (~{table_rows:,.0f} rows): "
+                f"{_preview(plan.statement)}"
+            )
+        if plan.max_rows > query.max_rows:
+            problems.append(
+                f"estimated {plan.max_rows:,.0f} rows, above the "
+                f"{query.max_rows:,.0f} limit: {_preview(plan.statement)}"
+            )
+
+    return problems
+
+
+def _repository(repository_class, engine: Engine):
+    repository = repository_class()
+    repository._engine = engine
+    return repository
+
+
+def sample_parameters(engine: Engine) -> dict:
+    with engine.connect() as conn:
+        student_count = conn.execute(text("SELECT COUNT(*) FROM students")).scalar_one()
+        std_nos = [
+            row[0]
+            for row in conn.execute(
+                text(
+                    "SELECT std_no FROM students ORDER BY std_no LIMIT 30 OFFSET :offset"
+                ),
+                {"offset": student_count // 2},
+            )
+        ]
+        program_cms_id, structure_cms_id, semester_module_cms_id = conn.execute(
+            text(
+                "SELECT p.cms_id, st.cms_id, m.cms_id FROM student_programs sp "
+                "JOIN structures st ON st.id = sp.structure_id "
+                "JOIN programs p ON p.id = st.program_id "
+                "JOIN student_semesters ss ON ss.student_program_id = sp.id "
+                "JOIN student_modules sm ON sm.student_semester_id = ss.id "
+                "JOIN semester_modules m ON m.id = sm.semester_module_id "
+                "WHERE sp.std_no = :std_no LIMIT 1"
+            ),
+            {"std_no": std_nos[0]},
+        ).one()
+        request_count = conn.execute(
+            text("SELECT COUNT(*) FROM registration_requests")
+        ).scalar_one()
+        request_id, term_code = conn.execute(
+            text(
+                "SELECT r.id, t.code FROM registration_requests r "
+                "JOIN terms t ON t.id = r.term_id ORDER BY r.id LIMIT 1 OFFSET :offset"
+            ),
+            {"offset": request_count // 2},
+        ).one()
+
+    return {
+        "std_no": str(std_nos[0]),
+        "std_nos": [str(std_no) for std_no in std_nos],
+        "program_cms_id": program_cms_id,
+        "structure_cms_id": structure_cms_id,
+        "semester_module_cms_id": semester_module_cms_id,
+        "registration_request_id": request_id,
+        "term_code": term_code,
+    }
+
+
+def _student_graph(engine: Engine, params: dict):
+    return _repository(StudentRepository, engine).get_student_graph(params["std_no"])
+
+
+def _students_by_numbers(engine: Engine, params: dict):
+    return _repository(StudentRepository, engine).fetch_students_by_numbers(
+        params["std_nos"]
+    )
+
+
+def _students_in_program(engine: Engine, params: dict):
+    return _repository(StudentRepository, engine).fetch_students(
+        program_cms_id=params["program_cms_id"]
+    )
+
+
+def _students_with_module(engine: Engine, params: dict):
+    return _repository(BulkStudentModulesRepository, engine).fetch_students_with_module(
+        params["semester_module_cms_id"], params["structure_cms_id"]
+    )
+
+
+def _registration_request(engine: Engine, params: dict):
+    repository = _repository(EnrollmentRequestRepository, engine)
+    repository.get_registration_request_details(params["registration_request_id"])
+    return repository.get_requested_modules(params["registration_request_id"])
+
+
+def _pending_requests_for_term(engine: Engine, params: dict):
+    return _repository(EnrollmentRequestRepository, engine).fetch_registration_requests(
+        term_code=params["term_code"], status="pending"
+    )
+
+
+HOT_QUERIES = (
+    HotQuery(
+        "student_graph",
+        _student_graph,
+        expected_indexes=(
+            "fk_student_programs_std_no",
+            "fk_student_semesters_student_program_id",
+            "fk_student_modules_student_semester_id",
+        ),
+        max_rows=1_000,
+    ),
+    HotQuery(
+        "students_by_numbers",
+        _students_by_numbers,
+        expected_indexes=("students_pkey",),
+        max_rows=1_000,
+    ),
+    HotQuery(
+        "students_in_program",
+        _students_in_program,
+        expected_indexes=("fk_student_programs_structure_id", "students_pkey"),
+        max_rows=10_000,
+    ),
+    HotQuery(
+        "students_with_module",
+        _students_with_module,
+        expected_indexes=("fk_student_modules_semester_module_id",),
+        max_rows=10_000,
+    ),
+    HotQuery(
+        "registration_request",
+        _registration_request,
+        expected_indexes=(
+            "registration_requests_pkey",
+            "fk_requested_modules_registration_request_id",
+        ),
+        max_rows=100,
+    ),
+    HotQuery(
+        "pending_requests_for_term",
+        _pending_requests_for_term,
+        expected_indexes=("students_pkey",),
+        max_rows=20_000,
+    ),
+)
+
+
+def run_checks(
+    engine: Engine,
+    queries: tuple[HotQuery, ...] = HOT_QUERIES,
+    *,
+    large_table_rows: float = LARGE_TABLE_ROWS,
+) -> list[QueryCheck]:
+    params = sample_parameters(engine)
+    sizes = table_sizes(engine)
+
+    checks: list[QueryCheck] = []
+    for query in queries:
+        check = QueryCheck(query.name)
+        statements = capture_statements(engine, partial(query.run, engine, params))
+        check.plans = [
+            explain(engine, statement, parameters)
+            for statement, parameters in statements
+        ]
+        check.problems = check_plans(query, check.plans, sizes, large_table_rows)
+        checks.append(check)
+    return checks
+
+
+def ensure_dataset(engine: Engine, scale: DatasetScale) -> bool:
+    with engine.connect() as conn:
+        existing = conn.execute(
+            Base.metadata.tables["students"].select().limit(1)
+        ).first()
+    if existing is not None:
+        return False
+    load_dataset(engine, SyntheticDataset(scale))
+    return True
+
+
+def print_checks(checks: list[QueryCheck], *, verbose: bool = False) -> None:
+    for check in checks:
+        status = "ok" if check.passed else "REGRESSED"
+        print(f"{check.name}: {status}")
+        if verbose:
+            for plan in check.plans:
+                indexes = ", ".join(sorted(plan.indexes)) or "none"
+                scans = (
+                    ", ".join(
+                        sorted({scan.relation or "" for scan in plan.sequential_scans})
+                    )
+                    or "none"
+                )
+                print(f"  {_preview(plan.statement)}")
+                print(
+                    f"    indexes: {indexes}; seq scans: {scans}; "
+                    f"max rows: {plan.max_rows:,.0f}; cost: {plan.total_cost:,.1f}"
+                )
+        for problem in check.problems:
+            print(f"  - {problem}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Check that the hot repository queries keep using their indexes."
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("REGISTRY_PLAN_DATABASE_URL"),
+        help="seeded Postgres database to explain against (default: REGISTRY_PLAN_DATABASE_URL)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="synthetic dataset scale to load when the database has no students",
+    )
+    parser.add_argument(
+        "--large-table-rows",
+        type=float,
+        default=LARGE_TABLE_ROWS,
+        help="tables with at least this many rows must not be scanned sequentially",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=[query.name for query in HOT_QUERIES],
+        help="check only this query (repeatable)",
+    )
+    parser.add_argument("--verbose", action="store_true", help="print every plan")
+    parser.add_argument("--output", type=Path, help="write a JSON report here")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if not args.database_url:
+        raise SystemExit(
+            "Pass --database-url or set REGISTRY_PLAN_DATABASE_URL to a throwaway Postgres database."
+        )
+
+    if make_url(args.database_url).get_backend_name() != "postgresql":
+        raise SystemExit("Query plans can only be checked against Postgres.")
+
+    prepare_database(args.database_url)
+
+    engine = create_database_engine(args.database_url)
+    try:
+        if ensure_dataset(engine, DatasetScale().scaled(args.scale)):
+            print(f"Loaded a synthetic dataset at scale {args.scale}")
+        queries = tuple(
+            query for query in HOT_QUERIES if not args.only or query.name in args.only
+        )
+        checks = run_checks(engine, queries, large_table_rows=args.large_table_rows)
+    finally:
+        engine.dispose()
+
+    print_checks(checks, verbose=args.verbose)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps([check.to_dict() for check in checks], indent=2),
+            encoding="utf-8",
+        )
+        print()
+        print(f"Report written to {args.output}")
+
+    if any(not check.passed for check in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
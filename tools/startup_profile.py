@@ -0,0 +1,233 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from base.__version__ import __version__
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    timings: list[ImportTiming] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+
+        self_text, cumulative_text, name = parts
+        try:
+            self_us = int(self_text.strip())
+            cumulative_us = int(cumulative_text.strip())
+        except ValueError:
+            continue
+
+        name = name.rstrip()
+        indent = len(name) - len(name.lstrip())
+        timings.append(
+            ImportTiming(
+                module=name.strip(),
+                self_us=self_us,
+                cumulative_us=cumulative_us,
+                depth=max((indent - 1) // 2, 0),
+            )
+        )
+
+    return timings
+
+
+def summarize_timings(timings: list[ImportTiming], top: int = 25) -> dict:
+    top_level = [timing for timing in timings if timing.depth == 0]
+    direct_imports = [timing for timing in timings if timing.depth == 1]
+    packages: dict[str, int] = {}
+    for timing in timings:
+        package = timing.module.split(".")[0]
+        packages[package] = packages.get(package, 0) + timing.self_us
+
+    return {
+        "import_total_us": sum(timing.cumulative_us for timing in top_level),
+        "module_count": len(timings),
+        "top_imports": [
+            asdict(timing)
+            for timing in sorted(
+                direct_imports, key=lambda timing: timing.cumulative_us, reverse=True
+            )[:top]
+        ],
+        "packages_us": dict(
+            sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        ),
+    }
+
+
+def measure_startup(
+    module: str = "main",
+    *,
+    runs: int = 3,
+    python: str = sys.executable,
+    top: int = 25,
+) -> dict:
+    wall_times: list[float] = []
+    best_output = ""
+    best_wall = None
+
+    for _ in range(max(runs, 1)):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [python, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        elapsed = time.perf_counter() - started
+
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"Importing {module} failed:\n{completed.stderr.strip()[-2000:]}"
+            )
+
+        wall_times.append(elapsed)
+        if best_wall is None or elapsed < best_wall:
+            best_wall = elapsed
+            best_output = completed.stderr
+
+    report = {
+        "version": __version__,
+        "module": module,
+        "python": sys.version.split()[0],
+        "runs": len(wall_times),
+        "wall_seconds_min": min(wall_times),
+        "wall_seconds_median": statistics.median(wall_times),
+    }
+    report.update(summarize_timings(parse_importtime(best_output), top=top))
+    return report
+
+
+def compare_reports(current: dict, baseline: dict) -> list[str]:
+    lines = [
+        f"Baseline {baseline.get('version', '?')} -> current {current.get('version', '?')}",
+        _delta_line(
+            "Wall time (min)",
+            baseline.get("wall_seconds_min", 0.0),
+            current.get("wall_seconds_min", 0.0),
+            "s",
+        ),
+        _delta_line(
+            "Import total",
+            baseline.get("import_total_us", 0) / 1000,
+            current.get("import_total_us", 0) / 1000,
+            "ms",
+        ),
+    ]
+
+    baseline_packages = baseline.get("packages_us", {})
+    current_packages = current.get("packages_us", {})
+    for package in sorted(
+        set(baseline_packages) | set(current_packages),
+        key=lambda name: abs(
+            current_packages.get(name, 0) - baseline_packages.get(name, 0)
+        ),
+        reverse=True,
+    )[:10]:
+        lines.append(
+            _delta_line(
+                f"  {package}",
+                baseline_packages.get(package, 0) / 1000,
+                current_packages.get(package, 0) / 1000,
+                "ms",
+            )
+        )
+
+    return lines
+
+
+def _delta_line(label: str, before: float, after: float, unit: str) -> str:
+    return f"{label}: {before:.3f}{unit} -> {after:.3f}{unit} ({after - before:+.3f}{unit})"
+
+
+def print_report(report: dict) -> None:
+    print(f"Startup profile for 'import {report['module']}' (v{report['version']})")
+    print(
+        f"Wall time: min {report['wall_seconds_min']:.3f}s, "
+        f"median {report['wall_seconds_median']:.3f}s over {report['runs']} run(s)"
+    )
+    print(
+        f"Import time: {report['import_total_us'] / 1000:.1f}ms "
+        f"across {report['module_count']} modules"
+    )
+    print()
+    print("Heaviest direct imports:")
+    for timing in report["top_imports"]:
+        print(f"  {timing['cumulative_us'] / 1000:9.1f}ms  {timing['module']}")
+    print()
+    print("Self time by package:")
+    for package, self_us in list(report["packages_us"].items())[:15]:
+        print(f"  {self_us / 1000:9.1f}ms  {package}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--module",
+        default="main",
+        help="module to import when measuring startup",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="number of cold interpreter runs to sample",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=25,
+        help="number of direct imports to include in the report",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="write the JSON report to this path",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="compare against a JSON report from a previous release",
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    report = measure_startup(args.module, runs=args.runs, top=args.top)
+    print_report(report)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print()
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        print()
+        for line in compare_reports(report, baseline):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ from sqlalchemy.engine.url import URL, make_url
 from sqlalchemy.orm import Session
 
 from base.browser import BASE_URL, Browser
+from base.http_telemetry import get_http_telemetry
 from base.runtime_config import (
     get_current_cms_base_url,
     get_current_country_code,
@@ -1189,6 +1190,7 @@ def main() -> None:
                 ),
             },
             "db_counts": db_counts,
+            "http": get_http_telemetry().snapshot(),
             "failure_samples": [
                 {
                     "student_number": result.student_number,
@@ -1,17 +1,32 @@
 import argparse
+import json
 import sys
-from collections.abc import Callable
-from dataclasses import dataclass, field
-
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    Text,
+    bindparam,
+    create_engine,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import NullPool
 
 sys.path.insert(0, ".")
 
 from base import get_logger
-from database.models import NextOfKin, Student, StudentEducation
+from database.bulk_copy import copy_rows
+from database.models import NextOfKin, Student, StudentEducation, utc_now
 
 logger = get_logger(__name__)
 
@@ -29,6 +44,32 @@ STUDENT_FILLABLE_FIELDS = [
     "religion",
 ]
 
+MERGE_BATCH_SIZE = 500
+LOOKUP_CHUNK_SIZE = 1000
+STAGING_BATCH_ROWS = 5000
+STAGED_STUDENT_COLUMNS = ["std_no", "name", "status", *STUDENT_FILLABLE_FIELDS]
+STAGED_EDUCATION_COLUMNS = [
+    "id",
+    "std_no",
+    "school_name",
+    "type",
+    "level",
+    "start_date",
+    "end_date",
+    "cms_id",
+]
+STAGED_KIN_COLUMNS = [
+    "id",
+    "std_no",
+    "name",
+    "relationship",
+    "phone",
+    "email",
+    "occupation",
+    "address",
+    "country",
+]
+
 
 @dataclass
 class MergeStats:
@@ -84,6 +125,9 @@ def analyze_differences(
     source_engine: Engine,
     target_engine: Engine,
 ) -> AnalysisResult:
+    if _stages_on_target(target_engine):
+        return analyze_staged_differences(source_engine, target_engine)
+
     result = AnalysisResult()
 
     with Session(source_engine) as src, Session(target_engine) as tgt:
@@ -156,21 +200,63 @@ def _effective_value(val: object) -> object:
     return val
 
 
+def _in_range(query, column, std_no_range: tuple[int | None, int | None] | None):
+    if std_no_range is None:
+        return query
+    lower, upper = std_no_range
+    if lower is not None:
+        query = query.filter(column > lower)
+    if upper is not None:
+        query = query.filter(column <= upper)
+    return query
+
+
+def _existing_values(session: Session, column, values: Iterable) -> set:
+    pending = list(dict.fromkeys(values))
+    found: set = set()
+    for start in range(0, len(pending), LOOKUP_CHUNK_SIZE):
+        chunk = pending[start : start + LOOKUP_CHUNK_SIZE]
+        found.update(
+            row[0] for row in session.query(column).filter(column.in_(chunk)).all()
+        )
+    return found
+
+
 def merge_students(
     source: Session,
     target: Session,
     stats: MergeStats,
     progress_callback: Callable[[str, int, int], None] | None = None,
     resolutions: dict[tuple[int, str], str] | None = None,
+    std_no_range: tuple[int | None, int | None] | None = None,
 ) -> None:
     resolved = resolutions or {}
-    source_students = source.query(Student).all()
-    target_students = {s.std_no: s for s in target.query(Student).all()}
+    source_students = (
+        _in_range(source.query(Student), Student.std_no, std_no_range)
+        .order_by(Student.std_no)
+        .all()
+    )
+    target_students = {
+        s.std_no: s
+        for s in _in_range(target.query(Student), Student.std_no, std_no_range).all()
+    }
 
-    used_national_ids: set[str] = set()
-    for s in target_students.values():
-        if s.national_id:
-            used_national_ids.add(s.national_id)
+    candidate_national_ids = {
+        _effective_value(src.national_id) for src in source_students
+    } | {
+        resolved[(src.std_no, "national_id")]
+        for src in source_students
+        if (src.std_no, "national_id") in resolved
+    }
+    used_national_ids: set[str] = {
+        national_id
+        for national_id in _existing_values(
+            target,
+            Student.national_id,
+            (value for value in candidate_national_ids if isinstance(value, str)),
+        )
+        if national_id
+    }
 
     total = len(source_students)
     for i, src in enumerate(source_students):
@@ -253,16 +339,22 @@ def merge_student_education(
     target: Session,
     stats: MergeStats,
     progress_callback: Callable[[str, int, int], None] | None = None,
+    std_no_range: tuple[int | None, int | None] | None = None,
 ) -> None:
-    target_student_ids = {row[0] for row in target.query(Student.std_no).all()}
-    target_cms_ids = {
-        row[0]
-        for row in target.query(StudentEducation.cms_id)
-        .filter(StudentEducation.cms_id.isnot(None))
+    source_educations = (
+        _in_range(source.query(StudentEducation), StudentEducation.std_no, std_no_range)
+        .order_by(StudentEducation.id)
         .all()
-    }
+    )
+    target_student_ids = _existing_values(
+        target, Student.std_no, (edu.std_no for edu in source_educations)
+    )
+    target_cms_ids = _existing_values(
+        target,
+        StudentEducation.cms_id,
+        (edu.cms_id for edu in source_educations if edu.cms_id is not None),
+    )
 
-    source_educations = source.query(StudentEducation).all()
     total = len(source_educations)
 
     for i, src_edu in enumerate(source_educations):
@@ -324,14 +416,24 @@ def merge_next_of_kins(
     target: Session,
     stats: MergeStats,
     progress_callback: Callable[[str, int, int], None] | None = None,
+    std_no_range: tuple[int | None, int | None] | None = None,
 ) -> None:
-    target_student_ids = {row[0] for row in target.query(Student.std_no).all()}
+    source_kins = (
+        _in_range(source.query(NextOfKin), NextOfKin.std_no, std_no_range)
+        .order_by(NextOfKin.id)
+        .all()
+    )
+    kin_std_nos = list(dict.fromkeys(kin.std_no for kin in source_kins))
+    target_student_ids = _existing_values(target, Student.std_no, kin_std_nos)
 
     existing_kins: set[tuple[int, str]] = set()
-    for kin in target.query(NextOfKin).all():
-        existing_kins.add((kin.std_no, kin.name.strip().lower()))
+    for start in range(0, len(kin_std_nos), LOOKUP_CHUNK_SIZE):
+        chunk = kin_std_nos[start : start + LOOKUP_CHUNK_SIZE]
+        for std_no, name in target.query(NextOfKin.std_no, NextOfKin.name).filter(
+            NextOfKin.std_no.in_(chunk)
+        ):
+            existing_kins.add((std_no, name.strip().lower()))
 
-    source_kins = source.query(NextOfKin).all()
     total = len(source_kins)
 
     for i, src_kin in enumerate(source_kins):
@@ -369,37 +471,722 @@ def merge_next_of_kins(
     )
 
 
-def run_merge(
+def _engine_key(engine: Engine) -> str:
+    return engine.url.render_as_string(hide_password=True)
+
+
+MERGE_CHECKPOINTS = Table(
+    "upload_merge_checkpoints",
+    MetaData(),
+    Column("source", String, primary_key=True),
+    Column("state", Text, nullable=False),
+)
+
+
+@dataclass
+class MergeCheckpoint:
+    source: str
+    target: str
+    last_std_no: int | None = None
+    batches: int = 0
+    stats: dict = field(default_factory=dict)
+    updated_at: str | None = None
+
+    def merge_stats(self) -> MergeStats:
+        return MergeStats(**self.stats)
+
+
+def load_merge_checkpoint(
+    source_engine: Engine, target_engine: Engine
+) -> MergeCheckpoint | None:
+    MERGE_CHECKPOINTS.create(target_engine, checkfirst=True)
+    with target_engine.connect() as conn:
+        state = conn.execute(
+            select(MERGE_CHECKPOINTS.c.state).where(
+                MERGE_CHECKPOINTS.c.source == _engine_key(source_engine)
+            )
+        ).scalar()
+    if state is None:
+        return None
+
+    try:
+        checkpoint = MergeCheckpoint(**json.loads(state))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable merge checkpoint: {str(e)}")
+        return None
+
+    if checkpoint.target != _engine_key(target_engine):
+        logger.warning("Ignoring merge checkpoint copied from a different database")
+        return None
+    return checkpoint
+
+
+def save_merge_checkpoint(target: Session, checkpoint: MergeCheckpoint) -> None:
+    """Stage the checkpoint row in the target session's open transaction.
+
+    The caller commits it together with the batch it describes, so a crash
+    can never leave committed rows that the checkpoint does not cover.
+    """
+    checkpoint.updated_at = datetime.now().isoformat()
+    clear_merge_checkpoint(target, checkpoint.source)
+    target.execute(
+        MERGE_CHECKPOINTS.insert().values(
+            source=checkpoint.source, state=json.dumps(asdict(checkpoint))
+        )
+    )
+
+
+def clear_merge_checkpoint(target: Session, source: str) -> None:
+    target.execute(
+        MERGE_CHECKPOINTS.delete().where(MERGE_CHECKPOINTS.c.source == source)
+    )
+
+
+def _batch_upper_bound(
+    source: Session, last_std_no: int | None, batch_size: int
+) -> int | None:
+    query = source.query(Student.std_no)
+    if last_std_no is not None:
+        query = query.filter(Student.std_no > last_std_no)
+    return query.order_by(Student.std_no).offset(batch_size - 1).limit(1).scalar()
+
+
+def run_chunked_merge(
     source_engine: Engine,
     target_engine: Engine,
     progress_callback: Callable[[str, int, int], None] | None = None,
     resolutions: dict[tuple[int, str], str] | None = None,
+    *,
+    batch_size: int = MERGE_BATCH_SIZE,
+    resumable: bool = False,
 ) -> MergeStats:
-    stats = MergeStats()
+    """Merge students in keyset-ordered batches of ``batch_size``.
+
+    Without ``resumable`` the batches only bound memory and the whole merge
+    is still one transaction. With it, every batch is committed together
+    with a checkpoint row in the target database, and a later resumable run
+    continues after the last committed batch.
+    """
+    checkpoint = None
+    if resumable:
+        checkpoint = load_merge_checkpoint(source_engine, target_engine)
+    if checkpoint is None:
+        checkpoint = MergeCheckpoint(
+            source=_engine_key(source_engine), target=_engine_key(target_engine)
+        )
+    else:
+        logger.info(
+            f"Resuming merge after student {checkpoint.last_std_no} "
+            f"({checkpoint.batches} batches already committed)"
+        )
+    stats = checkpoint.merge_stats()
 
     with Session(source_engine) as source_session:
-        with Session(target_engine) as target_session:
-            try:
-                merge_students(
-                    source_session,
-                    target_session,
-                    stats,
-                    progress_callback,
-                    resolutions,
+        total = source_session.query(Student).count()
+
+    with Session(target_engine) as target_session:
+        try:
+            while True:
+                done = (
+                    stats.students_added
+                    + stats.students_updated
+                    + stats.students_skipped
                 )
-                merge_student_education(
-                    source_session, target_session, stats, progress_callback
+
+                def batch_progress(
+                    msg: str, current: int, batch_total: int, done: int = done
+                ) -> None:
+                    if progress_callback:
+                        progress_callback(msg, min(done + current, total), total)
+
+                with Session(source_engine) as source_session:
+                    upper = _batch_upper_bound(
+                        source_session, checkpoint.last_std_no, batch_size
+                    )
+                    std_no_range = (checkpoint.last_std_no, upper)
+                    merge_students(
+                        source_session,
+                        target_session,
+                        stats,
+                        batch_progress,
+                        resolutions,
+                        std_no_range,
+                    )
+                    merge_student_education(
+                        source_session, target_session, stats, None, std_no_range
+                    )
+                    merge_next_of_kins(
+                        source_session, target_session, stats, None, std_no_range
+                    )
+
+                if upper is None:
+                    break
+
+                checkpoint.last_std_no = upper
+                checkpoint.batches += 1
+                checkpoint.stats = asdict(stats)
+                if resumable:
+                    save_merge_checkpoint(target_session, checkpoint)
+                    target_session.commit()
+                else:
+                    target_session.expunge_all()
+
+            if resumable:
+                clear_merge_checkpoint(target_session, checkpoint.source)
+            target_session.commit()
+        except Exception:
+            target_session.rollback()
+            if resumable:
+                logger.exception(
+                    f"Merge failed after student {checkpoint.last_std_no}, "
+                    "rolling back the current batch"
+                )
+            else:
+                logger.exception("Merge failed, rolling back all changes")
+            raise
+
+    logger.info("Merge completed successfully")
+    return stats
+
+
+def run_merge(
+    source_engine: Engine,
+    target_engine: Engine,
+    progress_callback: Callable[[str, int, int], None] | None = None,
+    resolutions: dict[tuple[int, str], str] | None = None,
+    *,
+    batch_size: int = MERGE_BATCH_SIZE,
+    resumable: bool = False,
+) -> MergeStats:
+    if not resumable and _stages_on_target(target_engine):
+        return run_staged_merge(
+            source_engine, target_engine, progress_callback, resolutions
+        )
+
+    return run_chunked_merge(
+        source_engine,
+        target_engine,
+        progress_callback,
+        resolutions,
+        batch_size=batch_size,
+        resumable=resumable,
+    )
+
+
+def _stages_on_target(target_engine: Engine) -> bool:
+    return target_engine.dialect.name == "postgresql"
+
+
+def _staged_student_row(row) -> tuple:
+    return (
+        row.std_no,
+        row.name,
+        row.status,
+        *(_effective_value(getattr(row, fname)) for fname in STUDENT_FILLABLE_FIELDS),
+    )
+
+
+def _staged_education_row(row) -> tuple:
+    return (
+        row.id,
+        row.std_no,
+        row.school_name or "",
+        row.type or None,
+        row.level or None,
+        row.start_date,
+        row.end_date,
+        row.cms_id,
+    )
+
+
+def _source_rows(
+    source_engine: Engine,
+    table: Table,
+    columns: list[str],
+    convert: Callable[[Any], tuple] = tuple,
+) -> Iterator[tuple]:
+    statement = select(*(table.c[column] for column in columns)).order_by(
+        table.c[columns[0]]
+    )
+    with source_engine.connect() as conn:
+        result = conn.execution_options(yield_per=STAGING_BATCH_ROWS).execute(statement)
+        for row in result:
+            yield convert(row)
+
+
+def _resolution_rows(resolutions: dict[tuple[int, str], str]) -> Iterator[tuple]:
+    by_student: dict[int, dict[str, object]] = {}
+    for (std_no, fname), value in resolutions.items():
+        if fname not in STUDENT_FILLABLE_FIELDS or value is None:
+            continue
+        if fname == "date_of_birth" and isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        by_student.setdefault(std_no, {})[fname] = value
+    for std_no in sorted(by_student):
+        values = by_student[std_no]
+        yield (std_no, *(values.get(fname) for fname in STUDENT_FILLABLE_FIELDS))
+
+
+def _create_staging_table(
+    conn: Connection, name: str, source: Table, columns: list[str]
+) -> Table:
+    column_list = ", ".join(columns)
+    conn.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {name} AS "
+            f"SELECT {column_list} FROM {source.name} WHERE 1 = 0"
+        )
+    )
+    return Table(
+        name,
+        MetaData(),
+        *(Column(column, source.c[column].type) for column in columns),
+    )
+
+
+def _stage_rows(conn: Connection, staging: Table, rows: Iterable[tuple]) -> int:
+    columns = [column.name for column in staging.columns]
+    if conn.dialect.name == "postgresql":
+        cursor = conn.connection.cursor()
+        try:
+            count = copy_rows(cursor, staging.name, columns, rows)
+        finally:
+            cursor.close()
+    else:
+        count = 0
+        batch: list[dict] = []
+        for row in rows:
+            batch.append(dict(zip(columns, row)))
+            if len(batch) >= STAGING_BATCH_ROWS:
+                conn.execute(staging.insert(), batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            conn.execute(staging.insert(), batch)
+            count += len(batch)
+
+    conn.execute(
+        text(f"CREATE INDEX {staging.name}_key ON {staging.name} ({columns[0]})")
+    )
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(f"ANALYZE {staging.name}"))
+    return count
+
+
+def _stage_source(
+    conn: Connection,
+    source_engine: Engine,
+    resolutions: dict[tuple[int, str], str] | None = None,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, int]:
+    students = Student.__table__
+    counts: dict[str, int] = {}
+
+    if progress:
+        progress("Staging students...")
+    staging = _create_staging_table(
+        conn, "upload_students", students, STAGED_STUDENT_COLUMNS
+    )
+    counts["students"] = _stage_rows(
+        conn,
+        staging,
+        _source_rows(
+            source_engine, students, STAGED_STUDENT_COLUMNS, _staged_student_row
+        ),
+    )
+
+    if progress:
+        progress("Staging education records...")
+    education = StudentEducation.__table__
+    staging = _create_staging_table(
+        conn, "upload_education", education, STAGED_EDUCATION_COLUMNS
+    )
+    counts["education"] = _stage_rows(
+        conn,
+        staging,
+        _source_rows(
+            source_engine,
+            education,
+            STAGED_EDUCATION_COLUMNS,
+            _staged_education_row,
+        ),
+    )
+
+    if progress:
+        progress("Staging next of kin...")
+    kins = NextOfKin.__table__
+    staging = _create_staging_table(conn, "upload_kins", kins, STAGED_KIN_COLUMNS)
+    counts["kins"] = _stage_rows(
+        conn, staging, _source_rows(source_engine, kins, STAGED_KIN_COLUMNS)
+    )
+
+    staging = _create_staging_table(
+        conn, "upload_resolutions", students, ["std_no", *STUDENT_FILLABLE_FIELDS]
+    )
+    counts["resolutions"] = _stage_rows(
+        conn, staging, _resolution_rows(resolutions or {})
+    )
+    return counts
+
+
+def _drop_staging(conn: Connection) -> None:
+    for name in (
+        "upload_national_ids",
+        "upload_resolutions",
+        "upload_kins",
+        "upload_education",
+        "upload_students",
+    ):
+        conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+
+
+def _fills(fname: str, target: str = "t", source: str = "s") -> str:
+    return f"{target}.{fname} IS NULL AND {source}.{fname} IS NOT NULL"
+
+
+def _differs(fname: str, left: str, right: str) -> str:
+    if fname == "date_of_birth":
+        return f"{left}.{fname} <> {right}.{fname}"
+    return f"TRIM(CAST({left}.{fname} AS TEXT)) <> TRIM(CAST({right}.{fname} AS TEXT))"
+
+
+def _conflicts(fname: str, target: str = "t", source: str = "s") -> str:
+    return (
+        f"{target}.{fname} IS NOT NULL AND {source}.{fname} IS NOT NULL "
+        f"AND {_differs(fname, target, source)}"
+    )
+
+
+def _resolves(fname: str, target: str = "t") -> str:
+    return (
+        f"r.{fname} IS NOT NULL AND {_conflicts(fname, target)} "
+        f"AND {_differs(fname, 'r', target)}"
+    )
+
+
+def _eligible_student(alias: str, *, staged: bool = False) -> str:
+    condition = f"EXISTS (SELECT 1 FROM students t WHERE t.std_no = {alias}.std_no)"
+    if staged:
+        condition = (
+            f"({condition} OR EXISTS "
+            f"(SELECT 1 FROM upload_students s WHERE s.std_no = {alias}.std_no))"
+        )
+    return condition
+
+
+def _count(conn: Connection, sql: str, params: dict | None = None) -> int:
+    return int(conn.execute(text(sql), params or {}).scalar_one() or 0)
+
+
+def _staged_conflicts(conn: Connection) -> list[Conflict]:
+    students = Student.__table__
+    conflicts: list[tuple[int, int, Conflict]] = []
+    for position, fname in enumerate(STUDENT_FILLABLE_FIELDS):
+        value_type = students.c[fname].type
+        rows = conn.execute(
+            text(
+                f"SELECT s.std_no, t.name, t.{fname} AS target_value, "
+                f"s.{fname} AS source_value "
+                "FROM upload_students s JOIN students t ON t.std_no = s.std_no "
+                f"WHERE {_conflicts(fname)}"
+            ).columns(
+                std_no=students.c.std_no.type,
+                name=students.c.name.type,
+                target_value=value_type,
+                source_value=value_type,
+            )
+        )
+        for row in rows:
+            conflicts.append(
+                (
+                    row.std_no,
+                    position,
+                    Conflict(
+                        std_no=row.std_no,
+                        student_name=row.name,
+                        field_name=fname,
+                        target_value=str(row.target_value),
+                        source_value=str(row.source_value),
+                    ),
                 )
-                merge_next_of_kins(
-                    source_session, target_session, stats, progress_callback
+            )
+    conflicts.sort(key=lambda item: item[:2])
+    return [conflict for _, _, conflict in conflicts]
+
+
+def analyze_staged_differences(
+    source_engine: Engine,
+    target_engine: Engine,
+) -> AnalysisResult:
+    result = AnalysisResult()
+
+    with target_engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            _stage_source(conn, source_engine)
+
+            result.students_to_add = _count(
+                conn,
+                "SELECT COUNT(*) FROM upload_students s "
+                "WHERE NOT EXISTS (SELECT 1 FROM students t WHERE t.std_no = s.std_no)",
+            )
+
+            fill_counts = ", ".join(
+                f"SUM(CASE WHEN {_fills(fname)} THEN 1 ELSE 0 END) AS {fname}"
+                for fname in STUDENT_FILLABLE_FIELDS
+            )
+            any_fill = " OR ".join(
+                f"({_fills(fname)})" for fname in STUDENT_FILLABLE_FIELDS
+            )
+            row = conn.execute(
+                text(
+                    f"SELECT {fill_counts}, "
+                    f"SUM(CASE WHEN {any_fill} THEN 1 ELSE 0 END) AS students "
+                    "FROM upload_students s JOIN students t ON t.std_no = s.std_no"
                 )
-                target_session.commit()
-                logger.info("Merge completed successfully")
-            except Exception:
-                target_session.rollback()
-                logger.exception("Merge failed, rolling back")
-                raise
+            ).one()
+            for fname in STUDENT_FILLABLE_FIELDS:
+                count = int(getattr(row, fname) or 0)
+                if count:
+                    result.fields_to_fill[fname] = count
+            result.students_to_update = int(row.students or 0)
+            result.conflicts = _staged_conflicts(conn)
+
+            result.education_to_add = _count(
+                conn,
+                "SELECT COUNT(*) FROM upload_education e "
+                f"WHERE {_eligible_student('e', staged=True)} "
+                "AND (e.cms_id IS NULL OR NOT EXISTS "
+                "(SELECT 1 FROM student_education x WHERE x.cms_id = e.cms_id))",
+            )
+            result.kins_to_add = _count(
+                conn,
+                "SELECT COUNT(*) FROM ("
+                "SELECT DISTINCT k.std_no, LOWER(TRIM(k.name)) AS name_key "
+                "FROM upload_kins k "
+                f"WHERE {_eligible_student('k', staged=True)} "
+                "AND NOT EXISTS (SELECT 1 FROM next_of_kins x "
+                "WHERE x.std_no = k.std_no "
+                "AND LOWER(TRIM(x.name)) = LOWER(TRIM(k.name)))"
+                ") kin_keys",
+            )
+        finally:
+            transaction.rollback()
+
+    return result
+
 
+def _claim_national_ids(conn: Connection) -> None:
+    conn.execute(
+        text(
+            "CREATE TEMPORARY TABLE upload_national_ids AS "
+            "SELECT std_no, national_id FROM students WHERE 1 = 0"
+        )
+    )
+    conn.execute(
+        text(
+            "INSERT INTO upload_national_ids (std_no, national_id) "
+            "SELECT std_no, national_id FROM ("
+            "SELECT c.std_no, c.national_id, ROW_NUMBER() OVER "
+            "(PARTITION BY c.national_id ORDER BY c.std_no) AS claim_rank "
+            "FROM ("
+            "SELECT s.std_no, s.national_id FROM upload_students s "
+            "LEFT JOIN students t ON t.std_no = s.std_no "
+            "WHERE s.national_id IS NOT NULL "
+            "AND (t.std_no IS NULL OR t.national_id IS NULL) "
+            "UNION ALL "
+            "SELECT r.std_no, r.national_id FROM upload_resolutions r "
+            "JOIN upload_students s ON s.std_no = r.std_no "
+            "JOIN students t ON t.std_no = r.std_no "
+            f"WHERE {_resolves('national_id')}"
+            ") c "
+            "WHERE NOT EXISTS (SELECT 1 FROM students u "
+            "WHERE u.national_id = c.national_id)"
+            ") ranked WHERE claim_rank = 1"
+        )
+    )
+    conn.execute(
+        text("CREATE INDEX upload_national_ids_key ON upload_national_ids (std_no)")
+    )
+
+
+def _merge_staged_students(conn: Connection, stats: MergeStats) -> None:
+    _claim_national_ids(conn)
+
+    other_fields = [f for f in STUDENT_FILLABLE_FIELDS if f != "national_id"]
+    changes = " OR ".join(
+        [
+            *(f"({_fills(fname)})" for fname in other_fields),
+            *(f"({_resolves(fname)})" for fname in other_fields),
+            "c.std_no IS NOT NULL",
+        ]
+    )
+    row = conn.execute(
+        text(
+            "SELECT COUNT(*) AS matched, "
+            f"SUM(CASE WHEN {changes} THEN 1 ELSE 0 END) AS updated, "
+            "SUM(CASE WHEN c.std_no IS NOT NULL AND t.national_id IS NULL "
+            "THEN 1 ELSE 0 END) AS national_ids "
+            "FROM upload_students s "
+            "JOIN students t ON t.std_no = s.std_no "
+            "LEFT JOIN upload_resolutions r ON r.std_no = s.std_no "
+            "LEFT JOIN upload_national_ids c ON c.std_no = s.std_no"
+        )
+    ).one()
+    stats.students_updated += int(row.updated or 0)
+    stats.students_skipped += int(row.matched or 0) - int(row.updated or 0)
+    if row.national_ids:
+        stats.students_fields_filled["national_id"] = stats.students_fields_filled.get(
+            "national_id", 0
+        ) + int(row.national_ids)
+
+    for fname in other_fields:
+        conn.execute(
+            text(
+                f"UPDATE students SET {fname} = r.{fname} "
+                "FROM upload_resolutions r JOIN upload_students s "
+                "ON s.std_no = r.std_no "
+                "WHERE students.std_no = r.std_no "
+                f"AND {_resolves(fname, target='students')}"
+            )
+        )
+        filled = conn.execute(
+            text(
+                f"UPDATE students SET {fname} = s.{fname} FROM upload_students s "
+                f"WHERE students.std_no = s.std_no AND {_fills(fname, 'students')}"
+            )
+        ).rowcount
+        if filled:
+            stats.students_fields_filled[fname] = (
+                stats.students_fields_filled.get(fname, 0) + filled
+            )
+    conn.execute(
+        text(
+            "UPDATE students SET national_id = c.national_id "
+            "FROM upload_national_ids c WHERE students.std_no = c.std_no"
+        )
+    )
+
+    columns = ", ".join(
+        ["std_no", "name", "national_id", "status", *other_fields, "created_at"]
+    )
+    values = ", ".join(
+        [
+            "s.std_no",
+            "s.name",
+            "c.national_id",
+            "s.status",
+            *(f"s.{fname}" for fname in other_fields),
+            ":created_at",
+        ]
+    )
+    stats.students_added += conn.execute(
+        text(
+            f"INSERT INTO students ({columns}) SELECT {values} "
+            "FROM upload_students s "
+            "LEFT JOIN upload_national_ids c ON c.std_no = s.std_no "
+            "WHERE NOT EXISTS (SELECT 1 FROM students t WHERE t.std_no = s.std_no) "
+            "ORDER BY s.std_no"
+        ).bindparams(bindparam("created_at", type_=DateTime())),
+        {"created_at": utc_now()},
+    ).rowcount
+
+
+def _merge_staged_education(conn: Connection, stats: MergeStats, staged: int) -> None:
+    added = conn.execute(
+        text(
+            "INSERT INTO student_education "
+            "(std_no, school_name, type, level, start_date, end_date, cms_id, "
+            "created_at) "
+            "SELECT e.std_no, e.school_name, e.type, e.level, e.start_date, "
+            "e.end_date, e.cms_id, :created_at FROM ("
+            "SELECT e.*, ROW_NUMBER() OVER "
+            "(PARTITION BY e.cms_id ORDER BY e.id) AS cms_rank "
+            f"FROM upload_education e WHERE {_eligible_student('e')}"
+            ") e "
+            "WHERE e.cms_id IS NULL OR (e.cms_rank = 1 AND NOT EXISTS "
+            "(SELECT 1 FROM student_education x WHERE x.cms_id = e.cms_id)) "
+            "ORDER BY e.id"
+        ).bindparams(bindparam("created_at", type_=DateTime())),
+        {"created_at": utc_now()},
+    ).rowcount
+    stats.education_added += added
+    stats.education_skipped += staged - added
+
+
+def _merge_staged_kins(conn: Connection, stats: MergeStats, staged: int) -> None:
+    added = conn.execute(
+        text(
+            "INSERT INTO next_of_kins "
+            "(std_no, name, relationship, phone, email, occupation, address, "
+            "country, created_at) "
+            "SELECT k.std_no, k.name, k.relationship, k.phone, k.email, "
+            "k.occupation, k.address, k.country, :created_at FROM ("
+            "SELECT k.*, ROW_NUMBER() OVER "
+            "(PARTITION BY k.std_no, LOWER(TRIM(k.name)) ORDER BY k.id) AS kin_rank "
+            f"FROM upload_kins k WHERE {_eligible_student('k')}"
+            ") k "
+            "WHERE k.kin_rank = 1 AND NOT EXISTS (SELECT 1 FROM next_of_kins x "
+            "WHERE x.std_no = k.std_no "
+            "AND LOWER(TRIM(x.name)) = LOWER(TRIM(k.name))) "
+            "ORDER BY k.id"
+        ).bindparams(bindparam("created_at", type_=DateTime())),
+        {"created_at": utc_now()},
+    ).rowcount
+    stats.kins_added += added
+    stats.kins_skipped += staged - added
+
+
+def run_staged_merge(
+    source_engine: Engine,
+    target_engine: Engine,
+    progress_callback: Callable[[str, int, int], None] | None = None,
+    resolutions: dict[tuple[int, str], str] | None = None,
+) -> MergeStats:
+    stats = MergeStats()
+    steps = 6
+    step = 0
+
+    def progress(message: str) -> None:
+        nonlocal step
+        step += 1
+        if progress_callback:
+            progress_callback(message, step, steps)
+
+    with target_engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            counts = _stage_source(conn, source_engine, resolutions, progress)
+            progress("Merging students...")
+            _merge_staged_students(conn, stats)
+            progress("Merging education records...")
+            _merge_staged_education(conn, stats, counts["education"])
+            progress("Merging next of kin...")
+            _merge_staged_kins(conn, stats, counts["kins"])
+            _drop_staging(conn)
+            transaction.commit()
+            logger.info("Merge completed successfully")
+        except Exception:
+            transaction.rollback()
+            logger.exception("Merge failed, rolling back")
+            raise
+
+    logger.info(
+        "Students: %d added, %d updated, %d skipped",
+        stats.students_added,
+        stats.students_updated,
+        stats.students_skipped,
+    )
+    logger.info(
+        "Education: %d added, %d skipped",
+        stats.education_added,
+        stats.education_skipped,
+    )
+    logger.info(
+        "Next of Kin: %d added, %d skipped",
+        stats.kins_added,
+        stats.kins_skipped,
+    )
     return stats
 
 
@@ -418,6 +1205,18 @@ def main() -> None:
         action="store_true",
         help="Show what would be done without making changes",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=MERGE_BATCH_SIZE,
+        help="Students to merge and commit per batch",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Commit each batch with a checkpoint in the target database and "
+        "continue an earlier interrupted run",
+    )
     args = parser.parse_args()
 
     source_engine = create_source_engine(args.source)
@@ -459,7 +1258,13 @@ def main() -> None:
         if current % 500 == 0 or current == total:
             logger.info("[%d/%d] %s", current, total, msg)
 
-    stats = run_merge(source_engine, target_engine, progress)
+    stats = run_merge(
+        source_engine,
+        target_engine,
+        progress,
+        batch_size=args.batch_size,
+        resumable=args.resume,
+    )
     print(stats.summary())
 
 